@@ -1,6 +1,8 @@
 """Hourly AI evaluation coordinator — wires unit-1 core to HA.
 
-Fetches recorder history, runs the detector, calls the AI text path, splits
+Streams the box entities' state changes into the detector's ring buffer
+(one recorder read at start-up seeds the window; until then a tick reads the
+window from the recorder), runs the detector, calls the AI text path, splits
 the markdown into FAKTA/LIDSKY, updates the ledger, writes the Store, and
 signals the sensor. AI OPTIONAL: if generate_eval_report returns None, the
 tick is a graceful no-op.
@@ -13,9 +15,12 @@ from datetime import datetime, timedelta, timezone
 from typing import Any, Callable, Dict, List, Optional
 
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import Event, HomeAssistant, callback
 from homeassistant.helpers.dispatcher import async_dispatcher_send
-from homeassistant.helpers.event import async_track_point_in_time
+from homeassistant.helpers.event import (
+    async_track_point_in_time,
+    async_track_state_change_event,
+)
 from homeassistant.helpers.recorder import get_instance
 from homeassistant.helpers.storage import Store
 from homeassistant.util import dt as dt_util
@@ -92,11 +97,13 @@ def _states_to_samples(states: List[Any]) -> List[tuple[float, Any]]:
     return samples
 
 
+def _ts_label(ts: float) -> str:
+    return dt_util.as_local(datetime.fromtimestamp(ts, tz=timezone.utc)).strftime("%H:%M")
+
+
 def _label_fn(start_ts: float, n: int) -> Callable[[int], str]:
     def label(i: int) -> str:
-        t = start_ts + i * detector.STEP_S
-        dt = dt_util.as_local(datetime.fromtimestamp(t, tz=timezone.utc))
-        return dt.strftime("%H:%M")
+        return _ts_label(start_ts + i * detector.STEP_S)
     return label
 
 
@@ -144,21 +151,16 @@ async def _fetch_history(
 
 async def _fetch_plan_block(hass: HomeAssistant, box_id: str) -> str:
     try:
-        from homeassistant.helpers.aiohttp_client import async_get_clientsession
-
-        session = async_get_clientsession(hass)
-        base = f"/api/oig_cloud/battery_forecast/{box_id}"
-
-        tile_url = f"{base}/unified_cost_tile"
-        timeline_url = f"{base}/timeline?type=active"
-
-        async with session.get(tile_url) as resp:
-            tile_data = await resp.json() if resp.status == 200 else {}
-
-        async with session.get(timeline_url) as resp:
-            timeline_data = await resp.json() if resp.status == 200 else {}
+        from ..battery_forecast.presentation.plan_snapshot import (
+            async_get_plan_snapshot,
+        )
 
-        return _format_plan_block(tile_data, timeline_data)
+        snapshot = await async_get_plan_snapshot(hass, box_id)
+        if snapshot is None:
+            return "PLÁN A CENY: (nedostupné)"
+        return _format_plan_block(
+            snapshot.unified_cost_tile, {"active": snapshot.timeline}
+        )
     except Exception as err:
         _LOGGER.debug("Failed to fetch plan block: %s", err)
         return "PLÁN A CENY: (nedostupné)"
@@ -211,6 +213,12 @@ class AiEvalCoordinator:
         self._initial_task: asyncio.Task[None] | None = None
         self._tick_tasks: set[asyncio.Task[Any]] = set()
         self._shutting_down = False
+        # Streaming detector fed by state-change events (None until started;
+        # ticks then fall back to a recorder read of the window).
+        self._stream: Optional[detector.StreamingDetector] = None
+        self._stream_keys: Dict[str, str] = {}
+        self._stored_detector: Any = None
+        self._unsub_state: Optional[Callable[[], None]] = None
 
     async def async_setup(self) -> None:
         stored = await self._store.async_load()
@@ -226,6 +234,7 @@ class AiEvalCoordinator:
                             "detail": parts[2],
                             "ts": 0,
                         })
+            self._stored_detector = stored.get("detector")
         self._schedule_next_tick()
 
         # Initial tick as a background task (a point-in-time timer proved
@@ -235,6 +244,10 @@ class AiEvalCoordinator:
             await asyncio.sleep(15)
             if self._shutting_down:
                 return
+            try:
+                await self._async_start_stream()
+            except Exception as err:
+                _LOGGER.debug("AI eval: streaming unavailable, using recorder: %s", err)
             await self._async_on_tick(dt_util.utcnow())
 
         task = self.hass.async_create_task(_initial_tick())
@@ -255,32 +268,66 @@ class AiEvalCoordinator:
             self.hass, self._async_on_tick, next_hour
         )
 
-    async def _async_on_tick(self, now: datetime) -> None:
+    async def _async_start_stream(self) -> None:
+        """Seed the ring from one recorder read, then follow state changes."""
+        if not self.box_id or self._stream is not None or self._shutting_down:
+            return
+        entity_ids_map = _build_entity_ids(self.box_id)
+        now = dt_util.utcnow()
+        start_time = now - timedelta(minutes=HISTORY_MINUTES)
+        stream = detector.StreamingDetector(
+            int(HISTORY_MINUTES * 60 / detector.STEP_S),
+            list(entity_ids_map),
+            _ts_label,
+            start_ts=start_time.timestamp(),
+        )
+        stream.restore(self._stored_detector)
+
+        states_by_entity = await _fetch_history(
+            self.hass, list(entity_ids_map.values()), start_time, now
+        )
+        samples = [
+            (ts, key, val)
+            for key, entity_id in entity_ids_map.items()
+            for ts, val in _states_to_samples(states_by_entity.get(entity_id, []))
+        ]
+        samples.sort(key=lambda s: s[0])
+        for ts, key, val in samples:
+            stream.observe(key, ts, val)
         if self._shutting_down:
             return
-        task = asyncio.current_task()
-        if task is not None:
-            self._tick_tasks.add(task)
-        try:
-            await self._async_run_tick(now)
-        except Exception as err:
-            _LOGGER.error("AI eval tick failed: %s", err, exc_info=True)
-        finally:
-            if task is not None:
-                self._tick_tasks.discard(task)
-            self._schedule_next_tick()
 
-    async def _async_run_tick(self, now: datetime) -> None:
-        if not self.box_id:
-            _LOGGER.debug("AI eval: no box_id, skipping tick")
+        self._stream = stream
+        self._stream_keys = {entity_id: key for key, entity_id in entity_ids_map.items()}
+        self._unsub_state = async_track_state_change_event(
+            self.hass, list(entity_ids_map.values()), self._async_on_state_change
+        )
+        # Changes that landed while the recorder read was in flight.
+        for entity_id, key in self._stream_keys.items():
+            state = self.hass.states.get(entity_id)
+            for ts, val in _states_to_samples([state] if state is not None else []):
+                stream.observe(key, ts, val)
+
+    @callback
+    def _async_on_state_change(self, event: Event) -> None:
+        if self._stream is None:
+            return
+        key = self._stream_keys.get(event.data.get("entity_id"))
+        new_state = event.data.get("new_state")
+        if key is None or new_state is None:
             return
+        for ts, val in _states_to_samples([new_state]):
+            self._stream.observe(key, ts, val)
 
+    async def _async_read_window(
+        self, now: datetime
+    ) -> tuple[float, int, Dict[str, List[Optional[Any]]], List[Dict[str, Any]]]:
+        """Window (start_ts, n, grid, events) from a one-off recorder read."""
         entity_ids_map = _build_entity_ids(self.box_id)
-        end_time = now
         start_time = now - timedelta(minutes=HISTORY_MINUTES)
 
         states_by_entity = await _fetch_history(
-            self.hass, list(entity_ids_map.values()), start_time, end_time
+            self.hass, list(entity_ids_map.values()), start_time, now
         )
 
         grid: Dict[str, List[Optional[Any]]] = {}
@@ -301,6 +348,36 @@ class AiEvalCoordinator:
                 prior_low_soc_minutes += detector.STEP_S / 60.0
 
         events = detector.detect_events(grid, n, label, prior_low_soc_minutes)
+        return start_ts, n, grid, events
+
+    async def _async_on_tick(self, now: datetime) -> None:
+        if self._shutting_down:
+            return
+        task = asyncio.current_task()
+        if task is not None:
+            self._tick_tasks.add(task)
+        try:
+            await self._async_run_tick(now)
+        except Exception as err:
+            _LOGGER.error("AI eval tick failed: %s", err, exc_info=True)
+        finally:
+            if task is not None:
+                self._tick_tasks.discard(task)
+            self._schedule_next_tick()
+
+    async def _async_run_tick(self, now: datetime) -> None:
+        if not self.box_id:
+            _LOGGER.debug("AI eval: no box_id, skipping tick")
+            return
+
+        if self._stream is not None:
+            self._stream.advance(now.timestamp())
+            start_ts, n, grid, events = self._stream.window()
+        else:
+            start_ts, n, grid, events = await self._async_read_window(now)
+        label = _label_fn(start_ts, n)
+        start_time = datetime.fromtimestamp(start_ts, tz=timezone.utc)
+        end_time = now
         notable_events = [e for e in events if e.get("kind") in NOTABLE_EVENT_KINDS]
 
         # Update the rolling ledger every tick — cheap, deterministic memory.
@@ -320,6 +397,7 @@ class AiEvalCoordinator:
                 "last_run": now.isoformat(),
                 "anomaly_count": 0,
                 "status": "ok",
+                **self._detector_store_data(),
             })
             async_dispatcher_send(self.hass, f"oig_cloud_ai_eval_update_{self.entry_id}")
             return
@@ -348,14 +426,23 @@ class AiEvalCoordinator:
             "last_run": now.isoformat(),
             "anomaly_count": len(notable_events),
             "status": "attention",
+            **self._detector_store_data(),
         })
         async_dispatcher_send(self.hass, f"oig_cloud_ai_eval_update_{self.entry_id}")
 
         from .notify import publish_eval_notification
         await publish_eval_notification(self.hass, self.config_entry, lidsky, True)
 
+    def _detector_store_data(self) -> Dict[str, Any]:
+        if self._stream is None:
+            return {}
+        return {"detector": self._stream.state_dict()}
+
     async def async_shutdown(self) -> None:
         self._shutting_down = True
+        if self._unsub_state:
+            self._unsub_state()
+            self._unsub_state = None
         if self._initial_task is not None:
             task = self._initial_task
             self._initial_task = None
@@ -13,7 +13,9 @@ FVE+battery feed only zaloha and nezaloha always draws from the grid):
 """
 from __future__ import annotations
 
-from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+import math
+from collections import deque
+from typing import Any, Callable, Deque, Dict, List, Optional, Sequence, Tuple
 
 STEP_S = 20                     # snapshot grid step (native cadence is ~16-20s)
 BACKUP_PHASE_LIMIT_W = 3300     # per-phase zaloha limit before the box bypasses
@@ -66,6 +68,117 @@ def derive_series(grid: Dict[str, List[Optional[Any]]], n: int) -> Dict[str, Lis
     }
 
 
+def _tick_metrics(row: Dict[str, Any]) -> Dict[str, float]:
+    """The derived values of one grid tick (same as `derive_series` at i)."""
+    phases = [_num(row.get("zal_r")), _num(row.get("zal_s")), _num(row.get("zal_t"))]
+    return {
+        "zpeak": max(phases),
+        "imbalance": max(phases) - min(phases),
+        "grid": _num(row.get("grid")),
+        "zal": _num(row.get("zal")),
+        "nez": _num(row.get("nez")),
+        "fve": _num(row.get("fve")),
+        "bat": _num(row.get("bat")),
+        "soc": _num(row.get("soc")),
+    }
+
+
+class DetectorState:
+    """Re-arm hysteresis carried from one tick to the next.
+
+    `low_window` bounds the SoC-at-floor tick count to the last N ticks (None
+    counts the whole run — the one-shot `detect_events` behaviour)."""
+
+    def __init__(self, low_window: Optional[int] = None) -> None:
+        self.armed: Dict[str, bool] = {}
+        self.false_streak: Dict[str, int] = {}
+        self.recent_grid: Deque[float] = deque(maxlen=2)
+        self.low_flags: Deque[bool] = deque(maxlen=low_window)
+        self.low_ticks = 0
+
+    def push_low(self, low: bool) -> None:
+        if self.low_flags.maxlen is not None and len(self.low_flags) == self.low_flags.maxlen:
+            self.low_ticks -= self.low_flags[0]
+        self.low_flags.append(low)
+        self.low_ticks += low
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {
+            "armed": dict(self.armed),
+            "false_streak": dict(self.false_streak),
+            "recent_grid": list(self.recent_grid),
+            "low_flags": [int(f) for f in self.low_flags],
+        }
+
+    @classmethod
+    def from_dict(cls, data: Any, low_window: Optional[int] = None) -> "DetectorState":
+        state = cls(low_window)
+        if not isinstance(data, dict):
+            return state
+        state.armed = {str(k): bool(v) for k, v in (data.get("armed") or {}).items()}
+        state.false_streak = {
+            str(k): int(v) for k, v in (data.get("false_streak") or {}).items()
+        }
+        state.recent_grid.extend(_num(v) for v in data.get("recent_grid") or [])
+        for flag in data.get("low_flags") or []:
+            state.push_low(bool(flag))
+        return state
+
+
+def prime_step(state: DetectorState, row: Dict[str, Any]) -> None:
+    """Feed a tick that only seeds history (the first tick has no predecessor)."""
+    state.recent_grid.append(_num(row.get("grid")))
+
+
+def detect_step(
+    state: DetectorState,
+    row: Dict[str, Any],
+    i: int,
+    label: Callable[[int], str],
+    prior_low_soc_minutes: float = 0.0,
+) -> List[Dict[str, Any]]:
+    """Run the onset detector on tick `i` (`row` = metric -> value at that tick)."""
+    d = _tick_metrics(row)
+    events: List[Dict[str, Any]] = []
+
+    def edge(name: str, cond: bool, mk: Callable[[], str]) -> None:
+        if cond:
+            if state.armed.get(name, True):
+                events.append({"i": i, "at": label(i), "kind": name, "detail": mk()})
+                state.armed[name] = False
+            state.false_streak[name] = 0
+        else:
+            # Only reaching REARM_TICKS matters; capped so it stays bounded.
+            fs = min(state.false_streak.get(name, REARM_TICKS) + 1, REARM_TICKS)
+            state.false_streak[name] = fs
+            if fs >= REARM_TICKS:
+                state.armed[name] = True
+
+    g2 = state.recent_grid[0] if state.recent_grid else d["grid"]
+    edge("grid_skok", d["grid"] - g2 > GRID_JUMP_W and d["grid"] > GRID_JUMP_W,
+         lambda: f"sit +{d['grid']-g2:.0f}W za 40s na {d['grid']:.0f}; "
+                 f"zal {d['zal']:.0f} nez {d['nez']:.0f} fve {d['fve']:.0f} "
+                 f"bat {d['bat']:+.0f} soc {d['soc']:.0f}")
+    edge("faze_limit", d["zpeak"] >= PHASE_NEAR_LIMIT_W,
+         lambda: f"spicka faze {d['zpeak']:.0f}W (limit {BACKUP_PHASE_LIMIT_W}), "
+                 f"imbalance {d['imbalance']:.0f}")
+    edge("nerovnovaha", d["imbalance"] > IMBALANCE_W,
+         lambda: f"imbalance naskocila na {d['imbalance']:.0f}W, zpeak {d['zpeak']:.0f}")
+    b = row.get("byp")
+    edge("bypass", isinstance(b, str) and b.lower() in ("on", "1", "true"),
+         lambda: f"bypass ON, batT {_num(row.get('batT')):.1f} "
+                 f"invT {_num(row.get('invT')):.1f}")
+    # recovery-after-minimum: charging kicks in while SoC sat low a long time
+    state.push_low(bool(d["soc"] and d["soc"] <= 30))
+    low_minutes = prior_low_soc_minutes + state.low_ticks * STEP_S / 60.0
+    edge("dobijeni_po_minimu",
+         d["bat"] > 1500 and d["soc"] <= 40 and low_minutes >= 60,
+         lambda: f"dobijeni {d['bat']:+.0f}W po ~{low_minutes:.0f} min na minimu, "
+                 f"soc {d['soc']:.0f}, fve {d['fve']:.0f}, sit {d['grid']:.0f}")
+    state.recent_grid.append(d["grid"])
+    return events
+
+
 def detect_events(
     grid: Dict[str, List[Optional[Any]]],
     n: int,
@@ -77,50 +190,108 @@ def detect_events(
     `label(i)` maps a tick index to a human timestamp string. `prior_low_soc_
     minutes` lets the caller signal the battery was already long at its floor
     before this window (for the recovery-after-minimum event)."""
-    d = derive_series(grid, n)
+    state = DetectorState()
     events: List[Dict[str, Any]] = []
-    armed: Dict[str, bool] = {}
-    false_streak: Dict[str, int] = {}
-
-    def edge(name: str, cond: bool, i: int, mk: Callable[[int], str]) -> None:
-        if cond:
-            if armed.get(name, True):
-                events.append({"i": i, "at": label(i), "kind": name, "detail": mk(i)})
-                armed[name] = False
-            false_streak[name] = 0
+    for i in range(n):
+        row = {key: values[i] for key, values in grid.items()}
+        if i == 0:
+            prime_step(state, row)
         else:
-            fs = false_streak.get(name, REARM_TICKS) + 1
-            false_streak[name] = fs
-            if fs >= REARM_TICKS:
-                armed[name] = True
-
-    soc_low_ticks = 0
-    for i in range(1, n):
-        g2 = d["grid"][max(0, i - 2)]
-        edge("grid_skok", d["grid"][i] - g2 > GRID_JUMP_W and d["grid"][i] > GRID_JUMP_W, i,
-             lambda i: f"sit +{d['grid'][i]-d['grid'][max(0, i-2)]:.0f}W za 40s na {d['grid'][i]:.0f}; "
-                       f"zal {d['zal'][i]:.0f} nez {d['nez'][i]:.0f} fve {d['fve'][i]:.0f} "
-                       f"bat {d['bat'][i]:+.0f} soc {d['soc'][i]:.0f}")
-        edge("faze_limit", d["zpeak"][i] >= PHASE_NEAR_LIMIT_W, i,
-             lambda i: f"spicka faze {d['zpeak'][i]:.0f}W (limit {BACKUP_PHASE_LIMIT_W}), "
-                       f"imbalance {d['imbalance'][i]:.0f}")
-        edge("nerovnovaha", d["imbalance"][i] > IMBALANCE_W, i,
-             lambda i: f"imbalance naskocila na {d['imbalance'][i]:.0f}W, zpeak {d['zpeak'][i]:.0f}")
-        b = grid.get("byp", [None] * n)[i]
-        edge("bypass", isinstance(b, str) and b.lower() in ("on", "1", "true"), i,
-             lambda i: f"bypass ON, batT {_num(grid.get('batT', [None]*n)[i]):.1f} "
-                       f"invT {_num(grid.get('invT', [None]*n)[i]):.1f}")
-        # recovery-after-minimum: charging kicks in while SoC sat low a long time
-        if d["soc"][i] and d["soc"][i] <= 30:
-            soc_low_ticks += 1
-        low_minutes = prior_low_soc_minutes + soc_low_ticks * STEP_S / 60.0
-        edge("dobijeni_po_minimu",
-             d["bat"][i] > 1500 and d["soc"][i] <= 40 and low_minutes >= 60, i,
-             lambda i: f"dobijeni {d['bat'][i]:+.0f}W po ~{low_minutes:.0f} min na minimu, "
-                       f"soc {d['soc'][i]:.0f}, fve {d['fve'][i]:.0f}, sit {d['grid'][i]:.0f}")
+            events.extend(detect_step(state, row, i, label, prior_low_soc_minutes))
     return events
 
 
+class StreamingDetector:
+    """Incremental detection over a fixed-size ring of `step_s` grid ticks.
+
+    Feed change-on-write samples with `observe` (in time order) and close
+    ticks with `advance`: every closed tick is forward-filled from the latest
+    values, written into the ring and run through `detect_step` exactly once,
+    so the hysteresis state carries over between calls instead of re-reading
+    and re-detecting the whole window. `window()` returns the same
+    (start_ts, n, grid, events) view a one-shot `forward_fill` +
+    `detect_events` run produces."""
+
+    def __init__(self, capacity: int, keys: Sequence[str],
+                 label: Callable[[float], str], start_ts: Optional[float] = None,
+                 step_s: int = STEP_S) -> None:
+        self.capacity = capacity
+        self.step_s = step_s
+        self._label = label
+        self._current: Dict[str, Any] = {key: None for key in keys}
+        self._rings: Dict[str, List[Optional[Any]]] = {key: [None] * capacity for key in keys}
+        self._ticks = 0
+        self._next_ts = start_ts
+        self._replay_until = float("-inf")
+        self._events: Deque[Dict[str, Any]] = deque()
+        self.state = DetectorState(low_window=capacity)
+
+    def observe(self, key: str, ts: float, value: Any) -> None:
+        """Record a sample; it applies from the first tick at or after `ts`."""
+        if key not in self._current:
+            return
+        self.advance(ts, inclusive=False)
+        self._current[key] = value
+
+    def advance(self, until_ts: float, inclusive: bool = True) -> None:
+        """Close all ticks up to `until_ts`."""
+        if self._next_ts is None:
+            self._next_ts = math.ceil(until_ts / self.step_s) * self.step_s
+        # After a long gap only the last `capacity` ticks can still be seen.
+        skip = int((until_ts - self._next_ts) // self.step_s) - self.capacity
+        if skip > 0:
+            self._next_ts += skip * self.step_s
+        while self._next_ts < until_ts or (inclusive and self._next_ts == until_ts):
+            self._close_tick(self._next_ts)
+            self._next_ts += self.step_s
+
+    def _close_tick(self, ts: float) -> None:
+        tick = self._ticks
+        pos = tick % self.capacity
+        row = dict(self._current)
+        for key, value in row.items():
+            self._rings[key][pos] = value
+        self._ticks += 1
+        if ts <= self._replay_until or not self.state.recent_grid:
+            prime_step(self.state, row)
+        else:
+            for event in detect_step(self.state, row, tick, lambda _i: self._label(ts)):
+                event["tick"] = tick
+                event["ts"] = ts
+                self._events.append(event)
+        oldest = self._ticks - self.capacity
+        while self._events and self._events[0]["tick"] < oldest:
+            self._events.popleft()
+
+    def window(self) -> Tuple[float, int, Dict[str, List[Optional[Any]]], List[Dict[str, Any]]]:
+        """(start_ts, n, grid, events) for the ticks currently in the ring."""
+        n = min(self._ticks, self.capacity)
+        first = self._ticks - n
+        start_ts = (self._next_ts or 0.0) - n * self.step_s
+        pos = first % self.capacity
+        grid = {
+            key: (ring[pos:] + ring[:pos]) if n == self.capacity else ring[:n]
+            for key, ring in self._rings.items()
+        }
+        events = [dict(event, i=event["tick"] - first) for event in self._events]
+        return start_ts, n, grid, events
+
+    def state_dict(self) -> Dict[str, Any]:
+        """Persistable hysteresis state (restore with `restore`)."""
+        last_ts = None if self._next_ts is None or not self._ticks else self._next_ts - self.step_s
+        return {"state": self.state.as_dict(), "ts": last_ts}
+
+    def restore(self, data: Any) -> None:
+        """Continue from persisted state; ticks up to its timestamp (replayed
+        history that was already evaluated) only refill the ring."""
+        if not isinstance(data, dict):
+            return
+        self.state = DetectorState.from_dict(data.get("state"), self.capacity)
+        ts = data.get("ts")
+        if isinstance(ts, (int, float)):
+            self._replay_until = float(ts)
+
+
 def event_snapshot_indices(events: Sequence[Dict[str, Any]], n: int,
                            win: int = CONTEXT_TICKS) -> List[int]:
     """The union of full-snapshot rows to send: +/- `win` ticks around each event."""
@@ -65,6 +65,26 @@ from ..config_registry import (
     registry_as_api_dict,
 )
 from ..battery_forecast.config import SimulatorConfig
+from ..battery_forecast.presentation.plan_snapshot import async_get_plan_snapshot
+from ..battery_forecast.presentation.precomputed_format import (
+    DETAIL_TABS,
+    TIMELINE,
+    precomputed_artifact,
+)
+from ..battery_forecast.presentation.response_bodies import (
+    VARIANT_UNIFIED_COST_TILE,
+    EncodedResponse,
+    build_timeline_payload,
+    build_unified_cost_tile_payload,
+    detail_tabs_variant,
+    encode_json_body,
+    filter_detail_tabs,
+    timeline_variant,
+)
+from ..battery_forecast.presentation.timeline_delta import (
+    build_timeline_delta_payload,
+    get_timeline_delta_history,
+)
 from ..config.modules_validation import validate_modules_selection
 from ..config.solar_rules import (
     legacy_azimuth_read_model,
@@ -483,29 +503,106 @@ async def _load_precomputed_timeline(
 def _build_precomputed_response(
     precomputed_data: Dict[str, Any], timeline_type: str, box_id: str
 ) -> Optional[web.Response]:
-    last_update: Optional[str] = (precomputed_data or {}).get("last_update")
-    stored_hybrid: Optional[list[Any]] = (precomputed_data or {}).get("timeline")
-    if not stored_hybrid:
-        stored_hybrid = (precomputed_data or {}).get("timeline_hybrid")
-    if not stored_hybrid:
+    response_data = build_timeline_payload(precomputed_data, timeline_type, box_id)
+    if response_data is None:
         return None  # pragma: no cover
-    metadata = {
-        "box_id": box_id,
-        "last_update": last_update,
-        "points_count": len(stored_hybrid),
-        "size_kb": round(sys.getsizeof(str(stored_hybrid)) / 1024, 1),
-    }
-    response_data = {
-        "plan": "hybrid",
-        "active": stored_hybrid,
-        "timeline": stored_hybrid,
-        "metadata": metadata,
-    }
-    if timeline_type in ("baseline", "both"):
-        response_data["baseline"] = []
     return web.json_response(response_data)
 
 
+def _header_tokens(request: web.Request, name: str) -> list[str]:
+    headers = getattr(request, "headers", None) or {}
+    return [token.strip() for token in headers.get(name, "").split(",") if token.strip()]
+
+
+def _accepts_gzip(request: web.Request) -> bool:
+    for token in _header_tokens(request, "Accept-Encoding"):
+        coding, _, params = token.partition(";")
+        if coding.strip().lower() not in ("gzip", "*"):
+            continue
+        quality = params.strip().lower()
+        if quality.startswith("q="):
+            try:
+                return float(quality[2:]) > 0
+            except ValueError:
+                return False
+        return True
+    return False
+
+
+def _etag_matches(request: web.Request, etag: str) -> bool:
+    for token in _header_tokens(request, "If-None-Match"):
+        if token == "*" or token.removeprefix("W/") == etag:
+            return True
+    return False
+
+
+def _encoded_json_response(
+    request: web.Request, encoded: EncodedResponse
+) -> web.Response:
+    headers = {
+        "ETag": encoded.etag,
+        "Cache-Control": "no-cache",
+        "Vary": "Accept-Encoding",
+    }
+    if _etag_matches(request, encoded.etag):
+        return web.Response(status=304, headers=headers)
+    if _accepts_gzip(request):
+        headers["Content-Encoding"] = "gzip"
+        return web.Response(
+            body=encoded.gzip_body, content_type="application/json", headers=headers
+        )
+    return web.Response(
+        body=encoded.body, content_type="application/json", headers=headers
+    )
+
+
+async def _serve_pre_encoded(
+    request: web.Request, hass: HomeAssistant, box_id: str, variant: str
+) -> Optional[web.Response]:
+    """Answer from the body pre-encoded for the latest precomputed payload."""
+    try:
+        snapshot = await async_get_plan_snapshot(hass, box_id)
+        encoded = snapshot.encoded_response(variant) if snapshot else None
+    except Exception as err:
+        _LOGGER.debug("Pre-encoded %s response unavailable: %s", variant, err)
+        return None
+    if encoded is None:
+        return None
+    return _encoded_json_response(request, encoded)
+
+
+async def _serve_timeline_delta(
+    request: web.Request,
+    hass: HomeAssistant,
+    box_id: str,
+    since_raw: str,
+    timeline_type: str,
+) -> Optional[web.Response]:
+    """Intervals changed since a precompute version (None: serve full timeline)."""
+    try:
+        since = int(since_raw)
+    except (TypeError, ValueError):
+        return None
+    snapshot = await async_get_plan_snapshot(hass, box_id)
+    if snapshot is None:
+        return None
+    delta = get_timeline_delta_history(hass, box_id).since(
+        since, snapshot.data.get("timeline_version")
+    )
+    if delta is None:
+        _LOGGER.debug(
+            "API: Timeline version %s not in delta history for %s, serving full",
+            since,
+            box_id,
+        )
+        return None
+    changed, removed = delta
+    payload = build_timeline_delta_payload(
+        snapshot.data, box_id, since, changed, removed, timeline_type
+    )
+    return _encoded_json_response(request, encode_json_body(payload))
+
+
 def _find_entity(component: EntityComponent, entity_id: str) -> Optional[Any]:
     for entity in component.entities:
         if entity.entity_id == entity_id:
@@ -573,6 +670,9 @@ class OIGCloudBatteryTimelineView(HomeAssistantView):
             ?type=active - Active timeline (with applied charging plan)
             ?type=baseline - Baseline timeline (no charging plan)
             ?type=both - Both timelines (default)
+            ?since=<version> - Only intervals changed since metadata.version
+                of an earlier response; the full timeline when that version
+                is no longer in the delta history
 
         Returns:
             JSON with timeline data:
@@ -582,6 +682,7 @@ class OIGCloudBatteryTimelineView(HomeAssistantView):
                 "metadata": {
                     "box_id": "2206237016",
                     "last_update": "2025-10-28T12:00:00+01:00",
+                    "version": 1761649200000,
                     "points_count": 192,
                     "size_kb": 280
                 }
@@ -593,6 +694,20 @@ class OIGCloudBatteryTimelineView(HomeAssistantView):
         _ = request.query.get("plan", "hybrid").lower()  # legacy (single-planner)
 
         try:
+            since = request.query.get("since")
+            if since is not None:
+                response = await _serve_timeline_delta(
+                    request, hass, box_id, since, timeline_type
+                )
+                if response is not None:
+                    return response
+
+            response = await _serve_pre_encoded(
+                request, hass, box_id, timeline_variant(timeline_type)
+            )
+            if response is not None:
+                return response
+
             precomputed_data = await _load_precomputed_timeline(hass, box_id)
             if precomputed_data:
                 response = _build_precomputed_response(
@@ -620,9 +735,7 @@ class OIGCloudBatteryTimelineView(HomeAssistantView):
             entity_precomputed = await _load_entity_precomputed(entity_obj)
             stored_active = None
             if entity_precomputed:
-                stored_active = entity_precomputed.get(
-                    "timeline"
-                ) or entity_precomputed.get("timeline_hybrid")
+                stored_active = precomputed_artifact(entity_precomputed, TIMELINE)
                 if stored_active:
                     _LOGGER.debug(
                         "API: Serving hybrid timeline from precomputed storage for %s",
@@ -1054,6 +1167,12 @@ class OIGCloudUnifiedCostTileView(HomeAssistantView):
         mode = "hybrid"
 
         try:
+            response = await _serve_pre_encoded(
+                request, hass, box_id, VARIANT_UNIFIED_COST_TILE
+            )
+            if response is not None:
+                return response
+
             precomputed_data = await _load_precomputed_data(hass, box_id)
             response_payload = _build_precomputed_tile_payload(
                 precomputed_data, mode
@@ -1109,16 +1228,9 @@ async def _load_precomputed_data(
 def _build_precomputed_tile_payload(
     precomputed_data: Optional[Dict[str, Any]], mode: str
 ) -> Optional[Dict[str, Any]]:
-    if not precomputed_data:
-        return None
-    tile_key = _pick_unified_cost_tile_key(precomputed_data)
-    tile_payload = precomputed_data.get(tile_key)
-    if not tile_payload:
+    response_payload = build_unified_cost_tile_payload(precomputed_data)
+    if response_payload is None:
         return None
-    response_payload = dict(tile_payload)
-    comparison_summary = precomputed_data.get("cost_comparison")
-    if comparison_summary and isinstance(response_payload, dict):
-        response_payload["comparison"] = comparison_summary
     _LOGGER.debug(
         "API: Serving %s unified cost tile from precomputed storage",
         mode,
@@ -1126,12 +1238,6 @@ def _build_precomputed_tile_payload(
     return response_payload
 
 
-def _pick_unified_cost_tile_key(precomputed_data: Dict[str, Any]) -> str:
-    if precomputed_data.get("unified_cost_tile"):
-        return "unified_cost_tile"
-    return "unified_cost_tile_hybrid"
-
-
 def _resolve_battery_forecast_entity(
     hass: HomeAssistant, box_id: str
 ) -> Optional[Any]:
@@ -1173,13 +1279,7 @@ def _json_error(message: str, *, status: int) -> web.Response:
 
 
 def _filter_detail_tabs(detail_tabs: Dict[str, Any], tab: Optional[str]) -> Dict[str, Any]:
-    if tab and tab in ["yesterday", "today", "tomorrow"]:
-        return {tab: detail_tabs.get(tab, {})}
-    return {
-        "yesterday": detail_tabs.get("yesterday", {}),
-        "today": detail_tabs.get("today", {}),
-        "tomorrow": detail_tabs.get("tomorrow", {}),
-    }
+    return filter_detail_tabs(detail_tabs, tab)
 
 
 async def _load_detail_tabs_from_store(
@@ -1192,7 +1292,7 @@ async def _load_detail_tabs_from_store(
         loaded: Optional[Dict[str, Any]] = await store.async_load()
         if not isinstance(loaded, dict):
             return None
-        return loaded.get("detail_tabs") or loaded.get("detail_tabs_hybrid")
+        return precomputed_artifact(loaded, DETAIL_TABS)
     except Exception as storage_error:
         _LOGGER.warning(
             "Failed to read precomputed detail tabs data (fast path): %s",
@@ -1213,9 +1313,7 @@ async def _load_detail_tabs_from_entity_store(
         precomputed_data = await entity_obj._precomputed_store.async_load()
         if not precomputed_data:
             return None
-        detail_tabs = precomputed_data.get("detail_tabs") or precomputed_data.get(
-            "detail_tabs_hybrid"
-        )
+        detail_tabs = precomputed_artifact(precomputed_data, DETAIL_TABS)
         if not detail_tabs:
             _LOGGER.debug("API: detail_tabs missing in precomputed store")
             return None
@@ -1318,6 +1416,12 @@ class OIGCloudDetailTabsView(HomeAssistantView):
         plan_key = "hybrid"
 
         try:
+            response = await _serve_pre_encoded(
+                request, hass, box_id, detail_tabs_variant(tab)
+            )
+            if response is not None:
+                return response
+
             detail_tabs = await _load_detail_tabs_from_store(hass, box_id)
             if detail_tabs:
                 return web.json_response(_filter_detail_tabs(detail_tabs, tab))
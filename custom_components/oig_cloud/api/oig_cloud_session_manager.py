@@ -26,8 +26,10 @@ _LOGGER = logging.getLogger(__name__)
 # Session TTL: 30 minut (bezpečná rezerva)
 SESSION_TTL = timedelta(minutes=30)
 
-# Rate limiting: max 1 request per second
+# Rate limiting: token bucket refilled at 1 request per second, allowing short
+# bursts (e.g. the four concurrent extended-stats calls) without sleeping.
 MIN_REQUEST_INTERVAL = timedelta(seconds=1)
+RATE_LIMIT_BURST = 4
 
 
 class OigCloudSessionManager:
@@ -42,6 +44,7 @@ class OigCloudSessionManager:
         self._api = api
         self._last_auth_time: Optional[datetime] = None
         self._last_request_time: Optional[datetime] = None
+        self._rate_tokens: float = float(RATE_LIMIT_BURST)
         self._auth_lock = asyncio.Lock()
         self._request_lock = asyncio.Lock()
         self._telemetry_emitter: Optional[Any] = None
@@ -63,7 +66,8 @@ class OigCloudSessionManager:
         )
         _LOGGER.info(f"📊 Session TTL: {SESSION_TTL.total_seconds() / 60:.0f} minutes")
         _LOGGER.info(
-            f"⏱️  Rate limit: {MIN_REQUEST_INTERVAL.total_seconds():.1f}s between requests"
+            f"⏱️  Rate limit: {MIN_REQUEST_INTERVAL.total_seconds():.1f}s per token, "
+            f"burst {RATE_LIMIT_BURST}"
         )
 
     @property
@@ -400,18 +404,25 @@ class OigCloudSessionManager:
                 )
 
     async def _rate_limit(self) -> None:
-        """Enforce rate limiting between requests."""
+        """Enforce rate limiting between requests (token bucket)."""
+        interval = MIN_REQUEST_INTERVAL.total_seconds()
         async with self._request_lock:
             if self._last_request_time is not None:
-                elapsed = datetime.now() - self._last_request_time
-                if elapsed < MIN_REQUEST_INTERVAL:
-                    self._stats["rate_limited_count"] += 1
-                    sleep_time = (MIN_REQUEST_INTERVAL - elapsed).total_seconds()
-                    _LOGGER.debug(
-                        f"⏸️  Rate limiting: sleeping {sleep_time:.2f}s (total rate-limited: {self._stats['rate_limited_count']})"
-                    )
-                    await asyncio.sleep(sleep_time)
+                elapsed = (datetime.now() - self._last_request_time).total_seconds()
+                self._rate_tokens = min(
+                    float(RATE_LIMIT_BURST),
+                    self._rate_tokens + max(elapsed, 0.0) / interval,
+                )
+            if self._rate_tokens < 1.0:
+                self._stats["rate_limited_count"] += 1
+                sleep_time = (1.0 - self._rate_tokens) * interval
+                _LOGGER.debug(
+                    f"⏸️  Rate limiting: sleeping {sleep_time:.2f}s (total rate-limited: {self._stats['rate_limited_count']})"
+                )
+                await asyncio.sleep(sleep_time)
+                self._rate_tokens = 1.0
 
+            self._rate_tokens -= 1.0
             self._last_request_time = datetime.now()
 
     async def _call_with_retry(
@@ -685,9 +696,12 @@ class OigCloudSessionManager:
         _LOGGER.info("=" * 60)
         _LOGGER.debug("SessionManager closing")
 
-        # OigCloudApi handles its own session cleanup
+        close_api = getattr(self._api, "close", None)
+        if asyncio.iscoroutinefunction(close_api):
+            await close_api()
         self._last_auth_time = None
         self._last_request_time = None
+        self._rate_tokens = float(RATE_LIMIT_BURST)
 
     def get_statistics(self) -> Dict[str, Any]:
         """Get current session statistics.
@@ -17,6 +17,8 @@ import aiohttp
 import certifi
 from homeassistant.helpers.update_coordinator import UpdateFailed
 
+from ..pricing.spot_price_store import SpotPriceStore, remember_store, store_for
+
 _LOGGER = logging.getLogger(__name__)
 
 # --- NAMESPACE & SOAP ---
@@ -34,6 +36,9 @@ SOAP_ACTIONS = {
     "GetDamPricePeriodE": f"{NAMESPACE}/GetDamPricePeriodE",
 }
 
+# Interval-indexed copy of prices15m_czk_kwh persisted next to the dict.
+QH_STORE_CACHE_KEY = "prices15m_store"
+
 _SSL_CONTEXT: Optional[ssl.SSLContext] = None
 
 
@@ -191,6 +196,7 @@ class OteApi:
             cache_time = payload.get("cache_time")
             if data:
                 self._last_data = data
+                self._restore_spot_store(payload.get(QH_STORE_CACHE_KEY))
             if cache_time:
                 self._cache_time = datetime.fromisoformat(cache_time)
             _LOGGER.info("Loaded cached OTE spot prices (%s)", self._cache_path)
@@ -211,6 +217,24 @@ class OteApi:
         except Exception as err:
             _LOGGER.warning("Failed to load cached OTE spot prices: %s", err)
 
+    def _restore_spot_store(self, stored: Any) -> None:
+        """Reuse the interval-indexed store persisted with the cache."""
+        prices = self._last_data.get("prices15m_czk_kwh")
+        store = SpotPriceStore.from_dict(stored)
+        if not isinstance(prices, dict) or store is None:
+            return
+        # Same intervals and prices, not just the same count.
+        if store.to_prices() == prices:
+            remember_store(prices, store)
+
+    @property
+    def spot_store(self) -> SpotPriceStore:
+        """Interval-indexed view of the cached 15min CZK prices."""
+        prices = self._last_data.get("prices15m_czk_kwh") if self._last_data else None
+        if not isinstance(prices, dict) or not prices:
+            return SpotPriceStore()
+        return store_for(prices)
+
     async def async_load_cached_spot_prices(self) -> None:
         """Load cache from disk without blocking the event loop."""
         try:
@@ -231,6 +255,8 @@ class OteApi:
                     self._cache_time.isoformat() if self._cache_time else None
                 ),
             }
+            if self._last_data.get("prices15m_czk_kwh"):
+                payload[QH_STORE_CACHE_KEY] = self.spot_store.as_dict()
             with open(self._cache_path, "w", encoding="utf-8") as cache_file:
                 json.dump(payload, cache_file)
         except Exception as err:
@@ -490,15 +516,9 @@ class OteApi:
         if target_date is None:
             target_date = datetime.now().date()
 
-        # Vypočítat hodinu a minutu z indexu
-        hour: int = interval_index // 4
-        minute: int = (interval_index % 4) * 15
-
-        # Sestavit klíč pro vyhledání v datech
-        time_key: str = f"{target_date.strftime('%Y-%m-%d')}T{hour:02d}:{minute:02d}:00"
-
-        prices_15m: Dict[str, float] = spot_data["prices15m_czk_kwh"]
-        return prices_15m.get(time_key)
+        # O(1) lookup v indexovaném úložišti (sdíleno pro stejný dict)
+        store = store_for(spot_data["prices15m_czk_kwh"])
+        return store.price_for(target_date, interval_index)
 
     async def get_spot_prices(
         self, date: Optional[datetime] = None, force_today_only: bool = False
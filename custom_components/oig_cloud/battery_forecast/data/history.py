@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import copy
 import logging
+from bisect import bisect_right
 from datetime import datetime, timedelta, timezone
 from typing import Any, Dict, List, Optional, Set
 
@@ -176,26 +177,30 @@ async def _patch_existing_actual(
     interval was actually changed (M6: callers must persist on a patch even
     when no brand-new intervals were appended).
     """
-    patched_existing: List[Dict[str, Any]] = []
-    changed = False
-    for interval in existing_actual:
+    pending: List[tuple[int, datetime]] = []
+    for idx, interval in enumerate(existing_actual):
         if (
             interval.get("net_cost") is not None
             and interval.get("backup_net_cost") is not None
         ):
-            patched_existing.append(interval)
             continue
         start_dt = _parse_interval_start(interval.get("time"))
-        if start_dt is None:
-            patched_existing.append(interval)
-            continue
-        interval_end = start_dt + timedelta(minutes=15)
-        historical_patch = await fetch_interval_from_history(
-            sensor, start_dt, interval_end
-        )
+        if start_dt is not None:
+            pending.append((idx, start_dt))
+
+    patched_existing: List[Dict[str, Any]] = list(existing_actual)
+    changed = False
+    if not pending:
+        return patched_existing, changed
+
+    history_by_start = await fetch_intervals_from_history(
+        sensor, [start_dt for _, start_dt in pending]
+    )
+    for idx, start_dt in pending:
+        historical_patch = history_by_start.get(start_dt)
         if historical_patch:
-            interval = {
-                **interval,
+            patched_existing[idx] = {
+                **existing_actual[idx],
                 "net_cost": round(historical_patch.get("net_cost", 0), 2),
                 "backup_net_cost": historical_patch.get("backup_net_cost"),
                 "backup_grid_import_kwh": round(
@@ -208,7 +213,6 @@ async def _patch_existing_actual(
                 "export_price": round(historical_patch.get("export_price", 0), 2),
             }
             changed = True
-        patched_existing.append(interval)
     return patched_existing, changed
 
 
@@ -218,24 +222,24 @@ async def _build_new_actual_intervals(
     now: datetime,
     existing_times: set[str],
 ) -> List[Dict[str, Any]]:
+    missing_times: List[datetime] = []
     current_time = start_time
-    new_intervals: List[Dict[str, Any]] = []
-
     while current_time <= now:
-        interval_time_str = current_time.isoformat()
-        if interval_time_str in existing_times:
-            current_time += timedelta(minutes=15)
-            continue
+        if current_time.isoformat() not in existing_times:
+            missing_times.append(current_time)
+        current_time += timedelta(minutes=15)
 
-        actual_data = await fetch_interval_from_history(
-            sensor, current_time, current_time + timedelta(minutes=15)
-        )
+    new_intervals: List[Dict[str, Any]] = []
+    if not missing_times:
+        return new_intervals
+
+    history_by_start = await fetch_intervals_from_history(sensor, missing_times)
+    for interval_time in missing_times:
+        actual_data = history_by_start.get(interval_time)
         if actual_data:
             new_intervals.append(
-                _build_actual_interval_entry(current_time, actual_data)
+                _build_actual_interval_entry(interval_time, actual_data)
             )
-
-        current_time += timedelta(minutes=15)
     return new_intervals
 
 
@@ -289,7 +293,178 @@ def _expand_modes_to_intervals(
     return historical_modes_lookup
 
 
-async def fetch_interval_from_history(  # noqa: C901
+def _interval_metrics(
+    sensor: Any,
+    states: Dict[str, list[Any]],
+    start_time: datetime,
+    end_time: datetime,
+) -> Dict[str, Any]:
+    """Derive the actual-interval metrics from per-entity recorder states."""
+    box_id = sensor._box_id  # pylint: disable=protected-access
+
+    def _states(entity_id: str) -> list[Any]:
+        return states.get(entity_id, [])
+
+    consumption_kwh = _calc_delta_kwh(
+        _states(f"sensor.oig_{box_id}_ac_out_en_day"), start_time, end_time
+    )
+    grid_import_kwh = _calc_delta_kwh(
+        _states(f"sensor.oig_{box_id}_ac_in_ac_ad"), start_time, end_time
+    )
+    grid_export_kwh = _calc_delta_kwh(
+        _states(f"sensor.oig_{box_id}_ac_in_ac_pd"), start_time, end_time
+    )
+    solar_kwh = _calc_delta_kwh(
+        _states(f"sensor.oig_{box_id}_dc_in_fv_ad"), start_time, end_time
+    )
+
+    battery_soc = _safe_float(
+        _get_value_at_end(_states(f"sensor.oig_{box_id}_batt_bat_c"), end_time)
+    )
+    mode_raw = _get_value_at_end(
+        _states(f"sensor.oig_{box_id}_box_prms_mode"), end_time
+    )
+
+    battery_kwh = 0.0
+    if battery_soc is not None:
+        total_capacity = (
+            sensor._get_total_battery_capacity() or 0.0
+        )  # pylint: disable=protected-access
+        if total_capacity > 0:
+            battery_kwh = (battery_soc / 100.0) * total_capacity
+
+    spot_price = (
+        _safe_float(
+            _get_last_value(
+                _states(f"sensor.oig_{box_id}_spot_price_current_15min")
+            )
+        )
+        or 0.0
+    )
+    export_price = (
+        _safe_float(
+            _get_last_value(
+                _states(f"sensor.oig_{box_id}_export_price_current_15min")
+            )
+        )
+        or 0.0
+    )
+
+    import_cost = grid_import_kwh * spot_price
+    export_revenue = grid_export_kwh * export_price
+    net_cost = import_cost - export_revenue
+
+    # Záloha-only attribution: the planner/battery only controls the
+    # backed-up load. Strip the non-backup draw (car etc.) and the
+    # battery's grid-charging (incl. forced balancing) from the import so
+    # the savings comparison reflects only what the control influences.
+    nonbackup_kwh = _calc_delta_kwh(
+        _states(f"sensor.oig_{box_id}_computed_nonbackup_consumption_today"),
+        start_time,
+        end_time,
+    )
+    batt_grid_charge_kwh = _calc_delta_kwh(
+        _states(f"sensor.oig_{box_id}_computed_batt_charge_grid_energy_today"),
+        start_time,
+        end_time,
+    )
+    backup_grid_import_kwh = max(
+        0.0, grid_import_kwh - nonbackup_kwh - batt_grid_charge_kwh
+    )
+    backup_net_cost = backup_grid_import_kwh * spot_price - export_revenue
+
+    mode = (
+        map_mode_name_to_id(str(mode_raw))
+        if mode_raw is not None
+        else CBB_MODE_HOME_I
+    )
+
+    mode_name = CBB_MODE_NAMES.get(mode, "HOME I")
+
+    return {
+        "battery_kwh": round(battery_kwh, 2),
+        "battery_soc": round(battery_soc, 1) if battery_soc is not None else 0.0,
+        "mode": mode,
+        "mode_name": mode_name,
+        "solar_kwh": round(solar_kwh, 3),
+        "consumption_kwh": round(consumption_kwh, 3),
+        "grid_import": round(grid_import_kwh, 3),
+        "grid_export": round(grid_export_kwh, 3),
+        "spot_price": round(spot_price, 2),
+        "export_price": round(export_price, 2),
+        "net_cost": round(net_cost, 2),
+        "nonbackup_kwh": round(nonbackup_kwh, 3),
+        "backup_grid_import_kwh": round(backup_grid_import_kwh, 3),
+        "backup_net_cost": round(backup_net_cost, 2),
+    }
+
+
+async def _query_history_states(
+    sensor: Any, start_time: datetime, end_time: datetime
+) -> Dict[str, list[Any]]:
+    """One recorder round trip for all actual-interval entities."""
+    from homeassistant.components.recorder.history import get_significant_states
+    from homeassistant.helpers.recorder import get_instance
+
+    entity_ids = _build_history_entity_ids(
+        sensor._box_id  # pylint: disable=protected-access
+    )
+    recorder_instance = get_instance(sensor._hass)  # pylint: disable=protected-access
+    states = await recorder_instance.async_add_executor_job(
+        get_significant_states,
+        sensor._hass,  # pylint: disable=protected-access
+        start_time,
+        end_time,
+        entity_ids,
+        None,
+        True,
+    )
+    return states or {}
+
+
+class _StartState:
+    """Recorder state re-stamped to an interval start (include_start_time_state)."""
+
+    __slots__ = ("state", "last_updated", "last_changed")
+
+    def __init__(self, state: Any, start_utc: datetime) -> None:
+        self.state = state.state
+        self.last_updated = start_utc
+        self.last_changed = start_utc
+
+
+class _HistorySeries:
+    """Time-sorted recorder states of one entity, sliced per interval by bisect."""
+
+    __slots__ = ("_states", "_times")
+
+    def __init__(self, entity_states: list[Any]) -> None:
+        pairs = sorted(
+            ((_state_last_updated_utc(s), s) for s in entity_states),
+            key=lambda pair: pair[0],
+        )
+        self._times = [pair[0] for pair in pairs]
+        self._states = [pair[1] for pair in pairs]
+
+    def window(self, start_time: datetime, end_time: datetime) -> list[Any]:
+        """States a recorder query for [start_time, end_time] would return.
+
+        The last state at or before the start is reported at the start time,
+        followed by every state updated inside the window.
+        """
+        start_utc = _as_utc(start_time)
+        lo = bisect_right(self._times, start_utc)
+        hi = bisect_right(self._times, _as_utc(end_time))
+        window = self._states[lo:hi]
+        if lo:
+            prev = self._states[lo - 1]
+            if self._times[lo - 1] < start_utc:
+                prev = _StartState(prev, start_utc)
+            window = [prev, *window]
+        return window
+
+
+async def fetch_interval_from_history(
     sensor: Any, start_time: datetime, end_time: datetime
 ) -> Optional[Dict[str, Any]]:
     """Load actual data for a 15-min interval from HA history."""
@@ -309,121 +484,11 @@ async def fetch_interval_from_history(  # noqa: C901
         )
 
     try:
-        from homeassistant.components.recorder.history import get_significant_states
-        from homeassistant.helpers.recorder import get_instance
-
-        box_id = sensor._box_id  # pylint: disable=protected-access
-        entity_ids = _build_history_entity_ids(box_id)
-
-        recorder_instance = get_instance(sensor._hass)  # pylint: disable=protected-access
-        states = await recorder_instance.async_add_executor_job(
-            get_significant_states,
-            sensor._hass,
-            start_time,
-            end_time,
-            entity_ids,
-            None,
-            True,
-        )
-
+        states = await _query_history_states(sensor, start_time, end_time)
         if not states:
             return None
 
-        def _states(entity_id: str) -> list[Any]:
-            return states.get(entity_id, [])
-
-        consumption_kwh = _calc_delta_kwh(
-            _states(f"sensor.oig_{box_id}_ac_out_en_day"), start_time, end_time
-        )
-        grid_import_kwh = _calc_delta_kwh(
-            _states(f"sensor.oig_{box_id}_ac_in_ac_ad"), start_time, end_time
-        )
-        grid_export_kwh = _calc_delta_kwh(
-            _states(f"sensor.oig_{box_id}_ac_in_ac_pd"), start_time, end_time
-        )
-        solar_kwh = _calc_delta_kwh(
-            _states(f"sensor.oig_{box_id}_dc_in_fv_ad"), start_time, end_time
-        )
-
-        battery_soc = _safe_float(
-            _get_value_at_end(_states(f"sensor.oig_{box_id}_batt_bat_c"), end_time)
-        )
-        mode_raw = _get_value_at_end(
-            _states(f"sensor.oig_{box_id}_box_prms_mode"), end_time
-        )
-
-        battery_kwh = 0.0
-        if battery_soc is not None:
-            total_capacity = (
-                sensor._get_total_battery_capacity() or 0.0
-            )  # pylint: disable=protected-access
-            if total_capacity > 0:
-                battery_kwh = (battery_soc / 100.0) * total_capacity
-
-        spot_price = (
-            _safe_float(
-                _get_last_value(
-                    _states(f"sensor.oig_{box_id}_spot_price_current_15min")
-                )
-            )
-            or 0.0
-        )
-        export_price = (
-            _safe_float(
-                _get_last_value(
-                    _states(f"sensor.oig_{box_id}_export_price_current_15min")
-                )
-            )
-            or 0.0
-        )
-
-        import_cost = grid_import_kwh * spot_price
-        export_revenue = grid_export_kwh * export_price
-        net_cost = import_cost - export_revenue
-
-        # Záloha-only attribution: the planner/battery only controls the
-        # backed-up load. Strip the non-backup draw (car etc.) and the
-        # battery's grid-charging (incl. forced balancing) from the import so
-        # the savings comparison reflects only what the control influences.
-        nonbackup_kwh = _calc_delta_kwh(
-            _states(f"sensor.oig_{box_id}_computed_nonbackup_consumption_today"),
-            start_time,
-            end_time,
-        )
-        batt_grid_charge_kwh = _calc_delta_kwh(
-            _states(f"sensor.oig_{box_id}_computed_batt_charge_grid_energy_today"),
-            start_time,
-            end_time,
-        )
-        backup_grid_import_kwh = max(
-            0.0, grid_import_kwh - nonbackup_kwh - batt_grid_charge_kwh
-        )
-        backup_net_cost = backup_grid_import_kwh * spot_price - export_revenue
-
-        mode = (
-            map_mode_name_to_id(str(mode_raw))
-            if mode_raw is not None
-            else CBB_MODE_HOME_I
-        )
-
-        mode_name = CBB_MODE_NAMES.get(mode, "HOME I")
-
-        result = {
-            "battery_kwh": round(battery_kwh, 2),
-            "battery_soc": round(battery_soc, 1) if battery_soc is not None else 0.0,
-            "mode": mode,
-            "mode_name": mode_name,
-            "solar_kwh": round(solar_kwh, 3),
-            "consumption_kwh": round(consumption_kwh, 3),
-            "grid_import": round(grid_import_kwh, 3),
-            "grid_export": round(grid_export_kwh, 3),
-            "spot_price": round(spot_price, 2),
-            "export_price": round(export_price, 2),
-            "net_cost": round(net_cost, 2),
-            "nonbackup_kwh": round(nonbackup_kwh, 3),
-            "backup_grid_import_kwh": round(backup_grid_import_kwh, 3),
-            "backup_net_cost": round(backup_net_cost, 2),
-        }
+        result = _interval_metrics(sensor, states, start_time, end_time)
 
         if log_rl:
             log_rl(
@@ -431,8 +496,8 @@ async def fetch_interval_from_history(  # noqa: C901
                 "debug",
                 "[fetch_interval_from_history] sample %s -> soc=%s kwh=%.2f cons=%.3f net=%.2f",
                 start_time.strftime(LOG_DATETIME_FMT),
-                battery_soc,
-                battery_kwh,
+                result["battery_soc"],
+                result["battery_kwh"],
                 result["consumption_kwh"],
                 result["net_cost"],
                 cooldown_s=900.0,
@@ -445,6 +510,74 @@ async def fetch_interval_from_history(  # noqa: C901
         return None
 
 
+async def fetch_intervals_from_history(
+    sensor: Any,
+    interval_starts: List[datetime],
+    *,
+    interval_minutes: int = 15,
+) -> Dict[datetime, Dict[str, Any]]:
+    """Load actual data for many intervals with a single recorder query.
+
+    The entity series covering all requested intervals are fetched once and
+    each interval is sliced in memory, so backfilling a day costs one DB round
+    trip instead of one per 15-min slot. Intervals without any recorded data
+    are omitted from the result (same as ``fetch_interval_from_history``
+    returning ``None``).
+    """
+    if not interval_starts:
+        return {}
+    if not sensor._hass:  # pylint: disable=protected-access
+        _LOGGER.debug("[fetch_intervals_from_history] No _hass instance")
+        return {}
+
+    step = timedelta(minutes=interval_minutes)
+    range_start = min(interval_starts)
+    range_end = max(interval_starts) + step
+
+    try:
+        states = await _query_history_states(sensor, range_start, range_end)
+    except Exception as err:
+        _LOGGER.warning(
+            "[OIG_CLOUD_WARNING][component=planner][corr=na][run=na] "
+            "Failed to fetch history for %s - %s: %s",
+            range_start,
+            range_end,
+            err,
+        )
+        return {}
+    if not states:
+        return {}
+
+    series = {
+        entity_id: _HistorySeries(entity_states)
+        for entity_id, entity_states in states.items()
+    }
+    results: Dict[datetime, Dict[str, Any]] = {}
+    for start_time in interval_starts:
+        end_time = start_time + step
+        interval_states = {
+            entity_id: entity_series.window(start_time, end_time)
+            for entity_id, entity_series in series.items()
+        }
+        if not any(interval_states.values()):
+            continue
+        try:
+            results[start_time] = _interval_metrics(
+                sensor, interval_states, start_time, end_time
+            )
+        except Exception as err:
+            _LOGGER.warning("[OIG_CLOUD_WARNING][component=planner][corr=na][run=na] " + "Failed to fetch history for %s: %s", start_time, err)
+
+    _LOGGER.debug(
+        "[fetch_intervals_from_history] %s/%s intervals from one query (%s - %s)",
+        len(results),
+        len(interval_starts),
+        range_start.strftime(LOG_DATETIME_FMT),
+        range_end.strftime(LOG_DATETIME_FMT),
+    )
+    return results
+
+
 async def update_actual_from_history(sensor: Any) -> None:
     """Load actual values from HA history for today."""
     now = dt_util.now()
@@ -621,6 +754,23 @@ def map_mode_name_to_id(mode_name: str) -> int:
     return mode_id
 
 
+async def fetch_mode_changes(
+    sensor: Any, start_time: datetime, end_time: datetime
+) -> list[dict[str, Any]]:
+    """Recorder mode changes in [start_time, end_time], normalized and sorted."""
+    mode_history = await fetch_mode_history_from_recorder(sensor, start_time, end_time)
+    return _normalize_mode_history(mode_history)
+
+
+def expand_modes_to_intervals(
+    mode_changes: List[Dict[str, Any]],
+    day_start: datetime,
+    fetch_end: datetime,
+) -> Dict[str, Dict[str, Any]]:
+    """Active mode per 15-min interval from ``day_start`` up to ``fetch_end``."""
+    return _expand_modes_to_intervals(mode_changes, day_start, fetch_end)
+
+
 async def build_historical_modes_lookup(
     sensor: Any,
     *,
@@ -633,8 +783,7 @@ async def build_historical_modes_lookup(
     if not sensor._hass:  # pylint: disable=protected-access
         return {}
 
-    mode_history = await fetch_mode_history_from_recorder(sensor, day_start, fetch_end)
-    mode_changes = _normalize_mode_history(mode_history)
+    mode_changes = await fetch_mode_changes(sensor, day_start, fetch_end)
     historical_modes_lookup = _expand_modes_to_intervals(
         mode_changes, day_start, fetch_end
     )
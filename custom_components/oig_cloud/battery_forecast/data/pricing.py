@@ -9,6 +9,11 @@ from typing import Any, Dict, List, Optional
 
 from ...api.ote_api import OteApi
 from ...const import OTE_SPOT_PRICE_CACHE_FILE
+from ...pricing.price_engine import (
+    PricingOptions,
+    price_arrays,
+    resolve_pricing_options,
+)
 from ..utils_common import get_tariff_for_datetime
 
 _LOGGER = logging.getLogger(__name__)
@@ -29,53 +34,25 @@ def _get_pricing_config(sensor: Any) -> Dict[str, Any]:
     )
 
 
+def _pricing_options(config: Dict[str, Any]) -> PricingOptions:
+    return resolve_pricing_options(
+        config,
+        lambda when: get_tariff_for_datetime(when, config),
+        scheme=get_tariff_for_datetime,
+        decimal_rounding=True,
+    )
+
+
 def _calculate_commercial_price(
     raw_spot_price: float, target_datetime: datetime, config: Dict[str, Any]
 ) -> float:
-    pricing_model = config.get("spot_pricing_model", "percentage")
-    positive_fee_percent = config.get("spot_positive_fee_percent", 15.0)
-    negative_fee_percent = config.get("spot_negative_fee_percent", 9.0)
-    fixed_fee_mwh = config.get("spot_fixed_fee_mwh", 0.0)
-    positive_fee_percent_nt = config.get(
-        "spot_positive_fee_percent_nt", positive_fee_percent
-    )
-    negative_fee_percent_nt = config.get(
-        "spot_negative_fee_percent_nt", negative_fee_percent
-    )
-    fixed_fee_mwh_nt = config.get("spot_fixed_fee_mwh_nt", fixed_fee_mwh)
-
-    if pricing_model == "percentage":
-        current_tariff = get_tariff_for_datetime(target_datetime, config)
-        if raw_spot_price >= 0:
-            fee_percent = (
-                positive_fee_percent_nt
-                if current_tariff == "NT"
-                else positive_fee_percent
-            )
-            return raw_spot_price * (1 + fee_percent / 100.0)
-        fee_percent = (
-            negative_fee_percent_nt if current_tariff == "NT" else negative_fee_percent
-        )
-        return raw_spot_price * (1 - fee_percent / 100.0)
-    if pricing_model == "fixed_prices":
-        fixed_price_vt = config.get("fixed_commercial_price_vt", 4.50)
-        fixed_price_nt = config.get("fixed_commercial_price_nt", fixed_price_vt)
-        current_tariff = get_tariff_for_datetime(target_datetime, config)
-        return fixed_price_vt if current_tariff == "VT" else fixed_price_nt
-
-    current_tariff = get_tariff_for_datetime(target_datetime, config)
-    fee_mwh = fixed_fee_mwh_nt if current_tariff == "NT" else fixed_fee_mwh
-    fixed_fee_kwh = fee_mwh / 1000.0
-    return raw_spot_price + fixed_fee_kwh
+    options = _pricing_options(config)
+    return options.commercial_price(raw_spot_price, options.tariff(target_datetime))
 
 
 def _get_distribution_fee(target_datetime: datetime, config: Dict[str, Any]) -> float:
-    distribution_fee_vt_kwh = config.get("distribution_fee_vt_kwh", 1.50)
-    distribution_fee_nt_kwh = config.get("distribution_fee_nt_kwh", 1.20)
-    current_tariff = get_tariff_for_datetime(target_datetime, config)
-    return (
-        distribution_fee_vt_kwh if current_tariff == "VT" else distribution_fee_nt_kwh
-    )
+    options = _pricing_options(config)
+    return options.distribution_fee(options.tariff(target_datetime))
 
 
 async def _resolve_spot_data(
@@ -214,17 +191,8 @@ def calculate_final_spot_price(
     sensor: Any, raw_spot_price: float, target_datetime: datetime
 ) -> float:
     """Return final spot price including fees, distribution, and VAT."""
-    config = _get_pricing_config(sensor)
-    vat_rate = config.get("vat_rate", 21.0)
-    commercial_price = _calculate_commercial_price(
-        raw_spot_price, target_datetime, config
-    )
-    distribution_fee = _get_distribution_fee(target_datetime, config)
-
-    price_without_vat = Decimal(str(commercial_price)) + Decimal(str(distribution_fee))
-    vat_multiplier = Decimal("1") + (Decimal(str(vat_rate)) / Decimal("100"))
-    final_price = price_without_vat * vat_multiplier
-    return _round_czk(final_price)
+    options = _pricing_options(_get_pricing_config(sensor))
+    return options.import_price(raw_spot_price, options.tariff(target_datetime))
 
 
 def _build_price_timeline(
@@ -256,29 +224,38 @@ async def get_spot_price_timeline(sensor: Any) -> List[Dict[str, Any]]:
         return []
 
     price_sensor = _get_price_sensor_entity(sensor, price_type="spot")
-    sensor_price_fn = None
-    if price_sensor is not None:
-        sensor_price_fn = getattr(price_sensor, "_calculate_interval_price", None)
-        if not callable(sensor_price_fn):
-            sensor_price_fn = None
-
-    computed_prices: Dict[str, Any] = {}
-    for timestamp_str, raw_spot_price in raw_prices_dict.items():
-        try:
-            target_datetime = datetime.fromisoformat(timestamp_str)
-            if sensor_price_fn is not None:
+    sensor_options_fn = getattr(price_sensor, "pricing_options", None)
+    sensor_price_fn = getattr(price_sensor, "_calculate_interval_price", None)
+    if price_sensor is None or not callable(sensor_price_fn):
+        sensor_price_fn = None
+
+    if callable(sensor_options_fn) or sensor_price_fn is None:
+        # Same cached arrays the price sensor publishes; falls back to the
+        # planner's own tariff schedule without a price sensor.
+        options = (
+            sensor_options_fn()
+            if callable(sensor_options_fn)
+            else _pricing_options(_get_pricing_config(sensor))
+        )
+        arrays = price_arrays(raw_prices_dict, options, skip_invalid=True)
+        if arrays.dropped:
+            _LOGGER.warning("[OIG_CLOUD_WARNING][component=planner][corr=na][run=na] " + "Skipped %s invalid timestamps in spot prices", arrays.dropped)
+        timeline = [
+            {"time": time_key, "price": price}
+            for time_key, price in zip(arrays.keys, arrays.import_price)
+        ]
+    else:
+        computed_prices: Dict[str, Any] = {}
+        for timestamp_str, raw_spot_price in raw_prices_dict.items():
+            try:
+                target_datetime = datetime.fromisoformat(timestamp_str)
                 computed_prices[timestamp_str] = sensor_price_fn(
                     raw_spot_price, target_datetime
                 )
-            else:
-                computed_prices[timestamp_str] = calculate_final_spot_price(
-                    sensor, raw_spot_price, target_datetime
-                )
-        except ValueError:
-            _LOGGER.warning("[OIG_CLOUD_WARNING][component=planner][corr=na][run=na] " + "Invalid timestamp in spot prices: %s", timestamp_str)
-            continue
-
-    timeline = _build_price_timeline(computed_prices, label="spot")
+            except ValueError:
+                _LOGGER.warning("[OIG_CLOUD_WARNING][component=planner][corr=na][run=na] " + "Invalid timestamp in spot prices: %s", timestamp_str)
+                continue
+        timeline = _build_price_timeline(computed_prices, label="spot")
 
     _LOGGER.info(
         "Loaded %s spot price points from coordinator (final price with fees)",
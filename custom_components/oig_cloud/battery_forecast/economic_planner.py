@@ -156,21 +156,8 @@ def _percentile_threshold(values: List[float], percentile: float) -> float:
     return ordered[lower] + (ordered[upper] - ordered[lower]) * frac
 
 
-def find_expensive_import_moments(
-    states: List[SimulatedState],
-    inputs: PlannerInputs,
-) -> List[CriticalMoment]:
-    """Emit EXPENSIVE_IMPORT moments from a baseline (all-HOME_I) simulation.
-
-    A moment is created for every baseline interval that imports from the grid
-    (grid_import > 0) at a price >= the P-th percentile of the horizon prices.
-    These are the periods the LOCKED design wants to displace by pre-charging
-    the battery in cheaper, earlier windows.
-    """
-    moments: List[CriticalMoment] = []
-    if not states:
-        return moments
-
+def _expensive_import_thresholds(inputs: PlannerInputs) -> List[float]:
+    """Per-interval price threshold at/above which a grid import is expensive."""
     prices = [max(0.0, p) for p in inputs.prices]
     days = inputs.interval_days
     if days and len(days) == len(prices):
@@ -184,21 +171,29 @@ def find_expensive_import_moments(
             day: _percentile_threshold(values, inputs.expensive_percentile)
             for day, values in by_day.items()
         }
-        thresholds = [day_threshold[days[idx]] for idx in range(len(prices))]
-    else:
-        whole = _percentile_threshold(prices, inputs.expensive_percentile)
-        thresholds = [whole] * len(prices)
+        return [day_threshold[days[idx]] for idx in range(len(prices))]
+    whole = _percentile_threshold(prices, inputs.expensive_percentile)
+    return [whole] * len(prices)
 
-    for interval, state in enumerate(states):
-        price = prices[interval] if interval < len(prices) else 0.0
-        if state.grid_import_kwh <= 0.0:
+
+def _expensive_import_moments_from(
+    soc_after: List[float],
+    grid_imports: List[float],
+    inputs: PlannerInputs,
+    thresholds: List[float],
+) -> List[CriticalMoment]:
+    moments: List[CriticalMoment] = []
+    prices = inputs.prices
+    for interval, grid_import in enumerate(grid_imports):
+        price = max(0.0, prices[interval]) if interval < len(prices) else 0.0
+        if grid_import <= 0.0:
             continue
         if price + _PRICE_EPS_CZK < thresholds[interval]:
             continue
 
         # The "deficit" for an expensive import is the energy we would like the
         # battery to have supplied instead of the grid at this interval.
-        deficit = state.grid_import_kwh
+        deficit = grid_import
         intervals_needed = (
             ceil(deficit / inputs.charge_rate_per_interval)
             if inputs.charge_rate_per_interval > 0.0
@@ -211,7 +206,7 @@ def find_expensive_import_moments(
                 deficit_kwh=deficit,
                 intervals_needed=intervals_needed,
                 must_start_charging=max(0, interval - intervals_needed),
-                soc_kwh=state.soc_kwh,
+                soc_kwh=soc_after[interval],
                 price_czk=price,
             )
         )
@@ -219,48 +214,153 @@ def find_expensive_import_moments(
     return moments
 
 
-def _compute_soc_trajectory(modes: List[int], inputs: PlannerInputs) -> List[float]:
-    soc_trajectory: List[float] = []
-    soc = max(inputs.hw_min_kwh, min(inputs.current_soc_kwh, inputs.max_capacity_kwh))
+def find_expensive_import_moments(
+    states: List[SimulatedState],
+    inputs: PlannerInputs,
+) -> List[CriticalMoment]:
+    """Emit EXPENSIVE_IMPORT moments from a baseline (all-HOME_I) simulation.
 
-    for i, mode in enumerate(modes):
-        soc_trajectory.append(soc)
-        solar = max(0.0, inputs.solar_forecast[i])
-        load = max(0.0, inputs.load_forecast[i])
-        price = max(0.0, inputs.prices[i])
-        soc, _, _, _ = _simulate_interval(soc, solar, load, price, inputs, mode)
+    A moment is created for every baseline interval that imports from the grid
+    (grid_import > 0) at a price >= the P-th percentile of the horizon prices.
+    These are the periods the LOCKED design wants to displace by pre-charging
+    the battery in cheaper, earlier windows.
+    """
+    if not states:
+        return []
+    return _expensive_import_moments_from(
+        [state.soc_kwh for state in states],
+        [state.grid_import_kwh for state in states],
+        inputs,
+        _expensive_import_thresholds(inputs),
+    )
 
-    soc_trajectory.append(soc)
-    return soc_trajectory
 
+class _IncrementalTrajectory:
+    """Cached planner simulation that re-simulates only the changed suffix.
+
+    The greedy loops flip one interval at a time to HOME_UPS. Instead of
+    re-running the whole horizon after every flip, the trajectory keeps the
+    per-interval SoC/import/export/cost arrays and resumes the simulation at the
+    flipped index. Because SoC is the only state carried between intervals, the
+    re-simulation stops as soon as the start-of-interval SoC matches the cached
+    value again (clamping at capacity or the HW floor makes this common), so the
+    rest of the suffix is known to be unchanged. Results are identical to a full
+    ``_simulate_with_modes`` run.
+    """
+
+    def __init__(self, modes: List[int], inputs: PlannerInputs) -> None:
+        self._inputs = inputs
+        self._modes = list(modes)
+        n = len(self._modes)
+        self._solar = [max(0.0, inputs.solar_forecast[i]) for i in range(n)]
+        self._load = [max(0.0, inputs.load_forecast[i]) for i in range(n)]
+        self._prices = [max(0.0, inputs.prices[i]) for i in range(n)]
+        start_soc = max(inputs.hw_min_kwh, min(inputs.current_soc_kwh, inputs.max_capacity_kwh))
+        # soc[i] is the SoC at the start of interval i; soc[n] is the final SoC.
+        self.soc: List[float] = [start_soc] * (n + 1)
+        self.grid_import: List[float] = [0.0] * n
+        self.grid_export: List[float] = [0.0] * n
+        self.cost: List[float] = [0.0] * n
+        # Prefix sums of storable (net) solar surplus for O(1) range queries.
+        self._surplus_prefix: List[float] = [0.0] * (n + 1)
+        for i in range(n):
+            surplus = max(0.0, self._solar[i] - self._load[i]) * DEFAULT_CHARGE_EFFICIENCY
+            self._surplus_prefix[i + 1] = self._surplus_prefix[i] + surplus
+        self.resimulated_intervals = 0
+        self._resimulate_from(0, full=True)
+
+    @property
+    def modes(self) -> List[int]:
+        """Current per-interval modes (read-only view; use ``set_mode``)."""
+        return self._modes
+
+    def __len__(self) -> int:
+        return len(self._modes)
+
+    def soc_after(self, idx: int) -> float:
+        """Return the SoC at the end of interval ``idx``."""
+        return self.soc[idx + 1]
+
+    def total_cost(self) -> float:
+        """Total import cost, summed in interval order like a full simulation."""
+        return sum(self.cost)
+
+    def set_mode(self, idx: int, mode: int) -> None:
+        """Change the mode of one interval and update the affected suffix."""
+        if self._modes[idx] == mode:
+            return
+        self._modes[idx] = mode
+        self._resimulate_from(idx)
+
+    def storable_surplus_kwh(self, start_idx: int, end_idx: int) -> float:
+        """Net solar surplus (after charge losses) the battery could absorb
+        over ``[start_idx, end_idx)``."""
+        n = len(self._modes)
+        start = max(0, start_idx)
+        end = min(end_idx, n)
+        if end <= start:
+            return 0.0
+        return self._surplus_prefix[end] - self._surplus_prefix[start]
+
+    def states(self) -> List[SimulatedState]:
+        """Materialize the cached trajectory as ``SimulatedState`` objects."""
+        return [
+            SimulatedState(
+                interval_index=i,
+                soc_kwh=self.soc[i + 1],
+                solar_kwh=self._solar[i],
+                load_kwh=self._load[i],
+                grid_import_kwh=self.grid_import[i],
+                grid_export_kwh=self.grid_export[i],
+                cost_czk=self.cost[i],
+                mode=mode,
+            )
+            for i, mode in enumerate(self._modes)
+        ]
+
+    def _resimulate_from(self, start: int, *, full: bool = False) -> None:
+        soc = self.soc[start]
+        for i in range(start, len(self._modes)):
+            if not full and i > start and soc == self.soc[i]:
+                # Re-converged onto the cached trajectory: the remaining suffix
+                # is a pure function of this SoC and the unchanged modes.
+                return
+            self.soc[i] = soc
+            soc, grid_import, grid_export, cost = _simulate_interval(
+                soc,
+                self._solar[i],
+                self._load[i],
+                self._prices[i],
+                self._inputs,
+                self._modes[i],
+            )
+            self.grid_import[i] = grid_import
+            self.grid_export[i] = grid_export
+            self.cost[i] = cost
+            self.resimulated_intervals += 1
+        self.soc[len(self._modes)] = soc
 
-def _estimate_future_storable_surplus_kwh(
-    inputs: PlannerInputs,
-    *,
-    start_idx: int,
-    end_idx: int,
-) -> float:
-    surplus_kwh = 0.0
-    bounded_end = min(end_idx, len(inputs.intervals))
-    for idx in range(max(0, start_idx), bounded_end):
-        solar = max(0.0, inputs.solar_forecast[idx])
-        load = max(0.0, inputs.load_forecast[idx])
-        surplus_kwh += max(0.0, solar - load) * DEFAULT_CHARGE_EFFICIENCY
-    return surplus_kwh
+
+def _prices_cheapest_first(inputs: PlannerInputs) -> List[int]:
+    """Interval indices ordered by price (stable, so ties keep index order)."""
+    return sorted(range(len(inputs.intervals)), key=lambda idx: inputs.prices[idx])
 
 
 def _pick_greedy_candidate_for_moment(
     *,
     moment: CriticalMoment,
-    modes: List[int],
+    trajectory: _IncrementalTrajectory,
     inputs: PlannerInputs,
+    price_order: List[int],
 ) -> int | None:
-    candidate_range = range(0, min(moment.interval, len(inputs.intervals)))
-    candidates = sorted(candidate_range, key=lambda idx: inputs.prices[idx])
-    soc_traj = _compute_soc_trajectory(modes, inputs)
+    modes = trajectory.modes
+    soc_traj = trajectory.soc
     min_useful_charge_kwh = inputs.charge_rate_per_interval * DEFAULT_CHARGE_EFFICIENCY * 0.1
+    limit = min(moment.interval, len(inputs.intervals))
 
-    for candidate_idx in candidates:
+    for candidate_idx in price_order:
+        if candidate_idx >= limit:
+            continue
         if modes[candidate_idx] == CBBMode.HOME_UPS.value:
             continue
 
@@ -272,11 +372,7 @@ def _pick_greedy_candidate_for_moment(
         if effective_charge_kwh < min_useful_charge_kwh:
             continue
 
-        future_surplus_kwh = _estimate_future_storable_surplus_kwh(
-            inputs,
-            start_idx=candidate_idx + 1,
-            end_idx=moment.interval,
-        )
+        future_surplus_kwh = trajectory.storable_surplus_kwh(candidate_idx + 1, moment.interval)
         remaining_headroom_after_charge = max(
             0.0,
             headroom_before_charge - effective_charge_kwh,
@@ -289,33 +385,60 @@ def _pick_greedy_candidate_for_moment(
     return None
 
 
+def _worst_planning_min_moment(
+    trajectory: _IncrementalTrajectory,
+    inputs: PlannerInputs,
+) -> CriticalMoment | None:
+    """Largest PLANNING_MIN breach (ties -> later interval), as in
+    ``find_critical_moments`` but read straight from the cached trajectory."""
+    planning_min = inputs.planning_min_kwh
+    worst_idx: int | None = None
+    worst_deficit = 0.0
+    for idx in range(len(trajectory)):
+        soc = trajectory.soc_after(idx)
+        if soc >= planning_min:
+            continue
+        deficit = planning_min - soc
+        if worst_idx is None or deficit >= worst_deficit:
+            worst_idx = idx
+            worst_deficit = deficit
+    if worst_idx is None:
+        return None
+    intervals_needed = ceil(worst_deficit / inputs.charge_rate_per_interval)
+    return CriticalMoment(
+        type="PLANNING_MIN",
+        interval=worst_idx,
+        deficit_kwh=worst_deficit,
+        intervals_needed=intervals_needed,
+        must_start_charging=max(0, worst_idx - intervals_needed),
+        soc_kwh=trajectory.soc_after(worst_idx),
+    )
+
+
 def _global_greedy_charge_intervals(inputs: PlannerInputs) -> List[int]:
     n = len(inputs.intervals)
     if n == 0 or inputs.charge_rate_per_interval <= 0.0:
         return []
 
-    modes = [CBBMode.HOME_I.value] * n
+    trajectory = _IncrementalTrajectory([CBBMode.HOME_I.value] * n, inputs)
+    price_order = _prices_cheapest_first(inputs)
     ups_intervals: List[int] = []
 
     for _ in range(n):
-        states = _simulate_with_modes(modes, inputs)
-        critical_moments = find_critical_moments(states, inputs)
-        if not critical_moments:
+        worst_moment = _worst_planning_min_moment(trajectory, inputs)
+        if worst_moment is None:
             break
 
-        worst_moment = max(
-            critical_moments,
-            key=lambda moment: (moment.deficit_kwh, moment.interval),
-        )
         candidate_idx = _pick_greedy_candidate_for_moment(
             moment=worst_moment,
-            modes=modes,
+            trajectory=trajectory,
             inputs=inputs,
+            price_order=price_order,
         )
         if candidate_idx is None:
             break
 
-        modes[candidate_idx] = CBBMode.HOME_UPS.value
+        trajectory.set_mode(candidate_idx, CBBMode.HOME_UPS.value)
         ups_intervals.append(candidate_idx)
 
     return sorted(ups_intervals)
@@ -344,38 +467,37 @@ def _comfort_charge_intervals(
     target = min(comfort_kwh, inputs.max_capacity_kwh)
     min_useful_charge_kwh = inputs.charge_rate_per_interval * DEFAULT_CHARGE_EFFICIENCY * 0.1
     added: List[int] = []
+    trajectory = _IncrementalTrajectory(modes, inputs)
+    soc_traj = trajectory.soc
+    price_order = _prices_cheapest_first(inputs)
 
     for _ in range(2 * n):
-        states = _simulate_with_modes(modes, inputs)
         # Earliest interval whose projected SoC dips below the comfort target.
         moment_idx: int | None = None
-        for i, state in enumerate(states):
-            if state.soc_kwh < target - _SOLAR_HEADROOM_EPS_KWH:
+        for i in range(n):
+            if trajectory.soc_after(i) < target - _SOLAR_HEADROOM_EPS_KWH:
                 moment_idx = i
                 break
         if moment_idx is None:
             break
 
-        soc_traj = _compute_soc_trajectory(modes, inputs)
         # Cheapest CHEAP window up to AND INCLUDING the dip interval (charging at
         # the dip itself lifts its end-of-interval SoC), so a battery that already
         # starts below comfort can still top up from the earliest cheap window.
-        candidates = sorted(
-            range(0, min(moment_idx + 1, n)), key=lambda idx: inputs.prices[idx]
-        )
+        candidate_limit = min(moment_idx + 1, n)
         # PV-first: if upcoming solar will lift the SoC back to the comfort target
         # on its own, this dip is transient — don't grid-charge for it (comfort is
         # a soft "descend & wait" target, the hard floor still protects). Avoids
         # buying grid for a morning dip that the day's solar refills anyway.
-        deficit_kwh = target - states[moment_idx].soc_kwh
-        future_solar_kwh = _estimate_future_storable_surplus_kwh(
-            inputs, start_idx=moment_idx, end_idx=n
-        )
+        deficit_kwh = target - trajectory.soc_after(moment_idx)
+        future_solar_kwh = trajectory.storable_surplus_kwh(moment_idx, n)
         if future_solar_kwh >= deficit_kwh - _SOLAR_HEADROOM_EPS_KWH:
             break
 
         picked: int | None = None
-        for candidate_idx in candidates:
+        for candidate_idx in price_order:
+            if candidate_idx >= candidate_limit:
+                continue
             if modes[candidate_idx] == CBBMode.HOME_UPS.value:
                 continue
             if inputs.prices[candidate_idx] > cheap_threshold + _PRICE_EPS_CZK:
@@ -404,6 +526,7 @@ def _comfort_charge_intervals(
             break  # no cheap window available — descend and wait
 
         modes[picked] = CBBMode.HOME_UPS.value
+        trajectory.set_mode(picked, CBBMode.HOME_UPS.value)
         added.append(picked)
 
     return sorted(added)
@@ -412,9 +535,9 @@ def _comfort_charge_intervals(
 def _pick_displacement_candidate(
     *,
     moment: CriticalMoment,
-    modes: List[int],
+    trajectory: _IncrementalTrajectory,
     inputs: PlannerInputs,
-    soc_traj: List[float],
+    price_order: List[int],
     blocked: set[int],
 ) -> int | None:
     """Pick an earlier interval to set HOME_UPS so it displaces ``moment``.
@@ -426,16 +549,18 @@ def _pick_displacement_candidate(
           surplus skip).
       (c) re-simulation persistence: charging must actually reach the target.
     """
-    n = len(inputs.intervals)
-    candidate_range = range(0, min(moment.interval, n))
-    candidates = sorted(candidate_range, key=lambda idx: inputs.prices[idx])
+    modes = trajectory.modes
+    soc_traj = trajectory.soc
+    limit = min(moment.interval, len(inputs.intervals))
     min_useful_charge_kwh = inputs.charge_rate_per_interval * DEFAULT_CHARGE_EFFICIENCY * 0.1
 
     apply_eta_gate = moment.type == "EXPENSIVE_IMPORT"
     expensive_price = moment.price_czk if moment.price_czk is not None else 0.0
     eta = inputs.round_trip_efficiency if inputs.round_trip_efficiency > 0.0 else 1.0
 
-    for candidate_idx in candidates:
+    for candidate_idx in price_order:
+        if candidate_idx >= limit:
+            continue
         if modes[candidate_idx] == CBBMode.HOME_UPS.value:
             continue
         if candidate_idx in blocked:
@@ -458,11 +583,7 @@ def _pick_displacement_candidate(
         if effective_charge_kwh < min_useful_charge_kwh:
             continue
 
-        future_surplus_kwh = _estimate_future_storable_surplus_kwh(
-            inputs,
-            start_idx=candidate_idx + 1,
-            end_idx=moment.interval,
-        )
+        future_surplus_kwh = trajectory.storable_surplus_kwh(candidate_idx + 1, moment.interval)
         remaining_headroom_after_charge = max(
             0.0,
             headroom_before_charge - effective_charge_kwh,
@@ -492,37 +613,38 @@ def _displace_expensive_imports(
 
     added: List[int] = []
     blocked: set[int] = set()
+    trajectory = _IncrementalTrajectory(modes, inputs)
+    price_order = _prices_cheapest_first(inputs)
+    thresholds = _expensive_import_thresholds(inputs)
 
     # Each iteration either places one UPS interval or blocks one non-improving
     # candidate, so it terminates in <= 2n iterations. Cost per iteration is a
-    # constant number of O(n) simulations => O(n²) overall. Persistence ("does
-    # the charge actually reduce an expensive import?") is verified cheaply here
-    # by an improvement check instead of a per-candidate re-simulation.
+    # constant number of suffix re-simulations on the incremental trajectory.
+    # Persistence ("does the charge actually reduce an expensive import?") is
+    # verified cheaply here by an improvement check instead of a per-candidate
+    # re-simulation.
     for _ in range(2 * n):
-        states = _simulate_with_modes(modes, inputs)
-        moments = find_expensive_import_moments(states, inputs)
+        moments = _expensive_import_moments_from(
+            trajectory.soc[1:], trajectory.grid_import, inputs, thresholds
+        )
         if not moments:
             break
         # Improvement is measured in real TOTAL COST, not "expensive kWh": a
         # pre-charge that merely shifts an import to a similarly priced earlier
         # slot does not lower cost (and round-trip losses make it worse), so it
         # must be rejected.
-        total_cost = sum(state.cost_czk for state in states)
+        total_cost = trajectory.total_cost()
 
         # Most expensive first; tie-break on later interval (closer deadline).
         moments.sort(key=lambda m: (m.price_czk or 0.0, m.interval), reverse=True)
 
-        # SoC trajectory under the current modes — shared by all candidates this
-        # iteration (modes do not change until we place one).
-        soc_traj = _compute_soc_trajectory(modes, inputs)
-
         candidate_idx: int | None = None
         for moment in moments:
             candidate_idx = _pick_displacement_candidate(
                 moment=moment,
-                modes=modes,
+                trajectory=trajectory,
                 inputs=inputs,
-                soc_traj=soc_traj,
+                price_order=price_order,
                 blocked=blocked,
             )
             if candidate_idx is not None:
@@ -532,17 +654,17 @@ def _displace_expensive_imports(
             break
 
         # Place tentatively, then keep it only if TOTAL plan cost strictly drops.
-        modes[candidate_idx] = CBBMode.HOME_UPS.value
-        trial_states = _simulate_with_modes(modes, inputs)
-        trial_cost = sum(state.cost_czk for state in trial_states)
+        trajectory.set_mode(candidate_idx, CBBMode.HOME_UPS.value)
+        trial_cost = trajectory.total_cost()
 
         if trial_cost >= total_cost - _COST_IMPROVEMENT_EPS_CZK:
             # Not cost-reducing (no real arbitrage / round-trip loss dominates) —
             # revert, block this candidate, and try the next-cheapest one.
-            modes[candidate_idx] = CBBMode.HOME_I.value
+            trajectory.set_mode(candidate_idx, CBBMode.HOME_I.value)
             blocked.add(candidate_idx)
             continue
 
+        modes[candidate_idx] = CBBMode.HOME_UPS.value
         added.append(candidate_idx)
 
     return sorted(added)
@@ -9,6 +9,13 @@ from .types import (
     INTERVAL_MINUTES,
 )
 
+# Economic planner backends (``planner_backend`` option): the greedy
+# heuristics in ``economic_planner`` or the SoC-grid DP in
+# ``economic_planner_dp``.
+PLANNER_BACKEND_GREEDY = "greedy"
+PLANNER_BACKEND_DP = "dp"
+PLANNER_BACKENDS: Tuple[str, ...] = (PLANNER_BACKEND_GREEDY, PLANNER_BACKEND_DP)
+
 # Default daily-price percentile above which a baseline grid import is
 # considered "expensive" and worth displacing with pre-charging. Configurable
 # per the LOCKED design (F1); full wiring from config_entry.options happens in
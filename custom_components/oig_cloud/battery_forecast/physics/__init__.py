@@ -4,10 +4,13 @@ This package contains the core physics simulation for CBB battery modes.
 """
 
 from ...physics import simulate_interval
+from .batch_simulator import BatchSimulationResult, simulate_batch
 from .interval_simulator import IntervalResult, IntervalSimulator
 
 __all__ = [
+    "BatchSimulationResult",
     "IntervalSimulator",
     "IntervalResult",
+    "simulate_batch",
     "simulate_interval",
 ]
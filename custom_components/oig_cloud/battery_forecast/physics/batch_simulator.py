@@ -0,0 +1,279 @@
+"""Batch Simulator - array-backed CBB physics for many candidate plans.
+
+Evaluates K candidate mode vectors over the same N-interval horizon in one
+call. The SoC recurrence is inherently sequential in time, so the engine walks
+the horizon once and vectorizes every interval across all K candidates.
+
+The arithmetic mirrors ``physics.simulate_interval`` operation by operation
+(same clamps, same 0.001 kWh thresholds, same evaluation order), so each row
+of the result is bit-for-bit identical to chaining the scalar function.
+"""
+
+from dataclasses import dataclass
+from typing import Sequence
+
+import numpy as np
+
+from ..types import (
+    CBB_MODE_HOME_II,
+    CBB_MODE_HOME_III,
+    CBB_MODE_HOME_UPS,
+)
+
+_FLOW_EPS_KWH = 0.001
+
+
+def sequential_sum(values: Sequence[float]) -> float:
+    """Left-to-right float sum, identical to a ``total += value`` loop.
+
+    The builtin ``sum`` uses compensated summation on Python 3.12+, which would
+    make batch totals differ in the last bits from the scalar loops.
+    """
+    total = 0.0
+    for value in values:
+        total += value
+    return total
+
+
+@dataclass(frozen=True)
+class BatchSimulationResult:
+    """Per-candidate, per-interval flows of a batch simulation.
+
+    Every array has shape (K candidates, N intervals); ``soc_kwh`` holds the
+    battery level at the END of each interval.
+    """
+
+    soc_kwh: np.ndarray
+    grid_import_kwh: np.ndarray
+    grid_export_kwh: np.ndarray
+    battery_charge_kwh: np.ndarray
+    battery_discharge_kwh: np.ndarray
+    grid_charge_kwh: np.ndarray
+    solar_charge_kwh: np.ndarray
+    net_cost_czk: np.ndarray
+    modes: np.ndarray
+
+    @property
+    def candidates(self) -> int:
+        """Number of simulated candidate plans (K)."""
+        return int(self.modes.shape[0])
+
+    def final_soc_kwh(self, initial_soc_kwh: float | Sequence[float]) -> np.ndarray:
+        """End-of-horizon SoC per candidate (``initial_soc_kwh`` when N == 0)."""
+        if self.soc_kwh.shape[1] == 0:
+            return np.broadcast_to(
+                np.asarray(initial_soc_kwh, dtype=float), (self.candidates,)
+            ).copy()
+        return self.soc_kwh[:, -1].copy()
+
+    def total_cost_czk(self) -> list[float]:
+        """Net cost per candidate, summed in interval order like scalar loops."""
+        return [sequential_sum(row) for row in self.net_cost_czk.tolist()]
+
+
+def _solar_charge(
+    soc: np.ndarray,
+    surplus: float,
+    capacity_kwh: float,
+    charge_efficiency: float,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Surplus -> battery until full, rest exported (HOME I/II/III daytime)."""
+    battery_space = np.maximum(0.0, capacity_kwh - soc)
+    charge_amount = np.minimum(surplus, battery_space)
+    charging = charge_amount > _FLOW_EPS_KWH
+    new_soc = np.where(
+        charging,
+        np.minimum(capacity_kwh, soc + charge_amount * charge_efficiency),
+        soc,
+    )
+    remaining_surplus = surplus - charge_amount
+    export = np.where(remaining_surplus > _FLOW_EPS_KWH, remaining_surplus, 0.0)
+    return new_soc, np.where(charging, charge_amount, 0.0), export
+
+
+def _battery_discharge(
+    soc: np.ndarray,
+    deficit: float,
+    hw_min_capacity_kwh: float,
+    discharge_efficiency: float,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Battery covers ``deficit`` down to the HW minimum, rest from grid."""
+    available_battery = np.maximum(0.0, soc - hw_min_capacity_kwh)
+    usable_from_battery = available_battery * discharge_efficiency
+    covered_by_battery = np.minimum(deficit, usable_from_battery)
+    discharging = covered_by_battery > _FLOW_EPS_KWH
+    discharge = np.zeros_like(soc)
+    np.divide(covered_by_battery, discharge_efficiency, out=discharge, where=discharging)
+    new_soc = np.where(discharging, soc - discharge, soc)
+    remaining = deficit - covered_by_battery
+    grid_import = np.where(remaining > _FLOW_EPS_KWH, remaining, 0.0)
+    return np.maximum(hw_min_capacity_kwh, new_soc), discharge, grid_import
+
+
+def simulate_batch(
+    *,
+    modes: Sequence[Sequence[int]] | np.ndarray,
+    solar_kwh: Sequence[float] | np.ndarray,
+    load_kwh: Sequence[float] | np.ndarray,
+    initial_soc_kwh: float | Sequence[float],
+    capacity_kwh: float,
+    hw_min_capacity_kwh: float,
+    charge_efficiency: float,
+    discharge_efficiency: float,
+    home_charge_rate_kwh_15min: float,
+    import_price_czk: Sequence[float] | np.ndarray | None = None,
+    export_price_czk: Sequence[float] | np.ndarray | None = None,
+    ups_requires_headroom: bool = False,
+) -> BatchSimulationResult:
+    """Simulate K candidate mode vectors over N 15-minute intervals.
+
+    Args:
+        modes: (K, N) CBB modes; unknown modes behave as HOME I
+        solar_kwh: (N,) solar production per interval
+        load_kwh: (N,) consumption per interval
+        initial_soc_kwh: starting SoC, scalar or one value per candidate
+        capacity_kwh: battery capacity
+        hw_min_capacity_kwh: discharge floor
+        charge_efficiency: AC/DC charge efficiency
+        discharge_efficiency: DC/AC discharge efficiency
+        home_charge_rate_kwh_15min: grid charge limit per interval (HOME UPS)
+        import_price_czk: (N,) import price, defaults to zero
+        export_price_czk: (N,) export price, defaults to zero
+        ups_requires_headroom: HOME UPS intervals fall back to HOME I once the
+            SoC entering the interval has reached capacity
+
+    Returns:
+        BatchSimulationResult with (K, N) arrays
+    """
+    mode_matrix = np.atleast_2d(np.asarray(modes, dtype=np.int64))
+    k_count, n_count = mode_matrix.shape
+    solar = np.maximum(0.0, np.asarray(solar_kwh, dtype=float))
+    load = np.maximum(0.0, np.asarray(load_kwh, dtype=float))
+    if solar.shape != (n_count,) or load.shape != (n_count,):
+        raise ValueError("Solar/load length must match the mode horizon")
+    import_price = (
+        np.zeros(n_count)
+        if import_price_czk is None
+        else np.asarray(import_price_czk, dtype=float)
+    )
+    export_price = (
+        np.zeros(n_count)
+        if export_price_czk is None
+        else np.asarray(export_price_czk, dtype=float)
+    )
+
+    capacity = max(0.0, float(capacity_kwh))
+    hw_min = max(0.0, float(hw_min_capacity_kwh))
+    soc = np.broadcast_to(np.asarray(initial_soc_kwh, dtype=float), (k_count,)).copy()
+
+    shape = (k_count, n_count)
+    soc_out = np.zeros(shape)
+    grid_import_out = np.zeros(shape)
+    grid_export_out = np.zeros(shape)
+    charge_out = np.zeros(shape)
+    discharge_out = np.zeros(shape)
+    grid_charge_out = np.zeros(shape)
+    solar_charge_out = np.zeros(shape)
+
+    for i in range(n_count):
+        mode_col = mode_matrix[:, i]
+        is_ups = mode_col == CBB_MODE_HOME_UPS
+        if ups_requires_headroom:
+            is_ups = is_ups & (soc < capacity)
+        soc = np.maximum(0.0, np.minimum(capacity, soc))
+        solar_i = float(solar[i])
+        load_i = float(load[i])
+
+        new_soc = soc.copy()
+        grid_import = np.zeros(k_count)
+        grid_export = np.zeros(k_count)
+        charge = np.zeros(k_count)
+        discharge = np.zeros(k_count)
+        grid_charge = np.zeros(k_count)
+        solar_charge = np.zeros(k_count)
+
+        if solar_i < _FLOW_EPS_KWH:
+            # Night: HOME I/II/III all discharge to cover the load.
+            home_soc, home_discharge, home_import = _battery_discharge(
+                soc, load_i, hw_min, discharge_efficiency
+            )
+            home = ~is_ups
+            new_soc = np.where(home, home_soc, new_soc)
+            discharge = np.where(home, home_discharge, discharge)
+            grid_import = np.where(home, home_import, grid_import)
+        else:
+            is_ii = (mode_col == CBB_MODE_HOME_II) & ~is_ups
+            is_iii = (mode_col == CBB_MODE_HOME_III) & ~is_ups
+            is_i = ~(is_ups | is_ii | is_iii)
+
+            if solar_i >= load_i:
+                day_soc, day_charge, day_export = _solar_charge(
+                    soc, solar_i - load_i, capacity, charge_efficiency
+                )
+                home_i_ii = is_i | is_ii
+                new_soc = np.where(home_i_ii, day_soc, new_soc)
+                charge = np.where(home_i_ii, day_charge, charge)
+                solar_charge = np.where(home_i_ii, day_charge, solar_charge)
+                grid_export = np.where(home_i_ii, day_export, grid_export)
+            else:
+                deficit = load_i - solar_i
+                i_soc, i_discharge, i_import = _battery_discharge(
+                    soc, deficit, hw_min, discharge_efficiency
+                )
+                new_soc = np.where(is_i, i_soc, new_soc)
+                discharge = np.where(is_i, i_discharge, discharge)
+                grid_import = np.where(is_i, i_import, grid_import)
+                grid_import = np.where(is_ii, deficit, grid_import)
+
+            iii_soc, iii_charge, iii_export = _solar_charge(
+                soc, solar_i, capacity, charge_efficiency
+            )
+            new_soc = np.where(is_iii, iii_soc, new_soc)
+            charge = np.where(is_iii, iii_charge, charge)
+            solar_charge = np.where(is_iii, iii_charge, solar_charge)
+            grid_export = np.where(is_iii, iii_export, grid_export)
+            grid_import = np.where(is_iii, load_i, grid_import)
+
+        if is_ups.any():
+            battery_space = np.maximum(0.0, capacity - soc)
+            solar_to_battery = np.minimum(solar_i, battery_space)
+            remaining_space = battery_space - solar_to_battery
+            grid_to_battery = np.minimum(home_charge_rate_kwh_15min, remaining_space)
+            total_charge = solar_to_battery + grid_to_battery
+            charging = is_ups & (total_charge > _FLOW_EPS_KWH)
+            new_soc = np.where(
+                charging,
+                np.minimum(capacity, soc + total_charge * charge_efficiency),
+                new_soc,
+            )
+            charge = np.where(charging, total_charge, charge)
+            grid_charge = np.where(charging, grid_to_battery, grid_charge)
+            solar_charge = np.where(charging, solar_to_battery, solar_charge)
+            grid_import = np.where(is_ups, load_i + grid_to_battery, grid_import)
+            remaining_solar = solar_i - solar_to_battery
+            grid_export = np.where(
+                is_ups & (remaining_solar > _FLOW_EPS_KWH), remaining_solar, grid_export
+            )
+
+        soc = np.minimum(capacity, new_soc)
+        soc_out[:, i] = soc
+        grid_import_out[:, i] = grid_import
+        grid_export_out[:, i] = grid_export
+        charge_out[:, i] = charge
+        discharge_out[:, i] = discharge
+        grid_charge_out[:, i] = grid_charge
+        solar_charge_out[:, i] = solar_charge
+
+    net_cost = grid_import_out * import_price - grid_export_out * export_price
+
+    return BatchSimulationResult(
+        soc_kwh=soc_out,
+        grid_import_kwh=grid_import_out,
+        grid_export_kwh=grid_export_out,
+        battery_charge_kwh=charge_out,
+        battery_discharge_kwh=discharge_out,
+        grid_charge_kwh=grid_charge_out,
+        solar_charge_kwh=solar_charge_out,
+        net_cost_czk=net_cost,
+        modes=mode_matrix,
+    )
@@ -32,7 +32,14 @@ from ..economic_planner import (
     plan_battery_schedule,
     simulate_home_i_detailed,
 )
-from ..economic_planner_types import DEFAULT_ROUND_TRIP_EFFICIENCY, PlannerInputs
+from ..economic_planner_dp import plan_battery_schedule_dp
+from ..economic_planner_types import (
+    DEFAULT_ROUND_TRIP_EFFICIENCY,
+    PLANNER_BACKEND_DP,
+    PLANNER_BACKEND_GREEDY,
+    PlannerInputs,
+    PlannerResult,
+)
 from ..timeline.planner import (
     add_decision_reasons_to_timeline,
     attach_planner_reasons,
@@ -1118,7 +1125,22 @@ def _interval_day_indices(
     return days or None
 
 
-def _run_planner(
+@dataclass(frozen=True, slots=True)
+class _PlannerRun:
+    """Planner inputs plus the derived values the post-solve steps need."""
+
+    spot_prices: list[dict[str, Any]]
+    export_prices: list[dict[str, Any]]
+    load_forecast: list[float]
+    solar_kwh_list: list[float]
+    opts: Any
+    planner_inputs: PlannerInputs
+    hw_min_kwh: float
+    home_charge_rate_kw: float
+    directional_efficiency: float
+
+
+def _prepare_planner_run(
     sensor: Any,
     spot_prices: list[dict[str, Any]],
     export_prices: list[dict[str, Any]],
@@ -1130,224 +1152,373 @@ def _run_planner(
     *,
     run_id: str | None = None,
     correlation_id: str | None = None,
-) -> tuple[list[dict[str, Any]], dict[str, Any] | None, list[dict[str, Any]]]:
-    try:
-        max_intervals = 36 * 4
-        if len(spot_prices) > max_intervals:
-            spot_prices = spot_prices[:max_intervals]
-            export_prices = export_prices[:max_intervals]
-            load_forecast = load_forecast[:max_intervals]
-            solar_kwh_list = solar_kwh_list[:max_intervals]
-
-        opts = getattr(sensor._config_entry, "options", None) or {}
-        # NOTE: the `battery_efficiency` sensor measures DC/coulombic efficiency
-        # (~99%) from the battery's own charge/discharge energy counters — it is
-        # NOT the AC round-trip (grid -> house) the planner economics need, which
-        # also pays the inverter conversion losses both ways (~84% total). Use the
-        # planner's AC round-trip constant consistently for the η-gate, the
-        # displayed timeline and the mode guard so they all agree with the cost
-        # simulation (_simulate_interval). The DC sensor stays a battery-health
-        # metric only.
-        directional_efficiency = _round_trip_to_directional(
-            DEFAULT_ROUND_TRIP_EFFICIENCY
-        )
-        home_charge_rate_kw = float(opts.get("home_charge_rate", 2.8))
-        # Sensor-first: the box's own bat_min trigger (%) is the true hardware
-        # floor. Converted to kWh and validated for plausibility; falls back
-        # to the configured fallback fraction (20% by default) when the sensor
-        # is unavailable/implausible (see _resolve_hw_min_kwh). Comes from the
-        # snapshot captured once in async_update(), not a live re-read: a
-        # second read here could disagree with the readiness check that
-        # already ran against the same value.
-        proxy_bat_min_pct, bat_min_reason_class = box_floor.percent, box_floor.reason_class
-        sensor_min_kwh = (
-            max_capacity * proxy_bat_min_pct / 100.0
-            if proxy_bat_min_pct is not None
-            else None
-        )
-        hw_min_kwh = _resolve_hw_min_kwh(
-            sensor_min_kwh,
-            max_capacity,
-            fallback_fraction=opts.get("hw_min_fraction", _HW_MIN_FRACTION),
-            correlation_id=correlation_id,
-            run_id=run_id,
-            reason_class=bat_min_reason_class,
-        )
-        hw_min_percent = (hw_min_kwh / max_capacity) * 100.0 if max_capacity > 0 else 20.0
-        # Floor defense protects the hardware safety minimum PLUS a small
-        # margin above the BOX bat_min trigger: dwelling at the trigger makes
-        # the box force-balance from grid uncontrolled, so the plan must never
-        # aim at it (see _derive_planning_min_percent). Any reserve above this
-        # floor is still built purely by cost-gated displacement — no fixed
-        # backup that forces uneconomic grid charging. The legacy
-        # `min_capacity_percent` option no longer raises this floor.
-        planning_min_percent = _derive_planning_min_percent(
-            hw_min_percent,
-            proxy_bat_min_pct,
-            safety_margin_pct=float(
-                opts.get("box_floor_safety_margin_pct", BOX_FLOOR_SAFETY_MARGIN_PCT)
-            ),
-        )
+) -> _PlannerRun:
+    """Truncate the horizon and derive the PlannerInputs for one run."""
+    max_intervals = 36 * 4
+    if len(spot_prices) > max_intervals:
+        spot_prices = spot_prices[:max_intervals]
+        export_prices = export_prices[:max_intervals]
+        load_forecast = load_forecast[:max_intervals]
+        solar_kwh_list = solar_kwh_list[:max_intervals]
+
+    opts = getattr(sensor._config_entry, "options", None) or {}
+    # NOTE: the `battery_efficiency` sensor measures DC/coulombic efficiency
+    # (~99%) from the battery's own charge/discharge energy counters — it is
+    # NOT the AC round-trip (grid -> house) the planner economics need, which
+    # also pays the inverter conversion losses both ways (~84% total). Use the
+    # planner's AC round-trip constant consistently for the η-gate, the
+    # displayed timeline and the mode guard so they all agree with the cost
+    # simulation (_simulate_interval). The DC sensor stays a battery-health
+    # metric only.
+    directional_efficiency = _round_trip_to_directional(
+        DEFAULT_ROUND_TRIP_EFFICIENCY
+    )
+    home_charge_rate_kw = float(opts.get("home_charge_rate", 2.8))
+    # Sensor-first: the box's own bat_min trigger (%) is the true hardware
+    # floor. Converted to kWh and validated for plausibility; falls back
+    # to the configured fallback fraction (20% by default) when the sensor
+    # is unavailable/implausible (see _resolve_hw_min_kwh). Comes from the
+    # snapshot captured once in async_update(), not a live re-read: a
+    # second read here could disagree with the readiness check that
+    # already ran against the same value.
+    proxy_bat_min_pct, bat_min_reason_class = box_floor.percent, box_floor.reason_class
+    sensor_min_kwh = (
+        max_capacity * proxy_bat_min_pct / 100.0
+        if proxy_bat_min_pct is not None
+        else None
+    )
+    hw_min_kwh = _resolve_hw_min_kwh(
+        sensor_min_kwh,
+        max_capacity,
+        fallback_fraction=opts.get("hw_min_fraction", _HW_MIN_FRACTION),
+        correlation_id=correlation_id,
+        run_id=run_id,
+        reason_class=bat_min_reason_class,
+    )
+    hw_min_percent = (hw_min_kwh / max_capacity) * 100.0 if max_capacity > 0 else 20.0
+    # Floor defense protects the hardware safety minimum PLUS a small
+    # margin above the BOX bat_min trigger: dwelling at the trigger makes
+    # the box force-balance from grid uncontrolled, so the plan must never
+    # aim at it (see _derive_planning_min_percent). Any reserve above this
+    # floor is still built purely by cost-gated displacement — no fixed
+    # backup that forces uneconomic grid charging. The legacy
+    # `min_capacity_percent` option no longer raises this floor.
+    planning_min_percent = _derive_planning_min_percent(
+        hw_min_percent,
+        proxy_bat_min_pct,
+        safety_margin_pct=float(
+            opts.get("box_floor_safety_margin_pct", BOX_FLOOR_SAFETY_MARGIN_PCT)
+        ),
+    )
 
-        # Comfort SoC target: keep a buffer well above the hard floor so the BOX
-        # never force-charges to ~80% at any price when the battery dwells near
-        # bat_min. Maintained ONLY from cheap windows (never expensive grid);
-        # configurable %, default 50. 0 disables it.
-        comfort_pct = float(opts.get("battery_comfort_soc_percent", 50.0))
-        comfort_pct = max(0.0, min(95.0, comfort_pct))
-        comfort_soc_kwh = max_capacity * (comfort_pct / 100.0)
-
-        # Per-interval day index (0=today, 1=tomorrow, …) from price timestamps,
-        # so the expensive-price percentile is computed per day, not blended
-        # across a cheap day + an expensive day.
-        interval_days = _interval_day_indices(spot_prices)
-
-        planner_inputs = PlannerInputs(
-            current_soc_kwh=current_capacity,
-            max_capacity_kwh=max_capacity,
-            hw_min_kwh=hw_min_kwh,
-            planning_min_percent=planning_min_percent,
-            charge_rate_kw=home_charge_rate_kw,
-            intervals=[{"index": i} for i in range(len(spot_prices))],
-            prices=[float(point.get("price", 0.0) or 0.0) for point in spot_prices],
-            solar_forecast=list(solar_kwh_list),
-            load_forecast=list(load_forecast),
-            expensive_percentile=float(opts.get("expensive_percentile", 0.70)),
-            # round_trip_efficiency defaults to the AC round-trip constant
-            # (DEFAULT_ROUND_TRIP_EFFICIENCY), matching _simulate_interval — see
-            # the directional_efficiency note above.
-            interval_days=interval_days,
-            comfort_soc_kwh=comfort_soc_kwh,
-        )
+    # Comfort SoC target: keep a buffer well above the hard floor so the BOX
+    # never force-charges to ~80% at any price when the battery dwells near
+    # bat_min. Maintained ONLY from cheap windows (never expensive grid);
+    # configurable %, default 50. 0 disables it.
+    comfort_pct = float(opts.get("battery_comfort_soc_percent", 50.0))
+    comfort_pct = max(0.0, min(95.0, comfort_pct))
+    comfort_soc_kwh = max_capacity * (comfort_pct / 100.0)
+
+    # Per-interval day index (0=today, 1=tomorrow, …) from price timestamps,
+    # so the expensive-price percentile is computed per day, not blended
+    # across a cheap day + an expensive day.
+    interval_days = _interval_day_indices(spot_prices)
+
+    planner_inputs = PlannerInputs(
+        current_soc_kwh=current_capacity,
+        max_capacity_kwh=max_capacity,
+        hw_min_kwh=hw_min_kwh,
+        planning_min_percent=planning_min_percent,
+        charge_rate_kw=home_charge_rate_kw,
+        intervals=[{"index": i} for i in range(len(spot_prices))],
+        prices=[float(point.get("price", 0.0) or 0.0) for point in spot_prices],
+        solar_forecast=list(solar_kwh_list),
+        load_forecast=list(load_forecast),
+        expensive_percentile=float(opts.get("expensive_percentile", 0.70)),
+        # round_trip_efficiency defaults to the AC round-trip constant
+        # (DEFAULT_ROUND_TRIP_EFFICIENCY), matching _simulate_interval — see
+        # the directional_efficiency note above.
+        interval_days=interval_days,
+        comfort_soc_kwh=comfort_soc_kwh,
+    )
 
-        result = plan_battery_schedule(planner_inputs)
-        charging_metrics = dict(getattr(sensor, "_charging_metrics", {}) or {})
-        charging_metrics.pop("planner_failure_class", None)
-        charging_metrics["planner_decision_trace"] = build_planner_decision_trace(
-            result.decisions, planner_inputs
-        )
-        sensor._charging_metrics = charging_metrics
+    return _PlannerRun(
+        spot_prices=spot_prices,
+        export_prices=export_prices,
+        load_forecast=load_forecast,
+        solar_kwh_list=solar_kwh_list,
+        opts=opts,
+        planner_inputs=planner_inputs,
+        hw_min_kwh=hw_min_kwh,
+        home_charge_rate_kw=home_charge_rate_kw,
+        directional_efficiency=directional_efficiency,
+    )
 
-        planning_min_kwh = planner_inputs.planning_min_kwh
-        lock_until, lock_modes = mode_guard_module.build_plan_lock(
-            now=dt_util.now(),
-            spot_prices=spot_prices,
+
+def _finish_planner_run(
+    sensor: Any,
+    run: _PlannerRun,
+    result: PlannerResult,
+    current_capacity: float,
+    max_capacity: float,
+    *,
+    planner_name: str,
+) -> tuple[list[dict[str, Any]], dict[str, Any] | None, list[dict[str, Any]]]:
+    """Guard, timeline and mode_result for a finished planner solve."""
+    spot_prices = run.spot_prices
+    export_prices = run.export_prices
+    load_forecast = run.load_forecast
+    solar_kwh_list = run.solar_kwh_list
+    opts = run.opts
+    planner_inputs = run.planner_inputs
+    hw_min_kwh = run.hw_min_kwh
+    home_charge_rate_kw = run.home_charge_rate_kw
+    directional_efficiency = run.directional_efficiency
+
+    charging_metrics = dict(getattr(sensor, "_charging_metrics", {}) or {})
+    charging_metrics.pop("planner_failure_class", None)
+    charging_metrics["planner_decision_trace"] = build_planner_decision_trace(
+        result.decisions, planner_inputs
+    )
+    sensor._charging_metrics = charging_metrics
+
+    planning_min_kwh = planner_inputs.planning_min_kwh
+    lock_until, lock_modes = mode_guard_module.build_plan_lock(
+        now=dt_util.now(),
+        spot_prices=spot_prices,
+        modes=result.modes,
+        mode_guard_minutes=int(opts.get("mode_guard_minutes", MODE_GUARD_MINUTES)),
+        plan_lock_until=sensor._plan_lock_until,
+        plan_lock_modes=sensor._plan_lock_modes,
+    )
+    sensor._plan_lock_until = lock_until
+    sensor._plan_lock_modes = lock_modes
+    guarded_modes, guard_overrides, guard_until = (
+        mode_guard_module.apply_mode_guard(
             modes=result.modes,
-            mode_guard_minutes=int(opts.get("mode_guard_minutes", MODE_GUARD_MINUTES)),
-            plan_lock_until=sensor._plan_lock_until,
-            plan_lock_modes=sensor._plan_lock_modes,
-        )
-        sensor._plan_lock_until = lock_until
-        sensor._plan_lock_modes = lock_modes
-        guarded_modes, guard_overrides, guard_until = (
-            mode_guard_module.apply_mode_guard(
-                modes=result.modes,
-                spot_prices=spot_prices,
-                solar_kwh_list=solar_kwh_list,
-                load_forecast=load_forecast,
-                current_capacity=current_capacity,
-                max_capacity=max_capacity,
-                hw_min_capacity=hw_min_kwh,
-                efficiency=directional_efficiency,
-                home_charge_rate_kw=home_charge_rate_kw,
-                planning_min_kwh=planning_min_kwh,
-                lock_modes=lock_modes,
-                guard_until=lock_until,
-                log_rate_limited=sensor._log_rate_limited,
-            )
-        )
-        # Enforce minimum mode duration after guard (prevents short UPS blocks)
-        guarded_modes = mode_guard_module.enforce_min_mode_duration(
-            guarded_modes,
-            mode_names=CBB_MODE_NAMES,
-            min_mode_duration=MIN_MODE_DURATION,
-            logger=_LOGGER,
-        )
-        timeline = build_planner_timeline(
-            modes=guarded_modes,
             spot_prices=spot_prices,
-            export_prices=export_prices,
-            solar_forecast=sensor._get_solar_forecast(),
+            solar_kwh_list=solar_kwh_list,
             load_forecast=load_forecast,
             current_capacity=current_capacity,
             max_capacity=max_capacity,
             hw_min_capacity=hw_min_kwh,
             efficiency=directional_efficiency,
             home_charge_rate_kw=home_charge_rate_kw,
+            planning_min_kwh=planning_min_kwh,
+            lock_modes=lock_modes,
+            guard_until=lock_until,
             log_rate_limited=sensor._log_rate_limited,
         )
-        attach_planner_reasons(timeline, result.decisions)
-        add_decision_reasons_to_timeline(
-            timeline,
-            current_capacity=current_capacity,
-            max_capacity=max_capacity,
-            min_capacity=planning_min_kwh,
-            efficiency=directional_efficiency,
+    )
+    # Enforce minimum mode duration after guard (prevents short UPS blocks)
+    guarded_modes = mode_guard_module.enforce_min_mode_duration(
+        guarded_modes,
+        mode_names=CBB_MODE_NAMES,
+        min_mode_duration=MIN_MODE_DURATION,
+        logger=_LOGGER,
+    )
+    timeline = build_planner_timeline(
+        modes=guarded_modes,
+        spot_prices=spot_prices,
+        export_prices=export_prices,
+        solar_forecast=sensor._get_solar_forecast(),
+        load_forecast=load_forecast,
+        current_capacity=current_capacity,
+        max_capacity=max_capacity,
+        hw_min_capacity=hw_min_kwh,
+        efficiency=directional_efficiency,
+        home_charge_rate_kw=home_charge_rate_kw,
+        log_rate_limited=sensor._log_rate_limited,
+    )
+    attach_planner_reasons(timeline, result.decisions)
+    add_decision_reasons_to_timeline(
+        timeline,
+        current_capacity=current_capacity,
+        max_capacity=max_capacity,
+        min_capacity=planning_min_kwh,
+        efficiency=directional_efficiency,
+    )
+    mode_guard_module.apply_guard_reasons_to_timeline(
+        timeline,
+        guard_overrides,
+        guard_until,
+        None,
+        mode_names=CBB_MODE_NAMES,
+    )
+    mode_recommendations = sensor._create_mode_recommendations(
+        timeline, hours_ahead=48
+    )
+    # Real cost + savings vs the do-nothing (all HOME I) baseline over the
+    # planning horizon. These feed the Ceny "savings vs Home 1" tile, which
+    # previously always read missing keys and showed 0.
+    plan_total_cost = float(getattr(result, "total_cost", 0.0) or 0.0)
+    try:
+        baseline_total_cost = sum(
+            state.cost_czk for state in simulate_home_i_detailed(planner_inputs)
         )
-        mode_guard_module.apply_guard_reasons_to_timeline(
-            timeline,
-            guard_overrides,
-            guard_until,
-            None,
-            mode_names=CBB_MODE_NAMES,
+    except Exception:  # pragma: no cover - defensive
+        baseline_total_cost = plan_total_cost
+    savings_vs_home_i = baseline_total_cost - plan_total_cost
+    mode_result = {
+        "optimal_timeline": timeline,
+        "optimal_modes": guarded_modes,
+        "planner": planner_name,
+        "total_cost": round(plan_total_cost, 2),
+        "total_cost_48h": round(plan_total_cost, 2),
+        "total_savings_48h": round(savings_vs_home_i, 2),
+        "planning_min_kwh": planning_min_kwh,
+        "target_kwh": planning_min_kwh,
+        # Emergent dynamic reserve: the peak SoC the plan deliberately builds
+        # (via cheap grid pre-charging) to bridge upcoming expensive/low-PV
+        # windows — higher than the static floor when displacement kicks in.
+        "dynamic_reserve_kwh": round(
+            max(
+                (s.soc_kwh for s in (getattr(result, "states", None) or [])),
+                default=planning_min_kwh,
+            ),
+            3,
+        ),
+        "infeasible": False,
+        "infeasible_reason": None,
+    }
+    return timeline, mode_result, mode_recommendations
+
+
+def _planner_failed(
+    sensor: Any,
+    err: Exception,
+    *,
+    run_id: str | None = None,
+    correlation_id: str | None = None,
+) -> tuple[list[dict[str, Any]], dict[str, Any] | None, list[dict[str, Any]]]:
+    charging_metrics = dict(getattr(sensor, "_charging_metrics", {}) or {})
+    charging_metrics["planner_failure_class"] = err.__class__.__name__
+    charging_metrics["planner_decision_trace"] = []
+    sensor._charging_metrics = charging_metrics
+    if run_id is not None and correlation_id is not None:
+        _LOGGER.error(
+            "%s Planner failed: %s",
+            _planner_log_marker("ERROR", correlation_id, run_id),
+            err,
+            exc_info=True,
         )
-        mode_recommendations = sensor._create_mode_recommendations(
-            timeline, hours_ahead=48
+    else:
+        _LOGGER.error(
+            "[OIG_CLOUD_ERROR][component=planner][corr=na][run=na] "
+            "Planner failed: %s",
+            err,
+            exc_info=True,
+        )
+    return [], None, []
+
+
+def _run_planner(
+    sensor: Any,
+    spot_prices: list[dict[str, Any]],
+    export_prices: list[dict[str, Any]],
+    load_forecast: list[float],
+    solar_kwh_list: list[float],
+    current_capacity: float,
+    max_capacity: float,
+    box_floor: BoxFloorSnapshot,
+    *,
+    run_id: str | None = None,
+    correlation_id: str | None = None,
+) -> tuple[list[dict[str, Any]], dict[str, Any] | None, list[dict[str, Any]]]:
+    try:
+        run = _prepare_planner_run(
+            sensor,
+            spot_prices,
+            export_prices,
+            load_forecast,
+            solar_kwh_list,
+            current_capacity,
+            max_capacity,
+            box_floor,
+            run_id=run_id,
+            correlation_id=correlation_id,
+        )
+        result = plan_battery_schedule(run.planner_inputs)
+        return _finish_planner_run(
+            sensor,
+            run,
+            result,
+            current_capacity,
+            max_capacity,
+            planner_name="economic_planner",
         )
-        # Real cost + savings vs the do-nothing (all HOME I) baseline over the
-        # planning horizon. These feed the Ceny "savings vs Home 1" tile, which
-        # previously always read missing keys and showed 0.
-        plan_total_cost = float(getattr(result, "total_cost", 0.0) or 0.0)
-        try:
-            baseline_total_cost = sum(
-                state.cost_czk for state in simulate_home_i_detailed(planner_inputs)
-            )
-        except Exception:  # pragma: no cover - defensive
-            baseline_total_cost = plan_total_cost
-        savings_vs_home_i = baseline_total_cost - plan_total_cost
-        mode_result = {
-            "optimal_timeline": timeline,
-            "optimal_modes": guarded_modes,
-            "planner": "economic_planner",
-            "total_cost": round(plan_total_cost, 2),
-            "total_cost_48h": round(plan_total_cost, 2),
-            "total_savings_48h": round(savings_vs_home_i, 2),
-            "planning_min_kwh": planning_min_kwh,
-            "target_kwh": planning_min_kwh,
-            # Emergent dynamic reserve: the peak SoC the plan deliberately builds
-            # (via cheap grid pre-charging) to bridge upcoming expensive/low-PV
-            # windows — higher than the static floor when displacement kicks in.
-            "dynamic_reserve_kwh": round(
-                max(
-                    (s.soc_kwh for s in (getattr(result, "states", None) or [])),
-                    default=planning_min_kwh,
-                ),
-                3,
-            ),
-            "infeasible": False,
-            "infeasible_reason": None,
-        }
-        return timeline, mode_result, mode_recommendations
     except Exception as err:
-        charging_metrics = dict(getattr(sensor, "_charging_metrics", {}) or {})
-        charging_metrics["planner_failure_class"] = err.__class__.__name__
-        charging_metrics["planner_decision_trace"] = []
-        sensor._charging_metrics = charging_metrics
-        if run_id is not None and correlation_id is not None:
-            _LOGGER.error(
-                "%s Planner failed: %s",
-                _planner_log_marker("ERROR", correlation_id, run_id),
-                err,
-                exc_info=True,
+        return _planner_failed(
+            sensor, err, run_id=run_id, correlation_id=correlation_id
+        )
+
+
+async def _async_run_planner(
+    sensor: Any,
+    spot_prices: list[dict[str, Any]],
+    export_prices: list[dict[str, Any]],
+    load_forecast: list[float],
+    solar_kwh_list: list[float],
+    current_capacity: float,
+    max_capacity: float,
+    box_floor: BoxFloorSnapshot,
+    *,
+    run_id: str | None = None,
+    correlation_id: str | None = None,
+) -> tuple[list[dict[str, Any]], dict[str, Any] | None, list[dict[str, Any]]]:
+    """Run the configured planner backend.
+
+    The greedy planner runs inline via ``_run_planner``. The DP backend is a
+    full SoC-grid optimization, so its solve is moved to the executor; input
+    preparation and the guard/timeline steps stay on the event loop because
+    they read and write sensor state.
+    """
+    opts = getattr(getattr(sensor, "_config_entry", None), "options", None) or {}
+    if opts.get("planner_backend", PLANNER_BACKEND_GREEDY) != PLANNER_BACKEND_DP:
+        return _run_planner(
+            sensor,
+            spot_prices,
+            export_prices,
+            load_forecast,
+            solar_kwh_list,
+            current_capacity,
+            max_capacity,
+            box_floor,
+            run_id=run_id,
+            correlation_id=correlation_id,
+        )
+    try:
+        run = _prepare_planner_run(
+            sensor,
+            spot_prices,
+            export_prices,
+            load_forecast,
+            solar_kwh_list,
+            current_capacity,
+            max_capacity,
+            box_floor,
+            run_id=run_id,
+            correlation_id=correlation_id,
+        )
+        hass = getattr(sensor, "hass", None) or getattr(sensor, "_hass", None)
+        if hass is not None:
+            result = await hass.async_add_executor_job(
+                plan_battery_schedule_dp, run.planner_inputs
             )
         else:
-            _LOGGER.error(
-                "[OIG_CLOUD_ERROR][component=planner][corr=na][run=na] "
-                "Planner failed: %s",
-                err,
-                exc_info=True,
-            )
-        return [], None, []
+            result = plan_battery_schedule_dp(run.planner_inputs)
+        return _finish_planner_run(
+            sensor,
+            run,
+            result,
+            current_capacity,
+            max_capacity,
+            planner_name="economic_planner_dp",
+        )
+    except Exception as err:
+        return _planner_failed(
+            sensor, err, run_id=run_id, correlation_id=correlation_id
+        )
 
 
 def _update_timeline_hash(sensor: Any, timeline: list[dict[str, Any]]) -> None:
@@ -1826,7 +1997,7 @@ async def async_update(sensor: Any) -> None:  # noqa: C901
         pre_run_plan_lock_until = sensor._plan_lock_until
         pre_run_plan_lock_modes = sensor._plan_lock_modes
         pre_run_charging_metrics = getattr(sensor, "_charging_metrics", {})
-        timeline, mode_result, recommendations = _run_planner(
+        timeline, mode_result, recommendations = await _async_run_planner(
             sensor,
             spot_prices,
             export_prices,
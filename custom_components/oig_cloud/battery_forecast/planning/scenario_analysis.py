@@ -10,7 +10,8 @@ from typing import Any, Dict, List
 from homeassistant.util import dt as dt_util
 
 from ..data.input import get_solar_for_timestamp
-from ..physics import simulate_interval as physics_simulate_interval
+from ..physics import simulate_batch, simulate_interval as physics_simulate_interval
+from ..physics.batch_simulator import sequential_sum
 from ..types import (
     CBB_MODE_HOME_I,
     CBB_MODE_HOME_II,
@@ -28,6 +29,9 @@ _LOGGER = logging.getLogger(__name__)
 UPS_OPPORTUNISTIC_PRICE_CZK_KWH = 1.5  # below this price, opportunistic grid charge fires
 UPS_OPPORTUNISTIC_CHARGE_RATE_KW = 2.8  # charge rate when opportunistic mode fires
 UPS_OPPORTUNISTIC_INTERVAL_HOURS = 0.25  # 15-minute interval = 4.0; rate*hours -> per-interval kWh
+# Grid charge limit per 15-minute interval used by the fixed-mode scenarios
+# (matches the ``simulate_interval`` default).
+SCENARIO_HOME_CHARGE_RATE_KWH_15MIN = 0.7
 
 
 def _iter_interval_inputs(
@@ -73,7 +77,7 @@ def simulate_interval(
     export_price_czk: float,
     charge_efficiency: float = 0.95,
     discharge_efficiency: float = 0.95,
-    home_charge_rate_kwh_15min: float = 0.7,
+    home_charge_rate_kwh_15min: float = SCENARIO_HOME_CHARGE_RATE_KWH_15MIN,
     planning_min_capacity_kwh: float | None = None,
 ) -> dict:
     """Simulate one 15-minute interval and return costs."""
@@ -137,10 +141,68 @@ def calculate_interval_cost(
     }
 
 
-def calculate_fixed_mode_cost(
+def _collect_interval_inputs(
     sensor: Any,
     *,
-    fixed_mode: int,
+    spot_prices: List[Dict[str, Any]],
+    export_prices: List[Dict[str, Any]],
+    solar_forecast: Dict[str, Any],
+    load_forecast: List[float],
+) -> Dict[str, List[Any]]:
+    """Materialize ``_iter_interval_inputs`` as per-interval columns."""
+    columns: Dict[str, List[Any]] = {
+        "time": [],
+        "spot": [],
+        "export": [],
+        "load": [],
+        "solar": [],
+    }
+    for _, timestamp_str, spot_price, export_price, load_kwh, solar_kwh in _iter_interval_inputs(
+        sensor,
+        spot_prices=spot_prices,
+        export_prices=export_prices,
+        solar_forecast=solar_forecast,
+        load_forecast=load_forecast,
+    ):
+        columns["time"].append(timestamp_str)
+        columns["spot"].append(spot_price)
+        columns["export"].append(export_price)
+        columns["load"].append(load_kwh)
+        columns["solar"].append(solar_kwh)
+    return columns
+
+
+def _simulate_candidates(
+    columns: Dict[str, List[Any]],
+    *,
+    candidates: List[List[int]],
+    current_capacity: float,
+    max_capacity: float,
+    min_capacity: float,
+    efficiency: float,
+    ups_requires_headroom: bool = False,
+):
+    """Run all candidate mode vectors through the batch physics in one pass."""
+    return simulate_batch(
+        modes=candidates,
+        solar_kwh=columns["solar"],
+        load_kwh=columns["load"],
+        initial_soc_kwh=current_capacity,
+        capacity_kwh=max_capacity,
+        hw_min_capacity_kwh=min_capacity,
+        charge_efficiency=efficiency,
+        discharge_efficiency=efficiency,
+        home_charge_rate_kwh_15min=SCENARIO_HOME_CHARGE_RATE_KWH_15MIN,
+        import_price_czk=columns["spot"],
+        export_price_czk=columns["export"],
+        ups_requires_headroom=ups_requires_headroom,
+    )
+
+
+def _fixed_mode_costs(
+    sensor: Any,
+    *,
+    fixed_modes: List[int],
     current_capacity: float,
     max_capacity: float,
     min_capacity: float,
@@ -149,70 +211,85 @@ def calculate_fixed_mode_cost(
     solar_forecast: Dict[str, Any],
     load_forecast: List[float],
     physical_min_capacity: float | None = None,
-) -> Dict[str, Any]:
-    """Calculate cost for staying in a single mode for all intervals."""
+) -> List[Dict[str, Any]]:
+    """Cost summaries for staying in each of ``fixed_modes`` for all intervals."""
     effective_min = (
         physical_min_capacity if physical_min_capacity is not None else min_capacity
     )
 
     planning_minimum = min_capacity
-    penalty_cost = 0.0
-    planning_violations = 0
     efficiency = sensor._get_battery_efficiency()
 
-    total_cost = 0.0
-    total_grid_import = 0.0
-    battery_soc = current_capacity
-    timeline_cache = []
-
-    for _, timestamp_str, spot_price, export_price, load_kwh, solar_kwh in _iter_interval_inputs(
+    columns = _collect_interval_inputs(
         sensor,
         spot_prices=spot_prices,
         export_prices=export_prices,
         solar_forecast=solar_forecast,
         load_forecast=load_forecast,
-    ):
-        sim_result = simulate_interval(
-            mode=fixed_mode,
-            solar_kwh=solar_kwh,
-            load_kwh=load_kwh,
-            battery_soc_kwh=battery_soc,
-            capacity_kwh=max_capacity,
-            hw_min_capacity_kwh=effective_min,
-            spot_price_czk=spot_price,
-            export_price_czk=export_price,
-            charge_efficiency=efficiency,
-            discharge_efficiency=efficiency,
-        )
+    )
+    horizon = len(columns["time"])
+    batch = _simulate_candidates(
+        columns,
+        candidates=[[mode] * horizon for mode in fixed_modes],
+        current_capacity=current_capacity,
+        max_capacity=max_capacity,
+        min_capacity=effective_min,
+        efficiency=efficiency,
+    )
 
-        total_cost += sim_result["net_cost_czk"]
-        total_grid_import += sim_result.get("grid_import_kwh", 0.0)
-        battery_soc = sim_result["new_soc_kwh"]
-
-        if battery_soc < planning_minimum:
-            deficit = planning_minimum - battery_soc
-            interval_penalty = (deficit * spot_price) / efficiency
-            penalty_cost += interval_penalty
-            planning_violations += 1
-
-        if fixed_mode == CBB_MODE_HOME_I:
-            timeline_cache.append(
-                {
-                    "time": timestamp_str,
-                    "net_cost": sim_result["net_cost_czk"],
-                }
-            )
+    total_costs = batch.total_cost_czk()
+    final_socs = batch.final_soc_kwh(current_capacity).tolist()
+    results: List[Dict[str, Any]] = []
+    for k, soc_row in enumerate(batch.soc_kwh.tolist()):
+        penalty_cost = 0.0
+        planning_violations = 0
+        for battery_soc, spot_price in zip(soc_row, columns["spot"]):
+            if battery_soc < planning_minimum:
+                deficit = planning_minimum - battery_soc
+                penalty_cost += (deficit * spot_price) / efficiency
+                planning_violations += 1
+
+        total_cost = total_costs[k]
+        total_grid_import = sequential_sum(batch.grid_import_kwh[k].tolist())
+        results.append(
+            {
+                "total_cost": round(total_cost, 2),
+                "grid_import_kwh": round(total_grid_import, 2),
+                "final_battery_kwh": round(final_socs[k], 2),
+                "penalty_cost": round(penalty_cost, 2),
+                "planning_violations": planning_violations,
+                "adjusted_total_cost": round(total_cost + penalty_cost, 2),
+            }
+        )
+    return results
 
-    adjusted_total_cost = total_cost + penalty_cost
 
-    return {
-        "total_cost": round(total_cost, 2),
-        "grid_import_kwh": round(total_grid_import, 2),
-        "final_battery_kwh": round(battery_soc, 2),
-        "penalty_cost": round(penalty_cost, 2),
-        "planning_violations": planning_violations,
-        "adjusted_total_cost": round(adjusted_total_cost, 2),
-    }
+def calculate_fixed_mode_cost(
+    sensor: Any,
+    *,
+    fixed_mode: int,
+    current_capacity: float,
+    max_capacity: float,
+    min_capacity: float,
+    spot_prices: List[Dict[str, Any]],
+    export_prices: List[Dict[str, Any]],
+    solar_forecast: Dict[str, Any],
+    load_forecast: List[float],
+    physical_min_capacity: float | None = None,
+) -> Dict[str, Any]:
+    """Calculate cost for staying in a single mode for all intervals."""
+    return _fixed_mode_costs(
+        sensor,
+        fixed_modes=[fixed_mode],
+        current_capacity=current_capacity,
+        max_capacity=max_capacity,
+        min_capacity=min_capacity,
+        spot_prices=spot_prices,
+        export_prices=export_prices,
+        solar_forecast=solar_forecast,
+        load_forecast=load_forecast,
+        physical_min_capacity=physical_min_capacity,
+    )[0]
 
 
 def calculate_mode_baselines(
@@ -226,7 +303,7 @@ def calculate_mode_baselines(
     solar_forecast: Dict[str, Any],
     load_forecast: List[float],
 ) -> Dict[str, Dict[str, Any]]:
-    """Calculate baseline costs for all modes."""
+    """Calculate baseline costs for all modes (one batch simulation)."""
     baselines: Dict[str, Dict[str, Any]] = {}
 
     mode_mapping = [
@@ -242,20 +319,20 @@ def calculate_mode_baselines(
         physical_min_capacity / max_capacity * 100,
     )
 
-    for mode_id, mode_name in mode_mapping:
-        result = calculate_fixed_mode_cost(
-            sensor,
-            fixed_mode=mode_id,
-            current_capacity=current_capacity,
-            max_capacity=max_capacity,
-            min_capacity=physical_min_capacity,
-            spot_prices=spot_prices,
-            export_prices=export_prices,
-            solar_forecast=solar_forecast,
-            load_forecast=load_forecast,
-            physical_min_capacity=physical_min_capacity,
-        )
+    results = _fixed_mode_costs(
+        sensor,
+        fixed_modes=[mode_id for mode_id, _ in mode_mapping],
+        current_capacity=current_capacity,
+        max_capacity=max_capacity,
+        min_capacity=physical_min_capacity,
+        spot_prices=spot_prices,
+        export_prices=export_prices,
+        solar_forecast=solar_forecast,
+        load_forecast=load_forecast,
+        physical_min_capacity=physical_min_capacity,
+    )
 
+    for (_, mode_name), result in zip(mode_mapping, results):
         baselines[mode_name] = result
 
         penalty_info = ""
@@ -299,33 +376,22 @@ def calculate_do_nothing_cost(
         current_mode,
     )
 
-    total_cost = 0.0
-    battery_soc = current_capacity
-
-    for _, _timestamp_str, spot_price, export_price, load_kwh, solar_kwh in _iter_interval_inputs(
+    columns = _collect_interval_inputs(
         sensor,
         spot_prices=spot_prices,
         export_prices=export_prices,
         solar_forecast=solar_forecast,
         load_forecast=load_forecast,
-    ):
-        sim_result = simulate_interval(
-            mode=current_mode,
-            solar_kwh=solar_kwh,
-            load_kwh=load_kwh,
-            battery_soc_kwh=battery_soc,
-            capacity_kwh=max_capacity,
-            hw_min_capacity_kwh=min_capacity,
-            spot_price_czk=spot_price,
-            export_price_czk=export_price,
-            charge_efficiency=efficiency,
-            discharge_efficiency=efficiency,
-        )
-
-        total_cost += sim_result["net_cost_czk"]
-        battery_soc = sim_result["new_soc_kwh"]
-
-    return total_cost
+    )
+    batch = _simulate_candidates(
+        columns,
+        candidates=[[current_mode] * len(columns["time"])],
+        current_capacity=current_capacity,
+        max_capacity=max_capacity,
+        min_capacity=min_capacity,
+        efficiency=efficiency,
+    )
+    return batch.total_cost_czk()[0]
 
 
 def calculate_full_ups_cost(
@@ -375,38 +441,28 @@ def calculate_full_ups_cost(
             len(night_intervals),
         )
 
-    total_cost = 0.0
-    battery_soc = current_capacity
-
-    for idx, _timestamp_str, spot_price, export_price, load_kwh, solar_kwh in _iter_interval_inputs(
+    columns = _collect_interval_inputs(
         sensor,
         spot_prices=spot_prices,
         export_prices=export_prices,
         solar_forecast=solar_forecast,
         load_forecast=load_forecast,
-    ):
-        if idx in cheapest_intervals and battery_soc < max_capacity:
-            mode = CBB_MODE_HOME_UPS
-        else:
-            mode = CBB_MODE_HOME_I
-
-        sim_result = simulate_interval(
-            mode=mode,
-            solar_kwh=solar_kwh,
-            load_kwh=load_kwh,
-            battery_soc_kwh=battery_soc,
-            capacity_kwh=max_capacity,
-            hw_min_capacity_kwh=min_capacity,
-            spot_price_czk=spot_price,
-            export_price_czk=export_price,
-            charge_efficiency=efficiency,
-            discharge_efficiency=efficiency,
-        )
-
-        total_cost += sim_result["net_cost_czk"]
-        battery_soc = sim_result["new_soc_kwh"]
-
-    return total_cost
+    )
+    # UPS only while the battery still has headroom; a full battery stays HOME I.
+    candidate = [
+        CBB_MODE_HOME_UPS if idx in cheapest_intervals else CBB_MODE_HOME_I
+        for idx in range(len(columns["time"]))
+    ]
+    batch = _simulate_candidates(
+        columns,
+        candidates=[candidate],
+        current_capacity=current_capacity,
+        max_capacity=max_capacity,
+        min_capacity=min_capacity,
+        efficiency=efficiency,
+        ups_requires_headroom=True,
+    )
+    return batch.total_cost_czk()[0]
 
 
 def generate_alternatives(  # noqa: C901
@@ -0,0 +1,137 @@
+"""In-process read access to the latest precomputed plan data.
+
+``precompute_ui_data`` publishes every payload it saves to the
+``oig_cloud.precomputed_data_{box_id}`` Store here too, so internal consumers
+(AI evaluation, ...) read the unified cost tile and the active timeline as the
+stored objects themselves instead of requesting them from our own REST views
+(HTTP, auth and a JSON round-trip of the whole payload). Each publish bumps a
+per-box revision so readers can tell whether anything changed since their
+last read. Snapshots are shared: treat them as read-only.
+
+A snapshot also memoizes the encoded REST response bodies built from its data
+(``encoded_response``); a new payload is a new snapshot, so those never go
+stale.
+"""
+
+from __future__ import annotations
+
+import logging
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Mapping, Optional
+
+from ...const import DOMAIN
+from .precomputed_format import (
+    DETAIL_TABS,
+    TIMELINE,
+    UNIFIED_COST_TILE,
+    precomputed_artifact,
+)
+from .response_bodies import VARIANTS, EncodedResponse, encode_variant
+
+_LOGGER = logging.getLogger(__name__)
+
+HASS_DATA_KEY = "oig_plan_snapshots"
+
+
+@dataclass(frozen=True)
+class PlanSnapshot:
+    """One published precomputed payload of a box."""
+
+    box_id: str
+    revision: int
+    data: Mapping[str, Any]
+    _responses: Dict[str, Optional[EncodedResponse]] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+
+    @property
+    def last_update(self) -> Optional[str]:
+        return self.data.get("last_update")
+
+    @property
+    def unified_cost_tile(self) -> Dict[str, Any]:
+        return precomputed_artifact(self.data, UNIFIED_COST_TILE) or {}
+
+    @property
+    def timeline(self) -> List[Dict[str, Any]]:
+        """Active (hybrid) timeline."""
+        return precomputed_artifact(self.data, TIMELINE) or []
+
+    @property
+    def detail_tabs(self) -> Dict[str, Any]:
+        return precomputed_artifact(self.data, DETAIL_TABS) or {}
+
+    def encoded_response(self, variant: str) -> Optional[EncodedResponse]:
+        """Encoded body of a REST view variant (see ``response_bodies``)."""
+        if variant not in self._responses:
+            self._responses[variant] = encode_variant(self.data, self.box_id, variant)
+        return self._responses[variant]
+
+    def encode_responses(self) -> None:
+        """Encode every view variant up front (safe to run in an executor)."""
+        for variant in VARIANTS:
+            self.encoded_response(variant)
+
+
+class PlanSnapshotRegistry:
+    """Latest snapshot per box id."""
+
+    def __init__(self) -> None:
+        self._snapshots: Dict[str, PlanSnapshot] = {}
+
+    def publish(self, box_id: str, data: Mapping[str, Any]) -> PlanSnapshot:
+        previous = self._snapshots.get(box_id)
+        snapshot = PlanSnapshot(
+            box_id=box_id,
+            revision=(previous.revision + 1) if previous else 1,
+            data=data,
+        )
+        self._snapshots[box_id] = snapshot
+        return snapshot
+
+    def get(self, box_id: str) -> Optional[PlanSnapshot]:
+        return self._snapshots.get(box_id)
+
+
+def get_plan_snapshot_registry(hass: Any) -> PlanSnapshotRegistry:
+    """Return the integration-lifetime snapshot registry."""
+    domain_data = hass.data.setdefault(DOMAIN, {})
+    registry = domain_data.get(HASS_DATA_KEY)
+    if not isinstance(registry, PlanSnapshotRegistry):
+        registry = PlanSnapshotRegistry()
+        domain_data[HASS_DATA_KEY] = registry
+    return registry
+
+
+def publish_plan_snapshot(
+    hass: Any, box_id: str, data: Mapping[str, Any]
+) -> Optional[PlanSnapshot]:
+    """Publish a freshly saved precomputed payload (no-op without hass.data)."""
+    if not isinstance(getattr(hass, "data", None), dict):
+        return None
+    return get_plan_snapshot_registry(hass).publish(box_id, data)
+
+
+async def async_get_plan_snapshot(hass: Any, box_id: str) -> Optional[PlanSnapshot]:
+    """Latest snapshot for ``box_id``.
+
+    Before the first precompute after a restart, the payload persisted by the
+    previous run is loaded from the Store once and published.
+    """
+    registry = get_plan_snapshot_registry(hass)
+    snapshot = registry.get(box_id)
+    if snapshot is not None:
+        return snapshot
+
+    from homeassistant.helpers.storage import Store
+
+    store: Store = Store(hass, 1, f"oig_cloud.precomputed_data_{box_id}")
+    try:
+        loaded = await store.async_load()
+    except Exception as err:
+        _LOGGER.debug("Failed to read precomputed data for %s: %s", box_id, err)
+        return None
+    if not isinstance(loaded, dict):
+        return None
+    # A precompute may have published while the Store was being read.
+    return registry.get(box_id) or registry.publish(box_id, loaded)
@@ -2,13 +2,25 @@
 
 from __future__ import annotations
 
-import copy
 import logging
-from typing import Any, Dict
+from typing import Any, Dict, Optional
 
 from homeassistant.util import dt as dt_util
 
 from . import detail_tabs as detail_tabs_module
+from .plan_snapshot import get_plan_snapshot_registry, publish_plan_snapshot
+from .precomputed_format import (
+    DETAIL_TABS,
+    PRECOMPUTED_VERSION,
+    TIMELINE,
+    UNIFIED_COST_TILE,
+)
+from .response_bodies import (
+    VARIANT_DETAIL_TABS,
+    VARIANT_TIMELINE,
+    VARIANT_UNIFIED_COST_TILE,
+)
+from .timeline_delta import get_timeline_delta_history, next_timeline_version
 from ..types import CBB_MODE_NAMES
 
 _LOGGER = logging.getLogger(__name__)
@@ -26,14 +38,23 @@ async def precompute_ui_data(sensor: Any) -> None:
 
         detail_tabs = await _build_detail_tabs(sensor)
         unified_cost_tile = await sensor.build_unified_cost_tile()
-        timeline = copy.deepcopy(sensor._timeline_data or [])
+        timeline = [_copy_timeline_row(row) for row in sensor._timeline_data or []]
+        previous = _previous_snapshot(sensor)
         precomputed_data = _build_precomputed_payload(
             detail_tabs, unified_cost_tile, timeline
         )
+        precomputed_data["timeline_version"] = next_timeline_version(
+            previous.data.get("timeline_version") if previous else None
+        )
 
         await sensor._precomputed_store.async_save(
             precomputed_data
         )  # pylint: disable=protected-access
+        snapshot = publish_plan_snapshot(
+            sensor.hass, sensor._box_id, precomputed_data
+        )  # pylint: disable=protected-access
+        _record_timeline_delta(sensor, previous, precomputed_data)
+        await _encode_snapshot_responses(sensor, snapshot)
         sensor._last_precompute_hash = (
             sensor._data_hash
         )  # pylint: disable=protected-access
@@ -41,12 +62,16 @@ async def precompute_ui_data(sensor: Any) -> None:
         _dispatch_precompute_update(sensor)
 
         duration = (dt_util.now() - start_time).total_seconds()
+        sensor._precompute_stats = _build_precompute_stats(
+            snapshot, duration, len(timeline)
+        )  # pylint: disable=protected-access
         plan_cost = unified_cost_tile.get("today", {}).get("plan_total_cost") or 0.0
         _LOGGER.info(
-            "✅ Precomputed UI data saved in %.2fs (blocks=%s, cost=%.2f Kč)",
+            "✅ Precomputed UI data saved in %.2fs (blocks=%s, cost=%.2f Kč, payload=%s KB)",
             duration,
             len(detail_tabs.get("today", {}).get("mode_blocks", [])),
             float(plan_cost),
+            sensor._precompute_stats["payload_kb"],  # pylint: disable=protected-access
         )
 
     except Exception as err:
@@ -94,25 +119,98 @@ async def _build_detail_tabs(sensor: Any) -> Dict[str, Any]:
         return {}
 
 
+def _copy_timeline_row(row: Dict[str, Any]) -> Dict[str, Any]:
+    """Copy an interval row and its nested dicts/lists (e.g. decision_metrics).
+
+    Nested row values hold scalars, so one level of copying isolates the
+    published snapshot from later in-place edits without a deepcopy.
+    """
+    return {
+        key: value.copy() if isinstance(value, (dict, list)) else value
+        for key, value in row.items()
+    }
+
+
 def _build_precomputed_payload(
     detail_tabs: Dict[str, Any],
     unified_cost_tile: Dict[str, Any],
     timeline: list[Dict[str, Any]],
 ) -> Dict[str, Any]:
+    # Each artifact is stored once; readers resolve the legacy *_hybrid
+    # aliases of older payloads via precomputed_artifact().
     return {
-        "detail_tabs": detail_tabs,
-        "detail_tabs_hybrid": detail_tabs,  # legacy alias
-        "active_planner": "planner",
-        "unified_cost_tile": unified_cost_tile,
-        "unified_cost_tile_hybrid": unified_cost_tile,  # legacy alias
-        "timeline": timeline,
-        "timeline_hybrid": timeline,  # legacy alias
-        "cost_comparison": {},  # legacy key (dual-planner removed)
+        DETAIL_TABS: detail_tabs,
+        UNIFIED_COST_TILE: unified_cost_tile,
+        TIMELINE: timeline,
         "last_update": dt_util.now().isoformat(),
-        "version": 3,  # Single-planner architecture
+        "version": PRECOMPUTED_VERSION,
+    }
+
+
+def _build_precompute_stats(
+    snapshot: Any, duration: float, timeline_points: int
+) -> Dict[str, Any]:
+    """Precompute diagnostics; the payload size comes from the encoded bodies."""
+    payload_kb: Optional[float] = None
+    if snapshot is not None:
+        encoded = [
+            snapshot.encoded_response(variant)
+            for variant in (
+                VARIANT_TIMELINE,
+                VARIANT_UNIFIED_COST_TILE,
+                VARIANT_DETAIL_TABS,
+            )
+        ]
+        payload_kb = round(
+            sum(len(item.body) for item in encoded if item is not None) / 1024, 1
+        )
+    return {
+        "duration_s": round(duration, 3),
+        "payload_kb": payload_kb,
+        "timeline_points": timeline_points,
     }
 
 
+def _previous_snapshot(sensor: Any) -> Any:
+    if not isinstance(getattr(sensor.hass, "data", None), dict):
+        return None
+    return get_plan_snapshot_registry(sensor.hass).get(
+        sensor._box_id
+    )  # pylint: disable=protected-access
+
+
+def _record_timeline_delta(
+    sensor: Any, previous: Any, precomputed_data: Dict[str, Any]
+) -> None:
+    """Diff the new timeline against the previous payload for ``?since=``."""
+    if previous is None or not isinstance(previous.data.get("timeline_version"), int):
+        return
+    history = get_timeline_delta_history(
+        sensor.hass, sensor._box_id
+    )  # pylint: disable=protected-access
+    history.record(
+        previous.data["timeline_version"],
+        precomputed_data["timeline_version"],
+        previous.timeline,
+        precomputed_data["timeline"],
+    )
+
+
+async def _encode_snapshot_responses(sensor: Any, snapshot: Any) -> None:
+    """Pre-encode the REST view bodies so dashboard polls only write bytes."""
+    if snapshot is None:
+        return
+    try:
+        add_executor_job = getattr(sensor.hass, "async_add_executor_job", None)
+        if callable(add_executor_job):
+            await add_executor_job(snapshot.encode_responses)
+        else:
+            snapshot.encode_responses()
+    except Exception as err:
+        # Views encode lazily on the first request when this fails.
+        _LOGGER.debug("Failed to pre-encode API responses: %s", err)
+
+
 def _dispatch_precompute_update(sensor: Any) -> None:
     if not sensor.hass:
         return
@@ -0,0 +1,30 @@
+"""Layout of the ``oig_cloud.precomputed_data_{box_id}`` Store payload.
+
+Version 4 stores each artifact once. Payloads written by earlier versions
+carry the same objects under legacy ``*_hybrid`` aliases too (very old ones
+only there), so readers resolve artifacts with ``precomputed_artifact``
+instead of reading the keys directly.
+"""
+
+from __future__ import annotations
+
+from typing import Any, Mapping, Optional
+
+PRECOMPUTED_VERSION = 4
+
+TIMELINE = "timeline"
+DETAIL_TABS = "detail_tabs"
+UNIFIED_COST_TILE = "unified_cost_tile"
+
+LEGACY_ALIASES = {
+    TIMELINE: "timeline_hybrid",
+    DETAIL_TABS: "detail_tabs_hybrid",
+    UNIFIED_COST_TILE: "unified_cost_tile_hybrid",
+}
+
+
+def precomputed_artifact(data: Optional[Mapping[str, Any]], key: str) -> Any:
+    """Artifact ``key`` of a precomputed payload of any version (None if absent)."""
+    if not data:
+        return None
+    return data.get(key) or data.get(LEGACY_ALIASES[key])
@@ -0,0 +1,167 @@
+"""Pre-encoded REST response bodies built from precomputed plan data.
+
+The timeline, detail tabs and unified cost tile views answer every dashboard
+poll from the same precomputed payload. Instead of re-encoding ~200-300 KB of
+JSON per request, each view variant is encoded once per published payload
+(``PlanSnapshot.encoded_response``): the JSON bytes, their gzip form and an
+ETag derived from the content, so the views can answer ``If-None-Match`` with
+304 and serve the compressed body to clients that accept it.
+"""
+
+from __future__ import annotations
+
+import gzip
+import hashlib
+import json
+import logging
+import sys
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Mapping, Optional
+
+from .precomputed_format import (
+    DETAIL_TABS as DETAIL_TABS_KEY,
+    TIMELINE,
+    UNIFIED_COST_TILE,
+    precomputed_artifact,
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+GZIP_LEVEL = 6
+
+VARIANT_TIMELINE = "timeline"
+VARIANT_TIMELINE_WITH_BASELINE = "timeline_baseline"
+VARIANT_UNIFIED_COST_TILE = "unified_cost_tile"
+VARIANT_DETAIL_TABS = "detail_tabs"
+DETAIL_TABS = ("yesterday", "today", "tomorrow")
+
+
+@dataclass(frozen=True)
+class EncodedResponse:
+    """JSON body of one view variant, ready to be written to the wire."""
+
+    body: bytes
+    gzip_body: bytes
+    etag: str
+
+
+def encode_json_body(payload: Any) -> EncodedResponse:
+    """Encode ``payload`` the way ``web.json_response`` does, plus gzip/ETag."""
+    body = json.dumps(payload).encode("utf-8")
+    digest = hashlib.sha1(body, usedforsecurity=False).hexdigest()
+    return EncodedResponse(
+        body=body,
+        gzip_body=gzip.compress(body, compresslevel=GZIP_LEVEL, mtime=0),
+        etag=f'"{digest}"',
+    )
+
+
+def timeline_variant(timeline_type: str) -> str:
+    if timeline_type in ("baseline", "both"):
+        return VARIANT_TIMELINE_WITH_BASELINE
+    return VARIANT_TIMELINE
+
+
+def detail_tabs_variant(tab: Optional[str]) -> str:
+    if tab in DETAIL_TABS:
+        return f"{VARIANT_DETAIL_TABS}:{tab}"
+    return VARIANT_DETAIL_TABS
+
+
+def build_timeline_payload(
+    precomputed_data: Mapping[str, Any], timeline_type: str, box_id: str
+) -> Optional[Dict[str, Any]]:
+    """Timeline view response for precomputed data (None without a timeline)."""
+    last_update: Optional[str] = (precomputed_data or {}).get("last_update")
+    stored_hybrid: Optional[list[Any]] = precomputed_artifact(precomputed_data, TIMELINE)
+    if not stored_hybrid:
+        return None
+    metadata = {
+        "box_id": box_id,
+        "last_update": last_update,
+        "version": (precomputed_data or {}).get("timeline_version"),
+        "points_count": len(stored_hybrid),
+        "size_kb": round(sys.getsizeof(str(stored_hybrid)) / 1024, 1),
+    }
+    response_data: Dict[str, Any] = {
+        "plan": "hybrid",
+        "active": stored_hybrid,
+        "timeline": stored_hybrid,
+        "metadata": metadata,
+    }
+    if timeline_type in ("baseline", "both"):
+        response_data["baseline"] = []
+    return response_data
+
+
+def build_unified_cost_tile_payload(
+    precomputed_data: Optional[Mapping[str, Any]],
+) -> Optional[Dict[str, Any]]:
+    """Unified cost tile response for precomputed data (None without a tile)."""
+    if not precomputed_data:
+        return None
+    tile_payload = precomputed_artifact(precomputed_data, UNIFIED_COST_TILE)
+    if not tile_payload:
+        return None
+    response_payload = dict(tile_payload)
+    comparison_summary = precomputed_data.get("cost_comparison")
+    if comparison_summary:
+        response_payload["comparison"] = comparison_summary
+    return response_payload
+
+
+def filter_detail_tabs(
+    detail_tabs: Mapping[str, Any], tab: Optional[str]
+) -> Dict[str, Any]:
+    if tab and tab in DETAIL_TABS:
+        return {tab: detail_tabs.get(tab, {})}
+    return {name: detail_tabs.get(name, {}) for name in DETAIL_TABS}
+
+
+def build_detail_tabs_payload(
+    precomputed_data: Mapping[str, Any], tab: Optional[str]
+) -> Optional[Dict[str, Any]]:
+    """Detail tabs response for precomputed data (None without detail tabs)."""
+    detail_tabs = precomputed_artifact(precomputed_data, DETAIL_TABS_KEY)
+    if not detail_tabs:
+        return None
+    return filter_detail_tabs(detail_tabs, tab)
+
+
+_Builder = Callable[[Mapping[str, Any], str], Optional[Dict[str, Any]]]
+
+_BUILDERS: Dict[str, _Builder] = {
+    VARIANT_TIMELINE: lambda data, box_id: build_timeline_payload(
+        data, "active", box_id
+    ),
+    VARIANT_TIMELINE_WITH_BASELINE: lambda data, box_id: build_timeline_payload(
+        data, "both", box_id
+    ),
+    VARIANT_UNIFIED_COST_TILE: lambda data, _box_id: build_unified_cost_tile_payload(
+        data
+    ),
+    VARIANT_DETAIL_TABS: lambda data, _box_id: build_detail_tabs_payload(data, None),
+    **{
+        detail_tabs_variant(tab): (
+            lambda data, _box_id, tab=tab: build_detail_tabs_payload(data, tab)
+        )
+        for tab in DETAIL_TABS
+    },
+}
+
+VARIANTS = tuple(_BUILDERS)
+
+
+def encode_variant(
+    data: Mapping[str, Any], box_id: str, variant: str
+) -> Optional[EncodedResponse]:
+    """Encoded body of ``variant`` (None when the data has nothing to serve)."""
+    builder = _BUILDERS[variant]
+    try:
+        payload = builder(data, box_id)
+        if payload is None:
+            return None
+        return encode_json_body(payload)
+    except Exception as err:
+        _LOGGER.debug("Failed to pre-encode %s response for %s: %s", variant, box_id, err)
+        return None
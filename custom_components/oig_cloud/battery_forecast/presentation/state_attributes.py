@@ -48,6 +48,10 @@ def build_extra_state_attributes(
 
     attrs["plan_status"] = getattr(sensor, "_plan_status", "none")
 
+    precompute_stats = getattr(sensor, "_precompute_stats", None)
+    if precompute_stats:
+        attrs["precompute_stats"] = precompute_stats
+
     _attach_mode_optimization(attrs, sensor)
 
     if debug_expose_baseline_timeline:
@@ -0,0 +1,165 @@
+"""Per-precompute diffs of the active timeline for delta API responses.
+
+Every precompute stamps its payload with a ``timeline_version`` and records
+which timeline intervals changed (or dropped out of the window) against the
+previous payload. The timeline view answers ``?since=<version>`` from this
+bounded history with only the changed intervals; a version that is unknown
+or older than the history (e.g. from before a restart) gets the full
+timeline instead.
+"""
+
+from __future__ import annotations
+
+from collections import deque
+from dataclasses import dataclass
+from typing import Any, Deque, Dict, FrozenSet, List, Mapping, Optional, Tuple
+
+from homeassistant.util import dt as dt_util
+
+from ...const import DOMAIN
+from .precomputed_format import TIMELINE, precomputed_artifact
+
+HASS_DATA_KEY = "oig_timeline_deltas"
+MAX_TIMELINE_DELTAS = 24
+
+
+@dataclass(frozen=True)
+class TimelineDelta:
+    """Intervals changed between two consecutive timeline versions."""
+
+    from_version: int
+    to_version: int
+    changed: Dict[str, Dict[str, Any]]
+    removed: FrozenSet[str]
+
+
+def interval_key(entry: Mapping[str, Any]) -> Optional[str]:
+    return entry.get("time") or entry.get("timestamp")
+
+
+def next_timeline_version(previous_version: Optional[int]) -> int:
+    """Millisecond timestamp, strictly above the previous version.
+
+    Timestamps keep versions unique across restarts, so a client holding a
+    version from a previous run never matches a new one by accident.
+    """
+    version = int(dt_util.now().timestamp() * 1000)
+    if isinstance(previous_version, int) and version <= previous_version:
+        version = previous_version + 1
+    return version
+
+
+def diff_timelines(
+    old: List[Dict[str, Any]], new: List[Dict[str, Any]]
+) -> Tuple[Dict[str, Dict[str, Any]], FrozenSet[str]]:
+    """Intervals of ``new`` that are new or differ, and keys gone from ``old``."""
+    old_by_key = {interval_key(entry): entry for entry in old or []}
+    changed: Dict[str, Dict[str, Any]] = {}
+    for entry in new or []:
+        key = interval_key(entry)
+        if key is None:
+            continue
+        previous = old_by_key.pop(key, None)
+        if previous is None or previous != entry:
+            changed[key] = entry
+    return changed, frozenset(key for key in old_by_key if key is not None)
+
+
+class TimelineDeltaHistory:
+    """Bounded chain of timeline diffs of one box."""
+
+    def __init__(self, maxlen: int = MAX_TIMELINE_DELTAS) -> None:
+        self._deltas: Deque[TimelineDelta] = deque(maxlen=maxlen)
+
+    @property
+    def latest_version(self) -> Optional[int]:
+        return self._deltas[-1].to_version if self._deltas else None
+
+    def record(
+        self,
+        from_version: int,
+        to_version: int,
+        old: List[Dict[str, Any]],
+        new: List[Dict[str, Any]],
+    ) -> TimelineDelta:
+        # A gap in the chain (e.g. a payload published without a diff) makes
+        # the older diffs unusable.
+        if self._deltas and self._deltas[-1].to_version != from_version:
+            self._deltas.clear()
+        changed, removed = diff_timelines(old, new)
+        delta = TimelineDelta(from_version, to_version, changed, removed)
+        self._deltas.append(delta)
+        return delta
+
+    def since(
+        self, version: int, current_version: Optional[int]
+    ) -> Optional[Tuple[List[Dict[str, Any]], List[str]]]:
+        """Changed intervals and removed keys from ``version`` to the current one.
+
+        Returns None when the history cannot bridge ``version`` (the caller
+        serves the full timeline).
+        """
+        if current_version is None:
+            return None
+        if version == current_version:
+            return [], []
+        if self.latest_version != current_version:
+            return None
+        deltas = list(self._deltas)
+        start = next(
+            (i for i, delta in enumerate(deltas) if delta.from_version == version),
+            None,
+        )
+        if start is None:
+            return None
+        changed: Dict[str, Dict[str, Any]] = {}
+        removed: set[str] = set()
+        for delta in deltas[start:]:
+            for key in delta.removed:
+                changed.pop(key, None)
+                removed.add(key)
+            for key, entry in delta.changed.items():
+                removed.discard(key)
+                changed[key] = entry
+        return [changed[key] for key in sorted(changed)], sorted(removed)
+
+
+def get_timeline_delta_history(hass: Any, box_id: str) -> TimelineDeltaHistory:
+    """Return the integration-lifetime delta history of ``box_id``."""
+    domain_data = hass.data.setdefault(DOMAIN, {})
+    histories = domain_data.setdefault(HASS_DATA_KEY, {})
+    history = histories.get(box_id)
+    if not isinstance(history, TimelineDeltaHistory):
+        history = TimelineDeltaHistory()
+        histories[box_id] = history
+    return history
+
+
+def build_timeline_delta_payload(
+    precomputed_data: Mapping[str, Any],
+    box_id: str,
+    since: int,
+    changed: List[Dict[str, Any]],
+    removed: List[str],
+    timeline_type: str = "both",
+) -> Dict[str, Any]:
+    """Delta response in the shape of ``build_timeline_payload``'s."""
+    timeline = precomputed_artifact(precomputed_data, TIMELINE) or []
+    response_data: Dict[str, Any] = {
+        "plan": "hybrid",
+        "delta": True,
+        "since": since,
+        "changed": changed,
+        "removed": removed,
+        "metadata": {
+            "box_id": box_id,
+            "last_update": precomputed_data.get("last_update"),
+            "version": precomputed_data.get("timeline_version"),
+            "points_count": len(timeline),
+            "changed_count": len(changed),
+        },
+    }
+    if timeline_type in ("baseline", "both"):
+        # The baseline timeline is always empty, so it never has changes.
+        response_data["baseline"] = []
+    return response_data
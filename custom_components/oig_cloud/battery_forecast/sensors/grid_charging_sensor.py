@@ -20,6 +20,7 @@ from homeassistant.util import dt as dt_util
 from propcache import cached_property
 
 from ...const import DOMAIN
+from ..presentation.precomputed_format import DETAIL_TABS, precomputed_artifact
 
 MODE_LABEL_HOME_UPS = "Home UPS"
 MODE_LABEL_HOME_I = "HOME I"
@@ -597,9 +598,7 @@ def _find_battery_forecast_sensor(hass: Any, box_id: str) -> Optional[Any]:
 
 
 def _get_detail_tabs(precomputed: Dict[str, Any]) -> Dict[str, Any]:
-    return precomputed.get("detail_tabs", {}) or precomputed.get(
-        "detail_tabs_hybrid", {}
-    )
+    return precomputed_artifact(precomputed, DETAIL_TABS) or {}
 
 
 def _collect_today_blocks(
@@ -19,6 +19,11 @@ from homeassistant.helpers.update_coordinator import CoordinatorEntity
 from homeassistant.util import dt as dt_util
 
 from ...const import DOMAIN
+from ..presentation.precomputed_format import (
+    DETAIL_TABS,
+    TIMELINE,
+    precomputed_artifact,
+)
 
 _LOGGER = logging.getLogger(__name__)
 HOME_1_LABEL = "Home 1"
@@ -75,12 +80,10 @@ def _normalize_mode_from_code(mode_code: Optional[int]) -> Optional[str]:
 
 
 def _build_precomputed_payload(precomputed: Dict[str, Any]) -> Optional[Dict[str, Any]]:
-    timeline = precomputed.get("timeline") or precomputed.get("timeline_hybrid")
+    timeline = precomputed_artifact(precomputed, TIMELINE)
     if not isinstance(timeline, list) or not timeline:
         return None
-    detail_tabs = precomputed.get("detail_tabs") or precomputed.get(
-        "detail_tabs_hybrid"
-    )
+    detail_tabs = precomputed_artifact(precomputed, DETAIL_TABS)
     return {
         "timeline_data": timeline,
         "calculation_time": precomputed.get("last_update"),
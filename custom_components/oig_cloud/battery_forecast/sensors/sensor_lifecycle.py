@@ -14,6 +14,8 @@ from homeassistant.helpers.storage import Store
 from homeassistant.util import dt as dt_util
 
 from ..planning import auto_switch as auto_switch_module
+from ..presentation.precomputed_format import TIMELINE, precomputed_artifact
+from ..storage.plan_storage_shards import ShardedPlanStore
 
 _LOGGER = logging.getLogger(__name__)
 DATE_FMT = "%Y-%m-%d"
@@ -42,10 +44,10 @@ async def async_added_to_hass(sensor) -> None:
 
 def _ensure_storage_helpers(sensor) -> None:
     if not sensor._plans_store and sensor._hass:
-        sensor._plans_store = Store(
+        sensor._plans_store = ShardedPlanStore(
             sensor._hass,
-            version=1,
-            key=f"oig_cloud.battery_plans_{sensor._box_id}",
+            f"oig_cloud.battery_plans_{sensor._box_id}",
+            Store,
         )
         _LOGGER.info(
             " Retry: Initialized Storage Helper: oig_cloud.battery_plans_%s",
@@ -79,7 +81,7 @@ async def _restore_precomputed(sensor) -> None:
         return  # pragma: no cover
     try:
         precomputed = await sensor._precomputed_store.async_load() or {}
-        timeline = precomputed.get("timeline_hybrid")
+        timeline = precomputed_artifact(precomputed, TIMELINE)
         last_update = precomputed.get("last_update")
         if isinstance(timeline, list) and timeline:
             sensor._timeline_data = timeline
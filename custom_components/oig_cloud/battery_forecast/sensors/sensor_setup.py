@@ -14,6 +14,7 @@ from homeassistant.util import dt as dt_util
 
 from ...entities.base_sensor import resolve_box_id
 from ...sensors.SENSOR_TYPES_STATISTICS import SENSOR_TYPES_STATISTICS
+from ..storage.plan_storage_shards import ShardedPlanStore
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -122,10 +123,10 @@ def initialize_sensor(
     # Storage helper for persistent battery plans.
     sensor._plans_store = None
     if sensor._hass:
-        sensor._plans_store = Store(
+        sensor._plans_store = ShardedPlanStore(
             sensor._hass,
-            version=1,
-            key=f"oig_cloud.battery_plans_{sensor._box_id}",
+            f"oig_cloud.battery_plans_{sensor._box_id}",
+            Store,
         )
         _LOGGER.debug(
             "Initialized storage helper: oig_cloud.battery_plans_%s", sensor._box_id
@@ -141,8 +142,11 @@ def initialize_sensor(
     sensor._precomputed_store = None
     sensor._precompute_interval = timedelta(minutes=15)
     sensor._last_precompute_at = None
+    sensor._precompute_stats = None
     sensor._last_precompute_hash = None
     sensor._precompute_task = None
+    # Frozen past days / incremental today for the extended timeline.
+    sensor._timeline_day_cache = None
     if sensor._hass:
         sensor._precomputed_store = Store(
             sensor._hass,
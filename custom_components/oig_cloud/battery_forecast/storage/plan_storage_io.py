@@ -12,6 +12,8 @@ from homeassistant.components.persistent_notification import (
 from homeassistant.helpers.event import async_call_later
 from homeassistant.util import dt as dt_util
 
+from .plan_storage_shards import ShardedPlanStore
+
 _LOGGER = logging.getLogger(__name__)
 STORAGE_HELPER_NOT_INITIALIZED = "Storage Helper not initialized"
 
@@ -42,13 +44,15 @@ async def load_plan_from_storage(
         return _get_cached_plan(sensor, date_str, STORAGE_HELPER_NOT_INITIALIZED)
 
     try:
-        data = await sensor._plans_store.async_load()
-        if not data:
-            _LOGGER.debug("No storage data found")
-            return _get_cached_plan(sensor, date_str, "Storage empty")
-
-        detailed = data.get("detailed", {})
-        plan = detailed.get(date_str)
+        store = sensor._plans_store
+        if isinstance(store, ShardedPlanStore):
+            plan = await store.async_load_day(date_str)
+        else:
+            data = await store.async_load()
+            if not data:
+                _LOGGER.debug("No storage data found")
+                return _get_cached_plan(sensor, date_str, "Storage empty")
+            plan = data.get("detailed", {}).get(date_str)
 
         if plan:
             interval_count = len(plan.get("intervals", []))
@@ -90,11 +94,15 @@ async def save_plan_to_storage(
 
     try:
         async with get_plans_store_lock(sensor):
-            data = await sensor._plans_store.async_load() or {}
-            _ensure_storage_sections(data)
             plan = _build_plan_payload(intervals, metadata)
-            data["detailed"][date_str] = plan
-            await sensor._plans_store.async_save(data)
+            store = sensor._plans_store
+            if isinstance(store, ShardedPlanStore):
+                await store.async_save_day(date_str, plan)
+            else:
+                data = await store.async_load() or {}
+                _ensure_storage_sections(data)
+                data["detailed"][date_str] = plan
+                await store.async_save(data)
 
         _LOGGER.info(
             "Saved plan to Storage: date=%s, intervals=%s, baseline=%s",
@@ -215,12 +223,14 @@ async def plan_exists_in_storage(sensor: Any, date_str: str) -> bool:
         return False
 
     try:
-        data = await sensor._plans_store.async_load()
-        if not data:
-            return False
-
-        detailed = data.get("detailed", {})
-        exists = date_str in detailed
+        store = sensor._plans_store
+        if isinstance(store, ShardedPlanStore):
+            exists = await store.async_has_day(date_str)
+        else:
+            data = await store.async_load()
+            if not data:
+                return False
+            exists = date_str in data.get("detailed", {})
         _LOGGER.debug("Plan existence check: date=%s, exists=%s", date_str, exists)
         return exists
 
@@ -0,0 +1,336 @@
+"""Sharded persistence for battery forecast plans.
+
+The legacy layout kept every section (``detailed`` day plans, ``daily``
+aggregates, ``weekly`` aggregates, ``daily_archive``) in one Store file, so
+saving one day rewrote the whole multi-month document. ``ShardedPlanStore``
+keeps the same ``async_load``/``async_save`` contract but persists:
+
+- ``<key>``: small index (``daily``, ``weekly``, list of detailed days),
+- ``<key>_day_<YYYY-MM-DD>``: one shard per detailed day plan,
+- ``<key>_archive``: the daily plans archive.
+
+``async_save`` only writes shards whose content changed, and the per-day
+helpers (``async_load_day``/``async_save_day``/``async_has_day``) touch just
+the index and the requested shard. A legacy single-file document is read
+as-is and converted to shards on the first save.
+
+Shards are cached in memory after their first read (read-through), so timeline
+and tile builds do not deserialize the same files again. Writes update the
+cache immediately and are flushed through ``Store.async_delay_save`` (write
+behind), which coalesces bursts into one write per shard and flushes pending
+data on Home Assistant shutdown. Loaded documents share the cached plan
+dicts, so a plan edited in place is visible to other readers before it is
+saved.
+
+Changed shards are found by comparing by value with a private copy of what
+was last persisted (taken when a shard is read or written), so plans and
+sections edited in place are written on the next save too.
+
+The legacy migration does not use write-behind: the index reuses the legacy
+document's key, so every shard is saved (awaited) before the index replaces
+that document.
+"""
+
+from __future__ import annotations
+
+import copy
+import logging
+from typing import Any, Callable, Dict, List, Optional, Set
+
+_LOGGER = logging.getLogger(__name__)
+
+SHARDED_FORMAT = 2
+PLAN_WRITE_DELAY_SECONDS = 10.0
+STORE_VERSION = 1
+INDEX_FORMAT_KEY = "format"
+INDEX_DAYS_KEY = "days"
+INDEX_ARCHIVE_KEY = "has_archive"
+DETAILED_KEY = "detailed"
+ARCHIVE_KEY = "daily_archive"
+
+StoreFactory = Callable[..., Any]
+
+
+_NOT_LOADED = object()
+
+
+def _shallow_copy(data: Dict[str, Any]) -> Dict[str, Any]:
+    # Fresh section dicts so callers can add/remove entries without touching
+    # the cache; the plans inside are shared.
+    return {k: dict(v) if isinstance(v, dict) else v for k, v in data.items()}
+
+
+class ShardedPlanStore:
+    """Store-compatible facade persisting plan sections as separate shards."""
+
+    def __init__(
+        self,
+        hass: Any,
+        key: str,
+        store_factory: StoreFactory,
+        write_delay: float = PLAN_WRITE_DELAY_SECONDS,
+    ) -> None:
+        self._hass = hass
+        self._key = key
+        self._store_factory = store_factory
+        self._write_delay = write_delay
+        self._index_store = store_factory(hass, version=STORE_VERSION, key=key)
+        self._archive_store: Any = None
+        self._day_stores: Dict[str, Any] = {}
+        # Last persisted index (private copy); None until it has been read once.
+        self._index: Optional[Dict[str, Any]] = None
+        self._legacy: Optional[Dict[str, Any]] = None
+        # Read-through cache of shard contents (shared with callers) ...
+        self._days: Dict[str, Dict[str, Any]] = {}
+        self._archive: Any = _NOT_LOADED
+        # ... and private copies of what was last persisted.
+        self._saved_days: Dict[str, Dict[str, Any]] = {}
+        self._saved_archive: Any = _NOT_LOADED
+        self._hits = 0
+        self._misses = 0
+        self._writes = 0
+
+    @property
+    def key(self) -> str:
+        return self._key
+
+    @property
+    def cache_stats(self) -> Dict[str, int]:
+        """Cache hit/miss and shard write counters (for diagnostics)."""
+        return {
+            "hits": self._hits,
+            "misses": self._misses,
+            "writes": self._writes,
+            "cached_days": len(self._days),
+        }
+
+    # ------------------------------------------------------------------
+    # Store-compatible full-document API
+    # ------------------------------------------------------------------
+
+    async def async_load(self) -> Optional[Dict[str, Any]]:
+        """Assemble the full legacy-shaped document from all shards."""
+        index = await self._async_load_index()
+        if self._legacy is not None:
+            return _shallow_copy(self._legacy)
+        if index is None:
+            return None
+
+        # The index is small; copy it whole so edits never reach the
+        # persisted copy.
+        data = copy.deepcopy(
+            {
+                k: v
+                for k, v in index.items()
+                if k not in (INDEX_FORMAT_KEY, INDEX_DAYS_KEY, INDEX_ARCHIVE_KEY)
+            }
+        )
+        detailed: Dict[str, Any] = {}
+        for date_str in index.get(INDEX_DAYS_KEY, []):
+            plan = await self._async_get_day(date_str)
+            if plan is not None:
+                detailed[date_str] = plan
+        data[DETAILED_KEY] = detailed
+
+        if index.get(INDEX_ARCHIVE_KEY):
+            archive = await self._async_get_archive()
+            if archive is not None:
+                data[ARCHIVE_KEY] = _shallow_copy(archive)
+        return data
+
+    async def async_save(self, data: Dict[str, Any]) -> None:
+        """Persist ``data``, writing only the shards that changed."""
+        await self._async_load_index()
+        migrating = self._legacy is not None
+
+        detailed = data.get(DETAILED_KEY) or {}
+        known_days: Set[str] = set(self._index_days())
+        for date_str, plan in detailed.items():
+            await self._async_write_day(
+                date_str, plan, force=migrating, immediate=migrating
+            )
+        for date_str in known_days - set(detailed):
+            await self._async_remove_day(date_str)
+
+        has_archive = ARCHIVE_KEY in data
+        if has_archive:
+            archive = data[ARCHIVE_KEY]
+            if (
+                migrating
+                or self._saved_archive is _NOT_LOADED
+                or self._saved_archive != archive
+            ):
+                await self._async_write(
+                    self._get_archive_store(), archive, immediate=migrating
+                )
+                self._saved_archive = copy.deepcopy(archive)
+            self._archive = archive
+        elif self._index is not None and self._index.get(INDEX_ARCHIVE_KEY):
+            await self._async_remove(self._get_archive_store())
+            self._archive = None
+            self._saved_archive = None
+
+        index = {
+            k: v for k, v in data.items() if k not in (DETAILED_KEY, ARCHIVE_KEY)
+        }
+        index[INDEX_FORMAT_KEY] = SHARDED_FORMAT
+        index[INDEX_DAYS_KEY] = sorted(detailed)
+        index[INDEX_ARCHIVE_KEY] = has_archive
+        # Last: during migration this replaces the legacy document.
+        await self._async_write_index(index, force=migrating, immediate=migrating)
+
+        if migrating:
+            _LOGGER.info(
+                "Migrated battery plans storage %s to sharded layout (%s days)",
+                self._key,
+                len(detailed),
+            )
+            self._legacy = None
+
+    # ------------------------------------------------------------------
+    # Per-day API
+    # ------------------------------------------------------------------
+
+    async def async_load_day(self, date_str: str) -> Optional[Dict[str, Any]]:
+        """Load one detailed day plan without reading other shards."""
+        await self._async_load_index()
+        if self._legacy is not None:
+            return (self._legacy.get(DETAILED_KEY) or {}).get(date_str)
+        if date_str not in self._index_days():
+            return None
+        return await self._async_get_day(date_str)
+
+    async def async_save_day(self, date_str: str, plan: Dict[str, Any]) -> None:
+        """Persist one detailed day plan (and the index if the day is new)."""
+        await self._async_load_index()
+        if self._legacy is not None:
+            data = dict(self._legacy)
+            data[DETAILED_KEY] = dict(data.get(DETAILED_KEY) or {})
+            data[DETAILED_KEY][date_str] = plan
+            await self.async_save(data)
+            return
+
+        await self._async_write_day(date_str, plan, force=True)
+        days = self._index_days()
+        if date_str not in days:
+            index = dict(self._index or {})
+            index.setdefault(INDEX_FORMAT_KEY, SHARDED_FORMAT)
+            index[INDEX_DAYS_KEY] = sorted([*days, date_str])
+            await self._async_write_index(index, force=True)
+
+    async def async_has_day(self, date_str: str) -> bool:
+        """Return True if a detailed plan for ``date_str`` is stored."""
+        await self._async_load_index()
+        if self._legacy is not None:
+            return date_str in (self._legacy.get(DETAILED_KEY) or {})
+        return date_str in self._index_days()
+
+    # ------------------------------------------------------------------
+    # Internals
+    # ------------------------------------------------------------------
+
+    async def _async_load_index(self) -> Optional[Dict[str, Any]]:
+        if self._index is not None or self._legacy is not None:
+            return self._index
+        raw = await self._index_store.async_load()
+        if not raw:
+            return None
+        if raw.get(INDEX_FORMAT_KEY) != SHARDED_FORMAT:
+            self._legacy = raw
+            return None
+        self._index = raw
+        return raw
+
+    async def _async_get_day(self, date_str: str) -> Optional[Dict[str, Any]]:
+        plan = self._days.get(date_str)
+        if plan is not None:
+            self._hits += 1
+            return plan
+        self._misses += 1
+        plan = await self._day_store(date_str).async_load()
+        if plan is not None:
+            self._days[date_str] = plan
+            self._saved_days[date_str] = copy.deepcopy(plan)
+        return plan
+
+    async def _async_get_archive(self) -> Any:
+        if self._archive is not _NOT_LOADED:
+            self._hits += 1
+            return self._archive
+        self._misses += 1
+        archive = await self._get_archive_store().async_load()
+        self._archive = archive
+        self._saved_archive = copy.deepcopy(archive)
+        return archive
+
+    async def _async_write(
+        self, store: Any, data: Dict[str, Any], *, immediate: bool = False
+    ) -> None:
+        self._writes += 1
+        delay_save = getattr(store, "async_delay_save", None)
+        if not immediate and delay_save is not None and self._write_delay > 0:
+            delay_save(lambda: data, self._write_delay)
+            return
+        await store.async_save(data)
+
+    def _index_days(self) -> List[str]:
+        if self._index is None:
+            return []
+        return list(self._index.get(INDEX_DAYS_KEY, []))
+
+    async def _async_write_index(
+        self, index: Dict[str, Any], *, force: bool, immediate: bool = False
+    ) -> None:
+        if not force and self._index == index:
+            return
+        await self._async_write(self._index_store, index, immediate=immediate)
+        # Sections are the caller's dicts and may be edited before the next save.
+        self._index = copy.deepcopy(index)
+
+    async def _async_write_day(
+        self,
+        date_str: str,
+        plan: Dict[str, Any],
+        *,
+        force: bool,
+        immediate: bool = False,
+    ) -> None:
+        persisted = self._saved_days.get(date_str)
+        self._days[date_str] = plan
+        if not force and persisted is not None and persisted == plan:
+            return
+        await self._async_write(self._day_store(date_str), plan, immediate=immediate)
+        self._saved_days[date_str] = copy.deepcopy(plan)
+
+    async def _async_remove_day(self, date_str: str) -> None:
+        store = self._day_stores.pop(date_str, None) or self._new_store(
+            self._day_key(date_str)
+        )
+        await self._async_remove(store)
+        self._days.pop(date_str, None)
+        self._saved_days.pop(date_str, None)
+        _LOGGER.debug("Removed plan shard %s", self._day_key(date_str))
+
+    @staticmethod
+    async def _async_remove(store: Any) -> None:
+        remover = getattr(store, "async_remove", None)
+        if remover is not None:
+            await remover()
+
+    def _day_store(self, date_str: str) -> Any:
+        store = self._day_stores.get(date_str)
+        if store is None:
+            store = self._new_store(self._day_key(date_str))
+            self._day_stores[date_str] = store
+        return store
+
+    def _get_archive_store(self) -> Any:
+        if self._archive_store is None:
+            self._archive_store = self._new_store(f"{self._key}_archive")
+        return self._archive_store
+
+    def _new_store(self, key: str) -> Any:
+        return self._store_factory(self._hass, version=STORE_VERSION, key=key)
+
+    def _day_key(self, date_str: str) -> str:
+        return f"{self._key}_day_{date_str}"
@@ -0,0 +1,183 @@
+"""Memoized per-day results for the extended timeline builder.
+
+``build_timeline_extended`` runs on every precompute and used to rebuild
+yesterday, today and tomorrow from scratch: a Recorder read of the mode
+history per day plus one history query per elapsed 15-min interval.
+
+- A completed day no longer changes once it has settled: its first build is
+  frozen under the fingerprint of the day's stored plan and persisted once
+  (``oig_cloud.timeline_days_{box_id}``), so later builds and restarts reuse
+  it until the stored plan changes.
+- Today keeps the mode changes read so far and only reads the Recorder from
+  the watermark on; actual data of settled intervals is reused, so a build
+  only queries history for intervals that turned actual since the last build
+  (plus the current and the just finished one).
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+from datetime import datetime, timedelta
+from typing import Any, Dict, List, Optional, Tuple
+
+from ..data import history as history_module
+
+_LOGGER = logging.getLogger(__name__)
+
+FROZEN_DAYS_KEPT = 3
+FROZEN_KEYS_PER_DAY = 2
+SETTLE_DELAY = timedelta(minutes=15)
+STORE_VERSION = 1
+
+ActualKey = Tuple[Any, Any, Any]
+
+
+def plan_fingerprint(storage_plans: Dict[str, Any], date_str: str) -> str:
+    """Stable fingerprint of the stored plan data a day timeline is built from."""
+    payload = [
+        (storage_plans.get("detailed") or {}).get(date_str),
+        (storage_plans.get("daily_archive") or {}).get(date_str),
+    ]
+    raw = json.dumps(payload, sort_keys=True, default=str)
+    return hashlib.sha1(raw.encode("utf-8"), usedforsecurity=False).hexdigest()
+
+
+def is_settled(interval_end: datetime, now: datetime) -> bool:
+    """True once ``SETTLE_DELAY`` has passed since ``interval_end``."""
+    return interval_end + SETTLE_DELAY <= now
+
+
+class TimelineDayCache:
+    """Frozen completed days and the incremental state of today."""
+
+    def __init__(self, hass: Any, box_id: str) -> None:
+        self._hass = hass
+        self._store_key = f"oig_cloud.timeline_days_{box_id}"
+        self._store: Optional[Any] = None
+        self._loaded = False
+        # date_str -> plan fingerprint -> day timeline (callers passing
+        # different storage data get separate entries)
+        self._frozen: Dict[str, Dict[str, Dict[str, Any]]] = {}
+        self._today: Optional[str] = None
+        self._mode_changes: List[Dict[str, Any]] = []
+        self._mode_watermark: Optional[datetime] = None
+        self._actuals: Dict[str, Tuple[ActualKey, Dict[str, Any]]] = {}
+
+    # ------------------------------------------------------------------
+    # Completed days
+    # ------------------------------------------------------------------
+
+    async def async_get_frozen(self, date_str: str, key: str) -> Optional[Dict[str, Any]]:
+        await self._async_load()
+        return self._frozen.get(date_str, {}).get(key)
+
+    async def async_freeze(
+        self, date_str: str, key: str, result: Dict[str, Any]
+    ) -> None:
+        await self._async_load()
+        results = self._frozen.setdefault(date_str, {})
+        results.pop(key, None)
+        results[key] = result
+        while len(results) > FROZEN_KEYS_PER_DAY:
+            del results[next(iter(results))]
+        for old in sorted(self._frozen)[:-FROZEN_DAYS_KEPT]:
+            del self._frozen[old]
+        store = self._ensure_store()
+        if store is None:
+            return
+        try:
+            await store.async_save({"days": self._frozen})
+        except Exception as err:
+            _LOGGER.debug("Failed to persist frozen timeline %s: %s", date_str, err)
+
+    # ------------------------------------------------------------------
+    # Today
+    # ------------------------------------------------------------------
+
+    def start_day(self, date_str: str) -> None:
+        """Reset the incremental state when ``date_str`` is a new day."""
+        if self._today == date_str:
+            return
+        self._today = date_str
+        self._mode_changes = []
+        self._mode_watermark = None
+        self._actuals = {}
+
+    async def async_today_modes(
+        self, sensor: Any, day_start: datetime, now: datetime
+    ) -> Dict[str, Any]:
+        """Historical modes lookup for today, reading only new Recorder data."""
+        fetched = await history_module.fetch_mode_changes(
+            sensor, self._mode_watermark or day_start, now
+        )
+        # An empty read (no state yet or a Recorder error) keeps the watermark,
+        # so the next build reads the whole gap again.
+        if fetched:
+            merged = {change["time"]: change for change in self._mode_changes}
+            merged.update((change["time"], change) for change in fetched)
+            self._mode_changes = sorted(merged.values(), key=lambda x: x["time"])
+            self._mode_watermark = now
+        return history_module.expand_modes_to_intervals(
+            self._mode_changes, day_start, now
+        )
+
+    def get_actual(self, time_str: str, key: ActualKey) -> Optional[Dict[str, Any]]:
+        entry = self._actuals.get(time_str)
+        if entry is None or entry[0] != key:
+            return None
+        return dict(entry[1])
+
+    def put_actual(
+        self, time_str: str, key: ActualKey, actual_data: Dict[str, Any]
+    ) -> None:
+        self._actuals[time_str] = (key, dict(actual_data))
+
+    # ------------------------------------------------------------------
+    # Persistence
+    # ------------------------------------------------------------------
+
+    def _ensure_store(self) -> Optional[Any]:
+        if self._store is None and self._hass:
+            try:
+                from homeassistant.helpers.storage import Store
+
+                self._store = Store(self._hass, STORE_VERSION, self._store_key)
+            except Exception:  # pragma: no cover - defensive
+                self._store = None
+        return self._store
+
+    async def _async_load(self) -> None:
+        if self._loaded:
+            return
+        self._loaded = True
+        store = self._ensure_store()
+        if store is None:
+            return
+        try:
+            data = await store.async_load()
+        except Exception as err:
+            _LOGGER.debug("Failed to load frozen timelines: %s", err)
+            return
+        days = data.get("days") if isinstance(data, dict) else None
+        if not isinstance(days, dict):
+            return
+        for date_str, results in days.items():
+            if not isinstance(results, dict):
+                continue
+            known = self._frozen.setdefault(date_str, {})
+            for key, result in results.items():
+                if isinstance(result, dict):
+                    known.setdefault(key, result)
+
+
+def get_day_cache(sensor: Any) -> TimelineDayCache:
+    """Return the sensor's day cache, creating it on first use."""
+    cache = getattr(sensor, "_timeline_day_cache", None)
+    if not isinstance(cache, TimelineDayCache):
+        cache = TimelineDayCache(
+            getattr(sensor, "_hass", None), getattr(sensor, "_box_id", "unknown")
+        )
+        sensor._timeline_day_cache = cache
+    return cache
@@ -9,6 +9,7 @@ from typing import Any, Dict, List, Optional
 from homeassistant.util import dt as dt_util
 
 from ..data import history as history_module
+from . import day_cache as day_cache_module
 from .extended_summary import (
     build_today_tile_summary,
     calculate_day_summary,
@@ -246,6 +247,27 @@ async def _load_historical_modes(
         return {}
 
 
+async def _load_today_modes(
+    sensor: Any,
+    day_cache: day_cache_module.TimelineDayCache,
+    day_start: datetime,
+    now: datetime,
+    date_str: str,
+) -> Dict[str, Any]:
+    if not sensor._hass:
+        return {}
+    try:
+        return await day_cache.async_today_modes(sensor, day_start, now)
+    except Exception as err:
+        _LOGGER.error(
+            "[OIG_CLOUD_ERROR][component=planner][corr=na][run=na] "
+            + "Failed to fetch historical modes from Recorder for %s: %s",
+            date_str,
+            err,
+        )
+        return {}
+
+
 async def _build_historical_only_intervals(
     sensor: Any,
     day: date,
@@ -566,6 +588,7 @@ async def _build_mixed_intervals(
     now: datetime,
     mode_names: Dict[int, str],
     historical_modes_lookup: Dict[str, Any],
+    day_cache: Optional[day_cache_module.TimelineDayCache] = None,
 ) -> List[Dict[str, Any]]:
     past_planned, future_planned = await _resolve_mixed_planned(
         sensor, storage_plans, date_str, day
@@ -592,6 +615,7 @@ async def _build_mixed_intervals(
         planned_lookup,
         historical_modes_lookup,
         mode_names,
+        day_cache,
     )
 
 
@@ -712,6 +736,7 @@ async def _build_mixed_interval_entries(
     planned_lookup: Dict[str, Dict[str, Any]],
     historical_modes_lookup: Dict[str, Any],
     mode_names: Dict[int, str],
+    day_cache: Optional[day_cache_module.TimelineDayCache] = None,
 ) -> List[Dict[str, Any]]:
     intervals: List[Dict[str, Any]] = []
     interval_time = day_start
@@ -723,6 +748,7 @@ async def _build_mixed_interval_entries(
             planned_lookup,
             historical_modes_lookup,
             mode_names,
+            day_cache,
         )
         if interval_entry:
             intervals.append(interval_entry)
@@ -739,6 +765,7 @@ async def _build_interval_entry(
     planned_lookup: Dict[str, Dict[str, Any]],
     historical_modes_lookup: Dict[str, Any],
     mode_names: Dict[int, str],
+    day_cache: Optional[day_cache_module.TimelineDayCache] = None,
 ) -> Optional[Dict[str, Any]]:
     interval_time_str = interval_time.strftime(DATETIME_FMT)
     status = _interval_status(interval_time, current_interval_naive)
@@ -746,14 +773,38 @@ async def _build_interval_entry(
     planned_entry = planned_lookup.get(interval_time_str)
     planned_data = format_planned_data(planned_entry) if planned_entry else {}
 
-    actual_data = await _build_actual_data(
-        sensor,
-        interval_time,
-        interval_time_str,
-        status,
-        planned_data,
-        historical_modes_lookup,
+    # Settled historical intervals keep the actual data of an earlier build
+    # as long as their recorded mode and planned cost are unchanged.
+    settled = (
+        day_cache is not None
+        and status == "historical"
+        and day_cache_module.is_settled(
+            interval_time.replace(tzinfo=None) + timedelta(minutes=15),
+            current_interval_naive,
+        )
     )
+    mode_from_recorder = historical_modes_lookup.get(interval_time_str) or {}
+    actual_key = (
+        mode_from_recorder.get("mode"),
+        mode_from_recorder.get("mode_name"),
+        planned_data.get("net_cost"),
+    )
+    actual_data = (
+        day_cache.get_actual(interval_time_str, actual_key)
+        if settled and day_cache is not None
+        else None
+    )
+    if actual_data is None:
+        actual_data = await _build_actual_data(
+            sensor,
+            interval_time,
+            interval_time_str,
+            status,
+            planned_data,
+            historical_modes_lookup,
+        )
+        if settled and day_cache is not None and actual_data is not None:
+            day_cache.put_actual(interval_time_str, actual_key, actual_data)
 
     if status == "current":
         actual_data = _apply_current_interval_data(sensor, actual_data, mode_names)
@@ -876,10 +927,25 @@ async def build_day_timeline(  # noqa: C901
     mode_names = mode_names or {}
 
     now, day_start, day_end, date_str, source = _build_day_context(day)
+    day_cache = day_cache_module.get_day_cache(self)
 
-    historical_modes_lookup = await _load_historical_modes(
-        self, source, day_start, day_end, now, date_str
-    )
+    # Settled past days are built once per stored plan version.
+    frozen_key = None
+    if source == "historical_only" and day_cache_module.is_settled(day_end, now):
+        frozen_key = day_cache_module.plan_fingerprint(storage_plans or {}, date_str)
+        frozen = await day_cache.async_get_frozen(date_str, frozen_key)
+        if frozen is not None:
+            return frozen
+
+    if source == "mixed":
+        day_cache.start_day(date_str)
+        historical_modes_lookup = await _load_today_modes(
+            self, day_cache, day_start, now, date_str
+        )
+    else:
+        historical_modes_lookup = await _load_historical_modes(
+            self, source, day_start, day_end, now, date_str
+        )
 
     intervals = await _select_day_intervals(
         sensor=self,
@@ -892,9 +958,14 @@ async def build_day_timeline(  # noqa: C901
         now=now,
         mode_names=mode_names,
         historical_modes_lookup=historical_modes_lookup,
+        day_cache=day_cache,
     )
 
-    return _build_day_result(day, intervals)
+    result = _build_day_result(day, intervals)
+    # Without Recorder modes the day is incomplete: keep rebuilding it.
+    if frozen_key is not None and historical_modes_lookup:
+        await day_cache.async_freeze(date_str, frozen_key, result)
+    return result
 
 
 def _build_day_context(
@@ -929,6 +1000,7 @@ async def _select_day_intervals(
     now: datetime,
     mode_names: Dict[int, str],
     historical_modes_lookup: Dict[str, Any],
+    day_cache: Optional[day_cache_module.TimelineDayCache] = None,
 ) -> List[Dict[str, Any]]:
     storage_plans_dict = storage_plans or {}
     if source == "historical_only":
@@ -950,5 +1022,6 @@ async def _select_day_intervals(
             now,
             mode_names,
             historical_modes_lookup,
+            day_cache,
         )
     return _build_planned_only_intervals(sensor, day_start, day_end)
@@ -19,6 +19,7 @@ import math
 from collections import defaultdict
 from dataclasses import dataclass
 from datetime import date, datetime, timedelta
+from functools import partial
 from typing import Any, Optional
 
 from .const import COMMAND_ON_W
@@ -403,6 +404,13 @@ def _distribute_draw_to_slots(draw: DrawEvent) -> dict[int, float]:
 # Profile storage: category -> list-of-days -> slot -> kWh samples
 # ---------------------------------------------------------------------------
 
+# Incremental recorder ingestion: detection context fetched before the first
+# recomputed day (draws need preceding samples), and persisted payload keys.
+DRAW_CONTEXT: timedelta = timedelta(hours=1)
+STORE_SLOTS_KEY = "slots"
+STORE_WATERMARK_KEY = "watermark"
+STORE_INLET_KEY = "inlet_min_c"
+
 # Internal type: dict[category, dict[day_str, dict[slot_idx, float]]]
 # For each observed day, we sum kWh per slot (single observation per slot per day).
 CategorySlots = dict[str, dict[str, dict[int, float]]]
@@ -900,6 +908,33 @@ def _cluster_windows(
 # Async profiler wrapper (follows executor pattern from existing profiler.py)
 # ---------------------------------------------------------------------------
 
+def _parse_heating_state(state: Any) -> Optional[bool]:
+    """Heating entity state → on/off (None when the state is missing)."""
+    try:
+        return str(state.state).lower() in ("on", "true", "1", "zapnuto")
+    except AttributeError:
+        return None
+
+
+def _parse_numeric_state(state: Any) -> Optional[float]:
+    """Numeric entity state → float (None for unknown/unavailable)."""
+    try:
+        return float(state.state)
+    except (ValueError, AttributeError, TypeError):
+        return None
+
+
+def _parse_watermark(value: Any) -> Optional[datetime]:
+    """Persisted ISO watermark → aware datetime (None if missing/invalid)."""
+    if not isinstance(value, str):
+        return None
+    try:
+        parsed = datetime.fromisoformat(value)
+    except ValueError:
+        return None
+    return parsed if parsed.tzinfo is not None else None
+
+
 class BoilerDemandProfilerAsync:
     """Async wrapper around BoilerDemandProfiler that fetches recorder data.
 
@@ -947,6 +982,13 @@ class BoilerDemandProfilerAsync:
         # purge + restarts). None until first async_update on a real hass.
         self._store: Any = None
         self._store_loaded: bool = False
+        # Incremental ingestion state: time up to which recorder changes have
+        # been ingested (persisted), buffered (ts, value) series per entity
+        # role covering the current local day, and the coldest inlet
+        # candidate per local day (persisted).
+        self._watermark: Optional[datetime] = None
+        self._series: dict[str, tuple[list[datetime], list[Any]]] = {}
+        self._inlet_min_c: dict[str, float] = {}
 
     def _ensure_store(self) -> Any:
         """Lazily create the persistent Store keyed by box_id."""
@@ -962,10 +1004,26 @@ class BoilerDemandProfilerAsync:
                 _LOGGER.debug("DemandProfiler: store unavailable: %s", err)
         return self._store
 
+    def _entity_roles(self) -> dict[str, str]:
+        """Configured recorder entities keyed by their role in draw detection."""
+        roles = {
+            "temp": self.temp_sensor_entity,
+            "bottom": self.temp_sensor_bottom_entity,
+            "heating": self.heating_entity,
+            "power": self.power_entity,
+            "command": self.command_entity,
+        }
+        return {role: entity_id for role, entity_id in roles.items() if entity_id}
+
     async def async_update(self) -> None:
-        """Fetch history from recorder and update demand profiles."""
+        """Ingest new recorder state changes and update demand profiles.
+
+        The first run backfills ``lookback_days`` with one multi-entity query.
+        Later runs only fetch changes since the persisted watermark and
+        recompute the local days touched since then; those days replace the
+        persisted ones via ``merge_category_slots``.
+        """
         try:
-            from homeassistant.components.recorder.history import state_changes_during_period
             from homeassistant.helpers.recorder import get_instance
             from homeassistant.util import dt as dt_util
 
@@ -975,172 +1033,63 @@ class BoilerDemandProfilerAsync:
                 return
 
             end_time = dt_util.now()
-            start_time = end_time - timedelta(days=self.lookback_days)
-
-            # Fetch temperature history
-            temp_states = await instance.async_add_executor_job(
-                state_changes_during_period,
-                self.hass,
-                start_time,
-                end_time,
-                self.temp_sensor_entity,
-            )
+            lookback_start = end_time - timedelta(days=self.lookback_days)
+            persisted = await self._async_load_persisted()
 
-            # Fetch heating state if configured.
-            # Build a sorted list of (timestamp, is_on) pairs and use bisect
-            # for last-value-carry-forward lookup, because the heating entity
-            # and the temperature entity change state at different moments so
-            # exact isoformat key matching always misses.
-            heating_ts_list: list[datetime] = []
-            heating_on_list: list[bool] = []
-            if self.heating_entity:
-                heating_raw = await instance.async_add_executor_job(
-                    state_changes_during_period,
-                    self.hass,
-                    start_time,
-                    end_time,
-                    self.heating_entity,
-                )
-                pairs: list[tuple[datetime, bool]] = []
-                for state in heating_raw.get(self.heating_entity, []):
-                    try:
-                        ts = state.last_updated
-                        is_on = str(state.state).lower() in ("on", "true", "1", "zapnuto")
-                        pairs.append((ts, is_on))
-                    except (ValueError, AttributeError):
-                        pass
-                pairs.sort(key=lambda p: p[0])
-                heating_ts_list = [p[0] for p in pairs]
-                heating_on_list = [p[1] for p in pairs]
-
-            def _is_heating_on_at(ts: datetime) -> bool:
-                """Return True if heating was on at ts (last-value-carry-forward)."""
-                if not heating_ts_list:
-                    return False
-                idx = bisect.bisect_right(heating_ts_list, ts) - 1
-                if idx < 0:
-                    return False
-                return heating_on_list[idx]
-
-            async def _fetch_numeric_series(
-                entity_id: Optional[str],
-            ) -> tuple[list[datetime], list[float]]:
-                """Fetch a numeric entity's history as sorted (ts, value) lists."""
-                if not entity_id:
-                    return [], []
-                raw = await instance.async_add_executor_job(
-                    state_changes_during_period,
-                    self.hass,
-                    start_time,
+            watermark = self._watermark
+            # Set when the buffered series already hold everything up to the
+            # watermark: only later changes are fetched and ingested.
+            ingested_until: Optional[datetime] = None
+            if watermark is None or watermark < lookback_start:
+                # Backfill: recompute the whole lookback window.
+                self._series = {}
+                window_start = lookback_start
+                fetch_start = lookback_start
+            else:
+                window_start = dt_util.start_of_local_day(dt_util.as_local(watermark))
+                if self._series:
+                    ingested_until = fetch_start = watermark
+                else:
+                    fetch_start = max(lookback_start, window_start - DRAW_CONTEXT)
+
+            if fetch_start < end_time:
+                # The start-time state only seeds empty series; on incremental
+                # fetches it would be a synthetic sample stamped at the watermark.
+                raw = await self._async_fetch_states(
+                    instance,
+                    fetch_start,
                     end_time,
-                    entity_id,
+                    include_start_time_state=ingested_until is None,
                 )
-                num_pairs: list[tuple[datetime, float]] = []
-                for state in raw.get(entity_id, []):
-                    try:
-                        num_pairs.append((state.last_updated, float(state.state)))
-                    except (ValueError, AttributeError, TypeError):
-                        pass
-                num_pairs.sort(key=lambda p: p[0])
-                return [p[0] for p in num_pairs], [p[1] for p in num_pairs]
-
-            # Non-backup circuit power [W] and commanded heater power (cbb_w).
-            power_ts, power_vals = await _fetch_numeric_series(self.power_entity)
-            command_ts, command_vals = await _fetch_numeric_series(self.command_entity)
-
-            def _value_at(
-                ts: datetime, ts_list: list[datetime], val_list: list[float]
-            ) -> Optional[float]:
-                if not ts_list:
-                    return None
-                idx = bisect.bisect_right(ts_list, ts) - 1
-                if idx < 0:
-                    return None
-                return val_list[idx]
-
-            def _boiler_power_w_at(ts: datetime) -> Optional[float]:
-                """Calorimetric heating-power proxy [W] at ts, or None if unknown.
-
-                The non-backup power is the authority for *actual* electrical
-                draw (it falls to ~0 when the tank thermostat cuts even though
-                cbb_w stays commanded-on). We therefore use the non-backup power
-                but gate it on the heater actually being commanded: when cbb_w is
-                ~0 the boiler contributes nothing, so any non-backup power is pure
-                house load and must not be credited as heating.
-                """
-                p = _value_at(ts, power_ts, power_vals)
-                if p is None:
-                    return None
-                p = max(0.0, p)
-                cmd = _value_at(ts, command_ts, command_vals)
-                if cmd is not None:
-                    if cmd < COMMAND_ON_W:
-                        return 0.0
-                    # Cap at the commanded heater power (cbb_w ≈ element nameplate):
-                    # non-backup power above it is house load, not boiler heating.
-                    return min(p, cmd)
-                return p
-
-            have_power = bool(power_ts)
-
-            # Bottom-zone series for tank-average draw detection. A shower/bath
-            # refills cold water from the bottom, so the bottom zone falls first
-            # while the top stays hot — detecting draws on the top alone misses
-            # them. When a bottom sensor is configured we feed detect_draws the
-            # tank average (top+bottom)/2 instead.
-            bottom_ts, bottom_vals = await _fetch_numeric_series(
-                self.temp_sensor_bottom_entity
-            )
-            have_bottom = bool(bottom_ts)
+                self._ingest_states(raw, after=ingested_until)
 
-            # Build history list
-            temp_list = temp_states.get(self.temp_sensor_entity, [])
-            history: list[dict] = []
-            min_temp: Optional[float] = None
-            for state in temp_list:
-                try:
-                    top_temp = float(state.state)
-                    ts = state.last_updated
-                    # Tank-average temperature (draw-sensitive); falls back to
-                    # the top when no bottom sensor / no bottom sample yet.
-                    bottom_temp = (
-                        _value_at(ts, bottom_ts, bottom_vals) if have_bottom else None
-                    )
-                    temp = (
-                        (top_temp + bottom_temp) / 2.0
-                        if bottom_temp is not None
-                        else top_temp
-                    )
-                    heating_on = _is_heating_on_at(ts)
-                    record: dict = {
-                        "timestamp": ts,
-                        "temp": temp,
-                        "heating": "on" if heating_on else "off",
-                    }
-                    if have_power:
-                        bp = _boiler_power_w_at(ts)
-                        if bp is not None:
-                            record["power_w"] = bp
-                    history.append(record)
-                    # Cold-inlet proxy: coldest observed *bottom* temp (the inlet
-                    # hits the bottom), falling back to the average when no bottom.
-                    inlet_candidate = bottom_temp if bottom_temp is not None else temp
-                    if min_temp is None or inlet_candidate < min_temp:
-                        min_temp = inlet_candidate
-                except (ValueError, AttributeError):
-                    continue
+            history, day_min_inlet = self._build_history(
+                window_start - DRAW_CONTEXT, window_start
+            )
+            if window_start == lookback_start:
+                self._inlet_min_c = {}
+            self._inlet_min_c.update(day_min_inlet)
 
             # D2: estimate cold-inlet from the coldest temperature actually
             # observed (the tank approaches inlet temp after a full draw),
             # clamped to a sane range; fall back to the configured constant.
+            cutoff = (end_time.date() - timedelta(days=self.lookback_days)).isoformat()
+            self._inlet_min_c = {
+                day: value for day, value in self._inlet_min_c.items() if day >= cutoff
+            }
             self._profiler.set_cold_inlet_temp_c(
-                self._estimate_cold_inlet_c(min_temp)
+                self._estimate_cold_inlet_c(
+                    min(self._inlet_min_c.values()) if self._inlet_min_c else None
+                )
             )
 
-            # Detect draws from the recorder window and aggregate into per-day
-            # slots. These are the *fresh* days; merge them over the persisted
-            # store so coverage survives the recorder purge (HA default 10 days).
-            fresh = build_category_slots(
+            # Detect draws in the recomputed window and aggregate into per-day
+            # slots. Only days starting inside the window are complete (the
+            # context before it only seeds detection), so only those replace
+            # persisted days.
+            first_day = _as_local(window_start).strftime("%Y-%m-%d")
+            fresh: CategorySlots = {}
+            for cat, days in build_category_slots(
                 detect_draws(
                     history,
                     volume_l=self._profiler.volume_l,
@@ -1148,18 +1097,25 @@ class BoilerDemandProfilerAsync:
                     cold_inlet_temp_c=self._profiler.cold_inlet_temp_c,
                     threshold_c_per_min=self._profiler.draw_threshold_c_per_min,
                 )
-            )
+            ).items():
+                kept = {day: slots for day, slots in days.items() if day >= first_day}
+                if kept:
+                    fresh[cat] = kept
 
-            persisted = await self._async_load_persisted()
             merged = merge_category_slots(persisted, fresh)
             merged = prune_category_slots(merged, self.lookback_days, end_time.date())
             self._profiler.set_category_slots(merged)
+            self._watermark = end_time
+            self._trim_series(
+                dt_util.start_of_local_day(dt_util.as_local(end_time)) - DRAW_CONTEXT
+            )
             await self._async_save_persisted(merged)
 
             _LOGGER.debug(
-                "DemandProfiler: %d temp records, %d fresh categories, "
+                "DemandProfiler: %d temp records since %s, %d fresh categories, "
                 "%d total categories after merge (cold_inlet=%.1f)",
                 len(history),
+                window_start.isoformat(),
                 len(fresh),
                 len(merged),
                 self._profiler.cold_inlet_temp_c,
@@ -1168,6 +1124,147 @@ class BoilerDemandProfilerAsync:
         except Exception as err:
             _LOGGER.error("DemandProfiler async_update failed: %s", err, exc_info=True)
 
+    async def _async_fetch_states(
+        self,
+        instance: Any,
+        start_time: datetime,
+        end_time: datetime,
+        *,
+        include_start_time_state: bool = True,
+    ) -> dict[str, list[Any]]:
+        """Fetch all configured entities' state changes in one recorder query."""
+        from homeassistant.components.recorder.history import get_significant_states
+
+        return (
+            await instance.async_add_executor_job(
+                partial(
+                    get_significant_states,
+                    self.hass,
+                    start_time,
+                    end_time,
+                    entity_ids=list(dict.fromkeys(self._entity_roles().values())),
+                    significant_changes_only=False,
+                    include_start_time_state=include_start_time_state,
+                    no_attributes=True,
+                )
+            )
+            or {}
+        )
+
+    def _ingest_states(
+        self, raw: dict[str, list[Any]], after: Optional[datetime] = None
+    ) -> None:
+        """Append parsed state changes newer than what each series holds.
+
+        ``after`` (the watermark of an incremental fetch) also drops states at
+        or before it, such as a start-time state stamped at the fetch start.
+        """
+        for role, entity_id in self._entity_roles().items():
+            parse = _parse_heating_state if role == "heating" else _parse_numeric_state
+            ts_list, val_list = self._series.setdefault(role, ([], []))
+            last_ts = ts_list[-1] if ts_list else None
+            if after is not None and (last_ts is None or last_ts < after):
+                last_ts = after
+            pairs: list[tuple[datetime, Any]] = []
+            for state in raw.get(entity_id) or []:
+                ts = getattr(state, "last_updated", None)
+                if ts is None or (last_ts is not None and ts <= last_ts):
+                    continue
+                value = parse(state)
+                if value is not None:
+                    pairs.append((ts, value))
+            pairs.sort(key=lambda p: p[0])
+            ts_list.extend(p[0] for p in pairs)
+            val_list.extend(p[1] for p in pairs)
+
+    def _trim_series(self, keep_from: datetime) -> None:
+        """Drop samples before ``keep_from``, keeping one for carry-forward."""
+        for ts_list, val_list in self._series.values():
+            idx = bisect.bisect_left(ts_list, keep_from) - 1
+            if idx > 0:
+                del ts_list[:idx]
+                del val_list[:idx]
+
+    def _build_history(
+        self, context_start: datetime, window_start: datetime
+    ) -> tuple[list[dict], dict[str, float]]:
+        """Build detect_draws records from the buffered series.
+
+        Returns the records from ``context_start`` on and the coldest inlet
+        candidate per local day for samples inside the window.
+        """
+        empty: tuple[list[datetime], list[Any]] = ([], [])
+        temp_ts, temp_vals = self._series.get("temp", empty)
+        bottom_ts, bottom_vals = self._series.get("bottom", empty)
+        heating_ts, heating_vals = self._series.get("heating", empty)
+        power_ts, power_vals = self._series.get("power", empty)
+        command_ts, command_vals = self._series.get("command", empty)
+
+        def _value_at(ts: datetime, ts_list: list[datetime], val_list: list[Any]) -> Any:
+            # Last-value-carry-forward: entities change state at different
+            # moments, so exact timestamp matching would always miss.
+            if not ts_list:
+                return None
+            idx = bisect.bisect_right(ts_list, ts) - 1
+            if idx < 0:
+                return None
+            return val_list[idx]
+
+        def _boiler_power_w_at(ts: datetime) -> Optional[float]:
+            """Calorimetric heating-power proxy [W] at ts, or None if unknown.
+
+            The non-backup power is the authority for *actual* electrical
+            draw (it falls to ~0 when the tank thermostat cuts even though
+            cbb_w stays commanded-on). We therefore use the non-backup power
+            but gate it on the heater actually being commanded: when cbb_w is
+            ~0 the boiler contributes nothing, so any non-backup power is pure
+            house load and must not be credited as heating.
+            """
+            p = _value_at(ts, power_ts, power_vals)
+            if p is None:
+                return None
+            p = max(0.0, p)
+            cmd = _value_at(ts, command_ts, command_vals)
+            if cmd is not None:
+                if cmd < COMMAND_ON_W:
+                    return 0.0
+                # Cap at the commanded heater power (cbb_w ≈ element nameplate):
+                # non-backup power above it is house load, not boiler heating.
+                return min(p, cmd)
+            return p
+
+        have_power = bool(power_ts)
+        history: list[dict] = []
+        day_min_inlet: dict[str, float] = {}
+        start_idx = bisect.bisect_left(temp_ts, context_start)
+        for ts, top_temp in zip(temp_ts[start_idx:], temp_vals[start_idx:]):
+            # Tank-average temperature (draw-sensitive): a shower refills cold
+            # water from the bottom, so the bottom zone falls first while the
+            # top stays hot. Falls back to the top when no bottom sample yet.
+            bottom_temp = _value_at(ts, bottom_ts, bottom_vals)
+            temp = (
+                (top_temp + bottom_temp) / 2.0 if bottom_temp is not None else top_temp
+            )
+            record: dict = {
+                "timestamp": ts,
+                "temp": temp,
+                "heating": "on" if _value_at(ts, heating_ts, heating_vals) else "off",
+            }
+            if have_power:
+                bp = _boiler_power_w_at(ts)
+                if bp is not None:
+                    record["power_w"] = bp
+            history.append(record)
+            if ts < window_start:
+                continue
+            # Cold-inlet proxy: coldest observed *bottom* temp (the inlet hits
+            # the bottom), falling back to the average when no bottom.
+            inlet_candidate = bottom_temp if bottom_temp is not None else temp
+            day = _as_local(ts).strftime("%Y-%m-%d")
+            if day not in day_min_inlet or inlet_candidate < day_min_inlet[day]:
+                day_min_inlet[day] = inlet_candidate
+        return history, day_min_inlet
+
     def _estimate_cold_inlet_c(self, min_observed_temp: Optional[float]) -> float:
         """Cold-inlet estimate from the coldest observed temp, clamped 5..20 degC."""
         if min_observed_temp is None:
@@ -1175,25 +1272,46 @@ class BoilerDemandProfilerAsync:
         return max(5.0, min(20.0, min_observed_temp))
 
     async def _async_load_persisted(self) -> CategorySlots:
-        """Load persisted CategorySlots once, then keep the in-memory copy."""
+        """Load persisted state once, then keep the in-memory copy."""
         store = self._ensure_store()
         if store is None or self._store_loaded:
             return self._profiler.get_category_slots()
         try:
             data = await store.async_load()
             self._store_loaded = True
-            return deserialize_category_slots(data)
         except Exception as err:  # pragma: no cover - defensive
             _LOGGER.debug("DemandProfiler: load failed: %s", err)
             self._store_loaded = True
             return {}
+        if not (isinstance(data, dict) and STORE_SLOTS_KEY in data):
+            # Legacy payload: bare CategorySlots, no watermark → full backfill.
+            return deserialize_category_slots(data)
+        self._watermark = _parse_watermark(data.get(STORE_WATERMARK_KEY))
+        inlet = data.get(STORE_INLET_KEY)
+        if isinstance(inlet, dict):
+            self._inlet_min_c = {
+                str(day): float(value)
+                for day, value in inlet.items()
+                if isinstance(value, (int, float))
+            }
+        return deserialize_category_slots(data.get(STORE_SLOTS_KEY))
 
     async def _async_save_persisted(self, slots: CategorySlots) -> None:
         store = self._ensure_store()
         if store is None:
             return
         try:
-            await store.async_save(serialize_category_slots(slots))
+            await store.async_save(
+                {
+                    STORE_SLOTS_KEY: serialize_category_slots(slots),
+                    STORE_WATERMARK_KEY: (
+                        self._watermark.isoformat() if self._watermark else None
+                    ),
+                    STORE_INLET_KEY: {
+                        day: round(value, 2) for day, value in self._inlet_min_c.items()
+                    },
+                }
+            )
         except Exception as err:  # pragma: no cover - defensive
             _LOGGER.debug("DemandProfiler: save failed: %s", err)
 
@@ -6,7 +6,6 @@ import math
 import time
 from dataclasses import dataclass, field, replace
 from datetime import datetime, time as dt_time, timedelta, timezone
-from itertools import combinations
 from typing import Any, Callable, Optional
 
 from homeassistant.util import dt as dt_util
@@ -607,46 +606,111 @@ def _allocate_multi_target(
     return allocated, demands_met, demand_labels, all_targets_met
 
 
+# Accumulated (cost, pv, transitions, timestamp_sum) of a partial selection.
+_DPState = tuple[float, float, int, float]
+
+
 def _best_heat_slot_combination(
     deadline_slots: list[PlanSlotAction],
     required_heat_slots: int,
     planner_input: PlannerInput,
     heat_kwh: float,
 ) -> list[PlanSlotAction]:
+    """Pick the ``required_heat_slots`` slots minimising ``_combination_score``.
+
+    Exact dynamic program over (slots seen, slots chosen, previous slot chosen)
+    instead of enumerating combinations: every score component is additive
+    once a slot's rank among the chosen ones is known (standing-loss wait =
+    chosen slots after it), and transitions only depend on whether the
+    time-adjacent predecessor was chosen. O(n * k) for n slots, k chosen.
+    """
+    if required_heat_slots <= 0:
+        return []
     if required_heat_slots >= len(deadline_slots):
         return list(deadline_slots)
 
-    if math.comb(len(deadline_slots), required_heat_slots) > 20000:
-        return _greedy_heat_slots(
-            deadline_slots,
-            required_heat_slots,
-            planner_input,
-            heat_kwh,
-        )
-
-    best: Optional[tuple[tuple[float, float, int, float], tuple[PlanSlotAction, ...]]] = None
-    for candidate in combinations(deadline_slots, required_heat_slots):
-        score = _combination_score(candidate, planner_input, heat_kwh)
-        if best is None:
-            best = (score, candidate)
-            continue
-        if score < best[0]:
-            best = (score, candidate)
-
-    return list(best[1]) if best is not None else []
+    ordered = sorted(deadline_slots, key=lambda slot: slot.start)
+    n = len(ordered)
+    k_total = required_heat_slots
+    battery_budget = _battery_budget_for_scoring(planner_input, heat_kwh)
+    costs: list[float] = []
+    pvs: list[float] = []
+    losses: list[float] = []
+    for slot in ordered:
+        allocation = _slot_allocation(slot, planner_input, heat_kwh, battery_budget)
+        costs.append(allocation.cost_czk)
+        pvs.append(allocation.pv_kwh)
+        losses.append(_standing_loss_cost_per_wait_slot(planner_input, slot, heat_kwh))
+    stamps = [slot.start.timestamp() for slot in ordered]
+    adjacent = [False] + [
+        ordered[i - 1].end == ordered[i].start for i in range(1, n)
+    ]
 
+    # layer[chosen][prev_chosen] = (cost, pv, transitions, timestamp_sum)
+    layer: list[list[Optional[_DPState]]] = [[None, None] for _ in range(k_total + 1)]
+    layer[0][0] = (0.0, 0.0, 0, 0.0)
+    parents: list[dict[tuple[int, int], tuple[int, int]]] = []
 
-def _greedy_heat_slots(
-    deadline_slots: list[PlanSlotAction],
-    required_heat_slots: int,
-    planner_input: PlannerInput,
-    heat_kwh: float,
-) -> list[PlanSlotAction]:
-    ranked = sorted(
-        deadline_slots,
-        key=lambda slot: _slot_score(slot, planner_input, heat_kwh),
-    )
-    return sorted(ranked[:required_heat_slots], key=lambda slot: slot.start)
+    for i in range(n):
+        nxt: list[list[Optional[_DPState]]] = [
+            [None, None] for _ in range(k_total + 1)
+        ]
+        parent: dict[tuple[int, int], tuple[int, int]] = {}
+        # Prune states that can no longer reach k_total chosen slots.
+        low = max(0, k_total - (n - i))
+        for chosen in range(low, min(i, k_total) + 1):
+            for prev in (0, 1):
+                state = layer[chosen][prev]
+                if state is None:
+                    continue
+                _relax_dp_state(nxt, parent, chosen, 0, state, (chosen, prev))
+                if chosen == k_total:
+                    continue
+                waits = k_total - 1 - chosen
+                taken = (
+                    state[0] + costs[i] + losses[i] * waits,
+                    state[1] + pvs[i],
+                    state[2] + (0 if prev and adjacent[i] else 1),
+                    state[3] + stamps[i],
+                )
+                _relax_dp_state(nxt, parent, chosen + 1, 1, taken, (chosen, prev))
+        layer = nxt
+        parents.append(parent)
+
+    final = [
+        (_dp_state_key(state), prev)
+        for prev, state in enumerate(layer[k_total])
+        if state is not None
+    ]
+    if not final:
+        return []
+    chosen, prev = k_total, min(final)[1]
+    selected: list[PlanSlotAction] = []
+    for i in range(n - 1, -1, -1):
+        if prev:
+            selected.append(ordered[i])
+        chosen, prev = parents[i][(chosen, prev)]
+    selected.reverse()
+    return selected
+
+
+def _dp_state_key(state: _DPState) -> _DPState:
+    # Same ordering as _combination_score.
+    return (round(state[0], 9), -round(state[1], 9), state[2], -state[3])
+
+
+def _relax_dp_state(
+    layer: list[list[Optional[_DPState]]],
+    parent: dict[tuple[int, int], tuple[int, int]],
+    chosen: int,
+    prev: int,
+    state: _DPState,
+    origin: tuple[int, int],
+) -> None:
+    current = layer[chosen][prev]
+    if current is None or _dp_state_key(state) < _dp_state_key(current):
+        layer[chosen][prev] = state
+        parent[(chosen, prev)] = origin
 
 
 def _standing_loss_cost_per_wait_slot(
@@ -728,26 +792,6 @@ def _combination_score(
     )
 
 
-def _slot_score(
-    slot: PlanSlotAction,
-    planner_input: PlannerInput,
-    heat_kwh: float,
-) -> tuple[float, float, float]:
-    """Score a single slot for greedy selection (lower is better)."""
-    # R3: pass full battery budget for scoring
-    battery_budget = _battery_budget_for_scoring(planner_input, heat_kwh)
-    allocation = _slot_allocation(slot, planner_input, heat_kwh, battery_budget)
-    # For greedy, we approximate standing-loss penalty as cost of one wait slot
-    # per unit of earliness (the timestamp term already handles recency bias).
-    loss_penalty = _standing_loss_cost_per_wait_slot(planner_input, slot, heat_kwh)
-    cost_adj = allocation.cost_czk + loss_penalty
-    return (
-        round(cost_adj, 9),
-        -round(allocation.pv_kwh, 9),
-        -slot.start.timestamp(),
-    )
-
-
 def _make_battery_budget_ref(
     planner_input: PlannerInput,
 ) -> Optional[list[float]]:
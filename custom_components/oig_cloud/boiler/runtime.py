@@ -81,6 +81,7 @@ from .demand_profiler import (
 from .planner_core import PlanResult, plan_comfort_core
 from .planner import plan_result_to_boiler_plan
 from .actuator import ActuatorSerializerState
+from .temperature_index import TemperatureIndex
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -901,8 +902,9 @@ def _build_planner_topology(config: dict[str, Any]) -> BoilerThermalTopology:
         # F3a: standing-loss coefficient is set to 0.0 until per-installation
         # calibration data is available.  The model default of 0.02 is
         # physically unrealistic (produces ~20 kWh/slot on a 100 l tank,
-        # 40x the heater output) and would cause the JIT bias in
-        # _combination_score to completely overwhelm real price differences.
+        # 40x the heater output) and would cause the JIT wait penalty of the
+        # slot allocator (_best_heat_slot_combination) to completely
+        # overwhelm real price differences.
         # A calibrated value must be ≤ 0.0003 kWh/(l·°C·h).
         standing_loss_coefficient=0.0,
         # Phase B: arbitrage over-heat ceiling (clamped to be ≥ target).
@@ -1076,10 +1078,14 @@ async def _async_detect_last_legionella_event(
     now: datetime,
     cache: _LegionellaCache,
     current_top_temp_c: Optional[float] = None,
+    index: Optional[TemperatureIndex] = None,
 ) -> Optional[datetime]:
     """Return the datetime of the most recent top-sensor reading >= legionella_target_temp_c.
 
-    Caches the result for up to 6 h to avoid hammering the recorder.
+    With a temperature ``index`` the answer comes from its persisted,
+    live-updated summary (one recorder scan to seed it, O(1) afterwards).
+    Without one, the result of a recorder scan is cached for up to 6 h to
+    avoid hammering the recorder.
     Short-circuits to now() when the current live temperature already satisfies
     the target (records the achievement in cache.last_achieved_at).
 
@@ -1101,6 +1107,29 @@ async def _async_detect_last_legionella_event(
         )
         return now
 
+    lookback_days = max(interval_days + 1, 14)  # at least 14 days to catch slow cycles
+    start_time = now - timedelta(days=lookback_days)
+
+    if index is not None:
+        try:
+            indexed_event = await index.async_last_at_or_above(
+                top_sensor_entity,
+                legionella_target_temp_c,
+                since=start_time,
+                now=now,
+            )
+        except Exception as err:
+            _LOGGER.debug(
+                "Legionella detection failed for %s (treating as unknown): %s",
+                top_sensor_entity,
+                err,
+            )
+            cache.last_checked_at = now
+            return None
+        cache.last_checked_at = now
+        cache.last_achieved_at = indexed_event
+        return indexed_event
+
     # Cache freshness check: skip recorder scan if cache is recent.
     if (
         cache.last_checked_at is not None
@@ -1109,8 +1138,6 @@ async def _async_detect_last_legionella_event(
         return cache.last_achieved_at
 
     # Recorder scan over the lookback window.
-    lookback_days = max(interval_days + 1, 14)  # at least 14 days to catch slow cycles
-    start_time = now - timedelta(days=lookback_days)
     last_event: Optional[datetime] = None
 
     try:
@@ -1172,6 +1199,7 @@ async def _async_build_legionella_obligation(
     current_top_temp_c: Optional[float],
     topology: Any,
     cache: _LegionellaCache,
+    index: Optional[TemperatureIndex] = None,
 ) -> Optional[LegionellaObligation]:
     """Build a LegionellaObligation from config and recorder history.
 
@@ -1208,6 +1236,7 @@ async def _async_build_legionella_obligation(
         now=now,
         cache=cache,
         current_top_temp_c=current_top_temp_c,
+        index=index,
     )
 
     days_since: Optional[int] = None
@@ -1367,6 +1396,9 @@ class BoilerRuntime:
         self._last_replan_temperature_c: Optional[float] = None
         self.last_plan_result: Optional[PlanResult] = None
         self._legionella_cache = _LegionellaCache()
+        # Persistent daily-max / threshold-crossing summary of the top sensor,
+        # fed by the activity listener (Legionella queries without rescans).
+        self._temperature_index = TemperatureIndex(hass, entry_id, box_id)
         # R5: Circulation scheduling state
         self._circulation_runs: list[tuple[datetime, datetime, str]] = []
         self._circulation_pump_on: bool = False  # True = we turned the pump on
@@ -1429,8 +1461,16 @@ class BoilerRuntime:
         unsub = async_listen("state_changed", self._handle_activity_state_changed)
         if callable(unsub):
             self._activity_listener_unsubs.append(unsub)
+            top_sensor = (getattr(self.coordinator, "config", {}) or {}).get(
+                CONF_BOILER_TEMP_SENSOR_TOP
+            )
+            if isinstance(top_sensor, str) and top_sensor:
+                self._temperature_index.attach_live([top_sensor])
 
     def unload_activity_listeners(self) -> None:
+        temperature_index = getattr(self, "_temperature_index", None)
+        if temperature_index is not None:
+            temperature_index.attach_live([])
         for unsub in self._activity_listener_unsubs:
             try:
                 unsub()
@@ -1491,6 +1531,10 @@ class BoilerRuntime:
             if entity_id not in self._activity_entity_ids:
                 return
 
+            temperature_index = getattr(self, "_temperature_index", None)
+            if temperature_index is not None:
+                temperature_index.observe_state(entity_id, data.get("new_state"))
+
             event_timestamp = self._event_timestamp(event)
             if self._activity_snapshot_is_older(event_timestamp):
                 return
@@ -2631,6 +2675,7 @@ class BoilerRuntime:
             current_top_temp_c=temperature_state.top_temp_c,
             topology=topology_for_legionella,
             cache=self._legionella_cache,
+            index=getattr(self, "_temperature_index", None),
         )
 
         # F5: read configured battery cycle cost (fallback to const default).
@@ -0,0 +1,301 @@
+"""Bounded per-entity temperature history index for the boiler runtime.
+
+Legionella compliance only needs "when was the tank last at or above X °C",
+yet answering it from the recorder means scanning two weeks of state changes
+(tens of thousands of rows with 1-minute sensors). ``TemperatureSummary``
+keeps what such queries need in bounded memory:
+
+- the daily maximum (and when it was reached) for the last
+  ``DAILY_RETENTION_DAYS`` local days,
+- the exact timestamp a tracked threshold was last reached.
+
+``TemperatureIndex`` owns the summaries of the configured entities, seeds a
+summary from the recorder once (one scan, persisted), catches up from its
+watermark after a restart and is then kept current by live state changes, so
+queries are O(1) dictionary lookups.
+"""
+
+from __future__ import annotations
+
+import logging
+import time
+from datetime import datetime
+from typing import Any, Iterable, Optional
+
+from homeassistant.util import dt as dt_util
+
+_LOGGER = logging.getLogger(__name__)
+
+DAILY_RETENTION_DAYS = 62
+MAX_TRACKED_THRESHOLDS = 8
+STORE_VERSION = 1
+SAVE_DELAY_S = 300
+
+
+def _parse_dt(value: Any) -> Optional[datetime]:
+    if not isinstance(value, str):
+        return None
+    parsed = dt_util.parse_datetime(value)
+    return parsed if parsed is not None and parsed.tzinfo is not None else None
+
+
+def _threshold_key(threshold: float) -> str:
+    return f"{float(threshold):.1f}"
+
+
+class TemperatureSummary:
+    """Daily maxima and last threshold crossings of one temperature entity."""
+
+    def __init__(self) -> None:
+        # local day (ISO) -> (max temp, when the max was reached)
+        self.daily_max: dict[str, tuple[float, datetime]] = {}
+        # threshold key -> last time a reading was >= threshold
+        self.last_reached: dict[str, Optional[datetime]] = {}
+        # Start of recorder coverage and the newest ingested time.
+        self.covered_since: Optional[datetime] = None
+        self.updated_at: Optional[datetime] = None
+
+    def observe(self, ts: datetime, temp: float) -> None:
+        day = dt_util.as_local(ts).date().isoformat()
+        current = self.daily_max.get(day)
+        if current is None or temp > current[0]:
+            self.daily_max[day] = (temp, ts)
+            if current is None and len(self.daily_max) > DAILY_RETENTION_DAYS:
+                for old in sorted(self.daily_max)[:-DAILY_RETENTION_DAYS]:
+                    del self.daily_max[old]
+        for key, last in self.last_reached.items():
+            if temp >= float(key) and (last is None or ts > last):
+                self.last_reached[key] = ts
+        if self.updated_at is None or ts > self.updated_at:
+            self.updated_at = ts
+
+    def track(self, threshold: float) -> None:
+        """Start tracking ``threshold`` exactly (seeded from the daily maxima)."""
+        key = _threshold_key(threshold)
+        if key in self.last_reached:
+            return
+        self.last_reached[key] = self._from_daily_max(threshold)
+        while len(self.last_reached) > MAX_TRACKED_THRESHOLDS:
+            del self.last_reached[next(iter(self.last_reached))]
+
+    def last_at_or_above(self, threshold: float) -> Optional[datetime]:
+        """Most recent time a reading was >= ``threshold`` (None if unseen)."""
+        key = _threshold_key(threshold)
+        if key in self.last_reached:
+            return self.last_reached[key]
+        return self._from_daily_max(threshold)
+
+    def _from_daily_max(self, threshold: float) -> Optional[datetime]:
+        # Day granularity: the max of the latest qualifying day is a reading
+        # >= threshold (later ones that day are only known once tracked).
+        for day in sorted(self.daily_max, reverse=True):
+            temp, ts = self.daily_max[day]
+            if temp >= threshold:
+                return ts
+        return None
+
+    def covers(self, since: datetime) -> bool:
+        return self.covered_since is not None and self.covered_since <= since
+
+    def as_dict(self) -> dict[str, Any]:
+        return {
+            "daily_max": {
+                day: [temp, ts.isoformat()] for day, (temp, ts) in self.daily_max.items()
+            },
+            "last_reached": {
+                key: ts.isoformat() if ts else None
+                for key, ts in self.last_reached.items()
+            },
+            "covered_since": self.covered_since.isoformat() if self.covered_since else None,
+            "updated_at": self.updated_at.isoformat() if self.updated_at else None,
+        }
+
+    @classmethod
+    def from_dict(cls, data: Any) -> "TemperatureSummary":
+        summary = cls()
+        if not isinstance(data, dict):
+            return summary
+        for day, entry in (data.get("daily_max") or {}).items():
+            try:
+                ts = _parse_dt(entry[1])
+                if ts is not None:
+                    summary.daily_max[str(day)] = (float(entry[0]), ts)
+            except (TypeError, ValueError, IndexError):
+                continue
+        for key, value in (data.get("last_reached") or {}).items():
+            summary.last_reached[str(key)] = _parse_dt(value)
+        summary.covered_since = _parse_dt(data.get("covered_since"))
+        summary.updated_at = _parse_dt(data.get("updated_at"))
+        return summary
+
+
+class TemperatureIndex:
+    """Persistent temperature summaries, fed live by the runtime listener."""
+
+    def __init__(self, hass: Any, entry_id: str, box_id: str) -> None:
+        self.hass = hass
+        self._store_key = f"oig_cloud.boiler_temp_index_{entry_id}_{box_id}"
+        self._store: Optional[Any] = None
+        self._loaded = False
+        self._summaries: dict[str, TemperatureSummary] = {}
+        # Entities whose live feed is attached and caught up in this process.
+        self._live_entities: set[str] = set()
+        self._attached: set[str] = set()
+        # Monotonic time the pending delayed save fires (None: none pending).
+        self._save_due: Optional[float] = None
+
+    def summary(self, entity_id: str) -> Optional[TemperatureSummary]:
+        return self._summaries.get(entity_id)
+
+    def attach_live(self, entity_ids: Iterable[str]) -> None:
+        """Entities whose state changes will be passed to ``observe_state``."""
+        self._attached = set(entity_ids)
+        self._live_entities &= self._attached
+
+    def observe_state(self, entity_id: str, state: Any) -> None:
+        """Ingest a live state (ignored until the entity has been caught up)."""
+        if entity_id not in self._live_entities or state is None:
+            return
+        try:
+            temp = float(state.state)
+            ts = state.last_updated
+        except (TypeError, ValueError, AttributeError):
+            return
+        self._summaries[entity_id].observe(ts, temp)
+        self._schedule_save()
+
+    async def async_last_at_or_above(
+        self,
+        entity_id: str,
+        threshold: float,
+        *,
+        since: datetime,
+        now: datetime,
+    ) -> Optional[datetime]:
+        """Last time ``entity_id`` read >= ``threshold`` since ``since``.
+
+        Returns None when no such reading falls in the window, even if the
+        summary retains an older one (callers treat None as unknown).
+        Raises when the recorder is needed (first seed, restart catch-up) but
+        unavailable; callers treat that as unknown.
+        """
+        await self._async_load()
+        summary = self._summaries.get(entity_id)
+        seeded = summary is not None and summary.covered_since is not None
+        if not seeded:
+            summary = TemperatureSummary()
+            self._summaries[entity_id] = summary
+        summary.track(threshold)
+        catch_up = entity_id not in self._live_entities
+        # Live changes arriving while the recorder is read are ingested too
+        # (observe is order-independent).
+        if entity_id in self._attached:
+            self._live_entities.add(entity_id)
+        try:
+            if not seeded:
+                await self._async_ingest(entity_id, summary, since, now)
+                summary.covered_since = since
+            else:
+                if not summary.covers(since):
+                    # Longer lookback than seeded: scan only the missing head.
+                    await self._async_ingest(
+                        entity_id, summary, since, summary.covered_since
+                    )
+                    summary.covered_since = since
+                if catch_up:
+                    # Restart / no live feed: catch up from the watermark.
+                    await self._async_ingest(
+                        entity_id,
+                        summary,
+                        summary.updated_at or summary.covered_since,
+                        now,
+                    )
+        except Exception:
+            self._live_entities.discard(entity_id)
+            if not seeded:
+                del self._summaries[entity_id]
+            raise
+        if summary.updated_at is None or summary.updated_at < now:
+            summary.updated_at = now
+        self._schedule_save()
+        last = summary.last_at_or_above(threshold)
+        if last is None or last < since:
+            return None
+        return last
+
+    async def _async_ingest(
+        self,
+        entity_id: str,
+        summary: TemperatureSummary,
+        start: datetime,
+        end: datetime,
+    ) -> None:
+        if start >= end:
+            return
+        from homeassistant.components.recorder.history import state_changes_during_period
+        from homeassistant.helpers.recorder import get_instance
+
+        instance = get_instance(self.hass)
+        if instance is None:
+            raise RuntimeError("recorder not available")
+        states = await instance.async_add_executor_job(
+            state_changes_during_period, self.hass, start, end, entity_id
+        )
+        records = states.get(entity_id, [])
+        for state in records:
+            try:
+                summary.observe(state.last_updated, float(state.state))
+            except (TypeError, ValueError, AttributeError):
+                continue
+        _LOGGER.debug(
+            "Temperature index: ingested %d records for %s (%s → %s)",
+            len(records),
+            entity_id,
+            start,
+            end,
+        )
+
+    def _ensure_store(self) -> Optional[Any]:
+        if self._store is None and self.hass is not None:
+            try:
+                from homeassistant.helpers.storage import Store
+
+                self._store = Store(self.hass, STORE_VERSION, self._store_key)
+            except Exception:  # pragma: no cover - defensive
+                self._store = None
+        return self._store
+
+    async def _async_load(self) -> None:
+        if self._loaded:
+            return
+        self._loaded = True
+        store = self._ensure_store()
+        if store is None:
+            return
+        try:
+            data = await store.async_load()
+        except Exception as err:  # pragma: no cover - defensive
+            _LOGGER.debug("Temperature index: load failed: %s", err)
+            return
+        for entity_id, payload in ((data or {}).get("entities") or {}).items():
+            self._summaries.setdefault(entity_id, TemperatureSummary.from_dict(payload))
+
+    def _data_to_save(self) -> dict[str, Any]:
+        return {
+            "entities": {
+                entity_id: summary.as_dict()
+                for entity_id, summary in self._summaries.items()
+            }
+        }
+
+    def _schedule_save(self) -> None:
+        # A pending save serializes the summaries when it fires; rescheduling
+        # it on every reading would keep pushing the write back.
+        now = time.monotonic()
+        if self._save_due is not None and now < self._save_due:
+            return
+        store = self._ensure_store()
+        delay_save = getattr(store, "async_delay_save", None)
+        if callable(delay_save):
+            delay_save(self._data_to_save, SAVE_DELAY_S)
+            self._save_due = now + SAVE_DELAY_S
@@ -15,6 +15,10 @@ from datetime import date, datetime, timezone
 from pathlib import Path
 from typing import Any, Dict, Optional, Tuple
 
+from .battery_forecast.economic_planner_types import (
+    PLANNER_BACKEND_GREEDY,
+    PLANNER_BACKENDS,
+)
 from .boiler.const import BATTERY_CYCLE_COST_CZK_PER_KWH
 
 _LOGGER = logging.getLogger(__name__)
@@ -341,6 +345,10 @@ _register(
           max=10.0, step=0.1),
     Field("ups_opportunistic_charge_rate_kw", "battery", float, default=2.8, min=0.5,
           max=10.0, step=0.1),
+    # "dp" swaps the greedy heuristics for the SoC-grid dynamic-programming
+    # optimizer (economic_planner_dp); same PlannerResult, solved off-loop.
+    Field("planner_backend", "battery", str, default=PLANNER_BACKEND_GREEDY,
+          enum=PLANNER_BACKENDS),
 )
 
 # --- section: solar ---------------------------------------------------------
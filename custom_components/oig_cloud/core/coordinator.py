@@ -2,17 +2,18 @@ import asyncio
 import logging
 import random
 from datetime import datetime, timedelta, timezone
-from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
+from typing import TYPE_CHECKING, Any, Dict, Iterable, List, Optional, Set, Tuple
 from zoneinfo import ZoneInfo  # Nahradit pytz import
 
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
 from homeassistant.helpers.event import async_track_point_in_time
 from homeassistant.helpers.storage import Store
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 from homeassistant.util import dt as dt_util
 
 from .data_source import DATA_SOURCE_CLOUD_ONLY, get_data_source_state
+from .payload_changes import ChangeKey, PayloadChangeTracker, is_change_key
 
 if TYPE_CHECKING:
     from ..api.ote_api import OteApi
@@ -28,6 +29,9 @@ COORDINATOR_CACHE_SAVE_COOLDOWN_S = 900.0  # 15 minut (low-power default)
 COORDINATOR_CACHE_MAX_LIST_ITEMS = 1500
 COORDINATOR_CACHE_MAX_STR_LEN = 5000
 
+# json2.php groups fetched for extended sensors (stored as ``extended_<name>``).
+EXTENDED_STATS_GROUPS = ("batt", "fve", "grid", "load")
+
 
 class OigCloudCoordinator(DataUpdateCoordinator):
     @staticmethod
@@ -70,6 +74,16 @@ class OigCloudCoordinator(DataUpdateCoordinator):
         self._battery_forecast_last_update: Optional[datetime] = None
         self._battery_forecast_last_inputs_hash: Optional[int] = None
 
+        # Change-aware fan-out: listeners subscribed with a change key are kept
+        # in our own index and only called when their payload slot changed
+        # since the last dispatch (one plain listener dispatches them).
+        self._change_tracker = PayloadChangeTracker()
+        self._reported_changes: Optional[Set[ChangeKey]] = None
+        self._dispatched_success: Optional[bool] = None
+        self._keyed_listeners: Dict[ChangeKey, Dict[object, CALLBACK_TYPE]] = {}
+        self._keyed_dispatch_unsub: Optional[CALLBACK_TYPE] = None
+        self._dispatch_changes: Optional[Set[ChangeKey]] = None
+
         # Spot price cache shared between scheduler/fallback and coordinator updates
         self._spot_prices_cache: Optional[Dict[str, Any]] = None
 
@@ -325,6 +339,75 @@ class OigCloudCoordinator(DataUpdateCoordinator):
         except Exception as err:
             _LOGGER.debug("Failed to schedule coordinator cache save: %s", err)
 
+    def report_changed_keys(self, keys: Optional[Iterable[ChangeKey]]) -> None:
+        """Announce which payload slots the next publish changed (None = unknown)."""
+        self._reported_changes = set(keys) if keys is not None else None
+
+    @callback
+    def async_add_listener(
+        self, update_callback: CALLBACK_TYPE, context: Any = None
+    ) -> CALLBACK_TYPE:
+        """Listen for data updates; change-key contexts go to the keyed index."""
+        if not is_change_key(context):
+            return super().async_add_listener(update_callback, context)
+
+        token = object()
+        self._keyed_listeners.setdefault(context, {})[token] = update_callback
+        if self._keyed_dispatch_unsub is None:
+            self._keyed_dispatch_unsub = super().async_add_listener(
+                self._async_dispatch_keyed_listeners
+            )
+
+        @callback
+        def remove_listener() -> None:
+            listeners = self._keyed_listeners.get(context)
+            if listeners is None or listeners.pop(token, None) is None:
+                return
+            if not listeners:
+                del self._keyed_listeners[context]
+            if not self._keyed_listeners and self._keyed_dispatch_unsub is not None:
+                unsub, self._keyed_dispatch_unsub = self._keyed_dispatch_unsub, None
+                unsub()
+
+        return remove_listener
+
+    @callback
+    def async_update_listeners(self) -> None:
+        """Notify listeners, skipping key-subscribed ones whose slot is unchanged."""
+        self._dispatch_changes = self._consume_changed_keys()
+        super().async_update_listeners()
+
+    @callback
+    def _async_dispatch_keyed_listeners(self) -> None:
+        changed = self._dispatch_changes
+        if changed is None:
+            keys: Iterable[ChangeKey] = list(self._keyed_listeners)
+        else:
+            keys = [key for key in changed if key in self._keyed_listeners]
+        callbacks = [
+            update_callback
+            for key in keys
+            for update_callback in self._keyed_listeners[key].values()
+        ]
+        for update_callback in callbacks:
+            update_callback()
+
+    def _consume_changed_keys(self) -> Optional[Set[ChangeKey]]:
+        reported, self._reported_changes = self._reported_changes, None
+        success = bool(self.last_update_success)
+        success_flipped = success != self._dispatched_success
+        self._dispatched_success = success
+
+        data = self.data
+        if not success or not data:
+            self._change_tracker.reset()
+            return None
+        if reported is not None and self._change_tracker.primed and not success_flipped:
+            self._change_tracker.update(data, reported)
+            return reported
+        changed = self._change_tracker.diff(data)
+        return None if success_flipped else changed
+
     def update_intervals(self, standard_interval: int, extended_interval: int) -> None:
         """Dynamicky aktualizuje intervaly coordinatoru."""
         # Uložíme původní hodnoty pro logování
@@ -765,24 +848,20 @@ class OigCloudCoordinator(DataUpdateCoordinator):
                 "Date range for extended stats: %s to %s", today_from, today_to
             )
 
-            extended_batt = await self.api.get_extended_stats(
-                "batt", today_from, today_to
-            )
-            extended_fve = await self.api.get_extended_stats(
-                "fve", today_from, today_to
-            )
-            extended_grid = await self.api.get_extended_stats(
-                "grid", today_from, today_to
-            )
-            extended_load = await self.api.get_extended_stats(
-                "load", today_from, today_to
+            # The four groups are independent json2.php calls; fetch them
+            # concurrently and let the session manager's token bucket pace them.
+            # json2.php only takes whole-day ranges, so every refresh fetches
+            # the full day (there is no incremental fetch).
+            results = await asyncio.gather(
+                *(
+                    self.api.get_extended_stats(name, today_from, today_to)
+                    for name in EXTENDED_STATS_GROUPS
+                )
             )
 
             self.extended_data = {
-                "extended_batt": extended_batt,
-                "extended_fve": extended_fve,
-                "extended_grid": extended_grid,
-                "extended_load": extended_load,
+                f"extended_{name}": payload
+                for name, payload in zip(EXTENDED_STATS_GROUPS, results)
             }
             self._last_extended_update = dt_util.now()
             _LOGGER.debug("Extended stats updated successfully")
@@ -21,6 +21,9 @@ from ..shared.cloud_contract import (
     resolve_telemetry_device_id,
 )
 from .local_mapper import (
+    SUPPORTED_DOMAINS,
+    ProxyEntityDescriptor,
+    build_proxy_entity_index,
     iter_local_entities,
     normalize_proxy_entity_id,
 )
@@ -157,6 +160,26 @@ def _get_proxy_box_id(hass: HomeAssistant) -> Optional[str]:
     return _coerce_box_id(proxy_box_state.state if proxy_box_state else None)
 
 
+def _is_proxy_registry_change(data: Any) -> bool:
+    """Registry event that adds, removes or renames an entity of a proxy domain.
+
+    Other updates (name, icon, area, options, ...) leave the entity ids and
+    therefore the proxy entity index unchanged.
+    """
+    action = data.get("action")
+    if action in ("create", "remove"):
+        entity_ids = (data.get("entity_id"),)
+    elif action == "update" and data.get("old_entity_id"):
+        entity_ids = (data.get("entity_id"), data.get("old_entity_id"))
+    else:
+        return False
+    return any(
+        isinstance(entity_id, str)
+        and entity_id.split(".", 1)[0] in SUPPORTED_DOMAINS
+        for entity_id in entity_ids
+    )
+
+
 def _determine_local_entities_dt(
     hass: HomeAssistant,
     box_id_for_scan: Optional[str],
@@ -446,6 +469,13 @@ class DataSourceController:
         # cloud->local dedupe slot that the genuine later recovery needs.
         self._incident_baseline_armed = False
         self._first_evaluation_utc: Optional[datetime] = None
+        # entity_id -> descriptor of the proxy entities of this box. The global
+        # state_changed listener rejects everything else with one dict lookup;
+        # None means "rebuild on next event" (registry change / proxy box id).
+        self._proxy_entity_index: Optional[dict[str, ProxyEntityDescriptor]] = None
+        self._proxy_index_box_id: Optional[str] = None
+        self._events_inspected = 0
+        self._events_accepted = 0
         self._debouncer = Debouncer(
             hass,
             _LOGGER,
@@ -474,6 +504,7 @@ class DataSourceController:
                     )
                 ):
                     snap = self.telemetry_store.get_snapshot()
+                    self._report_changed_keys()
                     self.coordinator.async_set_updated_data(snap.payload)
         except Exception as err:
             _LOGGER.debug("Failed to seed local telemetry snapshot: %s", err)
@@ -516,6 +547,11 @@ class DataSourceController:
                     "state_changed", self._on_any_state_change
                 )
             )
+            self._unsubs.append(
+                self.hass.bus.async_listen(
+                    "entity_registry_updated", self._on_entity_registry_updated
+                )
+            )
 
         _LOGGER.info(
             "DataSourceController started: mode=%s stale=%smin",
@@ -552,8 +588,67 @@ class DataSourceController:
         if mode_changed:
             self._on_effective_mode_changed()
 
+    @property
+    def listener_stats(self) -> dict[str, int]:
+        """Counters of the global state_changed listener."""
+        return {
+            "events_inspected": self._events_inspected,
+            "events_accepted": self._events_accepted,
+            "indexed_entities": len(self._proxy_entity_index or {}),
+        }
+
+    @callback
+    def _on_entity_registry_updated(self, event: Any) -> None:
+        if not _is_proxy_registry_change(event.data):
+            return
+        self._proxy_entity_index = None
+        if self.telemetry_store is not None:
+            self.telemetry_store.rebuild_local_mapping()
+
+    def _get_proxy_entity_index(self) -> dict[str, ProxyEntityDescriptor]:
+        index = self._proxy_entity_index
+        if index is not None:
+            return index
+        # If box_id isn't configured yet, fall back to proxy-reported box_id (if available).
+        box_id = _get_expected_box_id(self.entry) or _get_proxy_box_id(self.hass)
+        index = build_proxy_entity_index(self.hass, box_id) if box_id else {}
+        self._proxy_entity_index = index
+        self._proxy_index_box_id = box_id
+        return index
+
+    def _index_new_proxy_entity(self, entity_id: str) -> bool:
+        """Parse an entity_id unseen at index build time; index it if it is ours."""
+        if self._proxy_index_box_id is None:
+            return False
+        # normalize_proxy_entity_id handles both the current "oig_local_"
+        # prefix and the legacy "<device_id>_" format.
+        descriptor = normalize_proxy_entity_id(entity_id, self._proxy_index_box_id)
+        if descriptor is None:
+            return False
+        self._get_proxy_entity_index()[entity_id] = descriptor
+        return True
+
     @callback
     def _on_any_state_change(self, event: Any) -> None:
+        self._events_inspected += 1
+        data = event.data
+        entity_id = data.get("entity_id")
+        if not isinstance(entity_id, str):
+            return
+        if entity_id == PROXY_BOX_ID_ENTITY_ID and getattr(
+            data.get("old_state"), "state", None
+        ) != getattr(data.get("new_state"), "state", None):
+            # Only a new box id changes the index; attribute updates do not.
+            self._proxy_entity_index = None
+
+        if entity_id not in self._get_proxy_entity_index():
+            # Entities present at build time are all indexed, so only the first
+            # state of a newly added entity (old_state is None) can still be ours.
+            if data.get("old_state") is not None:
+                return
+            if not self._index_new_proxy_entity(entity_id):
+                return
+
         # Ignore local events unless user configured local/hybrid mode.
         if get_configured_mode(self.entry) == DATA_SOURCE_CLOUD_ONLY:
             return
@@ -566,24 +661,7 @@ class DataSourceController:
         except Exception as err:
             _LOGGER.debug("Failed to read data source state: %s", err)
 
-        entity_id = event.data.get("entity_id")
-        if not isinstance(entity_id, str):
-            return
-
-        expected_box_id = _get_expected_box_id(self.entry)
-
-        # Use normalize_proxy_entity_id as the sole gate — it handles both the
-        # current "oig_local_" prefix and the legacy "<device_id>_" format.
-        if expected_box_id:
-            if normalize_proxy_entity_id(entity_id, expected_box_id) is None:
-                return
-        else:
-            # If box_id isn't configured yet, fall back to proxy-reported box_id (if available).
-            proxy_box_id = _get_proxy_box_id(self.hass)
-            if proxy_box_id is None:
-                return
-            if normalize_proxy_entity_id(entity_id, proxy_box_id) is None:
-                return
+        self._events_accepted += 1
 
         # Remember the latest local telemetry activity timestamp.
         try:
@@ -679,8 +757,17 @@ class DataSourceController:
         self._pending_snapshot_publish = False
         self._last_snapshot_publish_monotonic = self._monotonic_time()
         snap = self.telemetry_store.get_snapshot()
+        self._report_changed_keys()
         self.coordinator.async_set_updated_data(snap.payload)
 
+    def _report_changed_keys(self) -> None:
+        # Lets the coordinator notify only entities whose slot changed.
+        pop_changed = getattr(self.telemetry_store, "pop_changed_keys", None)
+        changed = pop_changed() if callable(pop_changed) else None
+        report = getattr(self.coordinator, "report_changed_keys", None)
+        if callable(report):
+            report(changed)
+
     def _monotonic_time(self) -> float:
         loop = getattr(self.hass, "loop", None)
         if loop is not None and hasattr(loop, "time"):
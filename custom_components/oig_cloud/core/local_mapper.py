@@ -3,12 +3,13 @@ from __future__ import annotations
 import logging
 from dataclasses import dataclass
 from datetime import datetime
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set, Tuple
 
 from homeassistant.core import HomeAssistant
 from homeassistant.util import dt as dt_util
 
 from ..sensor_types import SENSOR_TYPES
+from .payload_changes import ChangeKey
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -138,6 +139,19 @@ def iter_local_entities(hass: HomeAssistant, box_id: str):
                 yield st
 
 
+def build_proxy_entity_index(
+    hass: HomeAssistant, box_id: str
+) -> Dict[str, ProxyEntityDescriptor]:
+    """Map every current proxy entity_id of ``box_id`` to its descriptor."""
+    index: Dict[str, ProxyEntityDescriptor] = {}
+    for domain in SUPPORTED_DOMAINS:
+        for st in hass.states.async_all(domain):
+            descriptor = normalize_proxy_entity_id(st.entity_id, box_id)
+            if descriptor is not None:
+                index[st.entity_id] = descriptor
+    return index
+
+
 def _as_utc(dt: Optional[datetime]) -> Optional[datetime]:
     if dt is None:
         return None
@@ -368,11 +382,99 @@ def _append_updates(
 _SUFFIX_UPDATES: Dict[str, _SuffixConfig] = _build_suffix_updates()
 
 
+# Precompiled setter: (payload, box, mapped value, raw state, ts) -> changed.
+_Setter = Callable[
+    [Dict[str, Any], Dict[str, Any], Any, Any, Optional[datetime]], bool
+]
+
+
+@dataclass(frozen=True, slots=True)
+class _CompiledEntity:
+    """Everything apply_state needs for one entity_id, resolved once."""
+
+    value_map: Optional[Dict[str, Any]]
+    setters: Tuple[_Setter, ...]
+    keys: Tuple[ChangeKey, ...]
+    needs_ts: bool
+
+
+def _compile_node_setter(upd: _NodeUpdate) -> _Setter:
+    def _set(
+        _payload: Dict[str, Any],
+        box: Dict[str, Any],
+        value: Any,
+        raw_state: Any,
+        _ts: Optional[datetime],
+    ) -> bool:
+        return _apply_node_update(box, upd, value, raw_state)
+
+    return _set
+
+
+def _compile_extended_setter(upd: _ExtendedUpdate) -> _Setter:
+    group_size = _EXTENDED_GROUP_SIZES.get(upd.group, upd.index + 1)
+
+    def _set(
+        payload: Dict[str, Any],
+        _box: Dict[str, Any],
+        value: Any,
+        _raw_state: Any,
+        ts: Optional[datetime],
+    ) -> bool:
+        return _apply_extended_update(payload, upd, value, ts, group_size)
+
+    return _set
+
+
+def _compile_entity(entity_id: str, box_id: str) -> Optional[_CompiledEntity]:
+    descriptor = normalize_proxy_entity_id(entity_id, box_id)
+    if descriptor is None:
+        return None
+
+    suffix_cfg = _SUFFIX_UPDATES.get(descriptor.raw_suffix)
+    if not suffix_cfg or descriptor.domain not in suffix_cfg.domains:
+        return None
+
+    setters: List[_Setter] = []
+    keys: List[ChangeKey] = []
+    needs_ts = False
+    for upd in suffix_cfg.updates:
+        if isinstance(upd, _NodeUpdate):
+            setters.append(_compile_node_setter(upd))
+            keys.append((upd.node_id, upd.node_key))
+        elif isinstance(upd, _ExtendedUpdate):
+            setters.append(_compile_extended_setter(upd))
+            keys.append((upd.group, None))
+            needs_ts = True
+    return _CompiledEntity(
+        value_map=suffix_cfg.value_map,
+        setters=tuple(setters),
+        keys=tuple(keys),
+        needs_ts=needs_ts,
+    )
+
+
 class LocalUpdateApplier:
-    """Apply local proxy state updates into the cloud-shaped coordinator payload."""
+    """Apply local proxy state updates into the cloud-shaped coordinator payload.
+
+    Entity ids are compiled once into setter closures (parsing, suffix lookup,
+    domain check and target slots resolved up front), so applying a local event
+    is a dict lookup plus the setters. Unknown ids are compiled on first sight;
+    ``compile`` rebuilds the table when the proxy entity set changes.
+    """
 
     def __init__(self, box_id: str) -> None:
         self.box_id = box_id
+        self._compiled: Dict[str, Optional[_CompiledEntity]] = {}
+
+    def compile(self, entity_ids: Iterable[str]) -> int:
+        """Replace the compiled table with ``entity_ids``; return mapped count."""
+        compiled: Dict[str, Optional[_CompiledEntity]] = {}
+        for entity_id in entity_ids:
+            if isinstance(entity_id, str):
+                compiled[entity_id] = _compile_entity(entity_id, self.box_id)
+        self._compiled = compiled
+        return sum(1 for entry in compiled.values() if entry is not None)
 
     def apply_state(
         self,
@@ -380,33 +482,35 @@ class LocalUpdateApplier:
         entity_id: str,
         state: Any,
         last_updated: Optional[datetime],
+        changed_keys: Optional[Set[ChangeKey]] = None,
     ) -> bool:
-        """Return True if payload changed."""
-        descriptor = normalize_proxy_entity_id(entity_id, self.box_id)
-        if descriptor is None:
-            return False
+        """Return True if payload changed.
 
-        suffix_cfg = _SUFFIX_UPDATES.get(descriptor.raw_suffix)
-        if not suffix_cfg or descriptor.domain not in suffix_cfg.domains:
+        Change keys of the touched slots are added to ``changed_keys`` if given.
+        """
+        try:
+            compiled = self._compiled[entity_id]
+        except (KeyError, TypeError):
+            if not isinstance(entity_id, str):
+                return False
+            compiled = _compile_entity(entity_id, self.box_id)
+            self._compiled[entity_id] = compiled
+        if compiled is None:
             return False
 
-        value = _apply_value_map(state, suffix_cfg.value_map)
+        value = _apply_value_map(state, compiled.value_map)
         if value is None:
             return False
 
-        changed = False
-        ts = _as_utc(last_updated) or dt_util.utcnow()
-
+        ts = (_as_utc(last_updated) or dt_util.utcnow()) if compiled.needs_ts else None
         box = _ensure_box_payload(payload, self.box_id)
 
-        for upd in suffix_cfg.updates:
-            if isinstance(upd, _NodeUpdate):
-                if _apply_node_update(box, upd, value, state):
-                    changed = True
-            elif isinstance(upd, _ExtendedUpdate):
-                if _apply_extended_update(payload, upd, value, ts):
-                    changed = True
-
+        changed = False
+        for setter, key in zip(compiled.setters, compiled.keys):
+            if setter(payload, box, value, state, ts):
+                changed = True
+                if changed_keys is not None:
+                    changed_keys.add(key)
         return changed
 
 
@@ -446,8 +550,10 @@ def _apply_extended_update(
     upd: _ExtendedUpdate,
     value: Any,
     ts: datetime,
+    group_size: Optional[int] = None,
 ) -> bool:
-    group_size = _EXTENDED_GROUP_SIZES.get(upd.group, upd.index + 1)
+    if group_size is None:
+        group_size = _EXTENDED_GROUP_SIZES.get(upd.group, upd.index + 1)
     ext_obj = payload.get(upd.group)
     if not isinstance(ext_obj, dict):
         ext_obj = {"items": []}
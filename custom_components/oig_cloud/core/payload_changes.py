@@ -0,0 +1,122 @@
+"""Change tracking for the cloud-shaped coordinator payload.
+
+Entities whose state is derived from a single payload slot register their
+coordinator listener with a *change key* as context:
+
+- ``(node_id, node_key)`` for box telemetry (``data[box_id][node_id][node_key]``),
+- ``(section, None)`` for other top-level sections (``extended_batt``, ...).
+
+``PayloadChangeTracker`` remembers the payload as last dispatched and reports
+which keys differ since, so the coordinator only notifies listeners whose slot
+changed. ``None`` means "unknown" and every listener must be notified.
+
+Sections are compared by value with a private copy taken when they last
+changed: the local telemetry payload is updated in place, so a kept reference
+would always compare equal. Unchanged sections cost one (C-level) equality
+check per publish; only changed ones are copied.
+"""
+
+from __future__ import annotations
+
+import copy
+from typing import Any, Dict, Iterable, Optional, Set, Tuple
+
+ChangeKey = Tuple[str, Optional[str]]
+
+_MISSING = object()
+
+
+def is_change_key(context: Any) -> bool:
+    """Return True if a listener context is a payload change key."""
+    return (
+        isinstance(context, tuple)
+        and len(context) == 2
+        and isinstance(context[0], str)
+        and (context[1] is None or isinstance(context[1], str))
+    )
+
+
+def _is_box(value: Any) -> bool:
+    return isinstance(value, dict) and all(
+        isinstance(node, dict) for node in value.values()
+    )
+
+
+class PayloadChangeTracker:
+    """Diff successive coordinator payloads at change-key granularity."""
+
+    def __init__(self) -> None:
+        self._nodes: Dict[ChangeKey, Any] = {}
+        self._sections: Dict[str, Any] = {}
+        self._primed = False
+
+    @property
+    def primed(self) -> bool:
+        return self._primed
+
+    def reset(self) -> None:
+        self._nodes = {}
+        self._sections = {}
+        self._primed = False
+
+    def diff(self, payload: Any) -> Optional[Set[ChangeKey]]:
+        """Record ``payload`` and return keys changed since the previous one.
+
+        Returns None for the first payload (nothing to compare against).
+        """
+        if not isinstance(payload, dict):
+            self.reset()
+            return None
+
+        nodes: Dict[ChangeKey, Any] = {}
+        sections: Dict[str, Any] = {}
+        changed_sections: Set[str] = set()
+        for name, value in payload.items():
+            if _is_box(value):
+                for node_id, node in value.items():
+                    for node_key, node_value in node.items():
+                        nodes[(node_id, node_key)] = node_value
+                continue
+            previous = self._sections.get(name, _MISSING)
+            if previous is not _MISSING and previous == value:
+                sections[name] = previous
+            else:
+                sections[name] = copy.deepcopy(value)
+                changed_sections.add(name)
+
+        changed: Optional[Set[ChangeKey]] = None
+        if self._primed:
+            changed = {
+                key
+                for key, value in nodes.items()
+                if self._nodes.get(key, _MISSING) != value
+            }
+            changed.update(key for key in self._nodes if key not in nodes)
+            changed.update((name, None) for name in changed_sections)
+            changed.update(
+                (name, None) for name in self._sections if name not in sections
+            )
+
+        self._nodes = nodes
+        self._sections = sections
+        self._primed = True
+        return changed
+
+    def update(self, payload: Dict[str, Any], keys: Iterable[ChangeKey]) -> None:
+        """Refresh the recorded state for ``keys`` only (changes reported upstream)."""
+        for node_id, node_key in keys:
+            if node_key is None:
+                if node_id in payload:
+                    self._sections[node_id] = copy.deepcopy(payload[node_id])
+                else:
+                    self._sections.pop(node_id, None)
+                continue
+            value = _MISSING
+            for box in payload.values():
+                if _is_box(box) and node_key in box.get(node_id, {}):
+                    value = box[node_id][node_key]
+                    break
+            if value is _MISSING:
+                self._nodes.pop((node_id, node_key), None)
+            else:
+                self._nodes[(node_id, node_key)] = value
@@ -3,7 +3,7 @@ from __future__ import annotations
 import logging
 from dataclasses import dataclass
 from datetime import datetime, timezone
-from typing import Any, Dict, Iterable, Optional
+from typing import Any, Dict, Iterable, Optional, Set
 
 from homeassistant.core import HomeAssistant
 from homeassistant.util import dt as dt_util
@@ -12,6 +12,7 @@ from .local_mapper import (
     LocalUpdateApplier,
     iter_local_entities,
 )
+from .payload_changes import ChangeKey
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -45,6 +46,20 @@ class TelemetryStore:
         self._applier = LocalUpdateApplier(box_id)
         self._payload: Dict[str, Any] = {box_id: {}}
         self._updated_at: Optional[datetime] = None
+        # Slots changed since the last pop_changed_keys(); None = unknown.
+        self._changed_keys: Optional[Set[ChangeKey]] = None
+        self.rebuild_local_mapping()
+
+    def rebuild_local_mapping(self) -> None:
+        """Recompile the local->cloud mapping for the current proxy entity set."""
+        try:
+            mapped = self._applier.compile(
+                st.entity_id for st in iter_local_entities(self.hass, self.box_id)
+            )
+        except Exception as err:
+            _LOGGER.debug("Local mapping compile failed: %s", err)
+            return
+        _LOGGER.debug("Compiled local mapping for %s entities", mapped)
 
     def set_cloud_payload(self, payload: Dict[str, Any]) -> None:
         """Replace store content with a cloud payload (already normalized)."""
@@ -55,6 +70,7 @@ class TelemetryStore:
             payload = {**payload, self.box_id: payload.get(self.box_id, {})}
         self._payload = payload
         self._updated_at = _utcnow()
+        self._changed_keys = None
 
     def apply_local_events(self, entity_ids: Iterable[str]) -> bool:
         """Apply current HA states for given local entity_ids into the normalized payload.
@@ -62,13 +78,18 @@ class TelemetryStore:
         Returns True if anything changed.
         """
         changed = False
+        changed_keys = self._changed_keys
         for entity_id in entity_ids:
             st = self.hass.states.get(entity_id)
             if st is None:
                 continue
             try:
                 did = self._applier.apply_state(
-                    self._payload, entity_id, st.state, st.last_updated
+                    self._payload,
+                    entity_id,
+                    st.state,
+                    st.last_updated,
+                    changed_keys,
                 )
             except Exception as err:
                 _LOGGER.debug("Local apply failed for %s: %s", entity_id, err)
@@ -86,6 +107,11 @@ class TelemetryStore:
         ]
         return self.apply_local_events(entity_ids)
 
+    def pop_changed_keys(self) -> Optional[Set[ChangeKey]]:
+        """Return slots changed since the previous call (None if unknown)."""
+        changed, self._changed_keys = self._changed_keys, set()
+        return changed
+
     def get_snapshot(self) -> TelemetrySnapshot:
         """Return a (mutable) snapshot suitable for coordinator.data."""
         if self._updated_at is None:
@@ -197,6 +197,71 @@ def _profile_spike_name(day_name: str, stats: Dict[str, float]) -> str:
     return f"{day_name} - běžný"
 
 
+class ProfileCandidates(List[Dict[str, Any]]):
+    """72h profile dicts plus the same data as a (profiles × hours) matrix."""
+
+    def __init__(self, profiles: List[Dict[str, Any]], matrix: np.ndarray) -> None:
+        super().__init__(profiles)
+        self.matrix = matrix
+
+
+class ProfileMatrix:
+    """Historical 72h profiles of three consecutive days, kept between runs.
+
+    ``sync`` takes the daily profiles of each profiling run and only rebuilds
+    what changed: the candidate matrix is re-sliced from the daily rows and
+    the profile dicts of windows not touching a changed day are reused.
+    """
+
+    def __init__(self) -> None:
+        self._days: Dict[date, List[float]] = {}
+        self._candidates = ProfileCandidates([], np.empty((0, PROFILE_HOURS)))
+
+    def sync(self, daily_profiles: Dict[date, List[float]]) -> ProfileCandidates:
+        changed: set[date] = set()
+        for day in self._days.keys() - daily_profiles.keys():
+            del self._days[day]
+            changed.add(day)
+        for day, values in daily_profiles.items():
+            if len(values) != 24:
+                if self._days.pop(day, None) is not None:
+                    changed.add(day)
+                continue
+            if self._days.get(day) != values:
+                self._days[day] = [float(value) for value in values]
+                changed.add(day)
+        if changed:
+            self._candidates = self._build(changed)
+        return self._candidates
+
+    def _build(self, changed: set[date]) -> ProfileCandidates:
+        days = sorted(self._days)
+        if len(days) < 3:
+            return ProfileCandidates([], np.empty((0, PROFILE_HOURS)))
+
+        daily = np.array([self._days[day] for day in days], dtype=float)
+        ordinals = np.array([day.toordinal() for day in days])
+        starts = np.flatnonzero(ordinals[2:] - ordinals[:-2] == 2)
+        matrix = np.hstack((daily[:-2], daily[1:-1], daily[2:]))[starts]
+        totals = matrix.sum(axis=1)
+
+        dirty = {day - timedelta(days=offset) for day in changed for offset in range(3)}
+        previous = {profile["start_date"]: profile for profile in self._candidates}
+        profiles: List[Dict[str, Any]] = []
+        for row, index in enumerate(starts):
+            start = days[index]
+            profile = None if start in dirty else previous.get(start.isoformat())
+            if profile is None:
+                profile = {
+                    "consumption_kwh": matrix[row].tolist(),
+                    "total_consumption": float(totals[row]),
+                    "avg_consumption": float(totals[row] / PROFILE_HOURS),
+                    "start_date": start.isoformat(),
+                }
+            profiles.append(profile)
+        return ProfileCandidates(profiles, matrix)
+
+
 class OigCloudAdaptiveLoadProfilesSensor(SensorEntity):
     """
     Sensor pro automatickou analýzu a tvorbu profilů spotřeby.
@@ -267,6 +332,7 @@ class OigCloudAdaptiveLoadProfilesSensor(SensorEntity):
         self._profiling_error: Optional[str] = None
         self._profiling_task: Optional[Any] = None  # Background task
         self._last_profile_reason: Optional[str] = None
+        self._profile_matrix = ProfileMatrix()
 
         # Current consumption prediction (from coordinator)
         self._current_prediction: Optional[Dict[str, Any]] = None
@@ -691,29 +757,7 @@ class OigCloudAdaptiveLoadProfilesSensor(SensorEntity):
         self, daily_profiles: Dict[date, List[float]]
     ) -> List[Dict[str, Any]]:
         """Sestavit historické 72h profily z po sobě jdoucích dnů."""
-        profiles: List[Dict[str, Any]] = []
-        days = sorted(daily_profiles.keys())
-
-        for i in range(len(days) - 2):
-            d0, d1, d2 = days[i], days[i + 1], days[i + 2]
-            if d1 != d0 + timedelta(days=1) or d2 != d1 + timedelta(days=1):
-                continue
-
-            profile_data = daily_profiles[d0] + daily_profiles[d1] + daily_profiles[d2]
-
-            if len(profile_data) != PROFILE_HOURS:
-                continue
-
-            profiles.append(
-                {
-                    "consumption_kwh": profile_data,
-                    "total_consumption": float(np.sum(profile_data)),
-                    "avg_consumption": float(np.mean(profile_data)),
-                    "start_date": d0.isoformat(),
-                }
-            )
-
-        return profiles
+        return self._profile_matrix.sync(daily_profiles)
 
     def _build_current_match(
         self,
@@ -1330,25 +1374,98 @@ def _select_top_matches(
     current_match: List[float],
     match_hours: int,
 ) -> List[Dict[str, Any]]:
-    """Score profiles and select top matches."""
-    scored: List[Dict[str, Any]] = []
-    for profile in profiles:
-        data = profile.get("consumption_kwh") or []
-        if len(data) < match_hours:
-            continue
-        segment = data[:match_hours]
-        score = sensor._calculate_profile_similarity(current_match, segment)
-        profile_with_score = dict(profile)
-        profile_with_score["similarity_score"] = score
-        scored.append(profile_with_score)
-
-    if not scored:
+    """Score all profiles in one pass and select top matches."""
+    matrix = getattr(profiles, "matrix", None)
+    if isinstance(matrix, np.ndarray) and matrix.shape[1] >= match_hours:
+        candidates = list(profiles)
+        segments = matrix[:, :match_hours]
+    else:
+        candidates = [
+            profile
+            for profile in profiles
+            if len(profile.get("consumption_kwh") or []) >= match_hours
+        ]
+        segments = np.array(
+            [profile["consumption_kwh"][:match_hours] for profile in candidates],
+            dtype=float,
+        ).reshape(len(candidates), match_hours)
+
+    if not candidates:
         sensor._last_profile_reason = "no_matching_profiles"
         _LOGGER.debug("No matching profiles after scoring")
         return []
 
-    scored.sort(key=lambda item: item.get("similarity_score", 0.0), reverse=True)
-    return scored[:TOP_MATCHES]
+    if len(current_match) != match_hours:
+        _LOGGER.warning(
+            "Invalid data length for similarity: %s != %s",
+            len(current_match),
+            match_hours,
+        )
+        scores = np.zeros(len(candidates))
+    else:
+        try:
+            scores = _profile_similarity_scores(
+                np.asarray(current_match, dtype=float), segments
+            )
+        except Exception as e:
+            _LOGGER.error("Failed to calculate similarity: %s", e, exc_info=True)
+            scores = np.zeros(len(candidates))
+
+    selected: List[Dict[str, Any]] = []
+    for index in _top_k_indices(scores, TOP_MATCHES):
+        profile_with_score = dict(candidates[index])
+        profile_with_score["similarity_score"] = float(scores[index])
+        selected.append(profile_with_score)
+    return selected
+
+
+def _profile_similarity_scores(current: np.ndarray, segments: np.ndarray) -> np.ndarray:
+    """Similarity of ``current`` to every row of ``segments`` (0.0 - 1.0).
+
+    Vectorized ``_calculate_profile_similarity``: the same weighted
+    correlation, RMSE and total-difference scores for all profiles at once.
+    """
+    # 1. Correlation coefficient (rows or current without variance score 0)
+    current_dev = current - current.mean()
+    segment_dev = segments - segments.mean(axis=1, keepdims=True)
+    denom = np.sqrt((segment_dev**2).sum(axis=1) * (current_dev**2).sum())
+    correlation = np.zeros(len(segments))
+    valid = (segments.std(axis=1) != 0) & (current.std() != 0) & (denom > 0)
+    np.divide(segment_dev @ current_dev, denom, out=correlation, where=valid)
+    correlation_score = np.clip(correlation, 0.0, 1.0)
+
+    # 2. RMSE - lower is better, exponential decay (5 kWh scale)
+    rmse = np.sqrt(np.mean((segments - current) ** 2, axis=1))
+    rmse_score = np.exp(-rmse / 5.0)
+
+    # 3. Total consumption difference - lower is better
+    total_current = current.sum()
+    total_profile = segments.sum(axis=1)
+    total_diff = np.full(len(segments), 1.0 if total_current > 0 else 0.0)
+    np.divide(
+        np.abs(total_current - total_profile),
+        total_profile,
+        out=total_diff,
+        where=total_profile > 0,
+    )
+    total_score = np.exp(-total_diff)
+
+    return (
+        WEIGHT_CORRELATION * correlation_score
+        + WEIGHT_RMSE * rmse_score
+        + WEIGHT_TOTAL * total_score
+    )
+
+
+def _top_k_indices(scores: np.ndarray, k: int) -> List[int]:
+    """Indices of the ``k`` best scores, best first (ties keep input order)."""
+    if len(scores) > k:
+        kth = np.partition(scores, len(scores) - k)[len(scores) - k]
+        pool = np.flatnonzero(scores >= kth)
+    else:
+        pool = np.arange(len(scores))
+    order = pool[np.argsort(-scores[pool], kind="stable")]
+    return [int(index) for index in order[:k]]
 
 
 def _average_profiles(profiles: List[Dict[str, Any]]) -> List[float]:
@@ -7,12 +7,20 @@ from typing import Any, Callable, Dict, List, Optional, Tuple, Union
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.util import dt as dt_util
 
+from ..pricing.price_engine import price_arrays, resolve_pricing_options
 from .base_sensor import OigCloudSensor, resolve_box_id
 
 _LOGGER = logging.getLogger(__name__)
 
 ISO_TZ_OFFSET = "+00:00"
 
+# Hourly analytics has always used its own fallbacks for unset options.
+ANALYTICS_PRICING_DEFAULTS: Dict[str, Any] = {
+    "spot_fixed_fee_mwh": 500.0,
+    "distribution_fee_vt_kwh": 1.35,
+    "distribution_fee_nt_kwh": 1.05,
+}
+
 
 class OigCloudAnalyticsSensor(OigCloudSensor):
     """Analytics senzor pro spotové ceny a analytické funkce."""
@@ -825,79 +833,33 @@ class OigCloudAnalyticsSensor(OigCloudSensor):
     def _build_dynamic_hourly_prices(
         self, raw_prices: Dict[str, Any]
     ) -> Dict[str, Dict[str, Union[str, float]]]:
-        final_prices: Dict[str, Dict[str, Union[str, float]]] = {}
-        vat_rate = self._entry.options.get("vat_rate", 21.0)
-
-        positive_fee_percent = self._entry.options.get(
-            "spot_positive_fee_percent", 15.0
+        options = resolve_pricing_options(
+            self._entry.options,
+            self._get_tariff_for_datetime,
+            defaults=ANALYTICS_PRICING_DEFAULTS,
+            fixed_prices_spot_fee=True,
         )
-        negative_fee_percent = self._entry.options.get("spot_negative_fee_percent", 9.0)
-        fixed_fee_mwh = self._entry.options.get("spot_fixed_fee_mwh", 500.0)
-        positive_fee_percent_nt = self._entry.options.get(
-            "spot_positive_fee_percent_nt", positive_fee_percent
-        )
-        negative_fee_percent_nt = self._entry.options.get(
-            "spot_negative_fee_percent_nt", negative_fee_percent
-        )
-        fixed_fee_mwh_nt = self._entry.options.get(
-            "spot_fixed_fee_mwh_nt", fixed_fee_mwh
-        )
-        distribution_fee_vt_kwh = self._entry.options.get(
-            "distribution_fee_vt_kwh", 1.35
-        )
-        distribution_fee_nt_kwh = self._entry.options.get(
-            "distribution_fee_nt_kwh", 1.05
-        )
-        pricing_model = self._entry.options.get("spot_pricing_model", "percentage")
+        arrays = price_arrays(raw_prices, options, skip_invalid=True)
+        cached = getattr(self, "_hourly_prices_cache", None)
+        if cached is not None and cached[0] is arrays:
+            return cached[1]
 
-        for time_key, spot_price in raw_prices.items():
-            try:
-                price_datetime = datetime.fromisoformat(
-                    time_key.replace("Z", ISO_TZ_OFFSET)
-                )
-                tariff = self._get_tariff_for_datetime(price_datetime)
-
-                if pricing_model == "percentage":
-                    if spot_price >= 0:
-                        fee_percent = (
-                            positive_fee_percent_nt
-                            if tariff == "NT"
-                            else positive_fee_percent
-                        )
-                        commercial_price = spot_price * (1 + fee_percent / 100.0)
-                    else:
-                        fee_percent = (
-                            negative_fee_percent_nt
-                            if tariff == "NT"
-                            else negative_fee_percent
-                        )
-                        commercial_price = spot_price * (1 - fee_percent / 100.0)
-                else:
-                    fee_mwh = fixed_fee_mwh_nt if tariff == "NT" else fixed_fee_mwh
-                    fixed_fee_kwh = fee_mwh / 1000.0
-                    commercial_price = spot_price + fixed_fee_kwh
-
-                distribution_fee = (
-                    distribution_fee_vt_kwh
-                    if tariff == "VT"
-                    else distribution_fee_nt_kwh
-                )
-
-                price_without_vat = commercial_price + distribution_fee
-                final_price = round(price_without_vat * (1 + vat_rate / 100.0), 2)
-
-                final_prices[time_key] = {
-                    "spot_price": round(spot_price, 2),
-                    "commercial_price": round(commercial_price, 2),
-                    "tariff": tariff,
-                    "distribution_fee": round(distribution_fee, 2),
-                    "price_without_vat": round(price_without_vat, 2),
-                    "vat_rate": vat_rate,
-                    "final_price": final_price,
-                }
-            except (ValueError, AttributeError):
-                continue
+        vat_rate = options.vat_rate
+        final_prices: Dict[str, Dict[str, Union[str, float]]] = {}
+        for index, time_key in enumerate(arrays.keys):
+            commercial_price = arrays.commercial[index]
+            distribution_fee = arrays.distribution[index]
+            final_prices[time_key] = {
+                "spot_price": round(arrays.spot[index], 2),
+                "commercial_price": round(commercial_price, 2),
+                "tariff": arrays.tariffs[index],
+                "distribution_fee": round(distribution_fee, 2),
+                "price_without_vat": round(commercial_price + distribution_fee, 2),
+                "vat_rate": vat_rate,
+                "final_price": arrays.import_price[index],
+            }
 
+        self._hourly_prices_cache = (arrays, final_prices)
         return final_prices
 
     def _build_date_range_from_prices(
@@ -45,6 +45,19 @@ _LANGS: Dict[str, Dict[str, str]] = {
 _STATE_NOT_HANDLED = object()
 
 
+def _extended_group(sensor_type: str) -> Optional[str]:
+    """Extended payload group an extended ``sensor_type`` reads its value from."""
+    if "battery" in sensor_type:
+        return "extended_batt"
+    if "fve" in sensor_type:
+        return "extended_fve"
+    if "grid" in sensor_type:
+        return "extended_grid"
+    if "load" in sensor_type:
+        return "extended_load"
+    return None
+
+
 if TYPE_CHECKING:
 
     class _DataSensorBase:
@@ -135,6 +148,31 @@ class OigCloudDataSensor(_DataSensorBase):
         self._box_id = self._resolve_box_id(coordinator)
         self.entity_id = f"sensor.oig_{self._box_id}_{sensor_type}"
 
+        # Listener context: the coordinator only calls us when this slot changed.
+        self.coordinator_context = self._resolve_change_key()
+
+    def _resolve_change_key(self) -> Optional[Tuple[str, Optional[str]]]:
+        """Return the single payload slot the state depends on (None = any).
+
+        Derived from the sensor config: notification sensors and configs
+        flagged ``multi_source`` read more than one slot.
+        """
+        category = self._sensor_config.get("sensor_type_category")
+        if (
+            self._notification
+            or category == "notification"
+            or self._sensor_config.get("multi_source")
+        ):
+            return None
+        if category == "extended":
+            group = _extended_group(self._sensor_type)
+            return (group, None) if group else None
+        node_id = self._sensor_config.get("node_id")
+        node_key = self._sensor_config.get("node_key")
+        if isinstance(node_id, str) and isinstance(node_key, str):
+            return (node_id, node_key)
+        return None
+
     async def async_added_to_hass(self) -> None:
         """Register per-entity listener for local telemetry."""
         await super().async_added_to_hass()
@@ -272,14 +310,8 @@ class OigCloudDataSensor(_DataSensorBase):
             pv_data = data.get(self._box_id, {})
 
             # Extended logika
-            try:
-                from ..sensor_types import SENSOR_TYPES
-
-                sensor_config = SENSOR_TYPES.get(self._sensor_type, {})
-                if sensor_config.get("sensor_type_category") == "extended":
-                    return self._get_extended_value_for_sensor()
-            except ImportError:
-                pass
+            if self._sensor_config.get("sensor_type_category") == "extended":
+                return self._get_extended_value_for_sensor()
 
             # Získáme raw hodnotu z parent
             raw_value = self.get_node_value()
@@ -480,20 +512,13 @@ class OigCloudDataSensor(_DataSensorBase):
         """Získá hodnotu pro extended senzor podle typu."""
         sensor_type = self._sensor_type
 
-        # Mapování sensor_type na extended_key
-        if "battery" in sensor_type:
-            return self._get_extended_value("extended_batt", sensor_type)
-        elif "fve" in sensor_type:
-            if "current" in sensor_type:
-                return self._compute_fve_current(sensor_type)
-            else:
-                return self._get_extended_value("extended_fve", sensor_type)
-        elif "grid" in sensor_type:
-            return self._get_extended_value("extended_grid", sensor_type)
-        elif "load" in sensor_type:
-            return self._get_extended_value("extended_load", sensor_type)
-
-        return None
+        # Mapování sensor_type na extended_key (sdílené s listener change key)
+        group = _extended_group(sensor_type)
+        if group is None:
+            return None
+        if group == "extended_fve" and "current" in sensor_type:
+            return self._compute_fve_current(sensor_type)
+        return self._get_extended_value(group, sensor_type)
 
     def _get_extended_value(
         self, extended_key: str, sensor_type: str
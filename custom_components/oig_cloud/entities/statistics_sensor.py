@@ -21,6 +21,8 @@ from homeassistant.helpers.restore_state import RestoreEntity
 from homeassistant.helpers.storage import Store
 from homeassistant.util import dt as dt_util
 
+from ..shared.history_window_cache import get_history_window_cache
+from ..shared.rolling_median import RollingMedianWindow
 from ..shared.statistics_storage import StatisticsStore
 
 _LOGGER = logging.getLogger(__name__)
@@ -31,6 +33,8 @@ class OigCloudStatisticsSensor(RestoreEntity, SensorEntity):
     """Statistics sensor for OIG Cloud data."""
 
     def __setattr__(self, name: str, value: Any) -> None:
+        if name == "_sampling_data" and not isinstance(value, RollingMedianWindow):
+            value = RollingMedianWindow.from_samples(value)
         super().__setattr__(name, value)
         try:
             if object.__getattribute__(self, "_initialized"):
@@ -136,7 +140,7 @@ class OigCloudStatisticsSensor(RestoreEntity, SensorEntity):
                 self._source_entity_id = f"sensor.oig_{self._data_key}_{source_sensor}"
 
         # Statistická data pro základní mediánový senzor
-        self._sampling_data: List[Tuple[datetime, float]] = []
+        self._sampling_data: RollingMedianWindow = RollingMedianWindow()
         self._max_sampling_size: int = 1000
         self._sampling_minutes: int = 10
 
@@ -410,7 +414,8 @@ class OigCloudStatisticsSensor(RestoreEntity, SensorEntity):
         # Vyčištění sampling dat - ponechat jen posledních N minut
         if self._sampling_data:
             cutoff_time = now - timedelta(minutes=self._sampling_minutes * 2)
-            self._sampling_data = self._filter_sampling_data(cutoff_time)
+            self._sampling_data.expire(cutoff_time)
+            self._refresh_attrs()
 
         # Vyčištění intervalových dat - ponechat jen posledních N dní
         if hasattr(self, "_max_age_days") and self._interval_data:
@@ -442,23 +447,14 @@ class OigCloudStatisticsSensor(RestoreEntity, SensorEntity):
             # Použití aktuálního lokálního času místo parametru
             now_local = datetime.now()
 
-            # Přidání nového vzorku
-            self._sampling_data.append((now_local, source_value))
-
-            # Omezení velikosti dat
-            if len(self._sampling_data) > self._max_sampling_size:
-                self._sampling_data = self._sampling_data[-self._max_sampling_size :]
-
-            # Vyčištění starých dat - zajistit naive datetime pro porovnání
-            cutoff_time = now_local - timedelta(minutes=self._sampling_minutes)
-            cleaned_data = []
-            for dt, value in self._sampling_data:
-                # Převod na naive datetime pokud je timezone-aware
-                dt_naive = dt.replace(tzinfo=None) if dt.tzinfo is not None else dt
-                if dt_naive > cutoff_time:
-                    cleaned_data.append((dt_naive, value))
-
-            self._sampling_data = cleaned_data
+            # Přidání nového vzorku, omezení velikosti a vyčištění starých dat
+            # (okno drží vzorky v časovém pořadí, vše v O(log n))
+            self._sampling_data.append(now_local, source_value)
+            self._sampling_data.trim(self._max_sampling_size)
+            self._sampling_data.expire(
+                now_local - timedelta(minutes=self._sampling_minutes)
+            )
+            self._refresh_attrs()
 
             # Aktualizace stavu senzoru
             self.async_write_ha_state()
@@ -601,9 +597,6 @@ class OigCloudStatisticsSensor(RestoreEntity, SensorEntity):
             return None
 
         try:
-            from homeassistant.components.recorder import history
-            from homeassistant.helpers.recorder import get_instance
-
             time_range = self._time_range
             if not isinstance(time_range, (list, tuple)) or len(time_range) != 2:
                 return None
@@ -624,33 +617,19 @@ class OigCloudStatisticsSensor(RestoreEntity, SensorEntity):
                 end_time.date(),
             )
 
-            try:
-                recorder_instance = get_instance(self.hass)
-            except Exception:
-                recorder_instance = None
-
-            # Načíst všechna historická data
-            if recorder_instance:
-                states = await recorder_instance.async_add_executor_job(
-                    history.state_changes_during_period,
-                    self.hass,
-                    start_time,
-                    end_time,
-                    source_entity_id,
-                )
-            elif hasattr(self.hass, "async_add_executor_job"):
-                states = await self.hass.async_add_executor_job(
-                    history.state_changes_during_period,
-                    self.hass,
-                    start_time,
-                    end_time,
-                    source_entity_id,
-                )
-            else:
+            # Sdílené okno historie (per entry) - dotaz jen na chybějící část
+            entry = getattr(self._coordinator, "config_entry", None)
+            cache = get_history_window_cache(
+                self.hass, getattr(entry, "entry_id", None) or self._data_key
+            )
+            state_list = await cache.async_get_states(
+                source_entity_id, start_time, end_time
+            )
+            if state_list is None:
                 _LOGGER.warning("[%s] Recorder instance not available", self.entity_id)
                 return None
 
-            if source_entity_id not in states or not states[source_entity_id]:
+            if not state_list:
                 _LOGGER.warning(
                     "[%s] No historical data found for %s",
                     self.entity_id,
@@ -659,7 +638,7 @@ class OigCloudStatisticsSensor(RestoreEntity, SensorEntity):
                 return None
 
             daily_medians = self._calculate_daily_medians(
-                states[source_entity_id],
+                state_list,
                 start_hour,
                 end_hour,
                 end_time,
@@ -935,7 +914,7 @@ class OigCloudStatisticsSensor(RestoreEntity, SensorEntity):
 
     def _load_sampling_data(
         self, sampling_list: List[Tuple[Any, Any]], max_size: int
-    ) -> List[Tuple[datetime, float]]:
+    ) -> RollingMedianWindow:
         samples: List[Tuple[datetime, float]] = []
         for item in sampling_list[-max_size:]:
             try:
@@ -950,7 +929,7 @@ class OigCloudStatisticsSensor(RestoreEntity, SensorEntity):
                     item[0],
                     err,
                 )
-        return samples
+        return RollingMedianWindow.from_samples(samples)
 
     def _load_hourly_data(self, raw_data: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         safe_hourly_data = []
@@ -979,12 +958,8 @@ class OigCloudStatisticsSensor(RestoreEntity, SensorEntity):
         return safe_hourly_data
 
     def _serialize_sampling_data(self) -> List[Tuple[str, float]]:
-        data: List[Tuple[str, float]] = []
-        for dt, value in self._sampling_data:
-            if dt.tzinfo is not None:
-                dt = dt.replace(tzinfo=None)
-            data.append((dt.isoformat(), value))
-        return data
+        # Samples in the window are already naive.
+        return self._sampling_data.serialize()
 
     def _serialize_hourly_data(self) -> List[Dict[str, Any]]:
         safe_hourly_data: List[Dict[str, Any]] = []
@@ -1003,16 +978,6 @@ class OigCloudStatisticsSensor(RestoreEntity, SensorEntity):
             safe_hourly_data.append(safe_record)
         return safe_hourly_data
 
-    def _filter_sampling_data(
-        self, cutoff_time: datetime
-    ) -> List[Tuple[datetime, float]]:
-        cleaned: List[Tuple[datetime, float]] = []
-        for dt, value in self._sampling_data:
-            dt_naive = dt.replace(tzinfo=None) if dt.tzinfo is not None else dt
-            if dt_naive > cutoff_time:
-                cleaned.append((dt_naive, value))
-        return cleaned
-
     def _filter_hourly_data(self, cutoff_time: datetime) -> List[Dict[str, Any]]:
         cleaned_hourly_data: List[Dict[str, Any]] = []
         for record in self._hourly_data:
@@ -1161,40 +1126,36 @@ def _convert_power_integral(
 
 def _calculate_sampling_median(
     entity_id: str,
-    sampling_data: List[Tuple[datetime, float]],
+    sampling_data: Union[RollingMedianWindow, List[Tuple[datetime, float]]],
     sampling_minutes: int,
 ) -> Optional[float]:
     if not sampling_data:
         return None
 
+    window = (
+        sampling_data
+        if isinstance(sampling_data, RollingMedianWindow)
+        else RollingMedianWindow.from_samples(sampling_data)
+    )
     now = datetime.now()
     cutoff_time = now - timedelta(minutes=sampling_minutes)
-    recent_data = [
-        value for dt, value in sampling_data if dt > cutoff_time and value is not None
-    ]
+    # Falls back to all samples when none is newer than the cutoff.
+    result = window.median_since(cutoff_time)
 
     _LOGGER.debug(
-        "[%s] Time check: now=%s, cutoff=%s, total_samples=%s, recent_samples=%s",
+        "[%s] Time check: now=%s, cutoff=%s, samples=%s",
         entity_id,
         now.strftime("%H:%M:%S"),
         cutoff_time.strftime("%H:%M:%S"),
-        len(sampling_data),
-        len(recent_data),
-    )
-
-    data = (
-        recent_data
-        if recent_data
-        else [value for _, value in sampling_data if value is not None]
+        len(window),
     )
-    if not data:
+    if result is None:
         return None
-    result = median(data)
     _LOGGER.debug(
         "[%s] Calculated median: %.1fW from %s samples",
         entity_id,
         result,
-        len(data),
+        len(window),
     )
     return round(result, 1)
 
@@ -1220,7 +1181,7 @@ def _calculate_interval_median(
 
 
 def _build_sampling_attrs(
-    sampling_data: List[Tuple[datetime, float]],
+    sampling_data: RollingMedianWindow,
     sampling_minutes: int,
     max_sampling_size: int,
 ) -> Dict[str, Any]:
@@ -1229,8 +1190,8 @@ def _build_sampling_attrs(
         "sampling_minutes": sampling_minutes,
         "max_sampling_size": max_sampling_size,
     }
-    if sampling_data:
-        last_update = max(dt for dt, _ in sampling_data)
+    last_update = sampling_data.last_sample_time
+    if last_update is not None:
         attributes["last_sample"] = last_update.isoformat()
     return attributes
 
@@ -4,7 +4,7 @@ import json
 import logging
 import ssl
 import time
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 import aiohttp
 import certifi
@@ -49,8 +49,21 @@ except ImportError:
     tracer = None  # type: ignore
     _has_opentelemetry = False
 
-# Using a lock to prevent multiple simultaneous API calls
-lock: asyncio.Lock = asyncio.Lock()
+# One lock per account: calls for the same login are serialized (the portal
+# session is shared), different accounts poll in parallel.
+_account_locks: Dict[str, asyncio.Lock] = {}
+
+# Keep-alive pool of the long-lived per-account session.
+_POOL_LIMIT = 4
+_POOL_KEEPALIVE_SECONDS = 60.0
+
+
+def _get_account_lock(username: str) -> asyncio.Lock:
+    account_lock = _account_locks.get(username)
+    if account_lock is None:
+        account_lock = asyncio.Lock()
+        _account_locks[username] = account_lock
+    return account_lock
 
 
 class OigCloudApiError(Exception):
@@ -69,6 +82,37 @@ class OigCloudTimeoutError(OigCloudApiError):
     """Exception for timeout errors."""
 
 
+class _SessionLease:
+    """Borrowed handle to the pooled session.
+
+    The lease is held from creation, so callers that skip ``async with`` and
+    call ``close()`` themselves are counted too. Neither form closes the
+    underlying session; they only release the lease so retired sessions can
+    be closed once unused.
+    """
+
+    def __init__(self, api: "OigCloudApi", session: aiohttp.ClientSession) -> None:
+        self._api = api
+        self._session = session
+        self._released = False
+        api._session_leases += 1
+
+    async def __aenter__(self) -> aiohttp.ClientSession:
+        return self._session
+
+    async def __aexit__(self, *_exc: Any) -> None:
+        await self.close()
+
+    async def close(self) -> None:
+        if not self._released:
+            self._released = True
+            self._api._session_leases = max(0, self._api._session_leases - 1)
+        await self._api._close_retired_sessions()
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._session, name)
+
+
 class OigCloudApi:
     """API client for OIG Cloud."""
 
@@ -119,6 +163,15 @@ class OigCloudApi:
         self._ssl_mode: int = 1
         self._ssl_context_with_intermediate: Optional[ssl.SSLContext] = None
 
+        # Long-lived keep-alive session, rebuilt when PHPSESSID/SSL mode change.
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._session_key: Optional[Tuple[str, int]] = None
+        self._session_leases: int = 0
+        self._retired_sessions: List[aiohttp.ClientSession] = []
+        self._lock: asyncio.Lock = _get_account_lock(username)
+        # Login started after a rejected request; concurrent 401s await it.
+        self._reauth_task: Optional["asyncio.Future[bool]"] = None
+
         self._logger.debug(
             "OigCloudApi initialized (ETag support enabled, timing controlled by coordinator)"
         )
@@ -196,20 +249,39 @@ LwoFE+ObVXxX674szQvIc+7WPCooVsUbwZIikzJqZb4gJQ1OQx23CgyyYlsPHIDN
         1 = SSL with cached intermediate cert (for broken chain)
         2 = SSL disabled (last resort)
         """
+        pool: Dict[str, Any] = {
+            "limit": _POOL_LIMIT,
+            "keepalive_timeout": _POOL_KEEPALIVE_SECONDS,
+        }
         if self._ssl_mode == 0:
             # Normal SSL verification
-            return TCPConnector()
+            return TCPConnector(**pool)
         elif self._ssl_mode == 1:
             # SSL with intermediate cert
-            return TCPConnector(ssl=self._get_ssl_context_with_intermediate())
+            return TCPConnector(ssl=self._get_ssl_context_with_intermediate(), **pool)
         else:
             # SSL disabled
-            return TCPConnector(ssl=False)
+            return TCPConnector(ssl=False, **pool)
 
     async def authenticate(self) -> bool:
         """Authenticate with the OIG Cloud API."""
         return await self._authenticate_internal()
 
+    async def _reauthenticate(self, stale_sessid: Optional[str]) -> bool:
+        """Log in again after a request was rejected with ``stale_sessid``.
+
+        Requests running concurrently (e.g. the extended stats groups) share
+        one in-flight login instead of each logging in and invalidating the
+        others' session; a request rejected after that login just retries.
+        """
+        if self._phpsessid and self._phpsessid != stale_sessid:
+            return True
+        task = self._reauth_task
+        if task is None or task.done():
+            task = asyncio.ensure_future(self.authenticate())
+            self._reauth_task = task
+        return await asyncio.shield(task)
+
     async def _authenticate_internal(self) -> bool:
         """Internal authentication method with SSL fallback.
 
@@ -289,11 +361,26 @@ LwoFE+ObVXxX674szQvIc+7WPCooVsUbwZIikzJqZb4gJQ1OQx23CgyyYlsPHIDN
         # Should not reach here, but just in case
         raise OigCloudAuthError("Authentication failed after all SSL fallbacks")
 
-    def get_session(self) -> aiohttp.ClientSession:
-        """Get a session with authentication cookies and browser-like headers."""
+    def get_session(self) -> _SessionLease:
+        """Get the pooled session with authentication cookies and browser-like headers.
+
+        The session is created once per PHPSESSID/SSL mode and kept alive
+        across calls; the returned lease never closes it.
+        """
         if not self._phpsessid:
             raise OigCloudAuthError("Not authenticated, call authenticate() first")
 
+        key = (self._phpsessid, self._ssl_mode)
+        session = self._session
+        if session is None or session.closed or self._session_key != key:
+            if session is not None and not session.closed:
+                self._retired_sessions.append(session)
+            session = self._create_session()
+            self._session = session
+            self._session_key = key
+        return _SessionLease(self, session)
+
+    def _create_session(self) -> aiohttp.ClientSession:
         # Browser-like headers to simulate real Chrome browser on Android
         headers = {
             "Cookie": f"PHPSESSID={self._phpsessid}",
@@ -322,10 +409,31 @@ LwoFE+ObVXxX674szQvIc+7WPCooVsUbwZIikzJqZb4gJQ1OQx23CgyyYlsPHIDN
 
         # Use SSL mode determined during authentication
         connector = self._get_connector()
+        # The PHPSESSID header is authoritative; don't let cookies collected by
+        # the long-lived session override it.
         return aiohttp.ClientSession(
-            headers=headers, timeout=self._timeout, connector=connector
+            headers=headers,
+            timeout=self._timeout,
+            connector=connector,
+            cookie_jar=aiohttp.DummyCookieJar(),
         )
 
+    async def _close_retired_sessions(self) -> None:
+        if self._session_leases > 0 or not self._retired_sessions:
+            return
+        retired, self._retired_sessions = self._retired_sessions, []
+        for session in retired:
+            await session.close()
+
+    async def close(self) -> None:
+        """Close the pooled session (call on config entry unload)."""
+        session, self._session = self._session, None
+        self._session_key = None
+        if session is not None:
+            self._retired_sessions.append(session)
+        self._session_leases = 0
+        await self._close_retired_sessions()
+
     def _update_cache(
         self, endpoint: str, response: aiohttp.ClientResponse, data: Any
     ) -> None:
@@ -352,7 +460,7 @@ LwoFE+ObVXxX674szQvIc+7WPCooVsUbwZIikzJqZb4gJQ1OQx23CgyyYlsPHIDN
         Note: No internal caching - coordinator controls timing.
         last_state is only used for timeout fallback.
         """
-        async with lock:
+        async with self._lock:
             return await self._get_stats_internal()
 
     async def _get_stats_internal(self) -> Optional[Dict[str, Any]]:
@@ -388,6 +496,7 @@ LwoFE+ObVXxX674szQvIc+7WPCooVsUbwZIikzJqZb4gJQ1OQx23CgyyYlsPHIDN
     async def _try_get_stats(self, dependent: bool = False) -> Optional[Dict[str, Any]]:
         """Try to get stats with proper error handling and ETag support."""
         endpoint = "json.php"
+        sessid = self._phpsessid
 
         try:
             async with self.get_session() as session:
@@ -430,7 +539,7 @@ LwoFE+ObVXxX674szQvIc+7WPCooVsUbwZIikzJqZb4gJQ1OQx23CgyyYlsPHIDN
                                         return retry_data
                                     if not dependent:
                                         self._logger.info("Retrying authentication")
-                                        if await self.authenticate():
+                                        if await self._reauthenticate(sessid):
                                             return await self._try_get_stats(True)
                                     return None
                                 else:
@@ -446,7 +555,7 @@ LwoFE+ObVXxX674szQvIc+7WPCooVsUbwZIikzJqZb4gJQ1OQx23CgyyYlsPHIDN
 
                         if not isinstance(response_data, dict) and not dependent:
                             self._logger.info("Retrying authentication")
-                            if await self.authenticate():
+                            if await self._reauthenticate(sessid):
                                 return await self._try_get_stats(True)
                             return None
 
@@ -722,7 +831,13 @@ LwoFE+ObVXxX674szQvIc+7WPCooVsUbwZIikzJqZb4gJQ1OQx23CgyyYlsPHIDN
         self, name: str, from_date: str, to_date: str
     ) -> Dict[str, Any]:
         """Get extended statistics with ETag support."""
+        return await self._get_extended_stats(name, from_date, to_date, True)
+
+    async def _get_extended_stats(
+        self, name: str, from_date: str, to_date: str, retry_auth: bool
+    ) -> Dict[str, Any]:
         endpoint = f"json2.php:{name}"  # Per-name caching
+        sessid = self._phpsessid
 
         try:
             self._logger.debug(
@@ -796,9 +911,9 @@ LwoFE+ObVXxX674szQvIc+7WPCooVsUbwZIikzJqZb4gJQ1OQx23CgyyYlsPHIDN
                         self._logger.warning(
                             f"Authentication failed for extended stats '{name}', retrying authentication"
                         )
-                        if await self.authenticate():
-                            return await self.get_extended_stats(
-                                name, from_date, to_date
+                        if retry_auth and await self._reauthenticate(sessid):
+                            return await self._get_extended_stats(
+                                name, from_date, to_date, False
                             )
                         return {}
                     else:
@@ -815,6 +930,12 @@ LwoFE+ObVXxX674szQvIc+7WPCooVsUbwZIikzJqZb4gJQ1OQx23CgyyYlsPHIDN
         self, device_id: Optional[str] = None
     ) -> Dict[str, Any]:
         """Get notifications from OIG Cloud - similar to get_extended_stats."""
+        return await self._get_notifications(device_id, True)
+
+    async def _get_notifications(
+        self, device_id: Optional[str], retry_auth: bool
+    ) -> Dict[str, Any]:
+        sessid = self._phpsessid
         try:
             if device_id is None:
                 device_id = self.box_id
@@ -865,8 +986,8 @@ LwoFE+ObVXxX674szQvIc+7WPCooVsUbwZIikzJqZb4gJQ1OQx23CgyyYlsPHIDN
                         self._logger.warning(
                             "Authentication failed for notifications, retrying authentication"
                         )
-                        if await self.authenticate():
-                            return await self.get_notifications(device_id)
+                        if retry_auth and await self._reauthenticate(sessid):
+                            return await self._get_notifications(device_id, False)
                         return {
                             "notifications": [],
                             "bypass_status": False,
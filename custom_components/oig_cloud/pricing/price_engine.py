@@ -0,0 +1,362 @@
+"""Shared final-price engine for spot-based tariffs.
+
+The 15-minute price sensors, the battery planner and the analytics sensor all
+turn raw spot prices into commercial, distribution, VAT-inclusive import and
+export prices. ``PricingOptions`` captures one consumer's resolved pricing
+configuration (fees, VAT and a week-long VT/NT tariff table, so tariffs are a
+table lookup instead of re-parsing option strings per interval).
+``price_arrays`` evaluates all intervals of a price dict at once and caches
+the result per (price data, options), so attribute rebuilds every 15 minutes
+only slice the cached arrays. Both caches find entries by comparing against
+a shallow snapshot of the inputs (the same objects come back each call, so
+equality short-circuits on identity) instead of re-hashing them.
+
+Each consumer keeps its historical behaviour: the tariff scheme is taken from
+the consumer's own tariff resolver, defaults can be overridden per consumer,
+the planner keeps its half-up decimal rounding and the analytics sensor
+prices ``fixed_prices`` like the fixed-fee model (spot + fee).
+"""
+
+from __future__ import annotations
+
+import logging
+from bisect import bisect_right
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from decimal import ROUND_HALF_UP, Decimal
+from typing import Any, Callable, Dict, List, Mapping, Optional, Tuple
+
+_LOGGER = logging.getLogger(__name__)
+
+TariffResolver = Callable[[datetime], str]
+
+INTERVAL = timedelta(minutes=15)
+
+# Any Monday works: tariffs only depend on the weekday and the hour.
+_REFERENCE_MONDAY = datetime(2024, 1, 1)
+_OPTIONS_CACHE_SIZE = 32
+_ARRAYS_CACHE_SIZE = 8
+
+DEFAULT_PRICING_VALUES: Dict[str, Any] = {
+    "spot_pricing_model": "percentage",
+    "spot_positive_fee_percent": 15.0,
+    "spot_negative_fee_percent": 9.0,
+    "spot_fixed_fee_mwh": 0.0,
+    "fixed_commercial_price_vt": 4.50,
+    "distribution_fee_vt_kwh": 1.50,
+    "distribution_fee_nt_kwh": 1.20,
+    "vat_rate": 21.0,
+    "export_pricing_model": "percentage",
+    "export_fee_percent": 15.0,
+    "export_fixed_fee_czk": 0.20,
+    "export_fixed_price": 2.50,
+}
+
+
+def _round_czk(value: Decimal) -> float:
+    return float(value.quantize(Decimal("0.01"), rounding=ROUND_HALF_UP))
+
+
+@dataclass(frozen=True)
+class PricingOptions:
+    """Resolved pricing configuration of one consumer."""
+
+    tariffs: Tuple[str, ...]
+    spot_model: str
+    positive_fee_percent: float
+    positive_fee_percent_nt: float
+    negative_fee_percent: float
+    negative_fee_percent_nt: float
+    fixed_fee_mwh: float
+    fixed_fee_mwh_nt: float
+    fixed_price_vt: float
+    fixed_price_nt: float
+    distribution_fee_vt: float
+    distribution_fee_nt: float
+    vat_rate: float
+    export_model: str
+    export_fee_percent: float
+    export_fee_percent_nt: float
+    export_fixed_fee: float
+    export_fixed_fee_nt: float
+    export_fixed_price: float
+    decimal_rounding: bool = False
+    fixed_prices_spot_fee: bool = False
+
+    @classmethod
+    def from_options(
+        cls,
+        options: Mapping[str, Any],
+        tariff_for: TariffResolver,
+        *,
+        defaults: Optional[Mapping[str, Any]] = None,
+        decimal_rounding: bool = False,
+        fixed_prices_spot_fee: bool = False,
+    ) -> "PricingOptions":
+        """Resolve ``options`` (config entry options) for ``tariff_for``."""
+        fallback = dict(DEFAULT_PRICING_VALUES)
+        if defaults:
+            fallback.update(defaults)
+
+        def get(name: str, default: Any = None) -> Any:
+            if name in options:
+                return options[name]
+            return fallback.get(name, default)
+
+        positive = get("spot_positive_fee_percent")
+        negative = get("spot_negative_fee_percent")
+        fixed_fee = get("spot_fixed_fee_mwh")
+        fixed_vt = get("fixed_commercial_price_vt")
+        export_fee = get("export_fee_percent")
+        export_fixed_fee = get("export_fixed_fee_czk")
+        return cls(
+            tariffs=build_tariff_table(tariff_for),
+            spot_model=get("spot_pricing_model"),
+            positive_fee_percent=positive,
+            positive_fee_percent_nt=get("spot_positive_fee_percent_nt", positive),
+            negative_fee_percent=negative,
+            negative_fee_percent_nt=get("spot_negative_fee_percent_nt", negative),
+            fixed_fee_mwh=fixed_fee,
+            fixed_fee_mwh_nt=get("spot_fixed_fee_mwh_nt", fixed_fee),
+            fixed_price_vt=fixed_vt,
+            fixed_price_nt=get("fixed_commercial_price_nt", fixed_vt),
+            distribution_fee_vt=get("distribution_fee_vt_kwh"),
+            distribution_fee_nt=get("distribution_fee_nt_kwh"),
+            vat_rate=get("vat_rate"),
+            export_model=get("export_pricing_model"),
+            export_fee_percent=export_fee,
+            export_fee_percent_nt=get("export_fee_percent_nt", export_fee),
+            export_fixed_fee=export_fixed_fee,
+            export_fixed_fee_nt=get("export_fixed_fee_czk_nt", export_fixed_fee),
+            export_fixed_price=get("export_fixed_price"),
+            decimal_rounding=decimal_rounding,
+            fixed_prices_spot_fee=fixed_prices_spot_fee,
+        )
+
+    def tariff(self, when: datetime) -> str:
+        """Return VT/NT for ``when``."""
+        return self.tariffs[when.weekday() * 24 + when.hour]
+
+    def commercial_price(self, spot_price: float, tariff: str) -> float:
+        """Spot price with the supplier's fee (or the fixed supplier price)."""
+        nt = tariff == "NT"
+        if self.spot_model == "percentage":
+            if spot_price >= 0:
+                fee = self.positive_fee_percent_nt if nt else self.positive_fee_percent
+                return spot_price * (1 + fee / 100.0)
+            fee = self.negative_fee_percent_nt if nt else self.negative_fee_percent
+            return spot_price * (1 - fee / 100.0)
+        if self.spot_model == "fixed_prices" and not self.fixed_prices_spot_fee:
+            return self.fixed_price_nt if nt else self.fixed_price_vt
+        fee_mwh = self.fixed_fee_mwh_nt if nt else self.fixed_fee_mwh
+        return spot_price + fee_mwh / 1000.0
+
+    def distribution_fee(self, tariff: str) -> float:
+        return self.distribution_fee_vt if tariff == "VT" else self.distribution_fee_nt
+
+    def import_price(self, spot_price: float, tariff: str) -> float:
+        """Final purchase price including distribution and VAT, in CZK/kWh."""
+        commercial = self.commercial_price(spot_price, tariff)
+        distribution = self.distribution_fee(tariff)
+        if self.decimal_rounding:
+            without_vat = Decimal(str(commercial)) + Decimal(str(distribution))
+            multiplier = Decimal("1") + Decimal(str(self.vat_rate)) / Decimal("100")
+            return _round_czk(without_vat * multiplier)
+        return round((commercial + distribution) * (1 + self.vat_rate / 100.0), 2)
+
+    def export_price(self, spot_price: float, tariff: str) -> float:
+        """Sell price without VAT and distribution, in CZK/kWh."""
+        nt = tariff == "NT"
+        if self.export_model == "percentage":
+            fee = self.export_fee_percent_nt if nt else self.export_fee_percent
+            price = spot_price * (1 - fee / 100.0)
+        elif self.export_model == "fixed_prices":
+            price = self.export_fixed_price
+        else:
+            price = spot_price - (
+                self.export_fixed_fee_nt if nt else self.export_fixed_fee
+            )
+        return round(price, 2)
+
+
+@dataclass(frozen=True)
+class PriceArrays:
+    """Per-interval prices, sorted by interval start."""
+
+    keys: Tuple[str, ...]
+    starts: Tuple[datetime, ...]
+    tariffs: Tuple[str, ...]
+    spot: Tuple[float, ...]
+    commercial: Tuple[float, ...]
+    distribution: Tuple[float, ...]
+    import_price: Tuple[float, ...]
+    export_price: Tuple[float, ...]
+    dropped: int = field(default=0, compare=False)
+
+    def __len__(self) -> int:
+        return len(self.keys)
+
+    def first_active(self, now: datetime, interval: timedelta = INTERVAL) -> int:
+        """Index of the first interval that has not ended at ``now``."""
+        if self.starts and self.starts[0].tzinfo is None and now.tzinfo is not None:
+            now = now.replace(tzinfo=None)
+        return bisect_right(self.starts, now - interval)
+
+
+def build_tariff_table(tariff_for: TariffResolver) -> Tuple[str, ...]:
+    """Evaluate ``tariff_for`` for every hour of a week (Monday first)."""
+    return tuple(
+        tariff_for(_REFERENCE_MONDAY + timedelta(days=day, hours=hour))
+        for day in range(7)
+        for hour in range(24)
+    )
+
+
+@dataclass(frozen=True)
+class _OptionsEntry:
+    scheme: Any
+    options: Dict[str, Any]
+    defaults: Dict[str, Any]
+    flags: Tuple[bool, bool]
+    resolved: PricingOptions
+
+
+@dataclass(frozen=True)
+class _ArraysEntry:
+    prices: Dict[str, Any]
+    options: PricingOptions
+    skip_invalid: bool
+    arrays: PriceArrays
+
+
+# Most recently used last.
+_options_cache: List[_OptionsEntry] = []
+_arrays_cache: List[_ArraysEntry] = []
+
+
+def _lookup(cache: List[Any], matches: Callable[[Any], bool]) -> Optional[Any]:
+    for index in range(len(cache) - 1, -1, -1):
+        entry = cache[index]
+        if matches(entry):
+            if index != len(cache) - 1:
+                cache.append(cache.pop(index))
+            return entry
+    return None
+
+
+def _remember(cache: List[Any], entry: Any, size: int) -> None:
+    cache.append(entry)
+    del cache[:-size]
+
+
+def resolve_pricing_options(
+    options: Mapping[str, Any],
+    tariff_for: TariffResolver,
+    *,
+    scheme: Any = None,
+    defaults: Optional[Mapping[str, Any]] = None,
+    decimal_rounding: bool = False,
+    fixed_prices_spot_fee: bool = False,
+) -> PricingOptions:
+    """Return cached ``PricingOptions`` for the current option values.
+
+    ``scheme`` identifies the tariff resolver implementation; it defaults to
+    the function behind ``tariff_for`` (resolvers must only depend on
+    ``options``).
+    """
+    if scheme is None:
+        scheme = getattr(tariff_for, "__func__", tariff_for)
+    flags = (decimal_rounding, fixed_prices_spot_fee)
+    defaults = defaults or {}
+    cached = _lookup(
+        _options_cache,
+        lambda entry: entry.scheme is scheme
+        and entry.flags == flags
+        and entry.options == options
+        and entry.defaults == defaults,
+    )
+    if cached is not None:
+        return cached.resolved
+
+    resolved = PricingOptions.from_options(
+        options,
+        tariff_for,
+        defaults=defaults,
+        decimal_rounding=decimal_rounding,
+        fixed_prices_spot_fee=fixed_prices_spot_fee,
+    )
+    _remember(
+        _options_cache,
+        _OptionsEntry(scheme, dict(options), dict(defaults), flags, resolved),
+        _OPTIONS_CACHE_SIZE,
+    )
+    return resolved
+
+
+def _parse_start(key: str) -> datetime:
+    return datetime.fromisoformat(key.replace("Z", "+00:00"))
+
+
+def price_arrays(
+    prices: Mapping[str, Any],
+    options: PricingOptions,
+    *,
+    skip_invalid: bool = False,
+) -> PriceArrays:
+    """Compute (or reuse) price arrays for ``prices`` (ISO start -> spot CZK/kWh).
+
+    Invalid keys raise ``ValueError`` unless ``skip_invalid`` is set, in which
+    case they are dropped (``PriceArrays.dropped`` counts them).
+    """
+    cached = _lookup(
+        _arrays_cache,
+        lambda entry: (entry.options is options or entry.options == options)
+        and entry.skip_invalid == skip_invalid
+        and entry.prices == prices,
+    )
+    if cached is not None:
+        return cached.arrays
+
+    items = sorted(prices.items())
+
+    keys, starts, tariffs, spot = [], [], [], []
+    commercial, distribution, import_price, export_price = [], [], [], []
+    dropped = 0
+    for time_key, spot_price in items:
+        try:
+            start = _parse_start(time_key)
+        except (AttributeError, TypeError, ValueError):
+            if not skip_invalid:
+                raise ValueError(f"Invalid price interval key: {time_key!r}")
+            dropped += 1
+            continue
+        tariff = options.tariff(start)
+        keys.append(time_key)
+        starts.append(start)
+        tariffs.append(tariff)
+        spot.append(spot_price)
+        commercial.append(options.commercial_price(spot_price, tariff))
+        distribution.append(options.distribution_fee(tariff))
+        import_price.append(options.import_price(spot_price, tariff))
+        export_price.append(options.export_price(spot_price, tariff))
+
+    if dropped:
+        _LOGGER.debug("Skipped %s invalid price interval keys", dropped)
+
+    arrays = PriceArrays(
+        keys=tuple(keys),
+        starts=tuple(starts),
+        tariffs=tuple(tariffs),
+        spot=tuple(spot),
+        commercial=tuple(commercial),
+        distribution=tuple(distribution),
+        import_price=tuple(import_price),
+        export_price=tuple(export_price),
+        dropped=dropped,
+    )
+    _remember(
+        _arrays_cache,
+        _ArraysEntry(dict(prices), options, skip_invalid, arrays),
+        _ARRAYS_CACHE_SIZE,
+    )
+    return arrays
@@ -5,7 +5,7 @@ from __future__ import annotations
 import asyncio
 import logging
 from datetime import datetime, timedelta
-from typing import TYPE_CHECKING, Any, Dict, Optional
+from typing import TYPE_CHECKING, Any, Dict, Optional, Tuple
 
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import callback
@@ -16,6 +16,12 @@ from homeassistant.util.dt import now as dt_now
 from ..api.ote_api import OteApi
 from ..entities.base_sensor import OigCloudSensor
 from ..sensors.SENSOR_TYPES_SPOT import SENSOR_TYPES_SPOT
+from .price_engine import (
+    PriceArrays,
+    PricingOptions,
+    price_arrays,
+    resolve_pricing_options,
+)
 from .spot_price_shared import (
     DAILY_FETCH_HOUR,
     DAILY_FETCH_MINUTE,
@@ -361,38 +367,17 @@ class BasePrice15MinSensor(OigCloudSensor, RestoreEntityBase):
         attrs: Dict[str, Any] = {}
 
         try:
-            if (
-                not self._spot_data_15min
-                or "prices15m_czk_kwh" not in self._spot_data_15min
-            ):
+            arrays = self.get_price_arrays()
+            if arrays is None:
                 return attrs
 
             now = dt_now()
             current_interval_index = self._get_current_interval_index(now)
-            prices_15m = self._spot_data_15min["prices15m_czk_kwh"]
-
-            future_prices = []
-            current_price: Optional[float] = None
-            next_price: Optional[float] = None
-
-            for time_key, spot_price_czk in sorted(prices_15m.items()):
-                dt_naive = datetime.fromisoformat(time_key)
-                dt = (
-                    dt_naive.replace(tzinfo=now.tzinfo)
-                    if dt_naive.tzinfo is None
-                    else dt_naive
-                )
-                interval_end = dt + timedelta(minutes=15)
-                if interval_end <= now:
-                    continue
 
-                price_value = self._calculate_interval_price(spot_price_czk, dt)
-                future_prices.append(price_value)
-
-                if current_price is None:
-                    current_price = price_value
-                elif next_price is None:
-                    next_price = price_value
+            start = arrays.first_active(now)
+            future_prices = list(self._price_series(arrays)[start:])
+            current_price = future_prices[0] if future_prices else None
+            next_price = future_prices[1] if len(future_prices) > 1 else None
 
             next_interval = (current_interval_index + 1) % 96
             next_hour = next_interval // 4
@@ -416,6 +401,51 @@ class BasePrice15MinSensor(OigCloudSensor, RestoreEntityBase):
 
         return attrs
 
+    def pricing_options(self) -> PricingOptions:
+        """Resolved pricing options (cached until the entry options change)."""
+        return resolve_pricing_options(
+            self._entry.options, self._get_tariff_for_datetime
+        )
+
+    def get_price_arrays(
+        self, prices: Optional[Dict[str, Any]] = None
+    ) -> Optional[PriceArrays]:
+        """Cached price arrays for ``prices`` (default: the sensor's 15min data)."""
+        if prices is None:
+            if (
+                not self._spot_data_15min
+                or "prices15m_czk_kwh" not in self._spot_data_15min
+            ):
+                return None
+            prices = self._spot_data_15min["prices15m_czk_kwh"]
+        return price_arrays(prices, self.pricing_options())
+
+    def _price_series(self, arrays: PriceArrays) -> Tuple[float, ...]:
+        """Subclasses select the price series they publish."""
+        raise NotImplementedError
+
+    def _get_tariff_for_datetime(self, target_datetime: datetime) -> str:
+        """Získat tarif (VT/NT) pro daný datetime podle ``vt_hours``."""
+        dual_tariff_enabled = self._entry.options.get("dual_tariff_enabled", True)
+        if not dual_tariff_enabled:
+            return "VT"
+
+        vt_hours = self._parse_tariff_times(self._entry.options.get("vt_hours", ""))
+        if not vt_hours:
+            return "VT"
+
+        hour = target_datetime.hour
+        return "VT" if hour in vt_hours else "NT"
+
+    def _parse_tariff_times(self, time_str: str) -> list[int]:
+        """Parse tariff times string to list of hours."""
+        if not time_str:
+            return []
+        try:
+            return [int(x.strip()) for x in time_str.split(",") if x.strip()]
+        except ValueError:
+            return []
+
     def _build_attributes(
         self,
         *,
@@ -2,11 +2,12 @@
 
 import logging
 from datetime import datetime
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Optional, Tuple
 
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.helpers.device_registry import DeviceInfo
 
+from ..pricing.price_engine import PriceArrays
 from ..pricing.spot_price_15min_base import BasePrice15MinSensor
 
 _LOGGER = logging.getLogger(__name__)
@@ -75,6 +76,9 @@ class ExportPrice15MinSensor(BasePrice15MinSensor):
             "api_note": "Full intervals data available via API endpoint (reduces sensor size by 95%)",
         }
 
+    def _price_series(self, arrays: PriceArrays) -> Tuple[float, ...]:
+        return arrays.export_price
+
     def _calculate_export_price_15min(
         self, spot_price_czk: float, target_datetime: datetime
     ) -> float:
@@ -82,58 +86,5 @@ class ExportPrice15MinSensor(BasePrice15MinSensor):
 
         Výkupní cena = Spotová cena - Poplatek za prodej (% nebo fixní)
         """
-        options = self._entry.options
-
-        pricing_model: str = options.get("export_pricing_model", "percentage")
-        export_fee_percent: float = options.get("export_fee_percent", 15.0)
-        export_fixed_fee_czk: float = options.get("export_fixed_fee_czk", 0.20)
-        export_fixed_price: float = options.get("export_fixed_price", 2.50)
-        export_fee_percent_nt: float = options.get(
-            "export_fee_percent_nt", export_fee_percent
-        )
-        export_fixed_fee_czk_nt: float = options.get(
-            "export_fixed_fee_czk_nt", export_fixed_fee_czk
-        )
-
-        current_tariff = self._get_tariff_for_datetime(target_datetime)
-
-        if pricing_model == "percentage":
-            fee_percent = (
-                export_fee_percent_nt
-                if current_tariff == "NT"
-                else export_fee_percent
-            )
-            export_price = spot_price_czk * (1 - fee_percent / 100.0)
-        elif pricing_model == "fixed_prices":
-            export_price = export_fixed_price
-        else:
-            fixed_fee = (
-                export_fixed_fee_czk_nt
-                if current_tariff == "NT"
-                else export_fixed_fee_czk
-            )
-            export_price = spot_price_czk - fixed_fee
-
-        return round(export_price, 2)
-
-    def _get_tariff_for_datetime(self, target_datetime: datetime) -> str:
-        """Get tariff (VT/NT) for a given datetime - mirrors SpotPrice15MinSensor."""
-        dual_tariff_enabled = self._entry.options.get("dual_tariff_enabled", True)
-        if not dual_tariff_enabled:
-            return "VT"
-
-        vt_hours = self._parse_tariff_times(self._entry.options.get("vt_hours", ""))
-        if not vt_hours:
-            return "VT"
-
-        hour = target_datetime.hour
-        return "VT" if hour in vt_hours else "NT"
-
-    def _parse_tariff_times(self, time_str: str) -> list[int]:
-        """Parse tariff times string to list of hours."""
-        if not time_str:
-            return []
-        try:
-            return [int(x.strip()) for x in time_str.split(",") if x.strip()]
-        except ValueError:
-            return []
+        options = self.pricing_options()
+        return options.export_price(spot_price_czk, options.tariff(target_datetime))
@@ -0,0 +1,158 @@
+"""Interval-indexed storage for 15-minute spot prices.
+
+OTE prices are published as ``{"YYYY-MM-DDTHH:MM:00": price}`` dicts (local
+wall-clock keys). ``SpotPriceStore`` keeps the same data as one contiguous
+array indexed by *interval index* (``date.toordinal() * 96 + slot``), so a
+price lookup is an O(1) index instead of building and parsing string keys.
+
+The dict format stays the canonical exchange format (coordinator data, REST
+API, OTE cache); ``store_for`` memoizes the store built for a prices dict so
+all consumers of the same dict share one instance. Memo entries are keyed on
+the dict's content, so a dict edited in place gets a fresh store.
+"""
+
+from __future__ import annotations
+
+from datetime import date, datetime
+from typing import Any, Dict, Hashable, List, Mapping, Optional, Sequence, Tuple
+
+SLOTS_PER_DAY = 96
+SLOT_MINUTES = 15
+
+_MEMO_SIZE = 4
+
+# Recent (prices dict, its content signature, store) entries, newest last.
+# Holding the dict keeps its id from being reused while cached.
+_memo: List[Tuple[Mapping[str, Any], Optional[Hashable], "SpotPriceStore"]] = []
+
+
+def interval_index(day: date, slot: int) -> int:
+    """Interval index of ``slot`` (0-95) on ``day``."""
+    return day.toordinal() * SLOTS_PER_DAY + slot
+
+
+def interval_index_for(when: datetime) -> int:
+    """Interval index containing ``when`` (local wall-clock time)."""
+    return interval_index(when.date(), when.hour * 4 + when.minute // SLOT_MINUTES)
+
+
+def parse_interval_key(key: str) -> int:
+    """Interval index for an OTE ``YYYY-MM-DDTHH:MM[:SS]`` key."""
+    if len(key) >= 16 and key[10] == "T" and key[13] == ":":
+        day = date(int(key[0:4]), int(key[5:7]), int(key[8:10]))
+        return interval_index(day, int(key[11:13]) * 4 + int(key[14:16]) // 15)
+    return interval_index_for(datetime.fromisoformat(key))
+
+
+def interval_key(index: int) -> str:
+    """OTE dict key for an interval index."""
+    day = date.fromordinal(index // SLOTS_PER_DAY)
+    slot = index % SLOTS_PER_DAY
+    return f"{day.isoformat()}T{slot // 4:02d}:{(slot % 4) * 15:02d}:00"
+
+
+class SpotPriceStore:
+    """Contiguous array of 15-minute prices starting at interval ``start``."""
+
+    __slots__ = ("_start", "_values")
+
+    def __init__(
+        self, start: int = 0, values: Sequence[Optional[float]] = ()
+    ) -> None:
+        self._start = start
+        self._values: List[Optional[float]] = list(values)
+
+    @classmethod
+    def from_prices(cls, prices: Mapping[str, Any]) -> "SpotPriceStore":
+        """Build a store from the OTE dict format (invalid keys are skipped)."""
+        indexed: Dict[int, float] = {}
+        for key, price in prices.items():
+            try:
+                indexed[parse_interval_key(key)] = price
+            except (TypeError, ValueError):
+                continue
+        if not indexed:
+            return cls()
+        start = min(indexed)
+        values: List[Optional[float]] = [None] * (max(indexed) - start + 1)
+        for index, price in indexed.items():
+            values[index - start] = price
+        return cls(start, values)
+
+    @classmethod
+    def from_dict(cls, payload: Any) -> Optional["SpotPriceStore"]:
+        """Inverse of ``as_dict``; None for missing or malformed payloads."""
+        if not isinstance(payload, dict):
+            return None
+        start = payload.get("start")
+        values = payload.get("values")
+        if not isinstance(start, int) or not isinstance(values, list):
+            return None
+        return cls(start, values)
+
+    def as_dict(self) -> Dict[str, Any]:
+        """JSON-serializable form (stored next to the dict in the OTE cache)."""
+        return {"start": self._start, "values": list(self._values)}
+
+    def __len__(self) -> int:
+        return sum(1 for value in self._values if value is not None)
+
+    def __bool__(self) -> bool:
+        return bool(self._values)
+
+    @property
+    def start(self) -> int:
+        return self._start
+
+    @property
+    def end(self) -> int:
+        """Interval index one past the last stored interval."""
+        return self._start + len(self._values)
+
+    def get(self, index: int) -> Optional[float]:
+        offset = index - self._start
+        if 0 <= offset < len(self._values):
+            return self._values[offset]
+        return None
+
+    def price_for(self, day: date, slot: int) -> Optional[float]:
+        return self.get(interval_index(day, slot))
+
+    def to_prices(self) -> Dict[str, float]:
+        """Back to the OTE dict format."""
+        return {
+            interval_key(self._start + offset): value
+            for offset, value in enumerate(self._values)
+            if value is not None
+        }
+
+
+def _prices_signature(prices: Mapping[str, Any]) -> Optional[Hashable]:
+    """In-process content hash of a prices dict (None if it is unhashable).
+
+    Covers every key (hence the interval range) and value, so in-place edits
+    of the dict invalidate its memo entry.
+    """
+    try:
+        return len(prices), hash(tuple(prices.items()))
+    except TypeError:
+        return None
+
+
+def store_for(prices: Mapping[str, Any]) -> SpotPriceStore:
+    """Return the (memoized) store for an OTE prices dict."""
+    signature = _prices_signature(prices)
+    if signature is not None:
+        for cached_prices, cached_signature, store in reversed(_memo):
+            if cached_prices is prices and cached_signature == signature:
+                return store
+    store = SpotPriceStore.from_prices(prices)
+    remember_store(prices, store)
+    return store
+
+
+def remember_store(prices: Mapping[str, Any], store: SpotPriceStore) -> None:
+    """Seed the memo with a store built elsewhere (e.g. loaded from cache)."""
+    _memo[:] = [entry for entry in _memo if entry[0] is not prices]
+    _memo.append((prices, _prices_signature(prices), store))
+    del _memo[:-_MEMO_SIZE]
@@ -56,6 +56,8 @@ SENSOR_TYPES_MISC: Dict[str, Dict[str, Any]] = {
         "local_entity_domains": ["sensor", "binary_sensor"],
         "local_value_map": {"on": 1, "off": 0},
         "local_entity_suffix": "tbl_invertor_prms_to_grid",
+        # Grid mode also reads other invertor/box nodes (see _grid_mode).
+        "multi_source": True,
     },
     "installed_battery_capacity_kwh": {
         "name": "Installed Battery Capacity",
@@ -0,0 +1,187 @@
+"""Shared recorder history windows for statistics sensors.
+
+Interval statistics sensors all read the same multi-week source series
+(``actual_aco_p``). Instead of each sensor pulling 14–30 days from the recorder
+once per day, the series is cached per entity and only the missing head/tail is
+fetched on the next request; sensors then slice the window in memory.
+
+Process-memory only — a restart cold-starts with one full query per entity.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from bisect import bisect_left, bisect_right
+from collections import OrderedDict
+from datetime import datetime
+from typing import Any, List, Optional
+
+from homeassistant.util import dt as dt_util
+
+_LOGGER = logging.getLogger(__name__)
+
+DOMAIN = "oig_cloud"
+HASS_DATA_KEY = "history_window_cache"
+DEFAULT_MAX_ENTITIES = 8
+
+
+def _naive(value: datetime) -> datetime:
+    # Same convention as the statistics sensor: local wall time without
+    # tzinfo. Recorder states are UTC-aware, request bounds naive local.
+    if value.tzinfo is None:
+        return value
+    return dt_util.as_local(value).replace(tzinfo=None)
+
+
+class _EntityWindow:
+    """Time-sorted states of one entity covering [start, end]."""
+
+    __slots__ = ("start", "end", "span", "times", "states")
+
+    def __init__(self, start: datetime, end: datetime) -> None:
+        self.start = start
+        self.end = end
+        self.span = end - start
+        self.times: List[datetime] = []
+        self.states: List[Any] = []
+
+    def prepend(self, states: List[Any]) -> None:
+        head = [s for s in states if _naive(s.last_updated) < self.first_time()]
+        self.times[:0] = [_naive(s.last_updated) for s in head]
+        self.states[:0] = head
+
+    def append(self, states: List[Any]) -> None:
+        last = self.times[-1] if self.times else None
+        tail = [
+            s for s in states if last is None or _naive(s.last_updated) > last
+        ]
+        self.times.extend(_naive(s.last_updated) for s in tail)
+        self.states.extend(tail)
+
+    def first_time(self) -> datetime:
+        return self.times[0] if self.times else datetime.max
+
+    def trim(self) -> None:
+        """Drop states older than the widest window requested so far."""
+        cutoff = self.end - self.span
+        if _naive(cutoff) <= _naive(self.start):
+            return
+        idx = bisect_left(self.times, _naive(cutoff))
+        del self.times[:idx]
+        del self.states[:idx]
+        self.start = cutoff
+
+    def slice(self, start: datetime, end: datetime) -> List[Any]:
+        lo = bisect_left(self.times, _naive(start))
+        hi = bisect_right(self.times, _naive(end))
+        return self.states[lo:hi]
+
+
+class HistoryWindowCache:
+    """LRU cache of recorder state series keyed by entity_id."""
+
+    def __init__(self, hass: Any, max_entities: int = DEFAULT_MAX_ENTITIES) -> None:
+        self._hass = hass
+        self._max_entities = max_entities
+        self._windows: "OrderedDict[str, _EntityWindow]" = OrderedDict()
+        self._lock = asyncio.Lock()
+
+    async def async_get_states(
+        self, entity_id: str, start_time: datetime, end_time: datetime
+    ) -> Optional[List[Any]]:
+        """Return states of ``entity_id`` recorded in [start_time, end_time].
+
+        The cached window is extended to ``end_time`` first, fetching only the
+        part not covered yet. Returns ``None`` when no recorder/executor is
+        available (nothing is cached in that case).
+        """
+        async with self._lock:
+            window = self._windows.get(entity_id)
+            if window is None:
+                states = await self._async_fetch(entity_id, start_time, end_time)
+                if states is None:
+                    return None
+                window = _EntityWindow(start_time, end_time)
+                window.append(
+                    sorted(states, key=lambda s: _naive(s.last_updated))
+                )
+                self._store(entity_id, window)
+                return window.slice(start_time, end_time)
+
+            self._windows.move_to_end(entity_id)
+            if _naive(start_time) < _naive(window.start):
+                head = await self._async_fetch(entity_id, start_time, window.start)
+                if head is None:
+                    return None
+                window.prepend(head)
+                window.start = start_time
+            if _naive(end_time) > _naive(window.end):
+                tail = await self._async_fetch(entity_id, window.end, end_time)
+                if tail is None:
+                    return None
+                window.append(tail)
+                window.end = end_time
+            window.span = max(window.span, end_time - start_time)
+            window.trim()
+            return window.slice(start_time, end_time)
+
+    def invalidate(self, entity_id: Optional[str] = None) -> None:
+        """Forget one entity (or everything) so the next read refetches."""
+        if entity_id is None:
+            self._windows.clear()
+        else:
+            self._windows.pop(entity_id, None)
+
+    def _store(self, entity_id: str, window: _EntityWindow) -> None:
+        self._windows[entity_id] = window
+        self._windows.move_to_end(entity_id)
+        while len(self._windows) > self._max_entities:
+            evicted, _ = self._windows.popitem(last=False)
+            _LOGGER.debug("History window cache evicted %s", evicted)
+
+    async def _async_fetch(
+        self, entity_id: str, start_time: datetime, end_time: datetime
+    ) -> Optional[List[Any]]:
+        from homeassistant.components.recorder import history
+        from homeassistant.helpers.recorder import get_instance
+
+        try:
+            recorder_instance = get_instance(self._hass)
+        except Exception:
+            recorder_instance = None
+
+        if recorder_instance:
+            executor = recorder_instance.async_add_executor_job
+        elif hasattr(self._hass, "async_add_executor_job"):
+            executor = self._hass.async_add_executor_job
+        else:
+            return None
+
+        states = await executor(
+            history.state_changes_during_period,
+            self._hass,
+            start_time,
+            end_time,
+            entity_id,
+        )
+        _LOGGER.debug(
+            "History window cache fetched %s for %s - %s",
+            entity_id,
+            start_time,
+            end_time,
+        )
+        return list((states or {}).get(entity_id) or [])
+
+
+def get_history_window_cache(hass: Any, entry_id: str) -> HistoryWindowCache:
+    """Return the history window cache of a config entry."""
+    data = getattr(hass, "data", None)
+    if not isinstance(data, dict):
+        return HistoryWindowCache(hass)
+    entry_data = data.setdefault(DOMAIN, {}).setdefault(entry_id, {})
+    cache = entry_data.get(HASS_DATA_KEY)
+    if not isinstance(cache, HistoryWindowCache):
+        cache = HistoryWindowCache(hass)
+        entry_data[HASS_DATA_KEY] = cache
+    return cache
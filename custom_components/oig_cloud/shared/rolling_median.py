@@ -0,0 +1,195 @@
+"""Rolling time window with a logarithmic-time median.
+
+The battery load median sensor samples the load every minute (or faster) and
+reports the median of the last N minutes. Rebuilding and sorting the sample
+list on every sample and state write grows with the window; this keeps the
+samples in a time-ordered deque next to a two-heap order-statistics
+container, so append, expiry (oldest first) and median are O(log n).
+
+Samples are ``(naive datetime, float)`` pairs, the statistics sensor
+convention; aware timestamps are stored as wall time without tzinfo.
+"""
+
+from __future__ import annotations
+
+import heapq
+import math
+from collections import deque
+from datetime import datetime
+from itertools import islice
+from statistics import median
+from typing import Any, Deque, Dict, Iterable, Iterator, List, Optional, Tuple
+
+Sample = Tuple[datetime, float]
+
+
+class _SlidingMedian:
+    """Median of a multiset with O(log n) add/remove (lazy heap deletion)."""
+
+    def __init__(self) -> None:
+        self._low: List[float] = []  # max-heap of the lower half (negated)
+        self._high: List[float] = []  # min-heap of the upper half
+        self._low_size = 0
+        self._high_size = 0
+        self._delayed: Dict[float, int] = {}
+
+    def __len__(self) -> int:
+        return self._low_size + self._high_size
+
+    def add(self, value: float) -> None:
+        if not self._low_size or value <= -self._low[0]:
+            heapq.heappush(self._low, -value)
+            self._low_size += 1
+        else:
+            heapq.heappush(self._high, value)
+            self._high_size += 1
+        self._rebalance()
+
+    def remove(self, value: float) -> None:
+        self._delayed[value] = self._delayed.get(value, 0) + 1
+        if value <= -self._low[0]:
+            self._low_size -= 1
+            if value == -self._low[0]:
+                self._prune(self._low, -1)
+        else:
+            self._high_size -= 1
+            if self._high and value == self._high[0]:
+                self._prune(self._high, 1)
+        self._rebalance()
+
+    def median(self) -> Optional[float]:
+        if not len(self):
+            return None
+        if self._low_size > self._high_size:
+            return -self._low[0]
+        return (-self._low[0] + self._high[0]) / 2
+
+    def _prune(self, heap: List[float], sign: int) -> None:
+        while heap:
+            value = sign * heap[0]
+            pending = self._delayed.get(value)
+            if not pending:
+                return
+            if pending == 1:
+                del self._delayed[value]
+            else:
+                self._delayed[value] = pending - 1
+            heapq.heappop(heap)
+
+    def _rebalance(self) -> None:
+        if self._low_size > self._high_size + 1:
+            heapq.heappush(self._high, -heapq.heappop(self._low))
+            self._low_size -= 1
+            self._high_size += 1
+            self._prune(self._low, -1)
+        elif self._low_size < self._high_size:
+            heapq.heappush(self._low, -heapq.heappop(self._high))
+            self._high_size -= 1
+            self._low_size += 1
+            self._prune(self._high, 1)
+
+
+class RollingMedianWindow:
+    """Time-ordered samples with O(log n) append, expiry and median.
+
+    Behaves as a read-only sequence of ``(datetime, value)`` samples (len,
+    indexing, iteration, equality with lists), so callers that inspect the
+    samples keep working.
+    """
+
+    def __init__(self) -> None:
+        self._samples: Deque[Sample] = deque()
+        self._median = _SlidingMedian()
+
+    @classmethod
+    def from_samples(cls, samples: Iterable[Any]) -> "RollingMedianWindow":
+        """Window of ``samples``; malformed, None or NaN samples are skipped."""
+        window = cls()
+        for sample in samples or []:
+            try:
+                timestamp, value = sample
+                if isinstance(timestamp, datetime):
+                    window.append(timestamp, value)
+            except (TypeError, ValueError):
+                continue
+        return window
+
+    # ------------------------------------------------------------------
+    # Sequence protocol
+    # ------------------------------------------------------------------
+
+    def __len__(self) -> int:
+        return len(self._samples)
+
+    def __iter__(self) -> Iterator[Sample]:
+        return iter(self._samples)
+
+    def __getitem__(self, index: int) -> Sample:
+        return self._samples[index]
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, RollingMedianWindow):
+            return list(self._samples) == list(other._samples)
+        if isinstance(other, (list, tuple)):
+            return list(self._samples) == list(other)
+        return NotImplemented
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        return f"RollingMedianWindow({list(self._samples)!r})"
+
+    # ------------------------------------------------------------------
+    # Window operations
+    # ------------------------------------------------------------------
+
+    @property
+    def last_sample_time(self) -> Optional[datetime]:
+        return self._samples[-1][0] if self._samples else None
+
+    def append(self, timestamp: datetime, value: Any) -> None:
+        """Add a sample (samples are expected in time order)."""
+        if value is None:
+            return
+        value = float(value)
+        if math.isnan(value):
+            return
+        if timestamp.tzinfo is not None:
+            timestamp = timestamp.replace(tzinfo=None)
+        self._samples.append((timestamp, value))
+        self._median.add(value)
+
+    def trim(self, max_size: int) -> None:
+        """Drop the oldest samples beyond ``max_size``."""
+        while len(self._samples) > max(max_size, 0):
+            self._pop_oldest()
+
+    def expire(self, cutoff: datetime) -> None:
+        """Drop samples taken at or before ``cutoff``."""
+        while self._samples and self._samples[0][0] <= cutoff:
+            self._pop_oldest()
+
+    def median_since(self, cutoff: datetime) -> Optional[float]:
+        """Median of the samples after ``cutoff``, without dropping any.
+
+        When every sample is older (no fresh data), the median of all samples
+        is returned instead. Expiry is left to ``expire``: with the window
+        expired at the same cutoff this is O(1), otherwise the fresh tail is
+        sorted.
+        """
+        stale = 0
+        for timestamp, _ in self._samples:
+            if timestamp > cutoff:
+                break
+            stale += 1
+        if stale in (0, len(self._samples)):
+            return self._median.median()
+        return median(value for _, value in islice(self._samples, stale, None))
+
+    def serialize(self) -> List[Tuple[str, float]]:
+        """``[(isoformat, value), ...]`` as persisted in the statistics Store."""
+        return [(timestamp.isoformat(), value) for timestamp, value in self._samples]
+
+    def _pop_oldest(self) -> None:
+        _, value = self._samples.popleft()
+        self._median.remove(value)
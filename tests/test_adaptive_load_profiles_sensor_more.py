@@ -6,6 +6,7 @@ from types import SimpleNamespace
 
 import pytest
 
+from custom_components.oig_cloud.entities import adaptive_load_profiles_sensor as module
 from custom_components.oig_cloud.entities.adaptive_load_profiles_sensor import (
     _generate_profile_name,
     _get_season,
@@ -133,6 +134,55 @@ def test_calculate_profile_similarity(monkeypatch):
     assert score > 0.9
 
 
+def test_select_top_matches_matches_per_profile_similarity(monkeypatch):
+    sensor = _make_sensor(monkeypatch)
+    start = datetime(2025, 1, 1).date()
+    daily = {
+        start + timedelta(days=day): [float((day * 7 + hour) % 5) for hour in range(24)]
+        for day in range(12)
+    }
+    daily[start + timedelta(days=4)] = [1.0] * 24
+    profiles = sensor._build_72h_profiles(daily)
+    current = [float((hour * 3) % 4) for hour in range(30)]
+
+    selected = module._select_top_matches(sensor, profiles, current, 30)
+
+    expected = sorted(
+        (
+            (sensor._calculate_profile_similarity(current, p["consumption_kwh"][:30]), p)
+            for p in profiles
+        ),
+        key=lambda item: item[0],
+        reverse=True,
+    )[: module.TOP_MATCHES]
+    assert [p["start_date"] for p in selected] == [p["start_date"] for _, p in expected]
+    for profile, (score, _) in zip(selected, expected):
+        assert profile["similarity_score"] == pytest.approx(score)
+    # Plain dict lists (no matrix) are scored the same way.
+    assert module._select_top_matches(sensor, list(profiles), current, 30) == selected
+
+
+def test_build_72h_profiles_reuses_unchanged_windows(monkeypatch):
+    sensor = _make_sensor(monkeypatch)
+    start = datetime(2025, 1, 1).date()
+    daily = {start + timedelta(days=day): [float(day)] * 24 for day in range(6)}
+    first = sensor._build_72h_profiles(daily)
+    assert [p["start_date"] for p in first] == [
+        (start + timedelta(days=day)).isoformat() for day in range(4)
+    ]
+    assert first.matrix.shape == (4, 72)
+
+    assert sensor._build_72h_profiles(dict(daily)) is first
+
+    daily[start + timedelta(days=5)] = [9.0] * 24
+    daily[start + timedelta(days=6)] = [6.0] * 24
+    second = sensor._build_72h_profiles(daily)
+    assert len(second) == 5
+    assert second[2] is first[2] and second[3] is not first[3]
+    assert second[4]["consumption_kwh"][48:] == [6.0] * 24
+    assert second.matrix[3].tolist() == second[3]["consumption_kwh"]
+
+
 def test_extra_state_attributes_prediction(monkeypatch):
     sensor = _make_sensor(monkeypatch)
     now = datetime(2025, 1, 5, 10, tzinfo=timezone.utc)
@@ -417,3 +417,83 @@ async def test_shutdown_cancels_inflight_hourly_tick(monkeypatch):
     assert cancelled.is_set()
     assert tick_task.done()
     assert coord._tick_tasks == set()
+
+
+@pytest.mark.asyncio
+async def test_streaming_tick_uses_state_changes_without_recorder_reads(monkeypatch):
+    """Once streaming, ticks read the ring buffer; only start-up hits the recorder."""
+    from custom_components.oig_cloud.ai_eval import coordinator
+
+    box_id = "1234567890"
+    now = datetime(2026, 8, 1, 14, 0, 0, tzinfo=timezone.utc)
+    fake_store = FakeStore()
+    monkeypatch.setattr(coordinator, "Store", lambda *_a, **_k: fake_store)
+    monkeypatch.setattr(coordinator.dt_util, "utcnow", lambda: now - timedelta(minutes=30))
+
+    fetches = []
+
+    async def fake_fetch_history(hass, entity_ids, start_time, end_time):
+        fetches.append((start_time, end_time))
+        return _make_states(box_id, now - timedelta(minutes=45))
+    monkeypatch.setattr(coordinator, "_fetch_history", fake_fetch_history)
+
+    listeners = []
+
+    def fake_track(hass, entity_ids, action):
+        listeners.append(action)
+        return lambda: listeners.clear()
+    monkeypatch.setattr(coordinator, "async_track_state_change_event", fake_track)
+
+    ai_calls = []
+
+    async def fake_ai(hass, entry, system_prompt, user_message):
+        ai_calls.append(user_message)
+        return None
+    monkeypatch.setattr(sys.modules["custom_components.oig_cloud.ai_eval.ai_client"],
+                        "generate_eval_report", fake_ai)
+
+    async def fake_fetch_plan_block(hass, box_id):
+        return "PLÁN A CENY:"
+    monkeypatch.setattr(coordinator, "_fetch_plan_block", fake_fetch_plan_block)
+
+    fake_hass = FakeHass()
+    fake_hass.states = type("States", (), {"get": staticmethod(lambda _eid: None)})()
+    coord = coordinator.AiEvalCoordinator(fake_hass, FakeConfigEntry(box_id=box_id))
+    coord._store = fake_store
+    await coord._async_start_stream()
+    assert len(fetches) == 1 and len(listeners) == 1
+
+    # A later grid spike arrives as a state-change event only.
+    spike_at = now - timedelta(minutes=10)
+    for value, offset in (("300", 0), ("4800", 40)):
+        listeners[0](type("Evt", (), {"data": {
+            "entity_id": f"sensor.oig_{box_id}_actual_aci_wtotal",
+            "new_state": FakeState(value, spike_at + timedelta(seconds=offset)),
+        }})())
+
+    await coord._async_run_tick(now)
+
+    assert len(fetches) == 1
+    assert ai_calls and "grid_skok" in ai_calls[0]
+    await coord.async_shutdown()
+    assert listeners == []
+
+
+@pytest.mark.asyncio
+async def test_plan_block_reads_published_snapshot_in_process():
+    from custom_components.oig_cloud.ai_eval import coordinator
+    from custom_components.oig_cloud.battery_forecast.presentation.plan_snapshot import (
+        publish_plan_snapshot,
+    )
+
+    fake_hass = FakeHass()
+    publish_plan_snapshot(fake_hass, "123", {
+        "unified_cost_tile": {"today": {"plan_total_cost": 50.0, "actual_total_cost": 45.0,
+                                        "delta": -5.0}},
+        "timeline": [{"grid_charge_kwh": 2.0, "spot_price": 1.5}],
+    })
+
+    block = await coordinator._fetch_plan_block(fake_hass, "123")
+
+    assert "plán 50.00 Kč" in block
+    assert "Nabíjení ze sítě: 1 oken" in block
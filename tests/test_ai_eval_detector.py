@@ -75,3 +75,50 @@ def test_event_snapshot_indices_merge_overlapping_windows():
     events = [{"i": 3}, {"i": 5}]
     idx = det.event_snapshot_indices(events, n=20, win=2)
     assert idx == [1, 2, 3, 4, 5, 6, 7]
+
+
+def test_streaming_detector_matches_one_shot_detection():
+    # Same samples through forward_fill+detect_events and the ring buffer.
+    n = 12
+    samples = {"grid": [(0.0, 100.0), (75.0, 4800.0), (130.0, 100.0)],
+               "zal_r": [(0.0, 0.0), (150.0, 3400.0)]}
+    grid = _grid(n)
+    for key, series in samples.items():
+        grid[key] = det.forward_fill(series, start_ts=0.0, n=n)
+    batch = det.detect_events(grid, n, _label)
+
+    stream = det.StreamingDetector(n, list(grid), lambda ts: f"t{int(ts // det.STEP_S)}",
+                                   start_ts=0.0)
+    for key in grid:
+        stream.observe(key, 0.0, 0.0)
+    merged = sorted((ts, key, val) for key, series in samples.items() for ts, val in series)
+    for ts, key, val in merged:
+        stream.observe(key, ts, val)
+    stream.advance((n - 1) * det.STEP_S)
+
+    start_ts, size, window, events = stream.window()
+    assert (start_ts, size) == (0.0, n)
+    assert window["grid"] == grid["grid"]
+    strip = lambda evs: [(e["i"], e["at"], e["kind"], e["detail"]) for e in evs]  # noqa: E731
+    assert strip(events) == strip(batch)
+
+
+def test_streaming_detector_ring_keeps_last_window_and_state():
+    stream = det.StreamingDetector(5, ["grid", "zal_t"], str, start_ts=0.0)
+    stream.observe("zal_t", 0.0, 1500.0)       # sustained imbalance from tick 0
+    for i in range(12):
+        stream.observe("grid", i * det.STEP_S, float(i))
+    stream.advance(11 * det.STEP_S)
+
+    start_ts, n, window, events = stream.window()
+    assert (start_ts, n) == (7 * det.STEP_S, 5)
+    assert window["grid"] == [7.0, 8.0, 9.0, 10.0, 11.0]
+    assert events == []                       # the onset (tick 1) left the ring
+
+    # Restored hysteresis: replayed ticks only refill the ring, and a still
+    # sustained condition does not fire again after a restart.
+    restored = det.StreamingDetector(5, ["grid", "zal_t"], str, start_ts=0.0)
+    restored.restore(stream.state_dict())
+    restored.observe("zal_t", 0.0, 1500.0)
+    restored.advance(14 * det.STEP_S)
+    assert restored.window()[3] == []
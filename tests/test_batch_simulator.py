@@ -0,0 +1,129 @@
+from __future__ import annotations
+
+import random
+
+import numpy as np
+import pytest
+
+from custom_components.oig_cloud.battery_forecast.physics import simulate_batch
+from custom_components.oig_cloud.battery_forecast.physics.batch_simulator import sequential_sum
+from custom_components.oig_cloud.const import HOME_I, HOME_II, HOME_III, HOME_UPS
+from custom_components.oig_cloud.physics import simulate_interval
+
+_PARAMS = {
+    "capacity_kwh": 12.0,
+    "hw_min_capacity_kwh": 2.4,
+    "charge_efficiency": 0.95,
+    "discharge_efficiency": 0.88,
+    "home_charge_rate_kwh_15min": 0.7,
+}
+
+
+def _scalar_chain(modes, solar, load, initial_soc, ups_requires_headroom=False):
+    soc = initial_soc
+    rows = []
+    for mode, solar_kwh, load_kwh in zip(modes, solar, load):
+        if ups_requires_headroom and mode == HOME_UPS and not soc < _PARAMS["capacity_kwh"]:
+            mode = HOME_I
+        flows = simulate_interval(
+            mode=mode,
+            solar_kwh=solar_kwh,
+            load_kwh=load_kwh,
+            battery_soc_kwh=soc,
+            **_PARAMS,
+        )
+        soc = flows.new_soc_kwh
+        rows.append(flows)
+    return rows
+
+
+def _random_horizon(rng: random.Random, n: int):
+    solar = [
+        0.0 if rng.random() < 0.35 else rng.choice([0.0005, rng.uniform(0.0, 2.5)])
+        for _ in range(n)
+    ]
+    load = [rng.choice([0.0, rng.uniform(0.0, 1.5)]) for _ in range(n)]
+    return solar, load
+
+
+@pytest.mark.parametrize("seed", [1, 2, 3])
+def test_simulate_batch_matches_scalar_physics_bit_for_bit(seed: int) -> None:
+    rng = random.Random(seed)
+    n = 96
+    solar, load = _random_horizon(rng, n)
+    candidates = [
+        [rng.choice([HOME_I, HOME_II, HOME_III, HOME_UPS, 7]) for _ in range(n)]
+        for _ in range(12)
+    ]
+    initial = [rng.uniform(0.0, 14.0) for _ in candidates]
+
+    result = simulate_batch(
+        modes=candidates,
+        solar_kwh=solar,
+        load_kwh=load,
+        initial_soc_kwh=initial,
+        **_PARAMS,
+    )
+
+    for k, modes in enumerate(candidates):
+        for i, flows in enumerate(_scalar_chain(modes, solar, load, initial[k])):
+            assert result.soc_kwh[k, i] == flows.new_soc_kwh
+            assert result.grid_import_kwh[k, i] == flows.grid_import_kwh
+            assert result.grid_export_kwh[k, i] == flows.grid_export_kwh
+            assert result.battery_charge_kwh[k, i] == flows.battery_charge_kwh
+            assert result.battery_discharge_kwh[k, i] == flows.battery_discharge_kwh
+            assert result.grid_charge_kwh[k, i] == flows.grid_charge_kwh
+            assert result.solar_charge_kwh[k, i] == flows.solar_charge_kwh
+
+
+def test_simulate_batch_costs_and_ups_headroom_fallback() -> None:
+    n = 8
+    solar = [0.0, 0.0, 3.0, 3.0, 0.0, 0.0, 0.0, 0.0]
+    load = [0.3] * n
+    prices = [1.0, 2.0, 3.0, 4.0, 5.0, 6.0, 7.0, 8.0]
+    exports = [0.5] * n
+    modes = [[HOME_UPS] * n]
+
+    result = simulate_batch(
+        modes=modes,
+        solar_kwh=solar,
+        load_kwh=load,
+        initial_soc_kwh=11.9,
+        import_price_czk=prices,
+        export_price_czk=exports,
+        ups_requires_headroom=True,
+        **_PARAMS,
+    )
+
+    expected = _scalar_chain(modes[0], solar, load, 11.9, ups_requires_headroom=True)
+    expected_costs = [
+        flows.grid_import_kwh * price - flows.grid_export_kwh * export
+        for flows, price, export in zip(expected, prices, exports)
+    ]
+    assert result.net_cost_czk[0].tolist() == expected_costs
+    assert result.total_cost_czk() == [sequential_sum(expected_costs)]
+    # Once full, the UPS intervals behave as HOME I and export the surplus.
+    assert result.grid_export_kwh[0, 3] > 0.0
+    assert result.final_soc_kwh(11.9).tolist() == [expected[-1].new_soc_kwh]
+
+
+def test_simulate_batch_empty_horizon_and_shape_validation() -> None:
+    result = simulate_batch(
+        modes=np.zeros((3, 0), dtype=int),
+        solar_kwh=[],
+        load_kwh=[],
+        initial_soc_kwh=5.0,
+        **_PARAMS,
+    )
+    assert result.candidates == 3
+    assert result.final_soc_kwh(5.0).tolist() == [5.0, 5.0, 5.0]
+    assert result.total_cost_czk() == [0.0, 0.0, 0.0]
+
+    with pytest.raises(ValueError):
+        simulate_batch(
+            modes=[[HOME_I, HOME_I]],
+            solar_kwh=[0.0],
+            load_kwh=[0.0, 0.0],
+            initial_soc_kwh=5.0,
+            **_PARAMS,
+        )
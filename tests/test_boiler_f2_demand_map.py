@@ -16,7 +16,7 @@ from __future__ import annotations
 from datetime import datetime, timedelta, timezone
 from types import SimpleNamespace
 from typing import Any
-from unittest.mock import MagicMock
+from unittest.mock import MagicMock, patch
 
 import pytest
 
@@ -480,6 +480,153 @@ class TestDrawMapDto:
         assert a._estimate_cold_inlet_c(40.0) == 20.0
 
 
+class TestIncrementalIngestion:
+    """Recorder series buffering and the persisted watermark payload."""
+
+    def _profiler(self, **kwargs):
+        from custom_components.oig_cloud.boiler.demand_profiler import (
+            BoilerDemandProfilerAsync,
+        )
+        return BoilerDemandProfilerAsync(
+            hass=None,
+            temp_sensor_entity="sensor.top",
+            heating_entity="switch.heat",
+            volume_l=200,
+            target_temp_c=60,
+            cold_inlet_temp_c=10,
+            **kwargs,
+        )
+
+    @staticmethod
+    def _state(ts: datetime, value: Any) -> SimpleNamespace:
+        return SimpleNamespace(last_updated=ts, state=value)
+
+    def test_ingest_appends_only_newer_states(self):
+        a = self._profiler()
+        a._ingest_states({
+            "sensor.top": [self._state(_ts(7, 5), "55"), self._state(_ts(7, 0), "56")],
+            "switch.heat": [self._state(_ts(6, 0), "on")],
+        })
+        # Re-fetch overlapping the watermark (include_start_time_state) + one new.
+        a._ingest_states({
+            "sensor.top": [
+                self._state(_ts(7, 5), "55"),
+                self._state(_ts(7, 10), "unavailable"),
+                self._state(_ts(7, 15), "50"),
+            ],
+        })
+        ts_list, values = a._series["temp"]
+        assert ts_list == [_ts(7, 0), _ts(7, 5), _ts(7, 15)]
+        assert values == [56.0, 55.0, 50.0]
+        assert a._series["heating"] == ([_ts(6, 0)], [True])
+
+    def test_ingest_drops_states_at_or_before_watermark(self):
+        a = self._profiler()
+        a._ingest_states({"sensor.top": [self._state(_ts(7, 0), "56")]})
+        # Incremental fetch from 08:00 that still carries the start-time state.
+        a._ingest_states(
+            {
+                "sensor.top": [
+                    self._state(_ts(8, 0), "56"),
+                    self._state(_ts(8, 20), "48"),
+                ],
+            },
+            after=_ts(8, 0),
+        )
+        assert a._series["temp"] == ([_ts(7, 0), _ts(8, 20)], [56.0, 48.0])
+
+    @pytest.mark.asyncio
+    async def test_incremental_update_skips_start_time_state(self):
+        a = self._profiler()
+        a._store_loaded = True
+        a._watermark = _ts(8, 0)
+        a._ingest_states({"sensor.top": [self._state(_ts(7, 0), "56")]})
+        calls: list[dict[str, Any]] = []
+
+        def _get_significant_states(_hass, start, _end, entity_ids=None, **kwargs):
+            calls.append(kwargs)
+            states = [self._state(_ts(8, 20), "48")]
+            if kwargs.get("include_start_time_state", True):
+                states.insert(0, self._state(start, "56"))
+            return {"sensor.top": states}
+
+        class _Recorder:
+            async def async_add_executor_job(self, func):
+                return func()
+
+        with patch(
+            "homeassistant.helpers.recorder.get_instance", return_value=_Recorder()
+        ), patch(
+            "homeassistant.components.recorder.history.get_significant_states",
+            _get_significant_states,
+        ), patch("homeassistant.util.dt.now", return_value=_ts(9, 0)):
+            await a.async_update()
+
+        assert calls[0]["include_start_time_state"] is False
+        assert a._series["temp"] == ([_ts(7, 0), _ts(8, 20)], [56.0, 48.0])
+        assert a._watermark == _ts(9, 0)
+
+    def test_trim_keeps_last_sample_for_carry_forward(self):
+        a = self._profiler()
+        a._ingest_states({
+            "switch.heat": [
+                self._state(_ts(1, 0), "off"),
+                self._state(_ts(2, 0), "on"),
+                self._state(_ts(9, 0), "off"),
+            ],
+        })
+        a._trim_series(_ts(8, 0))
+        assert a._series["heating"] == ([_ts(2, 0), _ts(9, 0)], [True, False])
+
+    def test_build_history_window_and_inlet_minimum(self):
+        a = self._profiler(temp_sensor_bottom_entity="sensor.bottom")
+        a._ingest_states({
+            "sensor.top": [
+                self._state(_ts(23, 30, day=3), "58"),
+                self._state(_ts(0, 30), "56"),
+            ],
+            "sensor.bottom": [
+                self._state(_ts(22, 0, day=3), "12"),
+                self._state(_ts(0, 15), "20"),
+            ],
+            "switch.heat": [self._state(_ts(0, 0), "on")],
+        })
+        history, inlet = a._build_history(_ts(23, 0, day=3), _ts(0, 0))
+        assert [r["temp"] for r in history] == [35.0, 38.0]
+        assert [r["heating"] for r in history] == ["off", "on"]
+        # Context samples seed detection but not the window's inlet minimum.
+        assert inlet == {"2026-06-04": 20.0}
+
+    @pytest.mark.asyncio
+    async def test_load_persisted_payload_and_legacy_format(self):
+        slots = {"workday_summer": {"2026-06-04": {28: 0.5}}}
+        a = self._profiler()
+        store = MagicMock()
+
+        async def _load():
+            return {
+                "slots": serialize_category_slots(slots),
+                "watermark": "2026-06-04T08:00:00+00:00",
+                "inlet_min_c": {"2026-06-04": 14.5},
+            }
+
+        store.async_load = _load
+        a._store = store
+        assert await a._async_load_persisted() == slots
+        assert a._watermark == _ts(8, 0)
+        assert a._inlet_min_c == {"2026-06-04": 14.5}
+
+        legacy = self._profiler()
+
+        async def _load_legacy():
+            return serialize_category_slots(slots)
+
+        store.async_load = _load_legacy
+        legacy._store = store
+        assert await legacy._async_load_persisted() == slots
+        assert legacy._watermark is None
+
+
 # ---------------------------------------------------------------------------
 # 3. Slot index & distribution
 # ---------------------------------------------------------------------------
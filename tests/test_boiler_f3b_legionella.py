@@ -803,3 +803,35 @@ def test_build_legionella_dto_no_scheduled_start_when_no_legionella_slots():
 def test_legionella_reason_codes_exist():
     assert PlannerReasonCode.LEGIONELLA_SCHEDULED.value == "legionella_scheduled"
     assert PlannerReasonCode.LEGIONELLA_OVERDUE_INFEASIBLE.value == "legionella_overdue_infeasible"
+
+
+@pytest.mark.asyncio
+async def test_legionella_detection_uses_temperature_index():
+    """With an index, detection reads its summary and refreshes the cache."""
+    from custom_components.oig_cloud.boiler.runtime import (
+        _async_detect_last_legionella_event,
+        _LegionellaCache,
+    )
+
+    now = _now()
+    last = now - timedelta(days=2)
+    index = MagicMock()
+    index.async_last_at_or_above = AsyncMock(return_value=last)
+    cache = _LegionellaCache(last_checked_at=now - timedelta(hours=1))
+
+    result = await _async_detect_last_legionella_event(
+        MagicMock(),
+        top_sensor_entity="sensor.boiler_top",
+        legionella_target_temp_c=60.0,
+        interval_days=7,
+        now=now,
+        cache=cache,
+        current_top_temp_c=45.0,
+        index=index,
+    )
+
+    assert result == last
+    assert cache.last_achieved_at == last
+    index.async_last_at_or_above.assert_awaited_once_with(
+        "sensor.boiler_top", 60.0, since=now - timedelta(days=14), now=now
+    )
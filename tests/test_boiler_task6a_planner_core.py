@@ -1340,3 +1340,81 @@ def test_arbitrage_skipped_when_prices_stale():
     n_stale = sum(1 for s in stale.slots if s.action == "heat")
     assert n_stale < n_fresh
     assert PlannerReasonCode.ARBITRAGE_SCHEDULED not in stale.reason_codes
+
+
+# ---------------------------------------------------------------------------
+# Slot allocator: exact DP vs exhaustive combination search
+# ---------------------------------------------------------------------------
+
+
+def _allocator_input(now: datetime, prices: dict[datetime, float]) -> PlannerInput:
+    return PlannerInput(
+        entry_id="test",
+        box_id="box",
+        profile=_profile(),
+        spot_prices=prices,
+        overflow_windows=[],
+        deadline_time="08:00",
+        topology=_f3a_topology(standing_loss_coefficient=0.05),
+        current_top_temp_c=40.0,
+        temperature_updated_at=now,
+    )
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_slot_allocator_matches_exhaustive_search(seed):
+    import itertools
+    import random
+
+    from custom_components.oig_cloud.boiler import planner_core
+
+    rng = random.Random(seed)
+    now = datetime(2026, 6, 11, 4, 0, tzinfo=timezone.utc)
+    slots = planner_core._build_empty_slots(now, 12)[:14]
+    # Drop a few slots so adjacency (transition count) is non-trivial.
+    slots = [slot for index, slot in enumerate(slots) if index not in (3, 8)]
+    prices = {
+        slot.start: round(rng.choice([2.0, 3.0, 4.0, 5.0]) + rng.random(), 3)
+        for slot in slots
+    }
+    inp = _allocator_input(now, prices)
+
+    for required in (1, 3, 5):
+        chosen = planner_core._best_heat_slot_combination(slots, required, inp, 0.5)
+        best = min(
+            planner_core._combination_score(candidate, inp, 0.5)
+            for candidate in itertools.combinations(slots, required)
+        )
+        assert len(chosen) == required
+        assert [s.start for s in chosen] == sorted(s.start for s in chosen)
+        assert planner_core._combination_score(tuple(chosen), inp, 0.5) == best
+
+
+def test_slot_allocator_handles_48h_horizon_quickly(monkeypatch):
+    from custom_components.oig_cloud.boiler import planner_core
+
+    now = datetime(2026, 6, 11, 4, 0, tzinfo=timezone.utc)
+    slots = planner_core._build_empty_slots(now, 48)
+    prices = {
+        slot.start: 2.0 + (index * 7919 % 97) / 10 for index, slot in enumerate(slots)
+    }
+    inp = _allocator_input(now, prices)
+
+    relaxations = []
+    relax = planner_core._relax_dp_state
+
+    def _counting_relax(*args):
+        relaxations.append(args)
+        return relax(*args)
+
+    monkeypatch.setattr(planner_core, "_relax_dp_state", _counting_relax)
+    chosen = planner_core._best_heat_slot_combination(slots, 40, inp, 0.5)
+
+    assert len(chosen) == 40
+    # O(n * k): at most two relaxations per (slot, chosen, prev) state.
+    assert len(relaxations) <= 2 * 2 * len(slots) * 41
+    score = planner_core._combination_score(tuple(chosen), inp, 0.5)
+    cheapest = tuple(sorted(slots, key=lambda slot: prices[slot.start])[:40])
+    latest = tuple(slots[-40:])
+    assert score <= planner_core._combination_score(cheapest, inp, 0.5)
+    assert score <= planner_core._combination_score(latest, inp, 0.5)
@@ -0,0 +1,147 @@
+"""Tests for the bounded boiler temperature history index."""
+
+from __future__ import annotations
+
+from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import pytest
+
+from custom_components.oig_cloud.boiler import temperature_index as ti
+
+UTC = timezone.utc
+NOW = datetime(2026, 6, 15, 12, 0, tzinfo=UTC)
+TOP = "sensor.boiler_top"
+
+
+def _state(temp: float, ts: datetime) -> SimpleNamespace:
+    return SimpleNamespace(state=str(temp), last_updated=ts)
+
+
+class _Recorder:
+    def __init__(self, states):
+        self.states = states
+        self.calls = []
+
+    async def async_add_executor_job(self, func, hass, start, end, entity_id):
+        self.calls.append((start, end))
+        return {entity_id: [s for s in self.states if start <= s.last_updated <= end]}
+
+
+def test_summary_tracks_threshold_and_daily_max():
+    summary = ti.TemperatureSummary()
+    summary.observe(NOW - timedelta(days=3, hours=2), 58.0)
+    summary.observe(NOW - timedelta(days=3), 62.0)
+    summary.observe(NOW - timedelta(days=3, hours=-1), 61.0)
+
+    # Untracked threshold: day granularity (the qualifying day's max).
+    assert summary.last_at_or_above(60.0) == NOW - timedelta(days=3)
+    summary.track(60.0)
+    summary.observe(NOW - timedelta(days=1), 60.5)
+    assert summary.last_at_or_above(60.0) == NOW - timedelta(days=1)
+    assert summary.last_at_or_above(70.0) is None
+
+    restored = ti.TemperatureSummary.from_dict(summary.as_dict())
+    assert restored.last_at_or_above(60.0) == NOW - timedelta(days=1)
+    assert restored.daily_max == summary.daily_max
+
+
+def test_summary_daily_max_is_bounded():
+    summary = ti.TemperatureSummary()
+    for day in range(ti.DAILY_RETENTION_DAYS + 10):
+        summary.observe(NOW - timedelta(days=day), 50.0)
+    assert len(summary.daily_max) == ti.DAILY_RETENTION_DAYS
+
+
+@pytest.mark.asyncio
+async def test_index_seeds_once_then_answers_from_live_states():
+    recorder = _Recorder([_state(61.0, NOW - timedelta(days=5)), _state(45.0, NOW - timedelta(days=1))])
+    index = ti.TemperatureIndex(None, "entry", "box")
+    index.attach_live([TOP])
+
+    with patch("homeassistant.helpers.recorder.get_instance", return_value=recorder):
+        first = await index.async_last_at_or_above(
+            TOP, 60.0, since=NOW - timedelta(days=14), now=NOW
+        )
+        index.observe_state(TOP, _state(60.2, NOW + timedelta(hours=1)))
+        second = await index.async_last_at_or_above(
+            TOP, 60.0, since=NOW - timedelta(days=13), now=NOW + timedelta(hours=2)
+        )
+
+    assert first == NOW - timedelta(days=5)
+    assert second == NOW + timedelta(hours=1)
+    assert recorder.calls == [(NOW - timedelta(days=14), NOW)]
+
+
+@pytest.mark.asyncio
+async def test_index_catches_up_from_watermark_after_restart():
+    summary = ti.TemperatureSummary()
+    summary.track(60.0)
+    summary.observe(NOW - timedelta(days=6), 61.0)
+    summary.covered_since = NOW - timedelta(days=14)
+    summary.updated_at = NOW - timedelta(hours=3)
+
+    index = ti.TemperatureIndex(None, "entry", "box")
+    index._loaded = True
+    index._summaries[TOP] = ti.TemperatureSummary.from_dict(summary.as_dict())
+    recorder = _Recorder([_state(60.5, NOW - timedelta(hours=2))])
+
+    with patch("homeassistant.helpers.recorder.get_instance", return_value=recorder):
+        result = await index.async_last_at_or_above(
+            TOP, 60.0, since=NOW - timedelta(days=14), now=NOW
+        )
+
+    assert result == NOW - timedelta(hours=2)
+    assert recorder.calls == [(NOW - timedelta(hours=3), NOW)]
+
+
+@pytest.mark.asyncio
+async def test_index_ignores_crossings_older_than_since():
+    summary = ti.TemperatureSummary()
+    summary.track(60.0)
+    summary.observe(NOW - timedelta(days=30), 62.0)
+    summary.covered_since = NOW - timedelta(days=40)
+    summary.updated_at = NOW
+
+    index = ti.TemperatureIndex(None, "entry", "box")
+    index._loaded = True
+    index._summaries[TOP] = summary
+    index.attach_live([TOP])
+    index._live_entities.add(TOP)
+
+    result = await index.async_last_at_or_above(
+        TOP, 60.0, since=NOW - timedelta(days=14), now=NOW
+    )
+
+    assert result is None
+    # The retained crossing still answers a longer lookback.
+    assert (
+        await index.async_last_at_or_above(
+            TOP, 60.0, since=NOW - timedelta(days=31), now=NOW
+        )
+        == NOW - timedelta(days=30)
+    )
+
+
+def test_live_states_do_not_postpone_pending_save():
+    class _Store:
+        def __init__(self):
+            self.delays = []
+
+        def async_delay_save(self, data_func, delay):
+            self.delays.append(delay)
+
+    index = ti.TemperatureIndex(None, "entry", "box")
+    index._store = _Store()
+    index._summaries[TOP] = ti.TemperatureSummary()
+    index._live_entities.add(TOP)
+
+    with patch.object(ti.time, "monotonic", return_value=1000.0):
+        for minute in range(10):
+            index.observe_state(TOP, _state(50.0, NOW + timedelta(minutes=minute)))
+    assert index._store.delays == [ti.SAVE_DELAY_S]
+
+    with patch.object(ti.time, "monotonic", return_value=1000.0 + ti.SAVE_DELAY_S):
+        index.observe_state(TOP, _state(51.0, NOW + timedelta(minutes=10)))
+    assert index._store.delays == [ti.SAVE_DELAY_S, ti.SAVE_DELAY_S]
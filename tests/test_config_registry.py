@@ -95,6 +95,16 @@ def test_modules_and_battery_sections_ported():
     assert battery["battery_comfort_soc_percent"].min == 0.0 and battery["battery_comfort_soc_percent"].max == 95.0
 
 
+def test_planner_backend_enum_follows_planner_backends():
+    from custom_components.oig_cloud.battery_forecast.economic_planner_types import (
+        PLANNER_BACKENDS,
+    )
+
+    field = fields_for_section("battery")["planner_backend"]
+    assert field.enum == PLANNER_BACKENDS
+    assert field.default in PLANNER_BACKENDS
+
+
 def test_module_enable_fields_reload_on_change():
     """f1/wv2-modules-fix root cause (b): a persisted enable_* flip must trigger
     an entry reload so CHMU/solar/battery/boiler entities appear or disappear
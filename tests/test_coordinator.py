@@ -2334,3 +2334,77 @@ async def test_async_config_entry_first_refresh_failure_no_cache(
         await coordinator.async_config_entry_first_refresh()
 
     assert coordinator._skip_next_jitter is True
+
+
+@pytest.mark.asyncio
+async def test_refresh_extended_stats_fetches_groups_concurrently(coordinator):
+    started: list[str] = []
+    release = asyncio.Event()
+
+    async def _get_extended_stats(name, _from, _to):
+        started.append(name)
+        if len(started) == 4:
+            release.set()
+        await release.wait()
+        return {"items": [{"values": [name]}]}
+
+    coordinator.api.get_extended_stats = _get_extended_stats
+
+    await asyncio.wait_for(coordinator._refresh_extended_stats(), timeout=1)
+
+    assert sorted(started) == ["batt", "fve", "grid", "load"]
+    assert coordinator.extended_data["extended_grid"] == {
+        "items": [{"values": ["grid"]}]
+    }
+
+
+@pytest.mark.asyncio
+async def test_refresh_extended_stats_does_not_serve_previous_payloads(coordinator):
+    coordinator.api.get_extended_stats = AsyncMock(
+        side_effect=lambda name, *_a: {"items": [{"values": [name]}]}
+    )
+    await coordinator._refresh_extended_stats()
+
+    coordinator.api.get_extended_stats = AsyncMock(
+        side_effect=lambda name, *_a: {} if name == "fve" else {"items": [{"values": [name, 2]}]}
+    )
+    await coordinator._refresh_extended_stats()
+
+    assert coordinator.extended_data["extended_fve"] == {}
+    assert coordinator.extended_data["extended_batt"] == {
+        "items": [{"values": ["batt", 2]}]
+    }
+
+
+def test_update_listeners_skips_unchanged_change_keys(coordinator):
+    calls: list[str] = []
+    coordinator.async_add_listener(lambda: calls.append("soc"), ("actual", "bat_c"))
+    coordinator.async_add_listener(lambda: calls.append("pv"), ("actual", "fv_p1"))
+    coordinator.async_add_listener(lambda: calls.append("any"))
+
+    coordinator.async_set_updated_data({"123": {"actual": {"bat_c": 50, "fv_p1": 1}}})
+    assert sorted(calls) == ["any", "pv", "soc"]
+
+    calls.clear()
+    coordinator.async_set_updated_data({"123": {"actual": {"bat_c": 51, "fv_p1": 1}}})
+    assert sorted(calls) == ["any", "soc"]
+
+    calls.clear()
+    coordinator.report_changed_keys([("actual", "fv_p1")])
+    coordinator.async_set_updated_data({"123": {"actual": {"bat_c": 51, "fv_p1": 2}}})
+    assert sorted(calls) == ["any", "pv"]
+
+
+def test_removed_change_key_listener_is_not_called(coordinator):
+    calls: list[str] = []
+    remove = coordinator.async_add_listener(
+        lambda: calls.append("soc"), ("actual", "bat_c")
+    )
+    coordinator.async_add_listener(lambda: calls.append("soc2"), ("actual", "bat_c"))
+
+    coordinator.async_set_updated_data({"123": {"actual": {"bat_c": 50}}})
+    remove()
+    remove()
+    coordinator.async_set_updated_data({"123": {"actual": {"bat_c": 51}}})
+
+    assert calls == ["soc", "soc2", "soc2"]
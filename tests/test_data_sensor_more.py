@@ -557,12 +557,15 @@ def test_state_handles_invalid_grid_value(monkeypatch):
     assert sensor.state is None
 
 
-def test_state_extended_import_error(monkeypatch):
+def test_state_extended_uses_config_resolved_at_init(monkeypatch):
     sensor = _make_sensor(
         monkeypatch,
         "extended_battery_voltage",
         {"sensor_type_category": "extended", "node_id": "node", "node_key": "value"},
-        data={"123": {"node": {"value": 1}}},
+        data={
+            "123": {"node": {"value": 1}},
+            "extended_batt": {"items": [{"values": [48.5, 10.0, 80.0, 25.0]}]},
+        },
     )
     import builtins
 
@@ -574,7 +577,7 @@ def test_state_extended_import_error(monkeypatch):
         return real_import(name, *args, **kwargs)
 
     monkeypatch.setattr(builtins, "__import__", _import)
-    assert sensor.state == 1
+    assert sensor.state == 48.5
 
 
 def test_resolve_box_id_fallback(monkeypatch):
@@ -1415,3 +1415,107 @@ def test_on_any_state_change_tracks_legacy_local_entity_id():
 
     assert legacy_entity_id in controller._pending_local_entities
     assert controller._last_local_entity_update is not None
+
+
+def _local_state(hass, entry, now):
+    hass.data[module.DOMAIN][entry.entry_id] = {
+        "data_source_state": module.DataSourceState(
+            configured_mode=module.DATA_SOURCE_LOCAL_ONLY,
+            effective_mode=module.DATA_SOURCE_LOCAL_ONLY,
+            local_available=True,
+            last_local_data=now,
+            reason="local_ok",
+        )
+    }
+
+
+def test_on_any_state_change_index_rejects_unrelated_without_parsing(monkeypatch):
+    now = dt_util.utcnow()
+    local_id = "sensor.oig_local_123_tbl_actual_aci_wr"
+    states = [
+        DummyState(local_id, "1", last_updated=now),
+        DummyState("light.kitchen", "on", last_updated=now),
+    ]
+    hass = DummyHass(states)
+    entry = _make_entry(module.DATA_SOURCE_LOCAL_ONLY, box_id="123")
+    controller = module.DataSourceController(hass, entry, coordinator=None)
+    controller._schedule_debounced_poke = lambda: None
+    _local_state(hass, entry, now)
+
+    controller._get_proxy_entity_index()
+    parsed = []
+    original = module.normalize_proxy_entity_id
+
+    def _counting(entity_id, box_id):
+        parsed.append(entity_id)
+        return original(entity_id, box_id)
+
+    monkeypatch.setattr(module, "normalize_proxy_entity_id", _counting)
+    for entity_id in ("light.kitchen", local_id):
+        controller._on_any_state_change(
+            SimpleNamespace(
+                data={"entity_id": entity_id, "old_state": object()},
+                time_fired=now,
+            )
+        )
+
+    assert parsed == []
+    assert controller._pending_local_entities == {local_id}
+    assert controller.listener_stats == {
+        "events_inspected": 2,
+        "events_accepted": 1,
+        "indexed_entities": 1,
+    }
+
+
+def test_on_any_state_change_indexes_new_entity_and_invalidates():
+    now = dt_util.utcnow()
+    hass = DummyHass([DummyState(module.PROXY_BOX_ID_ENTITY_ID, "123", last_updated=now)])
+    entry = _make_entry(module.DATA_SOURCE_LOCAL_ONLY, box_id=None)
+    controller = module.DataSourceController(hass, entry, coordinator=None)
+    controller._schedule_debounced_poke = lambda: None
+    _local_state(hass, entry, now)
+
+    new_id = "number.oig_local_123_tbl_batt_prms_bat_min_cfg"
+    controller._on_any_state_change(
+        SimpleNamespace(data={"entity_id": new_id, "old_state": None}, time_fired=now)
+    )
+    assert new_id in controller._get_proxy_entity_index()
+    assert new_id in controller._pending_local_entities
+
+    # Registry updates that keep every entity id keep the index.
+    for data in (
+        {"action": "update", "entity_id": new_id, "changes": {"name": "x"}},
+        {"action": "create", "entity_id": "light.kitchen"},
+    ):
+        controller._on_entity_registry_updated(SimpleNamespace(data=data))
+        assert controller._proxy_entity_index is not None
+
+    controller._on_entity_registry_updated(
+        SimpleNamespace(
+            data={
+                "action": "update",
+                "entity_id": "number.renamed",
+                "old_entity_id": new_id,
+            }
+        )
+    )
+    assert controller._proxy_entity_index is None
+
+    def _box_id_event(old, new):
+        return SimpleNamespace(
+            data={
+                "entity_id": module.PROXY_BOX_ID_ENTITY_ID,
+                "old_state": SimpleNamespace(state=old),
+                "new_state": SimpleNamespace(state=new),
+            },
+            time_fired=now,
+        )
+
+    index = controller._get_proxy_entity_index()
+    controller._on_any_state_change(_box_id_event("123", "123"))
+    assert controller._proxy_entity_index is index
+
+    hass.states._states[module.PROXY_BOX_ID_ENTITY_ID].state = "999"
+    controller._on_any_state_change(_box_id_event("123", "999"))
+    assert controller._proxy_index_box_id == "999"
@@ -416,3 +416,71 @@ def test_plan_battery_schedule_logs_error_on_exception(caplog: pytest.LogCapture
     assert isinstance(result, PlannerResult)
     assert len(result.modes) == 96
     assert result.decisions == []
+
+
+def test_incremental_trajectory_matches_full_resimulation() -> None:
+    from custom_components.oig_cloud.battery_forecast.economic_planner import (
+        _IncrementalTrajectory,
+        _simulate_with_modes,
+    )
+
+    n = 96
+    inputs = _build_inputs(
+        current_soc_kwh=4.0,
+        intervals_count=n,
+        prices=[1.0 + (i % 24) * 0.25 for i in range(n)],
+        solar_forecast=[1.2 if 30 <= i < 60 else 0.0 for i in range(n)],
+        load_forecast=[0.4] * n,
+    )
+    modes = [CBBMode.HOME_I.value] * n
+    trajectory = _IncrementalTrajectory(modes, inputs)
+
+    for idx in (70, 5, 40, 12, 5):
+        mode = CBBMode.HOME_I.value if modes[idx] == CBBMode.HOME_UPS.value else CBBMode.HOME_UPS.value
+        modes[idx] = mode
+        trajectory.set_mode(idx, mode)
+
+        expected = _simulate_with_modes(modes, inputs)
+        assert trajectory.states() == expected
+        assert trajectory.total_cost() == sum(state.cost_czk for state in expected)
+
+
+def test_incremental_trajectory_stops_when_soc_reconverges() -> None:
+    from custom_components.oig_cloud.battery_forecast.economic_planner import _IncrementalTrajectory
+
+    n = 96
+    # Strong midday solar saturates the battery, so an early charge is absorbed
+    # by the clamp at max capacity and the tail of the horizon is unchanged.
+    inputs = _build_inputs(
+        current_soc_kwh=5.0,
+        intervals_count=n,
+        solar_forecast=[3.0 if 20 <= i < 60 else 0.0 for i in range(n)],
+        load_forecast=[0.2] * n,
+    )
+    trajectory = _IncrementalTrajectory([CBBMode.HOME_I.value] * n, inputs)
+    before = trajectory.resimulated_intervals
+
+    trajectory.set_mode(2, CBBMode.HOME_UPS.value)
+
+    assert 0 < trajectory.resimulated_intervals - before < 60
+
+
+def test_incremental_trajectory_storable_surplus_prefix_sums() -> None:
+    from custom_components.oig_cloud.battery_forecast.economic_planner import _IncrementalTrajectory
+    from custom_components.oig_cloud.battery_forecast.types import DEFAULT_CHARGE_EFFICIENCY
+
+    inputs = _build_inputs(
+        current_soc_kwh=5.0,
+        intervals_count=8,
+        solar_forecast=[0.0, 1.0, 2.0, 0.5, 0.0, 1.5, 0.0, 0.0],
+        load_forecast=[0.5] * 8,
+    )
+    trajectory = _IncrementalTrajectory([CBBMode.HOME_I.value] * 8, inputs)
+
+    assert trajectory.storable_surplus_kwh(1, 6) == pytest.approx(
+        (0.5 + 1.5 + 1.0) * DEFAULT_CHARGE_EFFICIENCY
+    )
+    assert trajectory.storable_surplus_kwh(6, 3) == 0.0
+    assert trajectory.storable_surplus_kwh(-4, 100) == pytest.approx(
+        trajectory.storable_surplus_kwh(0, 8)
+    )
@@ -0,0 +1,162 @@
+from __future__ import annotations
+
+import itertools
+import random
+from datetime import datetime, timezone
+from types import SimpleNamespace
+
+import pytest
+
+from custom_components.oig_cloud.battery_forecast.economic_planner import (
+    _simulate_with_modes,
+    plan_battery_schedule,
+)
+from custom_components.oig_cloud.battery_forecast.economic_planner_dp import (
+    DP_FLOOR_PENALTY_CZK_PER_KWH,
+    plan_battery_schedule_dp,
+)
+from custom_components.oig_cloud.battery_forecast.economic_planner_types import (
+    PlannerInputs,
+)
+from custom_components.oig_cloud.battery_forecast.planning import (
+    forecast_update as forecast_update_module,
+)
+from custom_components.oig_cloud.battery_forecast.types import CBBMode
+
+
+def _random_inputs(seed: int, n: int) -> PlannerInputs:
+    rng = random.Random(seed)
+    return PlannerInputs(
+        current_soc_kwh=rng.uniform(2.5, 10.2),
+        max_capacity_kwh=10.24,
+        hw_min_kwh=2.048,
+        planning_min_percent=33.0,
+        charge_rate_kw=2.8,
+        intervals=[{"index": i} for i in range(n)],
+        prices=[rng.uniform(0.5, 8.0) for _ in range(n)],
+        solar_forecast=[
+            max(0.0, rng.gauss(0.5, 0.8)) if 28 < i % 96 < 72 else 0.0
+            for i in range(n)
+        ],
+        load_forecast=[rng.uniform(0.05, 0.8) for _ in range(n)],
+    )
+
+
+def _objective(states, inputs: PlannerInputs) -> float:
+    return sum(
+        state.cost_czk
+        + max(0.0, inputs.planning_min_kwh - state.soc_kwh) * DP_FLOOR_PENALTY_CZK_PER_KWH
+        for state in states
+    )
+
+
+@pytest.mark.parametrize("seed", range(6))
+def test_dp_plan_never_costs_more_than_greedy(seed: int) -> None:
+    inputs = _random_inputs(seed, 192)
+
+    dp = plan_battery_schedule_dp(inputs)
+    greedy = plan_battery_schedule(inputs)
+
+    assert len(dp.modes) == len(dp.states) == 192
+    assert set(dp.modes) <= {CBBMode.HOME_I.value, CBBMode.HOME_UPS.value}
+    assert dp.total_cost == pytest.approx(sum(s.cost_czk for s in dp.states))
+    assert _objective(dp.states, inputs) <= _objective(greedy.states, inputs) + 1e-6
+
+
+def test_dp_plan_matches_exhaustive_search_on_short_horizon() -> None:
+    n = 8
+    inputs = PlannerInputs(
+        current_soc_kwh=3.6,
+        max_capacity_kwh=10.24,
+        hw_min_kwh=2.048,
+        planning_min_percent=33.0,
+        charge_rate_kw=2.8,
+        intervals=[{"index": i} for i in range(n)],
+        prices=[1.0, 1.2, 6.0, 6.5, 0.8, 7.0, 7.5, 5.0],
+        solar_forecast=[0.0] * n,
+        load_forecast=[0.4] * n,
+    )
+
+    best = min(
+        _objective(_simulate_with_modes(list(modes), inputs), inputs)
+        for modes in itertools.product(
+            (CBBMode.HOME_I.value, CBBMode.HOME_UPS.value), repeat=n
+        )
+    )
+    dp = plan_battery_schedule_dp(inputs)
+
+    assert _objective(dp.states, inputs) == pytest.approx(best, abs=0.05)
+    assert dp.modes[0] == CBBMode.HOME_UPS.value
+    assert dp.decisions and dp.decisions[0].reason == "DP_OPTIMAL"
+
+
+class _FakeHass:
+    def __init__(self) -> None:
+        self.states = SimpleNamespace(get=lambda _entity_id: None)
+        self.executor_calls: list = []
+
+    async def async_add_executor_job(self, func, *args):
+        self.executor_calls.append(func)
+        return func(*args)
+
+
+class _PlannerSensor:
+    def __init__(self, options: dict) -> None:
+        self._config_entry = SimpleNamespace(options=options)
+        self._charging_metrics: dict = {}
+        self._plan_lock_until = None
+        self._plan_lock_modes = None
+        self._box_id = "123"
+        self.hass = _FakeHass()
+        self._hass = self.hass
+
+    def _log_rate_limited(self, *_args, **_kwargs) -> None:
+        return None
+
+    def _get_solar_forecast(self) -> dict:
+        return {}
+
+    def _create_mode_recommendations(self, timeline, hours_ahead=48) -> list:
+        return []
+
+
+async def _run_configured_planner(sensor: _PlannerSensor):
+    start = datetime(2025, 1, 1, 0, 0, tzinfo=timezone.utc)
+    prices = [
+        {"time": start.replace(hour=i).isoformat(), "price": price}
+        for i, price in enumerate([1.0, 6.0, 6.0, 6.0])
+    ]
+    box_floor = forecast_update_module._capture_box_floor_snapshot(sensor)
+    return await forecast_update_module._async_run_planner(
+        sensor,
+        prices,
+        prices,
+        [0.5] * 4,
+        [0.0] * 4,
+        current_capacity=4.0,
+        max_capacity=10.0,
+        box_floor=box_floor,
+        run_id="test-run",
+        correlation_id="test-corr",
+    )
+
+
+@pytest.mark.asyncio
+async def test_planner_backend_option_selects_dp_in_executor() -> None:
+    sensor = _PlannerSensor({"planner_backend": "dp"})
+
+    timeline, mode_result, _ = await _run_configured_planner(sensor)
+
+    assert sensor.hass.executor_calls == [plan_battery_schedule_dp]
+    assert mode_result["planner"] == "economic_planner_dp"
+    assert len(timeline) == 4
+
+
+@pytest.mark.asyncio
+async def test_planner_backend_defaults_to_greedy_inline() -> None:
+    sensor = _PlannerSensor({})
+
+    _, mode_result, _ = await _run_configured_planner(sensor)
+
+    assert sensor.hass.executor_calls == []
+    assert mode_result["planner"] == "economic_planner"
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import gzip
 import json
 from datetime import datetime, timezone
 from types import SimpleNamespace
@@ -13,9 +14,10 @@ _ADMIN_USER = SimpleNamespace(is_admin=True)
 
 
 class DummyRequest:
-    def __init__(self, hass, query=None):
+    def __init__(self, hass, query=None, headers=None):
         self.app = {"hass": hass, "hass_user": SimpleNamespace(is_admin=True)}
         self.query = query or {}
+        self.headers = headers or {}
 
 
 class DummyStore:
@@ -108,6 +110,81 @@ async def test_battery_timeline_view_precomputed(monkeypatch):
     assert payload["metadata"]["points_count"] == 2
 
 
+@pytest.mark.asyncio
+async def test_battery_timeline_view_pre_encoded_etag_and_gzip(monkeypatch):
+    hass = DummyHass()
+    DummyStore.data = {"last_update": "u", "timeline": [{"time": "t1"}]}
+    monkeypatch.setattr("homeassistant.helpers.storage.Store", DummyStore)
+    view = api_module.OIGCloudBatteryTimelineView()
+
+    first = await view.get(DummyRequest(hass, {"type": "active"}), "123")
+    etag = first.headers["ETag"]
+    assert "baseline" not in json.loads(first.text)
+
+    not_modified = await view.get(
+        DummyRequest(hass, {"type": "active"}, {"If-None-Match": f"W/{etag}"}), "123"
+    )
+    assert not_modified.status == 304
+
+    zipped = await view.get(
+        DummyRequest(hass, {"type": "both"}, {"Accept-Encoding": "br, gzip"}), "123"
+    )
+    assert zipped.headers["Content-Encoding"] == "gzip"
+    assert zipped.headers["ETag"] != etag
+    assert json.loads(gzip.decompress(zipped.body))["baseline"] == []
+
+
+@pytest.mark.asyncio
+async def test_battery_timeline_view_since_returns_delta(monkeypatch):
+    from custom_components.oig_cloud.battery_forecast.presentation import (
+        plan_snapshot as plan_snapshot_module,
+        timeline_delta as timeline_delta_module,
+    )
+
+    hass = DummyHass()
+    old = [{"time": "t1", "soc": 1}, {"time": "t2", "soc": 2}]
+    new = [{"time": "t2", "soc": 3}, {"time": "t3", "soc": 4}]
+    plan_snapshot_module.publish_plan_snapshot(
+        hass, "123", {"timeline": new, "timeline_version": 2}
+    )
+    history = timeline_delta_module.get_timeline_delta_history(hass, "123")
+    history.record(1, 2, old, new)
+    view = api_module.OIGCloudBatteryTimelineView()
+
+    response = await view.get(DummyRequest(hass, {"since": "1"}), "123")
+    payload = json.loads(response.text)
+    assert payload["delta"] is True
+    assert payload["changed"] == new
+    assert payload["removed"] == ["t1"]
+    assert payload["baseline"] == []
+    assert payload["metadata"]["version"] == 2
+
+    active = await view.get(
+        DummyRequest(hass, {"since": "1", "type": "active"}), "123"
+    )
+    assert "baseline" not in json.loads(active.text)
+    not_modified = await view.get(
+        DummyRequest(
+            hass,
+            {"since": "1", "type": "active"},
+            {"If-None-Match": active.headers["ETag"]},
+        ),
+        "123",
+    )
+    assert not_modified.status == 304
+    zipped = await view.get(
+        DummyRequest(hass, {"since": "1"}, {"Accept-Encoding": "gzip"}), "123"
+    )
+    assert zipped.headers["Content-Encoding"] == "gzip"
+    assert json.loads(gzip.decompress(zipped.body))["changed"] == new
+
+    response = await view.get(DummyRequest(hass, {"since": "0"}), "123")
+    payload = json.loads(response.text)
+    assert "delta" not in payload
+    assert payload["active"] == new
+    assert payload["metadata"]["version"] == 2
+
+
 @pytest.mark.asyncio
 async def test_battery_timeline_view_missing_sensor_component(monkeypatch):
     hass = DummyHass()
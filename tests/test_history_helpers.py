@@ -230,6 +230,81 @@ async def test_fetch_interval_from_history_exception(monkeypatch):
     assert result is None
 
 
+@pytest.mark.asyncio
+async def test_fetch_intervals_from_history_matches_single_queries(monkeypatch):
+    start = datetime(2025, 1, 1, 0, 0, tzinfo=timezone.utc)
+    step = timedelta(minutes=15)
+    day = {
+        "sensor.oig_123_ac_out_en_day": [
+            DummyState(str(1000 + 100 * i), start + step * i - timedelta(minutes=2))
+            for i in range(5)
+        ],
+        "sensor.oig_123_ac_in_ac_ad": [
+            DummyState("2000", start - timedelta(hours=1)),
+            DummyState("2300", start + timedelta(minutes=20)),
+            DummyState("2400", start + timedelta(minutes=50)),
+        ],
+        "sensor.oig_123_batt_bat_c": [
+            DummyState("40", start + timedelta(minutes=5)),
+            DummyState("60", start + timedelta(minutes=40)),
+        ],
+        "sensor.oig_123_box_prms_mode": [
+            DummyState(SERVICE_MODE_HOME_UPS, start - timedelta(hours=2)),
+        ],
+        "sensor.oig_123_spot_price_current_15min": [
+            DummyState(str(2 + i), start + step * i) for i in range(4)
+        ],
+    }
+
+    def fake_get_significant_states(_hass, query_start, query_end, *_args):
+        # Emulate include_start_time_state: last state before the window is
+        # reported at the window start.
+        result = {}
+        for entity_id, entity_states in day.items():
+            before = [s for s in entity_states if s.last_updated < query_start]
+            inside = [
+                s for s in entity_states if query_start <= s.last_updated <= query_end
+            ]
+            if before:
+                inside = [DummyState(before[-1].state, query_start), *inside]
+            if inside:
+                result[entity_id] = inside
+        return result
+
+    recorder_instance = DummyRecorderInstance()
+    monkeypatch.setattr(
+        "homeassistant.components.recorder.history.get_significant_states",
+        fake_get_significant_states,
+    )
+    monkeypatch.setattr(
+        "homeassistant.helpers.recorder.get_instance", lambda _hass: recorder_instance
+    )
+    sensor = DummySensor(DummyHass())
+    starts = [start + step * i for i in range(4)]
+
+    bulk = await history_module.fetch_intervals_from_history(sensor, starts)
+    assert len(recorder_instance.calls) == 1
+
+    for interval_start in starts:
+        single = await history_module.fetch_interval_from_history(
+            sensor, interval_start, interval_start + step
+        )
+        assert bulk[interval_start] == single
+    assert bulk[starts[1]]["grid_import"] == 0.3
+    assert bulk[starts[0]]["mode"] == CBB_MODE_HOME_UPS
+
+
+@pytest.mark.asyncio
+async def test_fetch_intervals_from_history_no_hass_or_empty():
+    start = datetime(2025, 1, 1, 0, 0, tzinfo=timezone.utc)
+    assert await history_module.fetch_intervals_from_history(
+        DummySensor(None), [start]
+    ) == {}
+    assert await history_module.fetch_intervals_from_history(
+        DummySensor(DummyHass()), []
+    ) == {}
+
+
 @pytest.mark.asyncio
 async def test_fetch_mode_history_uses_recorder_executor(monkeypatch):
     start = datetime(2025, 1, 1, 0, 0, tzinfo=timezone.utc)
@@ -260,10 +335,16 @@ async def test_fetch_mode_history_uses_recorder_executor(monkeypatch):
 async def test_patch_existing_actual(monkeypatch):
     sensor = DummySensor(DummyHass())
 
-    async def fake_fetch(*_args, **_kwargs):
-        return {"net_cost": 1.2, "spot_price": 4.5, "export_price": 2.2}
+    requested = []
 
-    monkeypatch.setattr(history_module, "fetch_interval_from_history", fake_fetch)
+    async def fake_fetch(_sensor, interval_starts, **_kwargs):
+        requested.append(list(interval_starts))
+        return {
+            start: {"net_cost": 1.2, "spot_price": 4.5, "export_price": 2.2}
+            for start in interval_starts
+        }
+
+    monkeypatch.setattr(history_module, "fetch_intervals_from_history", fake_fetch)
     existing = [
         {"time": "2025-01-01T00:00:00", "net_cost": None},
         {"time": "bad", "net_cost": None},
@@ -279,6 +360,8 @@ async def test_patch_existing_actual(monkeypatch):
     assert patched[2]["net_cost"] == 1.2
     assert patched[3]["net_cost"] == 1.0
     assert patched[3]["backup_net_cost"] == 0.8
+    assert len(requested) == 1
+    assert len(requested[0]) == 2
 
 
 @pytest.mark.asyncio
@@ -288,26 +371,34 @@ async def test_build_new_actual_intervals(monkeypatch):
     now = start + timedelta(minutes=30)
     existing_times = {start.isoformat()}
 
-    async def fake_fetch(*_args, **_kwargs):
-        return {
-            "solar_kwh": 0.1,
-            "consumption_kwh": 0.2,
-            "battery_soc": 50,
-            "battery_capacity_kwh": 5,
-            "grid_import": 0.1,
-            "grid_export": 0.0,
-            "net_cost": 1.0,
-            "spot_price": 2.0,
-            "export_price": 1.0,
-            "mode": 0,
-            "mode_name": "HOME I",
-        }
+    requested = []
+
+    async def fake_fetch(_sensor, interval_starts, **_kwargs):
+        requested.append(list(interval_starts))
+        return {ts: dict(actual) for ts in interval_starts}
+
+    actual = {
+        "solar_kwh": 0.1,
+        "consumption_kwh": 0.2,
+        "battery_soc": 50,
+        "battery_capacity_kwh": 5,
+        "grid_import": 0.1,
+        "grid_export": 0.0,
+        "net_cost": 1.0,
+        "spot_price": 2.0,
+        "export_price": 1.0,
+        "mode": 0,
+        "mode_name": "HOME I",
+    }
 
-    monkeypatch.setattr(history_module, "fetch_interval_from_history", fake_fetch)
+    monkeypatch.setattr(history_module, "fetch_intervals_from_history", fake_fetch)
     intervals = await history_module._build_new_actual_intervals(
         sensor, start, now, existing_times
     )
     assert len(intervals) == 2
+    assert requested == [
+        [start + timedelta(minutes=15), start + timedelta(minutes=30)]
+    ]
 
 
 def test_normalize_mode_history():
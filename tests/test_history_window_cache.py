@@ -0,0 +1,169 @@
+"""Tests for the shared recorder history window cache."""
+
+from __future__ import annotations
+
+from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
+
+import pytest
+
+from custom_components.oig_cloud.shared.history_window_cache import (
+    HASS_DATA_KEY,
+    HistoryWindowCache,
+    get_history_window_cache,
+)
+
+ENTITY = "sensor.oig_123_actual_aco_p"
+NOW = datetime(2025, 1, 31, 2, 0)
+
+
+def _series(start: datetime, end: datetime) -> list[SimpleNamespace]:
+    points = []
+    ts = start
+    while ts <= end:
+        points.append(SimpleNamespace(state=str(ts.hour), last_updated=ts))
+        ts += timedelta(hours=1)
+    return points
+
+
+class _Recorder:
+    def __init__(self) -> None:
+        self.calls: list[tuple[datetime, datetime, str]] = []
+        self.series = _series(NOW - timedelta(days=40), NOW + timedelta(days=5))
+        self.local_time = lambda ts: ts
+
+    def state_changes_during_period(self, _hass, start, end, entity_id):
+        self.calls.append((start, end, entity_id))
+        return {
+            entity_id: [
+                s
+                for s in self.series
+                if start < self.local_time(s.last_updated) <= end
+            ]
+        }
+
+
+@pytest.fixture
+def recorder(monkeypatch):
+    recorder = _Recorder()
+    monkeypatch.setattr(
+        "homeassistant.components.recorder.history.state_changes_during_period",
+        recorder.state_changes_during_period,
+    )
+
+    def _no_instance(_hass):
+        raise KeyError("recorder")
+
+    monkeypatch.setattr("homeassistant.helpers.recorder.get_instance", _no_instance)
+    return recorder
+
+
+def _hass():
+    async def _exec(func, *args):
+        return func(*args)
+
+    return SimpleNamespace(data={}, async_add_executor_job=_exec)
+
+
+@pytest.mark.asyncio
+async def test_sensors_share_one_query_and_slice_in_memory(recorder):
+    cache = HistoryWindowCache(_hass())
+
+    wide = await cache.async_get_states(ENTITY, NOW - timedelta(days=30), NOW)
+    narrow = await cache.async_get_states(ENTITY, NOW - timedelta(days=14), NOW)
+
+    assert len(recorder.calls) == 1
+    assert narrow == [
+        s for s in wide if s.last_updated >= NOW - timedelta(days=14)
+    ]
+
+
+@pytest.mark.asyncio
+async def test_next_day_fetches_only_the_missing_tail(recorder):
+    cache = HistoryWindowCache(_hass())
+    await cache.async_get_states(ENTITY, NOW - timedelta(days=14), NOW)
+
+    tomorrow = NOW + timedelta(days=1)
+    states = await cache.async_get_states(
+        ENTITY, tomorrow - timedelta(days=14), tomorrow
+    )
+
+    assert recorder.calls[-1][:2] == (NOW, tomorrow)
+    expected = [
+        s
+        for s in recorder.series
+        if tomorrow - timedelta(days=14) <= s.last_updated <= tomorrow
+    ]
+    assert states == expected
+
+
+@pytest.mark.asyncio
+async def test_wider_request_fetches_only_the_missing_head(recorder):
+    cache = HistoryWindowCache(_hass())
+    await cache.async_get_states(ENTITY, NOW - timedelta(days=14), NOW)
+
+    states = await cache.async_get_states(ENTITY, NOW - timedelta(days=30), NOW)
+
+    assert recorder.calls[-1][:2] == (
+        NOW - timedelta(days=30),
+        NOW - timedelta(days=14),
+    )
+    assert states[0].last_updated > NOW - timedelta(days=30)
+    assert [s.last_updated for s in states] == sorted(s.last_updated for s in states)
+    assert len(states) == len({s.last_updated for s in states})
+
+
+@pytest.mark.asyncio
+async def test_lru_eviction_refetches_evicted_entity(recorder):
+    cache = HistoryWindowCache(_hass(), max_entities=1)
+    start = NOW - timedelta(days=1)
+
+    await cache.async_get_states(ENTITY, start, NOW)
+    await cache.async_get_states("sensor.other", start, NOW)
+    await cache.async_get_states(ENTITY, start, NOW)
+
+    assert [call[2] for call in recorder.calls] == [ENTITY, "sensor.other", ENTITY]
+
+
+@pytest.mark.asyncio
+async def test_no_executor_returns_none(recorder):
+    cache = HistoryWindowCache(SimpleNamespace())
+    assert await cache.async_get_states(ENTITY, NOW - timedelta(days=1), NOW) is None
+    assert recorder.calls == []
+
+
+@pytest.mark.asyncio
+async def test_aware_states_are_sliced_in_local_time(recorder, monkeypatch):
+    prague = timezone(timedelta(hours=1))
+    monkeypatch.setattr(
+        "custom_components.oig_cloud.shared.history_window_cache.dt_util.as_local",
+        lambda value: value.astimezone(prague),
+    )
+    recorder.local_time = lambda ts: ts.astimezone(prague).replace(tzinfo=None)
+    recorder.series = [
+        SimpleNamespace(
+            state=s.state,
+            last_updated=(s.last_updated - timedelta(hours=1)).replace(
+                tzinfo=timezone.utc
+            ),
+        )
+        for s in recorder.series
+    ]
+    cache = HistoryWindowCache(_hass())
+    start = NOW - timedelta(days=1)
+
+    await cache.async_get_states(ENTITY, NOW - timedelta(days=2), NOW)
+    states = await cache.async_get_states(ENTITY, start, NOW - timedelta(hours=6))
+
+    local = [s.last_updated.astimezone(prague).replace(tzinfo=None) for s in states]
+    assert local[0] == start
+    assert local[-1] == NOW - timedelta(hours=6)
+
+
+def test_cache_is_per_entry():
+    hass = _hass()
+    first = get_history_window_cache(hass, "entry-a")
+
+    assert get_history_window_cache(hass, "entry-a") is first
+    assert get_history_window_cache(hass, "entry-b") is not first
+    assert hass.data["oig_cloud"]["entry-a"][HASS_DATA_KEY] is first
@@ -187,3 +187,46 @@ def test_apply_state_select_control_cfg_suffix(monkeypatch):
     entity_id = "select.oig_local_123_tbl_box_prms_mode_cfg"
     assert applier.apply_state(payload, entity_id, "Home 2", datetime.now()) is True
     assert payload["123"]["box_prms"]["mode"] == 1
+
+
+def test_apply_state_compiles_entity_once(monkeypatch):
+    cfg = local_mapper._SuffixConfig(
+        updates=(local_mapper._NodeUpdate(node_id="box_prms", node_key="mode"),),
+        domains=("sensor",),
+        value_map=None,
+    )
+    monkeypatch.setattr(local_mapper, "_SUFFIX_UPDATES", {"tbl_test_key": cfg})
+    applier = local_mapper.LocalUpdateApplier("123")
+    entity_id = "sensor.oig_local_123_tbl_test_key"
+    assert applier.compile([entity_id, "sensor.other"]) == 1
+
+    def _fail(*_args, **_kwargs):
+        raise AssertionError("entity id re-parsed")
+
+    monkeypatch.setattr(local_mapper, "normalize_proxy_entity_id", _fail)
+    payload = {}
+    assert applier.apply_state(payload, entity_id, "Home 2", datetime.now()) is True
+    assert applier.apply_state(payload, entity_id, "Home 2", datetime.now()) is False
+    assert applier.apply_state(payload, "sensor.other", 1, datetime.now()) is False
+    assert payload["123"]["box_prms"]["mode"] == 1
+
+
+def test_apply_state_compiled_matches_uncompiled_extended(monkeypatch):
+    cfg = local_mapper._SuffixConfig(
+        updates=(local_mapper._ExtendedUpdate(group="extended_batt", index=2),),
+        domains=("sensor",),
+        value_map=None,
+    )
+    monkeypatch.setattr(local_mapper, "_SUFFIX_UPDATES", {"tbl_test_key": cfg})
+    entity_id = "sensor.oig_local_123_tbl_test_key"
+    now = datetime.now()
+    compiled = local_mapper.LocalUpdateApplier("123")
+    compiled.compile([entity_id])
+    lazy = local_mapper.LocalUpdateApplier("123")
+
+    payload_a = {"extended_batt": {"items": [{"values": [1]}]}}
+    payload_b = {"extended_batt": {"items": [{"values": [1]}]}}
+    assert compiled.apply_state(payload_a, entity_id, "12.5", now) is True
+    assert lazy.apply_state(payload_b, entity_id, "12.5", now) is True
+    assert payload_a == payload_b
+    assert payload_a["extended_batt"]["items"][-1]["values"][2] == 12.5
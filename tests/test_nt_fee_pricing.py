@@ -381,3 +381,20 @@ def test_analytics_build_dynamic_hourly_prices_nt_splits_and_is_neutral():
     single_result = single_sensor._build_dynamic_hourly_prices(raw_prices)
     assert single_result["2025-01-02T10:00:00"]["final_price"] == 1.15
     assert single_result["2025-01-02T23:00:00"]["final_price"] == 1.15
+
+
+def test_analytics_dynamic_hourly_prices_keep_spot_fee_for_fixed_prices():
+    sensor = _make_analytics_sensor(
+        _single_config(
+            spot_pricing_model="fixed_prices",
+            spot_fixed_fee_mwh=400.0,
+            fixed_commercial_price_vt=9.0,
+            distribution_fee_vt_kwh=0.0,
+            distribution_fee_nt_kwh=0.0,
+            vat_rate=0.0,
+        )
+    )
+    result = sensor._build_dynamic_hourly_prices({"2025-01-02T10:00:00": 1.0})
+
+    assert result["2025-01-02T10:00:00"]["commercial_price"] == 1.4
+    assert result["2025-01-02T10:00:00"]["final_price"] == 1.4
@@ -785,6 +785,55 @@ class TestOigCloudApi:
             result = await self.api.get_extended_stats("foo", "2020-01-01", "2020-01-02")
         assert result == {}
 
+    async def test_get_extended_stats_concurrent_401_share_one_login(self):
+        self.api._phpsessid = "expired"
+        logins = 0
+
+        async def _login():
+            nonlocal logins
+            logins += 1
+            await asyncio.sleep(0)
+            self.api._phpsessid = "fresh"
+            return True
+
+        def _session():
+            if self.api._phpsessid == "expired":
+                response = _make_response(status=401, headers={})
+            else:
+                response = _make_response(status=200, json_data={"a": 1}, headers={})
+            return _make_session_context(_make_session(post_response=response))
+
+        with (
+            patch.object(self.api, "get_session", side_effect=_session),
+            patch.object(self.api, "authenticate", side_effect=_login),
+        ):
+            results = await asyncio.gather(
+                *(
+                    self.api.get_extended_stats(name, "2020-01-01", "2020-01-02")
+                    for name in ("batt", "fve", "grid", "load")
+                )
+            )
+
+        assert results == [{"a": 1}] * 4
+        assert logins == 1
+
+    async def test_get_extended_stats_retries_auth_once(self):
+        response_401 = _make_response(status=401, headers={})
+        session = _make_session(post_response=response_401)
+        authenticate = AsyncMock(return_value=True)
+
+        with (
+            patch.object(
+                self.api, "get_session", return_value=_make_session_context(session)
+            ),
+            patch.object(self.api, "authenticate", authenticate),
+        ):
+            result = await self.api.get_extended_stats("foo", "2020-01-01", "2020-01-02")
+
+        assert result == {}
+        assert authenticate.await_count == 1
+        assert session.post.call_count == 2
+
     async def test_get_extended_stats_http_error(self):
         mock_response = _make_response(status=500, headers={})
         session = _make_session(post_response=mock_response)
@@ -896,3 +945,79 @@ class TestOigCloudApi:
         with patch.object(self.api, "get_session", side_effect=RuntimeError("boom")):
             result = await self.api.get_notifications("device")
         assert result["error"] == "boom"
+
+
+class _PooledSession:
+    def __init__(self, **kwargs):
+        self.kwargs = kwargs
+        self.closed = False
+
+    async def close(self):
+        self.closed = True
+
+
+@pytest.mark.asyncio
+async def test_get_session_reuses_pooled_session_until_reauth(monkeypatch):
+    created = []
+
+    def _factory(**kwargs):
+        created.append(_PooledSession(**kwargs))
+        return created[-1]
+
+    monkeypatch.setattr(api_module.aiohttp, "ClientSession", _factory)
+    api = OigCloudApi("pool-user", "password", False)
+    api._phpsessid = "first"
+    monkeypatch.setattr(api, "_get_connector", lambda: object())
+
+    async with api.get_session() as first:
+        pass
+    async with api.get_session() as second:
+        api._phpsessid = "second"
+        async with api.get_session() as third:
+            assert first.closed is False
+    assert first is second
+    assert third is not first
+    assert first.closed is True
+    assert third.closed is False
+    assert len(created) == 2
+    assert created[1].kwargs["headers"]["Cookie"] == "PHPSESSID=second"
+
+    await api.close()
+    assert third.closed is True
+
+
+def test_api_locks_are_per_account():
+    first = OigCloudApi("account-a", "password", False)
+    same = OigCloudApi("account-a", "password", False)
+    other = OigCloudApi("account-b", "password", False)
+
+    assert first._lock is same._lock
+    assert first._lock is not other._lock
+
+
+@pytest.mark.asyncio
+async def test_session_lease_without_context_manager_keeps_retired_session(
+    monkeypatch,
+):
+    created = []
+
+    def _factory(**kwargs):
+        created.append(_PooledSession(**kwargs))
+        return created[-1]
+
+    monkeypatch.setattr(api_module.aiohttp, "ClientSession", _factory)
+    api = OigCloudApi("lease-user", "password", False)
+    api._phpsessid = "first"
+    monkeypatch.setattr(api, "_get_connector", lambda: object())
+
+    debug_lease = api.get_session()
+    api._phpsessid = "second"
+    async with api.get_session():
+        pass
+    assert created[0].closed is False
+
+    await debug_lease.close()
+    assert created[0].closed is True
+    assert api._session_leases == 0
+
+    await api.close()
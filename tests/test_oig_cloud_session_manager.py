@@ -485,3 +485,27 @@ async def test_close_resets_state():
 
     assert manager._last_auth_time is None
     assert manager._last_request_time is None
+
+
+@pytest.mark.asyncio
+async def test_rate_limit_allows_burst_then_paces(monkeypatch):
+    from custom_components.oig_cloud.api.oig_cloud_session_manager import (
+        RATE_LIMIT_BURST,
+    )
+
+    manager = OigCloudSessionManager(DummyApi())
+    slept: list[float] = []
+
+    async def _sleep(seconds):
+        slept.append(seconds)
+
+    monkeypatch.setattr("custom_components.oig_cloud.api.oig_cloud_session_manager.asyncio.sleep", _sleep)
+
+    for _ in range(RATE_LIMIT_BURST):
+        await manager._rate_limit()
+    assert slept == []
+
+    await manager._rate_limit()
+    assert len(slept) == 1
+    assert 0 < slept[0] <= 1.0
+    assert manager._stats["rate_limited_count"] == 1
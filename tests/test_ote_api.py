@@ -9,6 +9,7 @@ import pytest
 
 import custom_components.oig_cloud.api.ote_api as ote_module
 from custom_components.oig_cloud.api.ote_api import CnbRate, OTEFault, OteApi, UpdateFailed
+from custom_components.oig_cloud.pricing.spot_price_store import SpotPriceStore
 
 
 class DummyResponse:
@@ -937,3 +938,58 @@ async def test_download_soap_error(monkeypatch):
     )
     with pytest.raises(OTEFault):
         await api._download_soap("<xml />", "GetDamPricePeriodE")
+
+
+def test_cache_persists_interval_store(tmp_path):
+    cache_file = tmp_path / "cache.json"
+    api = OteApi(cache_path=str(cache_file))
+    api._last_data = {
+        "prices_czk_kwh": {"2025-01-01T10:00:00": 1.0},
+        "prices15m_czk_kwh": {
+            "2025-01-01T10:00:00": 1.0,
+            "2025-01-01T10:15:00": 1.5,
+        },
+    }
+    api._cache_time = datetime(2025, 1, 1, 12, 0, 0, tzinfo=api.timezone)
+    api._persist_cache_sync()
+
+    payload = json.loads(cache_file.read_text(encoding="utf-8"))
+    assert payload[ote_module.QH_STORE_CACHE_KEY]["values"] == [1.0, 1.5]
+
+    api2 = OteApi(cache_path=str(cache_file))
+    api2._load_cached_spot_prices_sync()
+    assert api2.spot_store.as_dict() == payload[ote_module.QH_STORE_CACHE_KEY]
+    assert (
+        OteApi.get_15min_price_for_interval(
+            41, api2._last_data, target_date=date(2025, 1, 1)
+        )
+        == 1.5
+    )
+
+
+def test_cache_ignores_interval_store_with_other_content(tmp_path):
+    cache_file = tmp_path / "cache.json"
+    prices = {"2025-01-01T10:00:00": 1.0, "2025-01-01T10:15:00": 1.5}
+    stale = SpotPriceStore.from_prices(
+        {"2025-01-01T09:00:00": 9.0, "2025-01-01T09:15:00": 9.5}
+    )
+    cache_file.write_text(
+        json.dumps(
+            {
+                "last_data": {"prices15m_czk_kwh": prices},
+                ote_module.QH_STORE_CACHE_KEY: stale.as_dict(),
+            }
+        ),
+        encoding="utf-8",
+    )
+
+    api = OteApi(cache_path=str(cache_file))
+    api._load_cached_spot_prices_sync()
+
+    assert api.spot_store.to_prices() == prices
+    assert (
+        OteApi.get_15min_price_for_interval(
+            41, api._last_data, target_date=date(2025, 1, 1)
+        )
+        == 1.5
+    )
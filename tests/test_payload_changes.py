@@ -0,0 +1,133 @@
+from __future__ import annotations
+
+from datetime import datetime
+from types import SimpleNamespace
+
+from custom_components.oig_cloud.core import local_mapper
+from custom_components.oig_cloud.core.payload_changes import (
+    PayloadChangeTracker,
+    is_change_key,
+)
+from custom_components.oig_cloud.entities import data_sensor
+from custom_components.oig_cloud.entities.data_sensor import OigCloudDataSensor
+
+
+def _payload(soc=50, pv=100, ext=1.0):
+    return {
+        "123": {"actual": {"bat_c": soc, "fv_p1": pv}, "box_prms": {"mode": 0}},
+        "extended_batt": {"items": [{"values": [ext]}]},
+    }
+
+
+def test_tracker_reports_changed_slots_only():
+    tracker = PayloadChangeTracker()
+    assert tracker.diff(_payload()) is None
+
+    assert tracker.diff(_payload()) == set()
+    assert tracker.diff(_payload(soc=51, ext=2.0)) == {
+        ("actual", "bat_c"),
+        ("extended_batt", None),
+    }
+
+    payload = _payload(soc=51, ext=2.0)
+    del payload["123"]["box_prms"]
+    assert tracker.diff(payload) == {("box_prms", "mode")}
+
+
+def test_tracker_detects_in_place_mutation():
+    tracker = PayloadChangeTracker()
+    payload = _payload()
+    tracker.diff(payload)
+
+    payload["extended_batt"]["items"][-1]["values"][0] = 9.0
+    payload["123"]["actual"]["fv_p1"] = 5
+    assert tracker.diff(payload) == {("extended_batt", None), ("actual", "fv_p1")}
+
+
+def test_tracker_detects_mutation_after_reported_update():
+    tracker = PayloadChangeTracker()
+    payload = _payload()
+    tracker.diff(payload)
+
+    payload["extended_batt"]["items"][-1]["values"][0] = 2.0
+    tracker.update(payload, [("extended_batt", None)])
+    payload["extended_batt"]["items"][-1]["values"][0] = 3.0
+    assert tracker.diff(payload) == {("extended_batt", None)}
+    assert tracker.diff(payload) == set()
+
+
+def test_tracker_update_keeps_reported_slots_in_sync():
+    tracker = PayloadChangeTracker()
+    payload = _payload()
+    tracker.diff(payload)
+
+    payload["123"]["actual"]["bat_c"] = 60
+    tracker.update(payload, [("actual", "bat_c")])
+    assert tracker.diff(payload) == set()
+
+
+def test_applier_collects_changed_keys(monkeypatch):
+    cfg = local_mapper._SuffixConfig(
+        updates=(
+            local_mapper._NodeUpdate(node_id="actual", node_key="bat_c"),
+            local_mapper._ExtendedUpdate(group="extended_batt", index=2),
+        ),
+        domains=("sensor",),
+        value_map=None,
+    )
+    monkeypatch.setattr(local_mapper, "_SUFFIX_UPDATES", {"tbl_test_key": cfg})
+    applier = local_mapper.LocalUpdateApplier("123")
+    entity_id = "sensor.oig_local_123_tbl_test_key"
+    payload = {}
+    changed = set()
+
+    assert applier.apply_state(payload, entity_id, 55, datetime.now(), changed)
+    assert changed == {("actual", "bat_c"), ("extended_batt", None)}
+
+    changed.clear()
+    assert not applier.apply_state(payload, entity_id, 55, datetime.now(), changed)
+    assert changed == set()
+
+
+def _sensor(monkeypatch, sensor_type, config, **kwargs):
+    monkeypatch.setattr(
+        "custom_components.oig_cloud.sensor_types.SENSOR_TYPES",
+        {sensor_type: config},
+    )
+    coordinator = SimpleNamespace(data={}, forced_box_id="123")
+    return OigCloudDataSensor(coordinator, sensor_type, **kwargs)
+
+
+def test_data_sensor_subscribes_with_change_key(monkeypatch):
+    node = _sensor(
+        monkeypatch, "batt_soc", {"node_id": "actual", "node_key": "bat_c"}
+    )
+    extended = _sensor(
+        monkeypatch, "extended_fve_current_1", {"sensor_type_category": "extended"}
+    )
+    grid_mode = _sensor(
+        monkeypatch,
+        "invertor_prms_to_grid",
+        {"node_id": "invertor_prms", "node_key": "to_grid", "multi_source": True},
+    )
+    notification = _sensor(
+        monkeypatch,
+        "bypass_status",
+        {"sensor_type_category": "notification", "node_id": "box_prms"},
+    )
+
+    assert node.coordinator_context == ("actual", "bat_c")
+    assert extended.coordinator_context == ("extended_fve", None)
+    assert grid_mode.coordinator_context is None
+    assert notification.coordinator_context is None
+    assert is_change_key(node.coordinator_context)
+    assert not is_change_key(None)
+
+
+def test_extended_change_keys_match_the_groups_sensors_read():
+    from custom_components.oig_cloud.sensor_types import SENSOR_TYPES
+
+    assert SENSOR_TYPES["invertor_prms_to_grid"]["multi_source"] is True
+    for sensor_type, (group, _index) in local_mapper._EXTENDED_INDEX_BY_SENSOR_TYPE.items():
+        assert SENSOR_TYPES[sensor_type]["sensor_type_category"] == "extended"
+        assert data_sensor._extended_group(sensor_type) == group
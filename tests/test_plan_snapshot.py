@@ -0,0 +1,77 @@
+from __future__ import annotations
+
+import gzip
+import json
+from types import SimpleNamespace
+
+import pytest
+
+from custom_components.oig_cloud.battery_forecast.presentation import (
+    plan_snapshot as plan_snapshot_module,
+)
+
+
+def test_publish_bumps_revision_and_shares_objects():
+    hass = SimpleNamespace(data={})
+    timeline = [{"time": "t"}]
+    payload = {"unified_cost_tile": {"today": {}}, "timeline": timeline}
+
+    first = plan_snapshot_module.publish_plan_snapshot(hass, "123", payload)
+    second = plan_snapshot_module.publish_plan_snapshot(
+        hass, "123", {"unified_cost_tile_hybrid": {"today": {"delta": 1}}}
+    )
+
+    assert first.revision == 1
+    assert first.timeline is timeline
+    assert second.revision == 2
+    assert second.unified_cost_tile == {"today": {"delta": 1}}
+    assert second.timeline == []
+
+
+def test_encoded_responses_are_memoized_per_snapshot():
+    hass = SimpleNamespace(data={})
+    payload = {
+        "detail_tabs": {"today": {"mode_blocks": []}},
+        "unified_cost_tile": {"today": {"delta": 1}},
+    }
+    snapshot = plan_snapshot_module.publish_plan_snapshot(hass, "123", payload)
+    snapshot.encode_responses()
+
+    today = snapshot.encoded_response("detail_tabs:today")
+    assert snapshot.encoded_response("detail_tabs:today") is today
+    assert json.loads(today.body) == {"today": {"mode_blocks": []}}
+    assert gzip.decompress(today.gzip_body) == today.body
+    assert snapshot.encoded_response("timeline") is None
+
+    changed = plan_snapshot_module.publish_plan_snapshot(
+        hass, "123", {"unified_cost_tile": {"today": {"delta": 2}}}
+    )
+    tile = snapshot.encoded_response("unified_cost_tile")
+    assert changed.encoded_response("unified_cost_tile").etag != tile.etag
+
+
+def test_publish_without_hass_data_is_noop():
+    assert plan_snapshot_module.publish_plan_snapshot(SimpleNamespace(), "1", {}) is None
+
+
+@pytest.mark.asyncio
+async def test_get_snapshot_loads_store_once(monkeypatch):
+    loads = []
+
+    class DummyStore:
+        def __init__(self, _hass, _version, key):
+            self.key = key
+
+        async def async_load(self):
+            loads.append(self.key)
+            return {"timeline": [{"time": "t"}], "last_update": "now"}
+
+    monkeypatch.setattr("homeassistant.helpers.storage.Store", DummyStore)
+    hass = SimpleNamespace(data={})
+
+    snapshot = await plan_snapshot_module.async_get_plan_snapshot(hass, "123")
+    again = await plan_snapshot_module.async_get_plan_snapshot(hass, "123")
+
+    assert snapshot is again
+    assert snapshot.last_update == "now"
+    assert loads == ["oig_cloud.precomputed_data_123"]
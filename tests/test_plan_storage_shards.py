@@ -0,0 +1,251 @@
+from __future__ import annotations
+
+import copy
+from types import SimpleNamespace
+
+import pytest
+
+from custom_components.oig_cloud.battery_forecast.storage import plan_storage_io
+from custom_components.oig_cloud.battery_forecast.storage.plan_storage_shards import (
+    SHARDED_FORMAT,
+    ShardedPlanStore,
+)
+
+KEY = "oig_cloud.battery_plans_123"
+
+
+class MemoryDisk:
+    def __init__(self, files=None):
+        self.files = dict(files or {})
+        self.loads: list[str] = []
+        self.saves: list[str] = []
+        self.removes: list[str] = []
+
+    def factory(self, _hass, version, key):
+        return MemoryStore(self, key)
+
+
+class MemoryStore:
+    def __init__(self, disk: MemoryDisk, key: str):
+        self._disk = disk
+        self.key = key
+
+    async def async_load(self):
+        self._disk.loads.append(self.key)
+        return copy.deepcopy(self._disk.files.get(self.key))
+
+    async def async_save(self, data):
+        self._disk.saves.append(self.key)
+        self._disk.files[self.key] = copy.deepcopy(data)
+
+    async def async_remove(self):
+        self._disk.removes.append(self.key)
+        self._disk.files.pop(self.key, None)
+
+
+def _plan(value):
+    return {"intervals": [{"net_cost": value}], "baseline": False}
+
+
+def _legacy_doc():
+    return {
+        "detailed": {"2025-01-01": _plan(1), "2025-01-02": _plan(2)},
+        "daily": {"2025-01-01": {"planned": {"total_cost": 1}}},
+        "weekly": {},
+        "daily_archive": {"2025-01-01": {"plan": []}},
+    }
+
+
+@pytest.mark.asyncio
+async def test_legacy_document_is_migrated_on_first_save():
+    disk = MemoryDisk({KEY: _legacy_doc()})
+    store = ShardedPlanStore(None, KEY, disk.factory)
+
+    data = await store.async_load()
+    assert data == _legacy_doc()
+    await store.async_save(data)
+
+    index = disk.files[KEY]
+    assert index["format"] == SHARDED_FORMAT
+    assert index["days"] == ["2025-01-01", "2025-01-02"]
+    assert "detailed" not in index and "daily_archive" not in index
+    assert disk.files[f"{KEY}_day_2025-01-02"] == _plan(2)
+    assert disk.files[f"{KEY}_archive"] == {"2025-01-01": {"plan": []}}
+
+    reloaded = ShardedPlanStore(None, KEY, disk.factory)
+    assert await reloaded.async_load() == _legacy_doc()
+
+
+@pytest.mark.asyncio
+async def test_full_save_writes_only_changed_shards():
+    disk = MemoryDisk({KEY: _legacy_doc()})
+    store = ShardedPlanStore(None, KEY, disk.factory)
+    await store.async_save(await store.async_load())
+    disk.saves.clear()
+
+    data = await store.async_load()
+    data["daily"]["2025-01-02"] = {"planned": {"total_cost": 2}}
+    del data["detailed"]["2025-01-01"]
+    await store.async_save(data)
+
+    assert disk.saves == [KEY]
+    assert disk.removes == [f"{KEY}_day_2025-01-01"]
+    assert await store.async_has_day("2025-01-01") is False
+
+
+@pytest.mark.asyncio
+async def test_day_api_touches_only_index_and_requested_shard():
+    disk = MemoryDisk({KEY: _legacy_doc()})
+    migrated = ShardedPlanStore(None, KEY, disk.factory)
+    await migrated.async_save(await migrated.async_load())
+    disk.loads.clear()
+    disk.saves.clear()
+
+    store = ShardedPlanStore(None, KEY, disk.factory)
+    assert await store.async_load_day("2025-01-02") == _plan(2)
+    assert await store.async_load_day("2025-01-05") is None
+    assert disk.loads == [KEY, f"{KEY}_day_2025-01-02"]
+
+    await store.async_save_day("2025-01-02", _plan(20))
+    assert disk.saves == [f"{KEY}_day_2025-01-02"]
+    await store.async_save_day("2025-01-03", _plan(3))
+    assert disk.saves[1:] == [f"{KEY}_day_2025-01-03", KEY]
+    assert disk.files[KEY]["days"] == ["2025-01-01", "2025-01-02", "2025-01-03"]
+
+
+@pytest.mark.asyncio
+async def test_plan_storage_io_uses_day_shards():
+    disk = MemoryDisk()
+    sensor = SimpleNamespace(
+        _plans_store=ShardedPlanStore(None, KEY, disk.factory), _hass=None
+    )
+
+    assert await plan_storage_io.save_plan_to_storage(
+        sensor, "2025-01-01", [{"net_cost": 1}], {"baseline": True}
+    )
+    assert await plan_storage_io.plan_exists_in_storage(sensor, "2025-01-01")
+    plan = await plan_storage_io.load_plan_from_storage(sensor, "2025-01-01")
+
+    assert plan["baseline"] is True
+    assert plan["intervals"] == [{"net_cost": 1}]
+    assert sorted(disk.files) == [KEY, f"{KEY}_day_2025-01-01"]
+
+
+class DelayedMemoryStore(MemoryStore):
+    def __init__(self, disk, key):
+        super().__init__(disk, key)
+        self.pending = None
+
+    def async_delay_save(self, data_func, delay):
+        self._disk.delayed.append((self.key, delay))
+        self.pending = data_func
+
+    def flush(self):
+        if self.pending is not None:
+            self._disk.files[self.key] = copy.deepcopy(self.pending())
+            self.pending = None
+
+
+class DelayedDisk(MemoryDisk):
+    def __init__(self, files=None):
+        super().__init__(files)
+        self.delayed: list[tuple[str, float]] = []
+        self.stores: dict[str, DelayedMemoryStore] = {}
+
+    def factory(self, _hass, version, key):
+        return self.stores.setdefault(key, DelayedMemoryStore(self, key))
+
+
+@pytest.mark.asyncio
+async def test_repeated_loads_are_served_from_memory():
+    disk = MemoryDisk({KEY: _legacy_doc()})
+    store = ShardedPlanStore(None, KEY, disk.factory)
+    await store.async_save(await store.async_load())
+    disk.loads.clear()
+
+    first = await store.async_load()
+    first["detailed"].pop("2025-01-01")
+    second = await store.async_load()
+    assert await store.async_load_day("2025-01-02") == _plan(2)
+
+    assert disk.loads == []
+    assert second == _legacy_doc()
+    assert store.cache_stats["hits"] >= 5
+    assert store.cache_stats["cached_days"] == 2
+
+
+@pytest.mark.asyncio
+async def test_saves_are_written_behind_and_coalesced():
+    disk = DelayedDisk()
+    store = ShardedPlanStore(None, KEY, disk.factory, write_delay=5)
+
+    await store.async_save_day("2025-01-01", _plan(1))
+    await store.async_save_day("2025-01-01", _plan(2))
+    assert disk.saves == []
+    assert await store.async_load_day("2025-01-01") == _plan(2)
+
+    for pending in disk.stores.values():
+        pending.flush()
+    assert disk.files[f"{KEY}_day_2025-01-01"] == _plan(2)
+    assert disk.files[KEY]["days"] == ["2025-01-01"]
+    assert {delay for _key, delay in disk.delayed} == {5}
+
+
+@pytest.mark.asyncio
+async def test_sections_edited_after_save_are_written_again():
+    disk = MemoryDisk({KEY: _legacy_doc()})
+    store = ShardedPlanStore(None, KEY, disk.factory)
+    data = await store.async_load()
+    await store.async_save(data)
+    disk.saves.clear()
+
+    await store.async_save(data)
+    assert disk.saves == []
+
+    # Archive and index sections are kept by callers and edited in place.
+    data["daily_archive"]["2025-01-02"] = {"plan": [1]}
+    data["daily"]["2025-01-02"] = {"planned": {"total_cost": 2}}
+    await store.async_save(data)
+
+    assert sorted(disk.saves) == sorted([KEY, f"{KEY}_archive"])
+    assert disk.files[f"{KEY}_archive"]["2025-01-02"] == {"plan": [1]}
+    assert disk.files[KEY]["daily"]["2025-01-02"] == {"planned": {"total_cost": 2}}
+
+
+@pytest.mark.asyncio
+async def test_migration_saves_shards_before_replacing_legacy_document():
+    disk = DelayedDisk({KEY: _legacy_doc()})
+    store = ShardedPlanStore(None, KEY, disk.factory, write_delay=5)
+
+    await store.async_save(await store.async_load())
+
+    # Written straight away (no write-behind), the index over the legacy
+    # document last.
+    assert disk.delayed == []
+    assert disk.saves[-1] == KEY
+    assert sorted(disk.saves[:-1]) == sorted(
+        [f"{KEY}_day_2025-01-01", f"{KEY}_day_2025-01-02", f"{KEY}_archive"]
+    )
+    reloaded = ShardedPlanStore(None, KEY, disk.factory)
+    assert await reloaded.async_load() == _legacy_doc()
+
+    # Later saves are written behind again.
+    await store.async_save_day("2025-01-03", _plan(3))
+    assert {key for key, _delay in disk.delayed} == {f"{KEY}_day_2025-01-03", KEY}
+
+
+@pytest.mark.asyncio
+async def test_plans_mutated_in_place_are_written_on_save():
+    disk = MemoryDisk({KEY: _legacy_doc()})
+    store = ShardedPlanStore(None, KEY, disk.factory)
+    await store.async_save(await store.async_load())
+    disk.saves.clear()
+
+    data = await store.async_load()
+    data["detailed"]["2025-01-02"]["intervals"][0]["net_cost"] = 5
+    data["daily_archive"]["2025-01-01"]["plan"].append(1)
+    await store.async_save(data)
+
+    assert sorted(disk.saves) == sorted([f"{KEY}_day_2025-01-02", f"{KEY}_archive"])
+    assert disk.files[f"{KEY}_day_2025-01-02"] == _plan(5)
+    assert disk.files[f"{KEY}_archive"] == {"2025-01-01": {"plan": [1]}}
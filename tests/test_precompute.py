@@ -50,6 +50,9 @@ async def test_precompute_ui_data_missing_store():
 @pytest.mark.asyncio
 async def test_precompute_ui_data_success(monkeypatch):
     sensor = DummySensor()
+    sensor._timeline_data = [
+        {"time": "t", "decision_metrics": {"planner_reason": "r"}}
+    ]
 
     monkeypatch.setattr(
         "custom_components.oig_cloud.battery_forecast.presentation.precompute.detail_tabs_module.build_detail_tabs",
@@ -70,6 +73,12 @@ async def test_precompute_ui_data_success(monkeypatch):
     assert sensor._last_precompute_hash == "hash"
     assert sensor._last_precompute_at is not None
 
+    sensor._timeline_data[0]["time"] = "changed"
+    sensor._timeline_data[0]["decision_metrics"]["planner_reason"] = "changed"
+    assert sensor._precomputed_store.saved["timeline"] == [
+        {"time": "t", "decision_metrics": {"planner_reason": "r"}}
+    ]
+
 
 def test_schedule_precompute_throttle(monkeypatch):
     sensor = DummySensor()
@@ -133,3 +142,28 @@ def test_schedule_precompute_prefers_background_task(monkeypatch):
 
     assert created["background"] is not None
     assert created["background"][1] == "oig_cloud_battery_forecast_precompute"
+
+
+@pytest.mark.asyncio
+async def test_precompute_ui_data_publishes_plan_snapshot(monkeypatch):
+    from custom_components.oig_cloud.battery_forecast.presentation import (
+        plan_snapshot as plan_snapshot_module,
+    )
+
+    sensor = DummySensor()
+    sensor.hass = SimpleNamespace(data={}, async_create_task=lambda coro: coro)
+    monkeypatch.setattr(
+        "custom_components.oig_cloud.battery_forecast.presentation.precompute.detail_tabs_module.build_detail_tabs",
+        lambda *_a, **_k: {"today": {"mode_blocks": []}},
+    )
+    monkeypatch.setattr(
+        "homeassistant.helpers.dispatcher.async_dispatcher_send",
+        lambda *_a, **_k: None,
+    )
+
+    await precompute_module.precompute_ui_data(sensor)
+
+    snapshot = plan_snapshot_module.get_plan_snapshot_registry(sensor.hass).get("123")
+    assert snapshot is not None
+    assert snapshot.data is sensor._precomputed_store.saved
+    assert snapshot.unified_cost_tile == {"today": {"plan_total_cost": 1.0}}
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from datetime import timedelta
+from types import SimpleNamespace
 
 import pytest
 from homeassistant.util import dt as dt_util
@@ -65,6 +66,35 @@ async def test_precompute_ui_data_saves_payload(monkeypatch):
     assert sensor._last_precompute_at is not None
 
 
+@pytest.mark.asyncio
+async def test_precompute_ui_data_stores_each_artifact_once(monkeypatch):
+    sensor = DummySensor()
+    sensor.hass = SimpleNamespace(data={})
+
+    async def _fake_detail_tabs(_sensor, plan="active", **_kwargs):
+        return {"today": {"mode_blocks": []}}
+
+    monkeypatch.setattr(
+        "custom_components.oig_cloud.battery_forecast.presentation.detail_tabs.build_detail_tabs",
+        _fake_detail_tabs,
+    )
+    monkeypatch.setattr(
+        "homeassistant.helpers.dispatcher.async_dispatcher_send",
+        lambda *_a, **_k: None,
+    )
+
+    await precompute_module.precompute_ui_data(sensor)
+
+    saved = sensor._precomputed_store.saved
+    assert not any(key.endswith("_hybrid") for key in saved)
+    assert saved["version"] == 4
+    assert saved["timeline"] is not sensor._timeline_data
+    assert saved["timeline"][0] is not sensor._timeline_data[0]
+    assert saved["timeline"] == sensor._timeline_data
+    assert sensor._precompute_stats["timeline_points"] == 1
+    assert sensor._precompute_stats["payload_kb"] > 0
+
+
 @pytest.mark.asyncio
 async def test_precompute_ui_data_skips_without_store():
     sensor = DummySensor()
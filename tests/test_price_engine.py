@@ -0,0 +1,84 @@
+from __future__ import annotations
+
+from datetime import datetime
+
+import pytest
+
+from custom_components.oig_cloud.pricing import price_engine
+
+
+def _vt_daytime(when: datetime) -> str:
+    return "VT" if 6 <= when.hour < 22 else "NT"
+
+
+def test_pricing_options_resolve_tariffs_and_fees():
+    options = price_engine.resolve_pricing_options(
+        {
+            "spot_positive_fee_percent": 10.0,
+            "spot_positive_fee_percent_nt": 5.0,
+            "distribution_fee_vt_kwh": 1.0,
+            "distribution_fee_nt_kwh": 0.5,
+            "vat_rate": 0.0,
+        },
+        _vt_daytime,
+    )
+
+    assert options.tariff(datetime(2025, 1, 2, 10, 0)) == "VT"
+    assert options.tariff(datetime(2025, 1, 2, 23, 30)) == "NT"
+    assert options.import_price(2.0, "VT") == 3.2
+    assert options.import_price(2.0, "NT") == 2.6
+    assert options.export_price(2.0, "VT") == 1.7
+
+
+def test_resolved_options_are_cached_until_options_change():
+    config = {"vat_rate": 21.0}
+    first = price_engine.resolve_pricing_options(config, _vt_daytime)
+    assert price_engine.resolve_pricing_options(config, _vt_daytime) is first
+
+    config["vat_rate"] = 10.0
+    changed = price_engine.resolve_pricing_options(config, _vt_daytime)
+    assert changed is not first
+    assert changed.vat_rate == 10.0
+
+
+def test_price_arrays_are_sorted_cached_and_sliceable():
+    options = price_engine.resolve_pricing_options(
+        {"dual_tariff_enabled": False, "vat_rate": 0.0}, _vt_daytime
+    )
+    prices = {
+        "2025-01-01T12:15:00": 3.0,
+        "2025-01-01T11:45:00": 2.0,
+        "2025-01-01T12:00:00": 2.5,
+    }
+
+    arrays = price_engine.price_arrays(prices, options)
+    assert arrays.keys[0] == "2025-01-01T11:45:00"
+    assert price_engine.price_arrays(dict(prices), options) is arrays
+
+    start = arrays.first_active(datetime(2025, 1, 1, 12, 7))
+    assert arrays.keys[start:] == ("2025-01-01T12:00:00", "2025-01-01T12:15:00")
+
+
+def test_price_arrays_invalid_keys():
+    options = price_engine.resolve_pricing_options({}, _vt_daytime)
+    prices = {"bad": 1.0, "2025-01-01T12:00:00": 2.0}
+
+    with pytest.raises(ValueError):
+        price_engine.price_arrays(prices, options)
+
+    arrays = price_engine.price_arrays(prices, options, skip_invalid=True)
+    assert arrays.keys == ("2025-01-01T12:00:00",)
+    assert arrays.dropped == 1
+
+
+def test_price_arrays_follow_in_place_price_updates():
+    options = price_engine.resolve_pricing_options({"vat_rate": 0.0}, _vt_daytime)
+    prices = {"2025-01-01T12:00:00": 2.0}
+
+    first = price_engine.price_arrays(prices, options)
+    assert price_engine.price_arrays(prices, options) is first
+
+    prices["2025-01-01T12:00:00"] = 3.0
+    updated = price_engine.price_arrays(prices, options)
+    assert updated is not first
+    assert updated.spot == (3.0,)
@@ -0,0 +1,66 @@
+from __future__ import annotations
+
+import random
+from datetime import datetime, timedelta, timezone
+from statistics import median
+
+from custom_components.oig_cloud.shared.rolling_median import RollingMedianWindow
+
+
+def test_window_median_matches_full_sort_under_expiry_and_trim():
+    rng = random.Random(7)
+    window = RollingMedianWindow()
+    reference = []
+    now = datetime(2025, 1, 1)
+    for _ in range(500):
+        now += timedelta(seconds=rng.choice([1, 30, 60]))
+        value = float(rng.choice([rng.randint(0, 3), rng.uniform(0, 500)]))
+        window.append(now, value)
+        reference.append((now, value))
+
+        window.trim(40)
+        reference = reference[-40:]
+        cutoff = now - timedelta(minutes=10)
+        window.expire(cutoff)
+        reference = [sample for sample in reference if sample[0] > cutoff]
+
+        assert window == reference
+        assert window.median_since(cutoff) == median(v for _, v in reference)
+
+        # Narrower query windows are answered without expiring anything.
+        narrow = now - timedelta(minutes=rng.choice([1, 3, 5]))
+        fresh = [v for t, v in reference if t > narrow]
+        expected = median(fresh) if fresh else median(v for _, v in reference)
+        assert window.median_since(narrow) == expected
+        assert window == reference
+
+
+def test_window_keeps_stale_samples_and_serializes_naive():
+    now = datetime(2025, 1, 1, 12, 0)
+    window = RollingMedianWindow.from_samples(
+        [
+            (now - timedelta(minutes=30), 1.0),
+            (now - timedelta(minutes=20), None),
+            ("bad", 5.0),
+            (now - timedelta(minutes=25), "n/a"),
+            (now - timedelta(minutes=25), [4.0]),
+            (now.replace(tzinfo=timezone.utc) - timedelta(minutes=20), 3.0),
+        ]
+    )
+
+    assert len(window) == 2
+    # No sample after the cutoff: the median of the stale ones is kept.
+    assert window.median_since(now - timedelta(minutes=5)) == 2.0
+    assert len(window) == 2
+    assert window.serialize() == [
+        ((now - timedelta(minutes=30)).isoformat(), 1.0),
+        ((now - timedelta(minutes=20)).isoformat(), 3.0),
+    ]
+
+    window.append(now, 10.0)
+    assert window.median_since(now - timedelta(minutes=5)) == 10.0
+    # Reading the median leaves the samples (and what gets persisted) alone.
+    assert len(window) == 3
+    window.expire(now - timedelta(minutes=5))
+    assert window == [(now, 10.0)]
+    assert window.last_sample_time == now
@@ -0,0 +1,56 @@
+from __future__ import annotations
+
+from datetime import date
+
+from custom_components.oig_cloud.pricing import spot_price_store as store_module
+from custom_components.oig_cloud.pricing.spot_price_store import SpotPriceStore
+
+
+PRICES = {
+    "2025-01-01T23:30:00": 1.0,
+    "2025-01-01T23:45:00": 2.0,
+    "2025-01-02T00:15:00": 4.0,
+    "bad": 9.0,
+}
+
+
+def test_lookup_by_interval():
+    store = SpotPriceStore.from_prices(PRICES)
+
+    assert len(store) == 3
+    assert store.price_for(date(2025, 1, 1), 95) == 2.0
+    assert store.price_for(date(2025, 1, 2), 1) == 4.0
+    assert store.price_for(date(2025, 1, 2), 0) is None
+    assert store.get(store.end) is None
+
+
+def test_round_trips_to_dict_formats():
+    store = SpotPriceStore.from_prices(PRICES)
+
+    assert store.to_prices() == {k: v for k, v in PRICES.items() if k != "bad"}
+    restored = SpotPriceStore.from_dict(store.as_dict())
+    assert restored.as_dict() == store.as_dict()
+    assert SpotPriceStore.from_dict({"start": "x", "values": []}) is None
+
+
+def test_store_for_is_memoized_per_dict():
+    prices = dict(PRICES)
+    store = store_module.store_for(prices)
+    assert store_module.store_for(prices) is store
+
+    prices["2025-01-02T00:30:00"] = 5.0
+    assert store_module.store_for(prices).price_for(date(2025, 1, 2), 2) == 5.0
+
+
+def test_store_for_notices_same_size_edits():
+    prices = {"2025-01-01T00:00:00": 1.0, "2025-01-01T00:15:00": 2.0}
+    store_module.store_for(prices)
+
+    prices["2025-01-01T00:15:00"] = 3.0
+    assert store_module.store_for(prices).price_for(date(2025, 1, 1), 1) == 3.0
+
+    del prices["2025-01-01T00:00:00"]
+    prices["2025-01-01T00:30:00"] = 4.0
+    store = store_module.store_for(prices)
+    assert store.price_for(date(2025, 1, 1), 0) is None
+    assert store.price_for(date(2025, 1, 1), 2) == 4.0
@@ -0,0 +1,135 @@
+from __future__ import annotations
+
+from datetime import datetime, timedelta
+
+import pytest
+from homeassistant.util import dt as dt_util
+
+from custom_components.oig_cloud.battery_forecast.timeline import (
+    day_cache as day_cache_module,
+)
+from custom_components.oig_cloud.battery_forecast.timeline import (
+    extended as extended_module,
+)
+
+
+class DummyStore:
+    def __init__(self, data=None):
+        self.data = data
+        self.saves = 0
+
+    async def async_load(self):
+        return self.data
+
+    async def async_save(self, data):
+        self.data = data
+        self.saves += 1
+
+
+class Sensor:
+    def __init__(self, cache):
+        self._hass = object()
+        self._plans_store = None
+        self._baseline_repair_attempts = set()
+        self._daily_plan_state = None
+        self._timeline_data = []
+        self._mode_optimization_result = None
+        self._timeline_day_cache = cache
+
+    def _is_baseline_plan_invalid(self, _plan):
+        return False
+
+    def _get_current_mode(self):
+        return 0
+
+    def _get_current_battery_soc_percent(self):
+        return 50.0
+
+    def _get_current_battery_capacity(self):
+        return 5.0
+
+
+def _cache(store=None):
+    cache = day_cache_module.TimelineDayCache(None, "123")
+    cache._store = store
+    return cache
+
+
+def _patch_history(monkeypatch, calls):
+    async def fake_modes(_sensor, *, day_start, fetch_end, **_k):
+        calls["modes"] += 1
+        return {
+            day_start.strftime(extended_module.DATETIME_FMT): {
+                "mode": 0,
+                "mode_name": "Home 1",
+            }
+        }
+
+    async def fake_mode_changes(_sensor, start, end):
+        calls["mode_reads"].append((start, end))
+        return [{"time": start, "mode": 0, "mode_name": "Home 1"}]
+
+    async def fake_interval(_sensor, start, _end):
+        calls["intervals"] += 1
+        return {"consumption_kwh": 0.1, "net_cost": 1.0}
+
+    history = extended_module.history_module
+    monkeypatch.setattr(history, "build_historical_modes_lookup", fake_modes)
+    monkeypatch.setattr(history, "fetch_mode_changes", fake_mode_changes)
+    monkeypatch.setattr(history, "fetch_interval_from_history", fake_interval)
+
+
+@pytest.mark.asyncio
+async def test_settled_past_day_is_frozen_per_plan_version(monkeypatch):
+    calls = {"modes": 0, "mode_reads": [], "intervals": 0}
+    _patch_history(monkeypatch, calls)
+    store = DummyStore()
+    sensor = Sensor(_cache(store))
+    day = dt_util.now().date() - timedelta(days=2)
+    date_str = day.strftime(extended_module.DATE_FMT)
+    plans = {"detailed": {date_str: {"intervals": [{"time": "00:00", "mode": 0}]}}}
+
+    first = await extended_module.build_day_timeline(sensor, day, plans)
+    assert calls["modes"] == 1 and store.saves == 1
+
+    again = await extended_module.build_day_timeline(sensor, day, plans)
+    assert again is first
+    assert calls["modes"] == 1 and store.saves == 1
+
+    # A restart reads the frozen day from the store.
+    restarted = Sensor(_cache(DummyStore(store.data)))
+    restored = await extended_module.build_day_timeline(restarted, day, plans)
+    assert restored == first
+    assert calls["modes"] == 1
+
+    # A changed stored plan is a new version.
+    plans["detailed"][date_str]["intervals"][0]["mode"] = 3
+    await extended_module.build_day_timeline(sensor, day, plans)
+    assert calls["modes"] == 2
+
+
+@pytest.mark.asyncio
+async def test_today_only_refetches_recent_intervals(monkeypatch):
+    calls = {"modes": 0, "mode_reads": [], "intervals": 0}
+    _patch_history(monkeypatch, calls)
+    sensor = Sensor(_cache())
+    today_start = dt_util.as_local(
+        datetime.combine(dt_util.now().date(), datetime.min.time())
+    )
+    now = today_start + timedelta(hours=10, minutes=7)
+    monkeypatch.setattr(extended_module.dt_util, "now", lambda: now)
+
+    first = await extended_module.build_day_timeline(sensor, now.date(), {})
+    assert calls["intervals"] == 41  # 00:00 .. 10:00 (current)
+    assert calls["mode_reads"] == [(today_start, now)]
+
+    previous_now = now
+    now = now + timedelta(minutes=15)
+    second = await extended_module.build_day_timeline(sensor, now.date(), {})
+    # 09:45 settled now, 10:00 just finished, 10:15 current.
+    assert calls["intervals"] == 41 + 3
+    assert calls["mode_reads"][-1] == (previous_now, now)
+
+    statuses = {item["time"][11:16]: item["status"] for item in second["intervals"]}
+    assert statuses["10:00"] == "historical" and statuses["10:15"] == "current"
+    assert second["intervals"][0]["actual"] == first["intervals"][0]["actual"]
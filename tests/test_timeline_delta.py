@@ -0,0 +1,45 @@
+from __future__ import annotations
+
+from custom_components.oig_cloud.battery_forecast.presentation import (
+    timeline_delta as timeline_delta_module,
+)
+
+
+def _point(time, soc):
+    return {"time": time, "battery_soc": soc}
+
+
+def test_since_composes_changes_and_removals():
+    history = timeline_delta_module.TimelineDeltaHistory()
+    v1 = [_point("10:00", 1), _point("10:15", 2), _point("10:30", 3)]
+    v2 = [_point("10:15", 2), _point("10:30", 4), _point("10:45", 5)]
+    v3 = [_point("10:30", 4), _point("10:45", 6), _point("11:00", 7)]
+    history.record(1, 2, v1, v2)
+    history.record(2, 3, v2, v3)
+
+    changed, removed = history.since(1, 3)
+    assert changed == [_point("10:30", 4), _point("10:45", 6), _point("11:00", 7)]
+    assert removed == ["10:00", "10:15"]
+
+    changed, removed = history.since(2, 3)
+    assert changed == [_point("10:45", 6), _point("11:00", 7)]
+    assert removed == ["10:15"]
+
+    assert history.since(3, 3) == ([], [])
+
+
+def test_since_falls_back_outside_the_history():
+    history = timeline_delta_module.TimelineDeltaHistory(maxlen=2)
+    timelines = [[_point("10:00", soc)] for soc in range(5)]
+    for version in range(1, 5):
+        history.record(version, version + 1, timelines[version - 1], timelines[version])
+
+    assert history.since(3, 5) is not None
+    assert history.since(2, 5) is None  # trimmed
+    assert history.since(99, 5) is None  # unknown (e.g. before a restart)
+    assert history.since(4, 6) is None  # published without a diff
+
+    # A gap in the chain drops the older diffs.
+    history.record(7, 8, timelines[0], timelines[1])
+    assert history.since(4, 8) is None
+    assert history.since(7, 8) == ([_point("10:00", 1)], [])